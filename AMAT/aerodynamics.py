@@ -0,0 +1,249 @@
+# SOURCE FILENAME : aerodynamics.py
+# DATE CREATED    : 10/18/2026, 15:40 MT
+# DATE MODIFIED   : 10/18/2026, 15:40 MT
+# REMARKS         : Tabulated aerodynamic database, CD and CL as a
+#                   function of Mach no. and optionally angle of
+#                   attack, with piecewise linear coefficients
+#                   precomputed for each table interval.
+
+from bisect import bisect_right
+
+import numpy as np
+
+
+class AeroTable:
+	"""
+	The AeroTable class holds a lookup table of the drag and lift
+	coefficients as a function of Mach no., and optionally angle of
+	attack. The table is interpolated linearly in Mach no. (bilinearly
+	in Mach no. and angle of attack), using the slopes of each table
+	interval computed once when the table is created. Queries outside
+	the table range are clamped to the table boundary.
+
+	Attributes
+	----------
+	mach : numpy.ndarray
+		Mach no. grid, ascending
+	alpha : numpy.ndarray
+		angle of attack grid, ascending, None for a Mach only table
+	CD : numpy.ndarray
+		drag coefficient at the grid points, shape (len(mach),) or
+		(len(mach), len(alpha))
+	CL : numpy.ndarray
+		lift coefficient at the grid points, same shape as CD
+	coefficients : list
+		interpolation coefficients of CD and CL for each table
+		interval, value and Mach slope (and for a 2D table, alpha
+		slope and cross term)
+	"""
+
+	def __init__(self, mach, CD, CL, alpha=None):
+		"""
+		Initializes the AeroTable and computes the interpolation
+		coefficients of each table interval.
+
+		Parameters
+		----------
+		mach : numpy.ndarray
+			Mach no. grid, at least 2 distinct values
+		CD : numpy.ndarray
+			drag coefficient, shape (len(mach),) or, if alpha is
+			provided, (len(mach), len(alpha))
+		CL : numpy.ndarray
+			lift coefficient, same shape as CD
+		alpha : numpy.ndarray, optional
+			angle of attack grid, same units as Vehicle.alpha,
+			at least 2 distinct values
+		"""
+
+		mach = np.asarray(mach, dtype=float)
+		CD = np.asarray(CD, dtype=float)
+		CL = np.asarray(CL, dtype=float)
+
+		if alpha is None:
+			shape = (len(mach),)
+		else:
+			alpha = np.asarray(alpha, dtype=float)
+			shape = (len(mach), len(alpha))
+
+		if CD.shape != shape or CL.shape != shape:
+			raise ValueError("AeroTable CD and CL must have shape " + str(shape) + ".")
+
+		order = np.argsort(mach, kind='mergesort')
+		self.mach = mach[order]
+		self.CD = CD[order]
+		self.CL = CL[order]
+
+		if alpha is None:
+			self.alpha = None
+		else:
+			order = np.argsort(alpha, kind='mergesort')
+			self.alpha = alpha[order]
+			self.CD = self.CD[:, order]
+			self.CL = self.CL[:, order]
+
+		for grid in [self.mach, self.alpha]:
+			if grid is not None and (len(grid) < 2 or np.any(np.diff(grid) <= 0)):
+				raise ValueError("AeroTable grid must have at least 2 distinct values.")
+
+		# slope of each Mach interval, and for a 2D table, of each
+		# alpha interval and the bilinear cross term
+		dM = np.diff(self.mach)
+		if self.alpha is None:
+			self.coefficients = [np.vstack((C[:-1], np.diff(C)/dM)) for C in [self.CD, self.CL]]
+		else:
+			dA = np.diff(self.alpha)
+			self.coefficients = []
+			for C in [self.CD, self.CL]:
+				C00 = C[:-1, :-1]
+				CM = (C[1:, :-1] - C00)/dM[:, None]
+				CA = (C[:-1, 1:] - C00)/dA[None, :]
+				CMA = (C[1:, 1:] - C[1:, :-1] - C[:-1, 1:] + C00)/(dM[:, None]*dA[None, :])
+				self.coefficients.append(np.stack((C00, CM, CA, CMA)))
+
+		# python lists for the scalar path
+		self._mach_list = self.mach.tolist()
+		self._alpha_list = None if self.alpha is None else self.alpha.tolist()
+		self._coef_list = [[c.tolist() for c in C] for C in self.coefficients]
+
+	@staticmethod
+	def locate(grid, xq):
+		"""
+		Returns the interval index of a scalar query point and the
+		query point clamped to the grid range.
+
+		Parameters
+		----------
+		grid : list
+			grid points, ascending
+		xq : float
+			query point
+
+		Returns
+		----------
+		i : int
+			interval index, grid[i] <= xq <= grid[i+1]
+		xq : float
+			query point clamped to [grid[0], grid[-1]]
+		"""
+
+		if xq <= grid[0]:
+			return 0, grid[0]
+		if xq >= grid[-1]:
+			return len(grid) - 2, grid[-1]
+		return bisect_right(grid, xq) - 1, xq
+
+	def evaluate(self, mach, alpha=None):
+		"""
+		Returns the drag and lift coefficients at a scalar query
+		point.
+
+		Parameters
+		----------
+		mach : float
+			Mach no.
+		alpha : float, optional
+			angle of attack, required for a 2D table
+
+		Returns
+		----------
+		CD : float
+			drag coefficient
+		CL : float
+			lift coefficient
+		"""
+
+		i, mach = self.locate(self._mach_list, mach)
+		s = mach - self._mach_list[i]
+		CD, CL = self._coef_list
+
+		if self._alpha_list is None:
+			return CD[0][i] + s*CD[1][i], CL[0][i] + s*CL[1][i]
+
+		j, alpha = self.locate(self._alpha_list, alpha)
+		t = alpha - self._alpha_list[j]
+
+		return CD[0][i][j] + s*CD[1][i][j] + t*(CD[2][i][j] + s*CD[3][i][j]), \
+			   CL[0][i][j] + s*CL[1][i][j] + t*(CL[2][i][j] + s*CL[3][i][j])
+
+	def evaluateArray(self, mach, alpha=None):
+		"""
+		Returns the drag and lift coefficients at an array of query
+		points.
+
+		Parameters
+		----------
+		mach : numpy.ndarray
+			Mach no.
+		alpha : float or numpy.ndarray, optional
+			angle of attack, required for a 2D table
+
+		Returns
+		----------
+		CD : numpy.ndarray
+			drag coefficient
+		CL : numpy.ndarray
+			lift coefficient
+		"""
+
+		mach = np.clip(np.asarray(mach, dtype=float), self.mach[0], self.mach[-1])
+		i = np.clip(np.searchsorted(self.mach, mach, side='right') - 1, 0, len(self.mach) - 2)
+		s = mach - self.mach[i]
+		CD, CL = self.coefficients
+
+		if self.alpha is None:
+			return CD[0][i] + s*CD[1][i], CL[0][i] + s*CL[1][i]
+
+		alpha = np.clip(np.broadcast_to(np.asarray(alpha, dtype=float), mach.shape), self.alpha[0], self.alpha[-1])
+		j = np.clip(np.searchsorted(self.alpha, alpha, side='right') - 1, 0, len(self.alpha) - 2)
+		t = alpha - self.alpha[j]
+
+		return CD[0][i, j] + s*CD[1][i, j] + t*(CD[2][i, j] + s*CD[3][i, j]), \
+			   CL[0][i, j] + s*CL[1][i, j] + t*(CL[2][i, j] + s*CL[3][i, j])
+
+
+def loadAeroTable(datfile, machCol, CDCol, CLCol, alphaCol=None):
+	"""
+	Reads an aerodynamic database from a text file with one row per
+	table point. For a 2D table, the rows must cover every
+	combination of the Mach no. and angle of attack values, in any
+	order.
+
+	Parameters
+	----------
+	datfile : str
+		file containing the aerodynamic database
+	machCol : int
+		column number (zero indexed) of the Mach no.
+	CDCol : int
+		column number (zero indexed) of the drag coefficient
+	CLCol : int
+		column number (zero indexed) of the lift coefficient
+	alphaCol : int, optional
+		column number (zero indexed) of the angle of attack
+
+	Returns
+	----------
+	ans : AeroTable
+		aerodynamic table
+	"""
+
+	data = np.loadtxt(datfile, ndmin=2)
+
+	if alphaCol is None:
+		return AeroTable(data[:, machCol], data[:, CDCol], data[:, CLCol])
+
+	mach, i = np.unique(data[:, machCol], return_inverse=True)
+	alpha, j = np.unique(data[:, alphaCol], return_inverse=True)
+
+	filled = np.zeros((len(mach), len(alpha)), dtype=int)
+	np.add.at(filled, (i, j), 1)
+	if np.any(filled != 1):
+		raise ValueError("Aerodynamic database " + datfile + " must have one row for each (Mach, alpha) pair.")
+
+	CD = np.empty((len(mach), len(alpha)))
+	CL = np.empty((len(mach), len(alpha)))
+	CD[i, j] = data[:, CDCol]
+	CL[i, j] = data[:, CLCol]
+
+	return AeroTable(mach, CD, CL, alpha)
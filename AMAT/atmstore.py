@@ -0,0 +1,845 @@
+# SOURCE FILENAME : atmstore.py
+# DATE CREATED    : 10/18/2026, 16:30 MT
+# DATE MODIFIED   : 10/18/2026, 20:40 MT
+# REMARKS         : Cache and store of parsed atmosphere look up
+#                   tables. Each text table is parsed once per process,
+#                   and saved to a memory-mappable .npy sidecar file in
+#                   the user cache directory which is reused by later
+#                   processes while the source file is unchanged. The
+#                   nominal and Monte Carlo tables of a planet may also
+#                   be packed into a single memory-mapped columnar
+#                   binary store.
+
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+
+class AtmosphereCache:
+	"""
+	The AtmosphereCache class holds the parsed numeric tables of
+	atmosphere data files, such as the GRAM Monte Carlo output files.
+
+	A table is parsed with np.loadtxt() on the first load, and kept
+	in memory until the source file changes. If sidecar is True,
+	the table is also saved in the cache directory (by default the
+	user cache directory, see defaultCacheDir(), never the data
+	directory) as a .cache.npy file, with the source size, 
+	modification time and SHA-256 hash in a .cache.json file. The
+	sidecar files are named after the source file and a hash of its
+	absolute path. Later processes memory-map
+	the sidecar instead of parsing the text. A sidecar is reused if
+	the source size and modification time, or else its hash, match.
+	If the sidecar cannot be written (read-only cache directory), 
+	only the in-memory cache is used.
+
+	If the directory of the source file holds a packed store
+	(STORE_FILENAME, see packAtmosphereStore()) with an up-to-date
+	copy of the table, or the source file was removed after packing,
+	the table is read from the store instead. A table of any store
+	can also be loaded directly as <storefile>/<table name>.
+
+	The tables are returned read-only, as they are shared between
+	callers.
+
+	Attributes
+	----------
+	sidecar : bool
+		if True, read and write the sidecar files
+	cacheDir : str
+		directory of the sidecar files
+	tables : dict
+		source signature (mtime, size) and table, numpy.ndarray,
+		by absolute path of the source file
+	stores : dict
+		store signature (mtime, size) and AtmosphereStore, by
+		absolute path of the store file
+	"""
+
+	def __init__(self, sidecar=True, cacheDir=None):
+		"""
+		Initializes the AtmosphereCache object.
+
+		Parameters
+		----------
+		sidecar : bool, optional
+			if True, read and write the sidecar files, default=True
+		cacheDir : str, optional
+			directory of the sidecar files, default=None uses
+			defaultCacheDir()
+		"""
+
+		self.sidecar = sidecar
+		self.cacheDir = cacheDir if cacheDir is not None else defaultCacheDir()
+		self.tables = {}
+		self.stores = {}
+
+	def sidecarFiles(self, datfile):
+		"""
+		Returns the sidecar table and metadata file names of a
+		source file in the cache directory. The names include a hash
+		of the absolute path, so that source files of the same name
+		in different directories do not share a sidecar.
+
+		Parameters
+		----------
+		datfile : str
+			source file
+
+		Returns
+		----------
+		npyfile : str
+			sidecar table file
+		metafile : str
+			sidecar metadata file
+		"""
+
+		path = os.path.abspath(datfile)
+		key = hashlib.sha256(path.encode()).hexdigest()[0:16]
+		base = os.path.join(self.cacheDir, os.path.basename(path) + '.' + key)
+
+		return base + '.cache.npy', base + '.cache.json'
+
+	@staticmethod
+	def fileHash(datfile):
+		"""
+		Returns the SHA-256 hash of the contents of a file.
+
+		Parameters
+		----------
+		datfile : str
+			file name
+
+		Returns
+		----------
+		ans : str
+			hex digest
+		"""
+
+		sha = hashlib.sha256()
+		with open(datfile, 'rb') as f:
+			for chunk in iter(lambda: f.read(1 << 20), b''):
+				sha.update(chunk)
+
+		return sha.hexdigest()
+
+	def load(self, datfile):
+		"""
+		Returns the numeric table of a whitespace delimited text file,
+		as np.loadtxt(datfile), from a packed store or the cache if 
+		available.
+
+		Parameters
+		----------
+		datfile : str
+			source file, or <storefile>/<table name>
+
+		Returns
+		----------
+		ans : numpy.ndarray or AtmosphereTable
+			table, shape (rows, columns), read-only
+		"""
+
+		store, name = self.findStoreTable(datfile)
+		if store is not None:
+			return store.table(name)
+
+		path = os.path.abspath(datfile)
+		stat = os.stat(path)
+		signature = (stat.st_mtime_ns, stat.st_size)
+
+		entry = self.tables.get(path)
+		if entry is not None and entry[0] == signature:
+			return entry[1]
+
+		table = self.readSidecar(path, stat) if self.sidecar is True else None
+
+		if table is None:
+			# column-major, so that the columns used by the callers
+			# are contiguous
+			table = np.asfortranarray(np.loadtxt(path, ndmin=2))
+			if self.sidecar is True:
+				self.writeSidecar(path, stat, table)
+			table.flags.writeable = False
+
+		self.tables[path] = (signature, table)
+
+		return table
+
+	def readSidecar(self, path, stat):
+		"""
+		Returns the memory-mapped sidecar table of a source file, or
+		None if there is no valid sidecar.
+
+		Parameters
+		----------
+		path : str
+			absolute path of the source file
+		stat : os.stat_result
+			status of the source file
+
+		Returns
+		----------
+		ans : numpy.memmap
+			table, or None
+		"""
+
+		npyfile, metafile = self.sidecarFiles(path)
+
+		try:
+			with open(metafile, 'r') as f:
+				meta = json.load(f)
+		except (OSError, ValueError):
+			return None
+
+		if meta.get('size') != stat.st_size:
+			return None
+
+		if meta.get('mtime_ns') != stat.st_mtime_ns:
+			# the source was touched (e.g. checked out again), the
+			# sidecar is still valid if the contents are unchanged
+			if meta.get('sha256') != self.fileHash(path):
+				return None
+			meta['mtime_ns'] = stat.st_mtime_ns
+			self.writeFile(metafile, lambda f: f.write(json.dumps(meta).encode()))
+
+		try:
+			return np.load(npyfile, mmap_mode='r')
+		except (OSError, ValueError):
+			return None
+
+	def writeSidecar(self, path, stat, table):
+		"""
+		Saves the sidecar table and metadata files of a source file.
+		The table is written first, so that the metadata never refers
+		to a partially written table.
+
+		Parameters
+		----------
+		path : str
+			absolute path of the source file
+		stat : os.stat_result
+			status of the source file, before parsing
+		table : numpy.ndarray
+			parsed table
+		"""
+
+		npyfile, metafile = self.sidecarFiles(path)
+
+		try:
+			os.makedirs(self.cacheDir, exist_ok=True)
+		except OSError:
+			return
+
+		meta = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': self.fileHash(path),
+				'shape': list(table.shape)}
+
+		if self.writeFile(npyfile, lambda f: np.save(f, table)):
+			self.writeFile(metafile, lambda f: f.write(json.dumps(meta).encode()))
+
+	@staticmethod
+	def writeFile(filename, write):
+		"""
+		Writes a file atomically, through a temporary file which is
+		renamed over the target.
+
+		Parameters
+		----------
+		filename : str
+			target file
+		write : callable
+			function of the open binary file object which writes
+			the contents
+
+		Returns
+		----------
+		ans : bool
+			True if the file was written
+		"""
+
+		tmpfile = filename + '.' + str(os.getpid()) + '.tmp'
+
+		try:
+			with open(tmpfile, 'wb') as f:
+				write(f)
+			os.replace(tmpfile, filename)
+		except OSError:
+			if os.path.exists(tmpfile):
+				os.remove(tmpfile)
+			return False
+
+		return True
+
+	def openStore(self, storefile):
+		"""
+		Returns the AtmosphereStore of a store file, opened once
+		while the store file is unchanged.
+
+		Parameters
+		----------
+		storefile : str
+			absolute path of the store file
+
+		Returns
+		----------
+		ans : AtmosphereStore
+			store
+		"""
+
+		stat = os.stat(storefile)
+		signature = (stat.st_mtime_ns, stat.st_size)
+
+		entry = self.stores.get(storefile)
+		if entry is None or entry[0] != signature:
+			entry = (signature, AtmosphereStore(storefile))
+			self.stores[storefile] = entry
+
+		return entry[1]
+
+	def findStoreTable(self, datfile):
+		"""
+		Returns the store and table name which hold the table of a
+		source file, or (None, None) if the table must be parsed 
+		from the source file.
+
+		Parameters
+		----------
+		datfile : str
+			source file, or <storefile>/<table name>
+
+		Returns
+		----------
+		store : AtmosphereStore
+			store, or None
+		name : str
+			table name, or None
+		"""
+
+		path = os.path.abspath(datfile)
+		head, name = os.path.split(path)
+
+		if head.endswith(STORE_EXTENSION) and os.path.isfile(head):
+			store = self.openStore(head)
+			if name not in store.tables:
+				raise ValueError("Table " + name + " not found in atmosphere store " + head + ".")
+			return store, name
+
+		storefile = os.path.join(head, STORE_FILENAME)
+		if os.path.isfile(storefile):
+			store = self.openStore(storefile)
+			if name in store.tables and store.isCurrent(name, path):
+				return store, name
+
+		return None, None
+
+	def clear(self):
+		"""
+		Clears the in-memory cache and closes the stores. Sidecar 
+		files are kept.
+		"""
+
+		self.tables.clear()
+		self.stores.clear()
+
+
+# file name of the packed store of a directory, its extension, the
+# file signature, and the alignment of the header and column blocks
+STORE_FILENAME = 'atmstore.atmb'
+STORE_EXTENSION = '.atmb'
+STORE_MAGIC = b'AMATATMB'
+STORE_ALIGN = 64
+
+
+def readHeaderLine(datfile):
+	"""
+	Returns the last comment line before the data of a text table,
+	without the leading '#', or an empty string if there is none.
+
+	Parameters
+	----------
+	datfile : str
+		text file
+
+	Returns
+	----------
+	ans : str
+		column header line
+	"""
+
+	header = ''
+	with open(datfile, 'r') as f:
+		for line in f:
+			if line.startswith('#'):
+				header = line[1:].strip()
+			elif line.strip():
+				break
+
+	return header
+
+
+def columnRole(name):
+	"""
+	Returns the role of a column from its header name: 'height',
+	'temp', 'pres', 'dens', 'sonic', or for GRAM Monte Carlo output
+	'DENSLO', 'DENSAV', 'DENSHI', 'DENSTOT', or None if unknown.
+
+	Parameters
+	----------
+	name : str
+		column header name, e.g. 'rho, kgm3' or 'DENSAV'
+
+	Returns
+	----------
+	ans : str
+		column role, or None
+	"""
+
+	key = re.sub('[^a-z]', '', name.lower())
+
+	rules = [('^(varx|hgtkm|heightkm|h|hm|hkm|zm|zkm)$', 'height'),
+			 ('^(denslo|lowdens)', 'DENSLO'),
+			 ('^densav', 'DENSAV'),
+			 ('^(denshi|highdens)', 'DENSHI'),
+			 ('^(denstot|perturbeddens)', 'DENSTOT'),
+			 ('^(rho|dens)', 'dens'),
+			 ('^(t$|tk$|temp)', 'temp'),
+			 ('^(p$|pnm|ppa|pres)', 'pres'),
+			 ('^(a$|ams$|speedofsound)', 'sonic')]
+
+	for pattern, role in rules:
+		if re.match(pattern, key):
+			return role
+
+	return None
+
+
+def inferColumns(header, ncols):
+	"""
+	Infers the column names, roles and height units of a table from
+	its header line. Names are split on whitespace, or if that does 
+	not give ncols names, on tabs and runs of spaces. Height units 
+	are 'km' for the GRAM Monte Carlo height (Var_X) and names 
+	containing km, and 'm' otherwise.
+
+	Parameters
+	----------
+	header : str
+		column header line
+	ncols : int
+		number of columns of the table
+
+	Returns
+	----------
+	names : list
+		column names
+	roles : list
+		column roles, see columnRole()
+	heightUnits : str
+		'km' or 'm', None if no height column is found
+	"""
+
+	names = header.split()
+	if len(names) != ncols:
+		names = [name for name in re.split(r'\s*\t\s*|\s{2,}', header) if name]
+	if len(names) != ncols:
+		names = ['col' + str(j) for j in range(ncols)]
+
+	roles = [columnRole(name) for name in names]
+
+	# mean density of a Monte Carlo table
+	if 'DENSLO' in roles and 'dens' in roles and 'DENSAV' not in roles:
+		roles[roles.index('dens')] = 'DENSAV'
+
+	heightUnits = None
+	if 'height' in roles:
+		name = names[roles.index('height')].lower()
+		heightUnits = 'km' if ('km' in name or name == 'var_x') else 'm'
+
+	return names, roles, heightUnits
+
+
+def columnPeriod(column):
+	"""
+	Returns the smallest period p, dividing the column length, with
+	which the column repeats its first p values, e.g. the height 
+	column of a GRAM Monte Carlo table repeats for every profile.
+
+	Parameters
+	----------
+	column : numpy.ndarray
+		column values
+
+	Returns
+	----------
+	ans : int
+		period, len(column) if the column does not repeat
+	"""
+
+	n = len(column)
+	for p in range(1, n//2 + 1):
+		if n % p == 0 and column[p] == column[0] and \
+				np.array_equal(column.reshape(-1, p), np.broadcast_to(column[0:p], (n//p, p))):
+			return p
+
+	return n
+
+
+class AtmosphereTable:
+	"""
+	The AtmosphereTable class is a read-only table of an
+	AtmosphereStore. Each column is a memory-mapped block of the
+	store, which is tiled to the table length on first access if
+	the column repeats. Indexing table[:, j] returns column j, as
+	for the array returned by np.loadtxt().
+
+	Attributes
+	----------
+	name : str
+		table name, file name of the source table
+	rows : int
+		number of rows
+	names : list
+		column names
+	roles : list
+		column roles, see columnRole()
+	heightUnits : str
+		units of the height column, 'km' or 'm'
+	blocks : list
+		stored values of each column, numpy.ndarray
+	columns : dict
+		columns expanded to the table length, by column index
+	"""
+
+	def __init__(self, name, rows, names, roles, heightUnits, blocks):
+		self.name = name
+		self.rows = rows
+		self.names = names
+		self.roles = roles
+		self.heightUnits = heightUnits
+		self.blocks = blocks
+		self.columns = {}
+
+	@property
+	def shape(self):
+		return (self.rows, len(self.blocks))
+
+	def __len__(self):
+		return self.rows
+
+	def column(self, j):
+		"""
+		Returns column j of the table.
+
+		Parameters
+		----------
+		j : int
+			column index
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			column values, read-only
+		"""
+
+		block = self.blocks[j]
+		if len(block) == self.rows:
+			return block
+
+		if j not in self.columns:
+			column = np.tile(block, self.rows//len(block))
+			column.flags.writeable = False
+			self.columns[j] = column
+
+		return self.columns[j]
+
+	def columnIndex(self, role):
+		"""
+		Returns the index of the column with a role.
+
+		Parameters
+		----------
+		role : str
+			column role, see columnRole()
+
+		Returns
+		----------
+		ans : int
+			column index
+		"""
+
+		return self.roles.index(role)
+
+	def __getitem__(self, key):
+		if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], slice) and \
+				key[0] == slice(None) and isinstance(key[1], (int, np.integer)):
+			return self.column(key[1])
+
+		return np.asarray(self)[key]
+
+	def __array__(self, dtype=None, copy=None):
+		ans = np.empty(self.shape, dtype=float, order='F')
+		for j in range(len(self.blocks)):
+			ans[:, j] = self.column(j)
+
+		return ans if dtype is None else ans.astype(dtype)
+
+
+class AtmosphereStore:
+	"""
+	The AtmosphereStore class reads a packed columnar store of
+	atmosphere tables, written by packAtmosphereStore().
+
+	The store file holds STORE_MAGIC, the header length (uint64,
+	little endian) and a JSON header, followed by the column blocks
+	(float64, little endian), each aligned to STORE_ALIGN bytes. A
+	column which repeats with a period (see columnPeriod()) stores 
+	one period only. The header records for each table the source 
+	file signature (size, mtime, SHA-256), the height units, and 
+	for each column its name, role, block offset and length.
+
+	Attributes
+	----------
+	storefile : str
+		store file
+	tables : dict
+		table header, by table name
+	data : numpy.memmap
+		memory-mapped column blocks, float64
+	"""
+
+	def __init__(self, storefile):
+		"""
+		Opens the store file and memory-maps the column blocks.
+
+		Parameters
+		----------
+		storefile : str
+			store file
+		"""
+
+		self.storefile = storefile
+
+		with open(storefile, 'rb') as f:
+			if f.read(len(STORE_MAGIC)) != STORE_MAGIC:
+				raise ValueError(storefile + " is not an atmosphere store.")
+			headerLength = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+			header = json.loads(f.read(headerLength).decode())
+
+		self.tables = header['tables']
+		self.data = np.memmap(storefile, dtype='<f8', mode='r', offset=header['dataOffset'])
+
+		self.tableObjects = {}
+		self.verified = {}
+
+	def table(self, name):
+		"""
+		Returns a table of the store.
+
+		Parameters
+		----------
+		name : str
+			table name
+
+		Returns
+		----------
+		ans : AtmosphereTable
+			table
+		"""
+
+		if name not in self.tableObjects:
+			meta = self.tables[name]
+			blocks = [self.data[c['offset']:c['offset'] + c['length']] for c in meta['columns']]
+			self.tableObjects[name] = AtmosphereTable(name, meta['rows'], [c['name'] for c in meta['columns']],
+													  [c['role'] for c in meta['columns']], meta['heightUnits'],
+													  blocks)
+
+		return self.tableObjects[name]
+
+	def isCurrent(self, name, datfile):
+		"""
+		Checks if the stored table is an up-to-date copy of a source
+		file: the source file was removed after packing, or has the
+		recorded size and modification time, or else hash.
+
+		Parameters
+		----------
+		name : str
+			table name
+		datfile : str
+			source file
+
+		Returns
+		----------
+		ans : bool
+			True if the stored table can be used for the source file
+		"""
+
+		if not os.path.exists(datfile):
+			return True
+
+		source = self.tables[name]['source']
+		stat = os.stat(datfile)
+		if stat.st_size != source['size']:
+			return False
+		if stat.st_mtime_ns == source['mtime_ns']:
+			return True
+
+		signature = (stat.st_mtime_ns, stat.st_size)
+		if self.verified.get(name) != signature:
+			if AtmosphereCache.fileHash(datfile) != source['sha256']:
+				return False
+			self.verified[name] = signature
+
+		return True
+
+
+def packAtmosphereStore(storefile, datfiles, columns=None):
+	"""
+	Packs text atmosphere tables into a columnar store file, see 
+	AtmosphereStore. Tables are named by the file name of the 
+	source. The column names, roles and height units are inferred
+	from the header line of each table, unless given in columns.
+
+	Parameters
+	----------
+	storefile : str
+		store file to write
+	datfiles : list
+		text table files
+	columns : dict, optional
+		(names, roles, heightUnits) by table name, overrides the
+		inferred column metadata, see inferColumns()
+
+	Returns
+	----------
+	ans : AtmosphereStore
+		the written store
+	"""
+
+	tables = {}
+	blocks = []
+	offset = 0
+
+	for datfile in datfiles:
+		data = np.loadtxt(datfile, ndmin=2)
+		name = os.path.basename(datfile)
+		stat = os.stat(datfile)
+
+		if columns is not None and name in columns:
+			names, roles, heightUnits = columns[name]
+		else:
+			names, roles, heightUnits = inferColumns(readHeaderLine(datfile), data.shape[1])
+
+		meta = {'source': {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+						   'sha256': AtmosphereCache.fileHash(datfile)},
+				'rows': data.shape[0], 'heightUnits': heightUnits, 'columns': []}
+
+		for j in range(data.shape[1]):
+			block = data[0:columnPeriod(data[:, j]), j]
+			meta['columns'].append({'name': names[j], 'role': roles[j], 'offset': offset, 'length': len(block)})
+			blocks.append(block)
+			offset = offset + len(block)
+			# pad each block to the alignment
+			offset = offset + (-offset) % (STORE_ALIGN//8)
+
+		tables[name] = meta
+
+	# the data offset depends on the header length, which is
+	# computed with a placeholder of the same width
+	header = {'version': 1, 'dataOffset': 0, 'tables': tables}
+	headerLength = len(json.dumps(header).encode()) + 32
+	dataOffset = len(STORE_MAGIC) + 8 + headerLength
+	dataOffset = dataOffset + (-dataOffset) % STORE_ALIGN
+	header['dataOffset'] = dataOffset
+	headerBytes = json.dumps(header).encode().ljust(headerLength)
+
+	data = np.zeros(offset)
+	for block, column in zip(blocks, [c for name in tables for c in tables[name]['columns']]):
+		data[column['offset']:column['offset'] + column['length']] = block
+
+	def write(f):
+		f.write(STORE_MAGIC)
+		f.write(np.array([headerLength], dtype='<u8').tobytes())
+		f.write(headerBytes)
+		f.write(bytes(dataOffset - len(STORE_MAGIC) - 8 - headerLength))
+		f.write(data.astype('<f8').tobytes())
+
+	if not AtmosphereCache.writeFile(storefile, write):
+		raise OSError("Cannot write atmosphere store " + storefile + ".")
+
+	return AtmosphereStore(storefile)
+
+
+def packAtmosphereTree(root, extensions=('.dat', '.txt')):
+	"""
+	Packs the text atmosphere tables of each directory under root
+	(e.g. the atmdata directory, one directory per planet) into a
+	store file STORE_FILENAME in that directory. The tables are then
+	read from the store by Planet.loadAtmosphereModel() and the 
+	Monte Carlo density file loaders, with the same arguments.
+
+	Parameters
+	----------
+	root : str
+		root directory
+	extensions : tuple, optional
+		file extensions of the text tables, default=('.dat', '.txt')
+
+	Returns
+	----------
+	ans : list
+		written store files
+	"""
+
+	storefiles = []
+
+	for dirpath, dirnames, filenames in sorted(os.walk(root)):
+		datfiles = [os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(extensions)]
+		if len(datfiles) > 0:
+			storefile = os.path.join(dirpath, STORE_FILENAME)
+			packAtmosphereStore(storefile, datfiles)
+			storefiles.append(storefile)
+
+	return storefiles
+
+
+def defaultCacheDir():
+	"""
+	Returns the default directory of the sidecar files,
+	$XDG_CACHE_HOME/AMAT/atmcache, or ~/.cache/AMAT/atmcache if
+	XDG_CACHE_HOME is not set.
+
+	Returns
+	----------
+	ans : str
+		cache directory
+	"""
+
+	root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+	return os.path.join(root, 'AMAT', 'atmcache')
+
+
+cache = AtmosphereCache()
+
+
+def loadAtmosphereTable(datfile):
+	"""
+	Returns the numeric table of a whitespace delimited atmosphere
+	data file, as np.loadtxt(datfile), using the module level cache.
+
+	Parameters
+	----------
+	datfile : str
+		source file
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		table, shape (rows, columns), read-only
+	"""
+
+	return cache.load(datfile)
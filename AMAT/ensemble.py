@@ -0,0 +1,398 @@
+# SOURCE FILENAME : ensemble.py
+# DATE CREATED    : 10/18/2026, 09:12 MT
+# DATE MODIFIED   : 10/18/2026, 15:10 MT
+# REMARKS         : Propogate an ensemble of N atmospheric entry
+#                   trajectories as a single vectorized (7, N) state.
+
+import numpy as np
+from scipy.integrate import odeint
+from scipy.integrate import cumulative_trapezoid
+
+from AMAT.vehicle import Vehicle
+
+
+class Ensemble:
+	"""
+	The Ensemble class propogates N entry trajectories in the same
+	planetary atmosphere as a single vectorized state, with
+	member-wise initial states, bank angles, ballistic coefficients,
+	lift-to-drag ratios and nose radii.
+
+	The members are integrated together in chunks. After each chunk,
+	members which have skipped out or descended below the trap in
+	altitude are removed from the integrated state, so the solver
+	only advances the members which are still flying.
+
+	The solver controls the RMS error over all members, so its 
+	tolerance is divided by the square root of the number of 
+	members in the chunk. The local error of each member is then
+	within the tolerance set by setSolverParams(), as for a single
+	Vehicle.
+	With tol=1E-10, the members of the Venus aerocapture ensemble in
+	tests/test_ensemble.py agree with Vehicle.propogateEntry() to 
+	1E-5 km in altitude and 1E-3 J/cm2 in heat load.
+
+	The user defined CD(Mach) option of Vehicle is not supported.
+
+	Attributes
+	----------
+	planetObj : planet.Planet
+		planet object associated with the ensemble
+	N : int
+		number of members in the ensemble
+	beta : numpy.ndarray
+		ballistic coefficient of each member, kg/m2
+	LD : numpy.ndarray
+		lift-to-drag ratio of each member
+	RN : numpy.ndarray
+		nose radius of each member, m
+	vehicle : vehicle.Vehicle
+		vehicle object with unit mass and reference area, used to
+		post-process the trajectory of each member
+	h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg,
+	drange0_km, heatLoad0 : numpy.ndarray
+		initial state of each member, same units as
+		Vehicle.setInitialState()
+	tol : float
+		solver tolerance of each member
+	chunkSteps : int
+		number of output time steps integrated between checks for
+		terminated members
+	index : numpy.ndarray
+		array index of the event location of each member
+	exitflag : numpy.ndarray
+		exitflag of each member, see Vehicle.classifyTrajectory()
+	tc, rc, thetac, phic, vc, psic, gammac, drangec : list
+		truncated trajectory of each member, SI units
+	t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc,
+	gamma_degc, drange_kmc : list
+		truncated trajectory of each member, plot units
+	acc_net_g, acc_drag_g, dyn_pres_atm, stag_pres_atm, q_stag_con,
+	q_stag_rad, q_stag_total, heatload : list
+		derived quantities along the trajectory of each member,
+		same units as Vehicle.propogateEntry()
+	"""
+
+	def __init__(self, planetObj, beta, LD, RN):
+		"""
+		Initializes the ensemble with the vehicle parameters of
+		each member. Scalar values are applied to all members.
+
+		Parameters
+		----------
+		planetObj : planet.Planet
+			planet object associated with the ensemble
+		beta : numpy.ndarray
+			ballistic coefficient of each member, kg/m2
+		LD : numpy.ndarray
+			lift-to-drag ratio of each member
+		RN : numpy.ndarray
+			nose radius of each member, m
+		"""
+
+		beta, LD, RN = np.broadcast_arrays(np.atleast_1d(np.asarray(beta, dtype=float)),
+										   np.atleast_1d(np.asarray(LD, dtype=float)),
+										   np.atleast_1d(np.asarray(RN, dtype=float)))
+
+		self.planetObj = planetObj
+		self.N = len(beta)
+		self.beta = beta.copy()
+		self.LD = LD.copy()
+		self.RN = RN.copy()
+
+		self.vehicle = Vehicle('Ensemble', 1.0, self.beta[0], self.LD[0], 1.0, 0.0, self.RN[0], planetObj)
+
+		# non-dimensional drag and lift coefficients Abar*CD, Abar*CL
+		self.kD = self.vehicle.Abar / self.beta
+		self.kL = self.kD * self.LD
+
+		self.tol = None
+		self.chunkSteps = 200
+
+		self.index = None
+		self.exitflag = None
+
+	def setInitialState(self, h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg, drange0_km, heatLoad0):
+		"""
+		Set initial state of each member. Scalar values are applied
+		to all members, and the vehicle parameters are broadcast
+		against the initial state arrays.
+
+		Parameters
+		----------
+		h0_km : numpy.ndarray
+			initial altitude, km
+		theta0_deg : numpy.ndarray
+			initial longitude, degrees
+		phi0_deg : numpy.ndarray
+			initial latitude, degrees
+		v0_kms : numpy.ndarray
+			initial speed (planet-relative), km/s
+		psi0_deg : numpy.ndarray
+			initial heading, degrees
+		gamma0_deg : numpy.ndarray
+			initial flight-path angle, degrees
+		drange0_km : numpy.ndarray
+			initial downrange, km
+		heatLoad0 : numpy.ndarray
+			initial heatload, J/cm2
+		"""
+
+		state = [np.array(x, dtype=float) for x in np.broadcast_arrays(h0_km, theta0_deg, phi0_deg, v0_kms,
+																		 psi0_deg, gamma0_deg, drange0_km, heatLoad0,
+																		 self.beta, self.LD, self.RN)]
+
+		self.h0_km, self.theta0_deg, self.phi0_deg, self.v0_kms, \
+			self.psi0_deg, self.gamma0_deg, self.drange0_km, self.heatLoad0, \
+			self.beta, self.LD, self.RN = state
+
+		self.N = len(self.beta)
+		self.kD = self.vehicle.Abar / self.beta
+		self.kL = self.kD * self.LD
+
+	def setSolverParams(self, tol):
+		"""
+		Set the solver parameters.
+
+		Parameters
+		----------
+		tol : float
+			solver tolerance, currently both abstol and reltol
+			are set to this value
+		"""
+		self.tol = tol
+
+	def EOM(self, y, t, kD, kL, cos_delta, sin_delta):
+		"""
+		Vectorized EoMs of the active members, see Vehicle.EOM().
+
+		The state of member j is stored in y[7*j : 7*j+7], so that
+		the Jacobian is block diagonal and can be treated as banded
+		by the solver.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			state vector of the active members
+		t : float
+			non-dimensional time
+		kD : numpy.ndarray
+			Abar*CD of the active members
+		kL : numpy.ndarray
+			Abar*CL of the active members
+		cos_delta : numpy.ndarray
+			cosine of the bank angle of the active members
+		sin_delta : numpy.ndarray
+			sine of the bank angle of the active members
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			derivate vector of state, process equations
+		"""
+
+		planetObj = self.planetObj
+		rbar, theta, phi, vbar, psi, gamma, drangebar = y.reshape(-1, 7).T
+
+		sin_phi = np.sin(phi)
+		cos_phi = np.cos(phi)
+		sin_gamma = np.sin(gamma)
+		cos_gamma = np.cos(gamma)
+		sin_psi = np.sin(psi)
+		cos_psi = np.cos(psi)
+		OMEGAbar = planetObj.OMEGAbar
+
+		qbar = 0.5*planetObj.rhobarvectorized(rbar)*vbar**2.0
+		a_sbar = -1.0*qbar*kD
+		Lbar = qbar*kL
+		a_nbar = Lbar*cos_delta
+		a_wbar = Lbar*sin_delta
+
+		rbar4 = rbar**4.0
+		rbar5 = rbar**5.0
+		grbar = -1.0/(rbar**2.0) \
+				+ (1.5*planetObj.J2/rbar4)*(3.0*sin_phi*sin_phi - 1.0) \
+				+ (2.0*planetObj.J3/rbar5)*(5.0*sin_phi**3.0 - 3.0*sin_phi)
+		gphibar = (-3.0*planetObj.J2/rbar4)*sin_phi*cos_phi \
+				+ (1.5*planetObj.J3/rbar5)*cos_phi*(1.0 - 5.0*sin_phi*sin_phi)
+
+		gnbar = cos_gamma*grbar - sin_gamma*sin_psi*gphibar
+		gsbar = sin_gamma*grbar + cos_gamma*sin_psi*gphibar
+		gwbar = cos_psi*gphibar
+
+		cos_gamma_reg = cos_gamma + 1e-2
+		cfvbar = OMEGAbar**2.0*rbar*cos_phi*(sin_gamma*cos_phi - cos_gamma*sin_phi*sin_psi)
+		cfpsibar = (-1.0*OMEGAbar**2.0*rbar/(vbar*cos_gamma_reg))*sin_phi*cos_phi*cos_psi
+		cfgammabar = (OMEGAbar**2.0*rbar/vbar)*cos_phi*(cos_gamma*cos_phi + sin_gamma*sin_phi*sin_psi)
+		copsibar = 2.0*OMEGAbar*((sin_gamma/cos_gamma_reg)*cos_phi*sin_psi - sin_phi)
+		cogammabar = 2.0*OMEGAbar*cos_phi*cos_psi
+
+		dydt = np.empty((len(rbar), 7))
+		dydt[:, 0] = vbar*sin_gamma
+		dydt[:, 1] = (vbar*cos_gamma*cos_psi)/(rbar*cos_phi)
+		dydt[:, 2] = (vbar*cos_gamma*sin_psi)/rbar
+		dydt[:, 3] = a_sbar + gsbar + cfvbar
+		dydt[:, 4] = (a_wbar + gwbar)/(vbar*cos_gamma_reg) \
+					- (1.0*vbar/rbar)*cos_gamma*cos_psi*np.tan(phi) \
+					+ cfpsibar + copsibar
+		dydt[:, 5] = (a_nbar + gnbar)/vbar + (vbar/rbar)*cos_gamma + cfgammabar + cogammabar
+		dydt[:, 6] = vbar*cos_gamma
+
+		return dydt.ravel()
+
+	def solveTrajectories(self, t_sec, dt, delta):
+		"""
+		Propogates the non-dimensional state of all members,
+		removing members from the integration once they have
+		skipped out or descended below the trap in altitude.
+
+		Parameters
+		----------
+		t_sec : float
+			max. propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta : numpy.ndarray
+			bank angle of each member, rad
+
+		Returns
+		----------
+		tbar : numpy.ndarray
+			nondimensional time at which solution is computed
+		xbar : list
+			non-dimensional solution of each member, one
+			numpy.ndarray of shape (n, 7) per member
+		"""
+
+		planetObj = self.planetObj
+
+		h0 = self.h0_km*1.0E3
+		r0 = planetObj.computeR(h0)
+		Y = np.vstack(planetObj.nonDimState(r0, self.theta0_deg*np.pi/180.0, self.phi0_deg*np.pi/180.0,
+											self.v0_kms*1.0E3, self.psi0_deg*np.pi/180.0,
+											self.gamma0_deg*np.pi/180.0, self.drange0_km*1E3))
+
+		# same time grid as Vehicle.solveTrajectory()
+		tbar = np.arange(0, (t_sec+dt)/planetObj.tau, dt/planetObj.tau)
+
+		rbar_skip = (planetObj.RP + planetObj.h_skip)/planetObj.RP
+		rbar_trap = (planetObj.RP + planetObj.h_trap)/planetObj.RP
+
+		cos_delta = np.cos(delta)
+		sin_delta = np.sin(delta)
+
+		chunks = [[Y[:, i].copy().reshape(1, 7)] for i in range(self.N)]
+		active = np.arange(self.N)
+		k0 = 0
+
+		while active.size > 0 and k0 < len(tbar) - 1:
+			k1 = min(k0 + self.chunkSteps, len(tbar) - 1)
+
+			# the solver controls the RMS error over all members, scale
+			# the tolerance so that it bounds the error of each member
+			tol = self.tol/np.sqrt(active.size)
+
+			y0 = Y[:, active].T.ravel()
+			sol = odeint(self.EOM, y0, tbar[k0:k1+1], rtol=tol, atol=tol, ml=6, mu=6,
+						 args=(self.kD[active], self.kL[active], cos_delta[active], sin_delta[active]))
+			sol = sol.reshape(k1 - k0 + 1, active.size, 7)
+
+			for j, i in enumerate(active):
+				chunks[i].append(sol[1:, j, :])
+			Y[:, active] = sol[-1].T
+
+			# mask out members which skipped out or trapped in
+			rbar = sol[1:, :, 0]
+			done = np.any(rbar > rbar_skip, axis=0) | np.any(rbar < rbar_trap, axis=0)
+			active = active[~done]
+			k0 = k1
+
+		xbar = [np.vstack(chunks[i]) for i in range(self.N)]
+
+		return tbar, xbar
+
+	def propogateEntry(self, t_sec, dt, delta_deg):
+		"""
+		Propogates all members for a specified time, and computes
+		the same truncated trajectory and derived quantities for
+		each member as Vehicle.propogateEntry(). The heat load of 
+		each member starts at its heatLoad0, as in 
+		Vehicle.propogateEntry2().
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : numpy.ndarray
+			bank angle command of each member, deg
+		"""
+
+		delta = np.broadcast_to(np.asarray(delta_deg, dtype=float), (self.N,))*np.pi/180.0
+
+		tbar, xbar = self.solveTrajectories(t_sec, dt, delta)
+
+		self.index = np.zeros(self.N, dtype=int)
+		self.exitflag = np.zeros(self.N)
+
+		self.tc, self.rc, self.thetac, self.phic, self.vc, self.psic, self.gammac, self.drangec = \
+			[], [], [], [], [], [], [], []
+		self.t_minc, self.h_kmc, self.v_kmsc, self.phi_degc, self.psi_degc, self.theta_degc, \
+			self.gamma_degc, self.drange_kmc = [], [], [], [], [], [], [], []
+		self.acc_net_g, self.acc_drag_g, self.dyn_pres_atm, self.stag_pres_atm = [], [], [], []
+		self.q_stag_con, self.q_stag_rad, self.q_stag_total, self.heatload = [], [], [], []
+
+		vehicle = self.vehicle
+
+		for i in range(self.N):
+			# configure the post-processing vehicle for member i
+			vehicle.beta = self.beta[i]
+			vehicle.LD = self.LD[i]
+			vehicle.RN = self.RN[i]
+			vehicle.CD = vehicle.mass / (vehicle.beta*vehicle.A)
+			vehicle.CL = vehicle.LD * vehicle.CD
+
+			x = xbar[i]
+			t, r, theta, phi, v, psi, gamma, drange = \
+				self.planetObj.dimensionalize(tbar[0:len(x)], x[:, 0], x[:, 1], x[:, 2], x[:, 3], x[:, 4], x[:, 5],
+											  x[:, 6])
+
+			index, exitflag = vehicle.classifyTrajectory(r)
+			tc, rc, thetac, phic, vc, psic, gammac, drangec = \
+				vehicle.truncateTrajectory(t, r, theta, phi, v, psi, gamma, drange, index)
+
+			self.index[i] = index
+			self.exitflag[i] = exitflag
+
+			self.tc.append(tc)
+			self.rc.append(rc)
+			self.thetac.append(thetac)
+			self.phic.append(phic)
+			self.vc.append(vc)
+			self.psic.append(psic)
+			self.gammac.append(gammac)
+			self.drangec.append(drangec)
+
+			t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km = \
+				vehicle.convertToPlotUnits(tc, rc, vc, phic, psic, thetac, gammac, drangec)
+
+			self.t_minc.append(t_min)
+			self.h_kmc.append(h_km)
+			self.v_kmsc.append(v_kms)
+			self.phi_degc.append(phi_deg)
+			self.psi_degc.append(psi_deg)
+			self.theta_degc.append(theta_deg)
+			self.gamma_degc.append(gamma_deg)
+			self.drange_kmc.append(drange_km)
+
+			self.acc_net_g.append(vehicle.computeAccelerationLoad(tc, rc, thetac, phic, vc, index, delta[i]))
+			self.acc_drag_g.append(vehicle.computeAccelerationDrag(tc, rc, thetac, phic, vc, index, delta[i]))
+			self.dyn_pres_atm.append(vehicle.computeDynPres(rc, vc)/1.01325E5)
+			self.stag_pres_atm.append(vehicle.computeStagPres(rc, vc)/1.01325E5)
+
+			q_stag_con, q_stag_rad = vehicle.qStagHeating(rc, vc, vehicle.RN)
+			self.q_stag_con.append(q_stag_con)
+			self.q_stag_rad.append(q_stag_rad)
+			self.q_stag_total.append(q_stag_con + q_stag_rad)
+			self.heatload.append(cumulative_trapezoid(q_stag_con + q_stag_rad, tc, initial=0) + self.heatLoad0[i])
@@ -0,0 +1,910 @@
+# SOURCE FILENAME : feasibility.py
+# DATE CREATED    : 10/18/2026, 10:05 MT
+# DATE MODIFIED   : 10/18/2026, 20:10 MT
+# REMARKS         : Compute aerocapture feasibility charts (corridor
+#                   limits and theoretical corridor width) over a grid
+#                   of arrival V_infty and L/D or ballistic coefficient
+#                   ratio, warm starting each cell from its neighbours.
+#                   Cells can be spread over a process pool, with each
+#                   finished cell appended to a results file so that an
+#                   interrupted run can be resumed.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from AMAT.vehicle import Vehicle
+
+
+class FeasibilityGrid:
+	"""
+	The FeasibilityGrid class computes the overshoot limit,
+	undershoot limit and theoretical corridor width (TCW) over a
+	grid of arrival V_infty and vehicle L/D (lift modulation) or
+	ballistic coefficient ratio (drag modulation), as used to make
+	aerocapture feasibility charts.
+
+	The grid is walked row by row, alternating direction between
+	rows, so that every cell except the first has a solved
+	neighbour. The corridor limit search for a cell is started from
+	a narrow bracket around the limit predicted from its solved
+	neighbours. The bracket is widened if it does not contain a
+	sign change, up to the user specified bounds.
+
+	computeFeasibilityParallel() solves the cells on a process pool
+	in the same order, each cell warm started from the neighbours
+	finished by the time it is submitted. Every finished cell is
+	appended to a results file, and cells already in the file are
+	skipped when the run is restarted.
+
+	Attributes
+	----------
+	planetObj : planet.Planet
+		planet object associated with the vehicles
+	vehicleID : str
+		identifier string for the vehicles
+	mass : float
+		vehicle mass, kg
+	beta : float
+		vehicle ballistic coefficient, kg/m2. For drag modulation,
+		the small ballistic coefficient beta1.
+	A : float
+		vehicle reference aerodynamic area, m2
+	RN : float
+		vehicle nose-radius, m
+	h0_km : float
+		atmospheric interface altitude, km
+	mode : str
+		'lift' for a V_infty x L/D grid, 'drag' for a
+		V_infty x beta ratio grid
+	vinf_kms_array : numpy.ndarray
+		arrival V_infty grid, km/s
+	v0_kms_array : numpy.ndarray
+		atmospheric interface speed, km/s
+	LD_array : numpy.ndarray
+		L/D grid, lift modulation only
+	betaRatio_array : numpy.ndarray
+		ballistic coefficient ratio grid, drag modulation only
+	param_array : numpy.ndarray
+		second grid axis, LD_array or betaRatio_array
+	t_sec : float
+		propogation time, seconds
+	dt : float
+		max. time step, seconds
+	gamma0_deg_guess_low : float
+		lower bound for the guess of the limit FPA, deg
+	gamma0_deg_guess_high : float
+		upper bound for the guess of the limit FPA, deg
+	gamma_deg_tol : float
+		desired accuracy for computation of the limits, deg
+	targetApopasisAltitude_km : float
+		target apoapsis altitude , km
+	solverTol : float
+		ODE solver tolerance
+	method : str
+		root finding method, see Vehicle.findCorridorLimit()
+	planetRotation : bool
+		if True, include the effect of planet rotation on the exit
+		orbit as in the Vehicle *2 methods
+	warmStart : bool
+		if True, seed each cell with a bracket from its neighbours
+	bracketWidth : float
+		half width of the initial warm start bracket, deg
+	widenFactor : float
+		factor by which the warm start bracket half width is
+		multiplied when it does not contain the limit
+	overShootLimit_array : numpy.ndarray
+		overshoot limit EFPA, deg
+	underShootLimit_array : numpy.ndarray
+		undershoot limit EFPA, deg
+	exitflag_os_array : numpy.ndarray
+		overshoot limit exit flag, 1.0 = found, 0.0 = not found
+	exitflag_us_array : numpy.ndarray
+		undershoot limit exit flag, 1.0 = found, 0.0 = not found
+	TCW_array : numpy.ndarray
+		theoretical corridor width, deg
+	acc_net_g_max_array : numpy.ndarray
+		max. deceleration over the overshoot and undershoot limit
+		trajectories, Earth g
+	stag_pres_atm_max_array : numpy.ndarray
+		max. stagnation pressure over the overshoot and undershoot
+		limit trajectories, atm
+	q_stag_total_max_array : numpy.ndarray
+		max. stagnation-point heat rate over the overshoot and
+		undershoot limit trajectories, W/cm2
+	heatload_max_array : numpy.ndarray
+		max. stagnation-point heat load over the overshoot and
+		undershoot limit trajectories, J/cm2
+	peakLoads : bool
+		True if the peak load arrays were computed in the last run
+	evaluations : int
+		total number of trajectory propogations in the limit
+		searches of the last call to computeFeasibility()
+	"""
+
+	def __init__(self, planetObj, vehicleID, mass, beta, A, RN, h0_km):
+		"""
+		Initializes the FeasibilityGrid object.
+
+		Parameters
+		----------
+		planetObj : planet.Planet
+			planet object associated with the vehicles
+		vehicleID : str
+			identifier string for the vehicles
+		mass : float
+			vehicle mass, kg
+		beta : float
+			vehicle ballistic coefficient, kg/m2. For drag modulation,
+			the small ballistic coefficient beta1.
+		A : float
+			vehicle reference aerodynamic area, m2
+		RN : float
+			vehicle nose-radius, m
+		h0_km : float
+			atmospheric interface altitude, km
+		"""
+
+		self.planetObj = planetObj
+		self.vehicleID = vehicleID
+		self.mass = mass
+		self.beta = beta
+		self.A = A
+		self.RN = RN
+		self.h0_km = h0_km
+
+		self.mode = None
+		self.LD_array = None
+		self.betaRatio_array = None
+
+		self.solverTol = 1E-6
+		self.method = 'bisection'
+		self.planetRotation = False
+
+		self.warmStart = True
+		self.bracketWidth = 0.5
+		self.widenFactor = 4.0
+
+		self.peakLoads = False
+		self.evaluations = 0
+
+	# order of the values computed for each grid cell
+	cellFields = ['overShootLimit', 'exitflag_os', 'underShootLimit', 'exitflag_us',
+				  'acc_net_g_max', 'stag_pres_atm_max', 'q_stag_total_max', 'heatload_max']
+
+	def setGrid(self, vinf_kms_array, param_array):
+		"""
+		Sets the grid axes, the atmospheric interface speed and
+		allocates the result arrays.
+
+		Parameters
+		----------
+		vinf_kms_array : numpy.ndarray
+			arrival V_infty grid, km/s
+		param_array : numpy.ndarray
+			L/D or beta ratio grid
+		"""
+
+		self.vinf_kms_array = np.asarray(vinf_kms_array, dtype=float)
+		self.param_array = np.asarray(param_array, dtype=float)
+
+		# entry speed at the atmospheric interface from the
+		# hyperbolic approach orbit
+		self.v0_kms_array = np.sqrt((self.vinf_kms_array*1E3)**2.0 +
+									2*self.planetObj.GM/(self.planetObj.RP + self.h0_km*1.0E3))/1.0E3
+
+		shape = (len(self.vinf_kms_array), len(self.param_array))
+
+		self.overShootLimit_array = np.zeros(shape)
+		self.underShootLimit_array = np.zeros(shape)
+		self.exitflag_os_array = np.zeros(shape)
+		self.exitflag_us_array = np.zeros(shape)
+		self.TCW_array = np.zeros(shape)
+
+		self.acc_net_g_max_array = np.zeros(shape)
+		self.stag_pres_atm_max_array = np.zeros(shape)
+		self.q_stag_total_max_array = np.zeros(shape)
+		self.heatload_max_array = np.zeros(shape)
+
+	def setLiftModulationGrid(self, vinf_kms_array, LD_array):
+		"""
+		Sets up a V_infty x L/D grid for lift modulation
+		aerocapture. The overshoot limit is computed with full lift
+		down, the undershoot limit with full lift up.
+
+		Parameters
+		----------
+		vinf_kms_array : numpy.ndarray
+			arrival V_infty grid, km/s
+		LD_array : numpy.ndarray
+			L/D grid
+		"""
+
+		self.mode = 'lift'
+		self.setGrid(vinf_kms_array, LD_array)
+		self.LD_array = self.param_array
+		self.betaRatio_array = None
+
+	def setDragModulationGrid(self, vinf_kms_array, betaRatio_array):
+		"""
+		Sets up a V_infty x beta ratio grid for drag modulation
+		aerocapture. The overshoot limit is computed with the
+		ballistic coefficient beta, the undershoot limit with
+		beta*betaRatio.
+
+		Parameters
+		----------
+		vinf_kms_array : numpy.ndarray
+			arrival V_infty grid, km/s
+		betaRatio_array : numpy.ndarray
+			ballistic coefficient ratio grid
+		"""
+
+		self.mode = 'drag'
+		self.setGrid(vinf_kms_array, betaRatio_array)
+		self.betaRatio_array = self.param_array
+		self.LD_array = None
+
+	def setSearchParams(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+						targetApopasisAltitude_km, solverTol=1E-6, method='bisection', planetRotation=False):
+		"""
+		Sets the corridor limit search parameters, see
+		Vehicle.findOverShootLimit().
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		gamma0_deg_guess_low : float
+			lower bound for the guess of the limit FPA, deg
+		gamma0_deg_guess_high : float
+			upper bound for the guess of the limit FPA, deg
+		gamma_deg_tol : float
+			desired accuracy for computation of the limits, deg
+		targetApopasisAltitude_km : float
+			target apoapsis altitude , km
+		solverTol : float, optional
+			ODE solver tolerance, default=1E-6
+		method : str, optional
+			root finding method, 'bisection' or 'illinois',
+			default='bisection'
+		planetRotation : bool, optional
+			if True, include the effect of planet rotation on the
+			exit orbit, default=False
+		"""
+
+		self.t_sec = t_sec
+		self.dt = dt
+		self.gamma0_deg_guess_low = gamma0_deg_guess_low
+		self.gamma0_deg_guess_high = gamma0_deg_guess_high
+		self.gamma_deg_tol = gamma_deg_tol
+		self.targetApopasisAltitude_km = targetApopasisAltitude_km
+		self.solverTol = solverTol
+		self.method = method
+		self.planetRotation = planetRotation
+
+	def setWarmStartParams(self, warmStart=True, bracketWidth=0.5, widenFactor=4.0):
+		"""
+		Sets the warm start parameters.
+
+		Parameters
+		----------
+		warmStart : bool, optional
+			if True, seed each cell with a bracket from its
+			neighbours, if False every cell is searched over the
+			user specified bounds, default=True
+		bracketWidth : float, optional
+			half width of the initial warm start bracket, deg,
+			default=0.5
+		widenFactor : float, optional
+			factor by which the bracket half width is multiplied
+			when the bracket does not contain the limit, default=4.0
+		"""
+
+		self.warmStart = warmStart
+		self.bracketWidth = bracketWidth
+		self.widenFactor = widenFactor
+
+	def walkOrder(self):
+		"""
+		Returns the order in which the grid cells are solved, row by
+		row with alternating direction.
+
+		Returns
+		----------
+		order : list
+			list of (i, j) grid indices
+		"""
+
+		order = []
+		for i in range(len(self.vinf_kms_array)):
+			cols = range(len(self.param_array))
+			if i % 2 == 1:
+				cols = reversed(cols)
+			order.extend([(i, j) for j in cols])
+
+		return order
+
+	def createVehicle(self, i, j):
+		"""
+		Creates the vehicle for grid cell (i, j).
+
+		Parameters
+		----------
+		i : int
+			V_infty index
+		j : int
+			L/D or beta ratio index
+
+		Returns
+		----------
+		vehicle : vehicle.Vehicle
+			vehicle object at the atmospheric interface
+		"""
+
+		if self.mode == 'lift':
+			vehicle = Vehicle(self.vehicleID, self.mass, self.beta, self.LD_array[j], self.A, 0.0, self.RN,
+							  self.planetObj)
+		else:
+			vehicle = Vehicle(self.vehicleID, self.mass, self.beta, 0.0, self.A, 0.0, self.RN, self.planetObj)
+			vehicle.setDragModulationVehicleParams(self.beta, self.betaRatio_array[j])
+
+		vehicle.setInitialState(self.h0_km, 0.0, 0.0, self.v0_kms_array[i], 0.0, -4.5, 0.0, 0.0)
+		vehicle.setSolverParams(self.solverTol)
+
+		return vehicle
+
+	def predictLimit(self, limit_array, solved, i, j):
+		"""
+		Predicts the corridor limit in cell (i, j) from its solved
+		neighbours. Linear extrapolation is used along the row when
+		the two previous cells in the row are solved, otherwise the
+		mean of the solved neighbours.
+
+		Parameters
+		----------
+		limit_array : numpy.ndarray
+			corridor limit array, deg
+		solved : numpy.ndarray
+			boolean array, True for cells with a limit found
+		i : int
+			V_infty index
+		j : int
+			L/D or beta ratio index
+
+		Returns
+		----------
+		center : float
+			predicted limit, deg, or None if no neighbour is solved
+		"""
+
+		n, m = solved.shape
+
+		for dj in [-1, 1]:
+			j1, j2 = j + dj, j + 2*dj
+			if 0 <= j2 < m and solved[i, j1] and solved[i, j2]:
+				return 2.0*limit_array[i, j1] - limit_array[i, j2]
+
+		neighbours = [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]
+		values = [limit_array[k, l] for (k, l) in neighbours if 0 <= k < n and 0 <= l < m and solved[k, l]]
+
+		if len(values) == 0:
+			return None
+
+		return float(np.mean(values))
+
+	def searchLimit(self, vehicle, limit, gamma0_deg_low, gamma0_deg_high):
+		"""
+		Runs a single corridor limit search over the bracket
+		[gamma0_deg_low, gamma0_deg_high].
+
+		Parameters
+		----------
+		vehicle : vehicle.Vehicle
+			vehicle object for the grid cell
+		limit : str
+			'overshoot' or 'undershoot'
+		gamma0_deg_low : float
+			lower end of the bracket, deg
+		gamma0_deg_high : float
+			upper end of the bracket, deg
+
+		Returns
+		----------
+		EFPALimit : float
+			limit EFPA, deg
+		exitflag : float
+			1.0 if the limit was found in the bracket, 0.0 otherwise
+		"""
+
+		delta_deg = self.setLimitVehicle(vehicle, limit)
+
+		if self.planetRotation is True:
+			apoapsisError = vehicle.computeApoapsisError2
+		else:
+			apoapsisError = vehicle.computeApoapsisError
+
+		EFPALimit, exitflag = vehicle.findCorridorLimit(apoapsisError, self.t_sec, self.dt, delta_deg,
+														gamma0_deg_low, gamma0_deg_high, self.gamma_deg_tol,
+														self.targetApopasisAltitude_km, self.method)
+		self.evaluations += vehicle.corridorEvaluations
+
+		return EFPALimit, exitflag
+
+	def findLimit(self, vehicle, limit, center):
+		"""
+		Finds a corridor limit, starting from a bracket of half width
+		bracketWidth around center and widening it by widenFactor
+		until the limit is bracketed. Falls back to the user
+		specified bounds.
+
+		Parameters
+		----------
+		vehicle : vehicle.Vehicle
+			vehicle object for the grid cell
+		limit : str
+			'overshoot' or 'undershoot'
+		center : float
+			predicted limit, deg, None for a cold start
+
+		Returns
+		----------
+		EFPALimit : float
+			limit EFPA, deg
+		exitflag : float
+			1.0 if the limit was found, 0.0 otherwise
+		"""
+
+		low = self.gamma0_deg_guess_low
+		high = self.gamma0_deg_guess_high
+
+		if center is not None:
+			width = self.bracketWidth
+			while True:
+				gamma0_deg_low = max(center - width, low)
+				gamma0_deg_high = min(center + width, high)
+				if gamma0_deg_low == low and gamma0_deg_high == high:
+					break
+
+				EFPALimit, exitflag = self.searchLimit(vehicle, limit, gamma0_deg_low, gamma0_deg_high)
+				if exitflag == 1.0:
+					return EFPALimit, exitflag
+
+				width = width*self.widenFactor
+
+		return self.searchLimit(vehicle, limit, low, high)
+
+	def setLimitVehicle(self, vehicle, limit):
+		"""
+		Sets the vehicle parameters and returns the bank angle used
+		for the given corridor limit.
+
+		Parameters
+		----------
+		vehicle : vehicle.Vehicle
+			vehicle object for the grid cell
+		limit : str
+			'overshoot' or 'undershoot'
+
+		Returns
+		----------
+		delta_deg : float
+			bank angle, deg
+		"""
+
+		if self.mode == 'lift':
+			return 180.0 if limit == 'overshoot' else 0.0
+
+		if limit == 'overshoot':
+			vehicle.beta = vehicle.beta1
+		else:
+			vehicle.beta = vehicle.beta1*vehicle.betaRatio
+		vehicle.CD = vehicle.mass/(vehicle.beta*vehicle.A)
+
+		return 0.0
+
+	def computePeakLoads(self, vehicle, overShootLimit, underShootLimit):
+		"""
+		Propogates the overshoot and undershoot limit trajectories
+		and returns the peak loads over both.
+
+		Parameters
+		----------
+		vehicle : vehicle.Vehicle
+			vehicle object for the grid cell
+		overShootLimit : float
+			overshoot limit EFPA, deg
+		underShootLimit : float
+			undershoot limit EFPA, deg
+
+		Returns
+		----------
+		acc_net_g_max : float
+			max. deceleration, Earth g
+		stag_pres_atm_max : float
+			max. stagnation pressure, atm
+		q_stag_total_max : float
+			max. stagnation-point heat rate, W/cm2
+		heatload_max : float
+			max. stagnation-point heat load, J/cm2
+		"""
+
+		peaks = []
+
+		for limit, gamma0_deg in [('overshoot', overShootLimit), ('undershoot', underShootLimit)]:
+			delta_deg = self.setLimitVehicle(vehicle, limit)
+			vehicle.gamma0_deg = gamma0_deg
+			vehicle.propogateEntry(self.t_sec, self.dt, delta_deg)
+
+			peaks.append([max(vehicle.acc_net_g), max(vehicle.stag_pres_atm),
+						  max(vehicle.q_stag_total), max(vehicle.heatload)])
+
+		return tuple(np.max(np.array(peaks), axis=0))
+
+	def solveCell(self, i, j, center_os=None, center_us=None, peakLoads=False):
+		"""
+		Computes the overshoot and undershoot limits for grid
+		cell (i, j), and optionally the peak loads along the limit
+		trajectories.
+
+		Parameters
+		----------
+		i : int
+			V_infty index
+		j : int
+			L/D or beta ratio index
+		center_os : float, optional
+			predicted overshoot limit, deg
+		center_us : float, optional
+			predicted undershoot limit, deg
+		peakLoads : bool, optional
+			if True, compute the peak loads, default=False
+
+		Returns
+		----------
+		values : list
+			cell values in the order of FeasibilityGrid.cellFields.
+			The peak loads are 0.0 if not computed or if either
+			limit was not found.
+		"""
+
+		vehicle = self.createVehicle(i, j)
+
+		overShootLimit, exitflag_os = self.findLimit(vehicle, 'overshoot', center_os)
+		underShootLimit, exitflag_us = self.findLimit(vehicle, 'undershoot', center_us)
+
+		loads = (0.0, 0.0, 0.0, 0.0)
+		if peakLoads is True and exitflag_os == 1.0 and exitflag_us == 1.0:
+			loads = self.computePeakLoads(vehicle, overShootLimit, underShootLimit)
+
+		return [overShootLimit, exitflag_os, underShootLimit, exitflag_us] + [float(x) for x in loads]
+
+	def storeCell(self, i, j, values):
+		"""
+		Stores the values computed for grid cell (i, j) in the
+		result arrays.
+
+		Parameters
+		----------
+		i : int
+			V_infty index
+		j : int
+			L/D or beta ratio index
+		values : list
+			cell values in the order of FeasibilityGrid.cellFields
+		"""
+
+		for field, value in zip(self.cellFields, values):
+			getattr(self, field + '_array')[i, j] = value
+
+		self.TCW_array[i, j] = self.overShootLimit_array[i, j] - self.underShootLimit_array[i, j]
+
+	def predictCell(self, solved_os, solved_us, i, j):
+		"""
+		Returns the predicted overshoot and undershoot limits for
+		grid cell (i, j), or None if warm starting is off or no
+		neighbour is solved.
+
+		Parameters
+		----------
+		solved_os : numpy.ndarray
+			boolean array, True for cells with an overshoot limit
+		solved_us : numpy.ndarray
+			boolean array, True for cells with an undershoot limit
+		i : int
+			V_infty index
+		j : int
+			L/D or beta ratio index
+
+		Returns
+		----------
+		center_os : float
+			predicted overshoot limit, deg
+		center_us : float
+			predicted undershoot limit, deg
+		"""
+
+		if self.warmStart is not True:
+			return None, None
+
+		return self.predictLimit(self.overShootLimit_array, solved_os, i, j), \
+			self.predictLimit(self.underShootLimit_array, solved_us, i, j)
+
+	def computeFeasibility(self, peakLoads=False):
+		"""
+		Computes the overshoot limit, undershoot limit and TCW over
+		the grid.
+
+		Parameters
+		----------
+		peakLoads : bool, optional
+			if True, also compute the peak load arrays,
+			default=False
+
+		Returns
+		----------
+		overShootLimit_array : numpy.ndarray
+			overshoot limit EFPA, deg
+		underShootLimit_array : numpy.ndarray
+			undershoot limit EFPA, deg
+		TCW_array : numpy.ndarray
+			theoretical corridor width, deg
+		"""
+
+		self.evaluations = 0
+		self.peakLoads = peakLoads
+
+		solved_os = np.zeros(self.overShootLimit_array.shape, dtype=bool)
+		solved_us = np.zeros(self.underShootLimit_array.shape, dtype=bool)
+
+		for (i, j) in self.walkOrder():
+			center_os, center_us = self.predictCell(solved_os, solved_us, i, j)
+
+			self.storeCell(i, j, self.solveCell(i, j, center_os, center_us, peakLoads))
+
+			solved_os[i, j] = self.exitflag_os_array[i, j] == 1.0
+			solved_us[i, j] = self.exitflag_us_array[i, j] == 1.0
+
+		return self.overShootLimit_array, self.underShootLimit_array, self.TCW_array
+
+	def resultsFileHeader(self):
+		"""
+		Returns the header lines of the results file, which identify
+		the grid, the vehicle and the corridor limit search the file
+		was written for.
+
+		Returns
+		----------
+		header : list
+			list of header lines
+		"""
+
+		def values(x):
+			return ' '.join(repr(float(v)) for v in x)
+
+		return ['# mode ' + str(self.mode),
+				'# vinf_kms_array ' + values(self.vinf_kms_array),
+				'# param_array ' + values(self.param_array),
+				'# planet ' + str(self.planetObj.ID),
+				'# mass beta A RN h0_km ' + values([self.mass, self.beta, self.A, self.RN, self.h0_km]),
+				'# t_sec dt gamma0_deg_guess_low gamma0_deg_guess_high gamma_deg_tol ' +
+				'targetApopasisAltitude_km solverTol ' +
+				values([self.t_sec, self.dt, self.gamma0_deg_guess_low, self.gamma0_deg_guess_high,
+						self.gamma_deg_tol, self.targetApopasisAltitude_km, self.solverTol]),
+				'# method ' + str(self.method),
+				'# planetRotation ' + str(self.planetRotation),
+				'# peakLoads ' + str(self.peakLoads),
+				'# i j ' + ' '.join(self.cellFields)]
+
+	def loadResultsFile(self, resultsFile):
+		"""
+		Loads the finished cells from a results file written by
+		computeFeasibilityParallel() into the result arrays. A
+		missing file is created with its header. Incomplete lines,
+		e.g. from an interrupted write, are ignored. Raises a
+		ValueError if the file was written with different grid axes,
+		vehicle, search parameters or peakLoads setting.
+
+		Parameters
+		----------
+		resultsFile : str
+			path to the results file
+
+		Returns
+		----------
+		done : set
+			set of (i, j) indices of the finished cells
+		"""
+
+		done = set()
+		header = self.resultsFileHeader()
+
+		if not os.path.exists(resultsFile):
+			with open(resultsFile, 'w') as f:
+				f.write('\n'.join(header) + '\n')
+			return done
+
+		with open(resultsFile, 'r') as f:
+			contents = f.read()
+		lines = contents.split('\n')
+
+		# terminate an incomplete last line so that appended cells
+		# start on a new line
+		if not contents.endswith('\n'):
+			with open(resultsFile, 'a') as f:
+				f.write('\n')
+
+		file_header = [line for line in lines if line.startswith('#')]
+		if file_header != header:
+			raise ValueError("Results file " + str(resultsFile) + " was written for a different grid, " +
+							 "vehicle or corridor limit search.")
+
+		for line in lines:
+			fields = line.split()
+			if line.startswith('#') or len(fields) != 2 + len(self.cellFields):
+				continue
+			try:
+				i, j = int(fields[0]), int(fields[1])
+				values = [float(x) for x in fields[2:]]
+			except ValueError:
+				continue
+
+			self.storeCell(i, j, values)
+			done.add((i, j))
+
+		return done
+
+	def computeFeasibilityParallel(self, resultsFile, processes=None, peakLoads=False):
+		"""
+		Computes the overshoot limit, undershoot limit and TCW over
+		the grid on a process pool. Each finished cell is appended to
+		resultsFile and flushed to disk. Cells already present in
+		resultsFile are not recomputed, so an interrupted run is
+		resumed by calling this method again with the same file.
+
+		Cells are submitted in the order of walkOrder(), with at most
+		one cell per process in flight. Each cell is warm started
+		from the neighbours finished by the time it is submitted,
+		which depends on the order in which the processes complete.
+		The limits therefore match those of computeFeasibility() to
+		within gamma_deg_tol, not exactly, and may differ by as much
+		between runs.
+
+		Parameters
+		----------
+		resultsFile : str
+			path to the results file
+		processes : int, optional
+			number of worker processes, default=os.cpu_count()
+		peakLoads : bool, optional
+			if True, also compute the peak load arrays,
+			default=False
+
+		Returns
+		----------
+		overShootLimit_array : numpy.ndarray
+			overshoot limit EFPA, deg
+		underShootLimit_array : numpy.ndarray
+			undershoot limit EFPA, deg
+		TCW_array : numpy.ndarray
+			theoretical corridor width, deg
+		"""
+
+		self.evaluations = 0
+		self.peakLoads = peakLoads
+
+		if processes is None:
+			processes = os.cpu_count()
+
+		done = self.loadResultsFile(resultsFile)
+
+		solved_os = np.zeros(self.overShootLimit_array.shape, dtype=bool)
+		solved_us = np.zeros(self.underShootLimit_array.shape, dtype=bool)
+		for (i, j) in done:
+			solved_os[i, j] = self.exitflag_os_array[i, j] == 1.0
+			solved_us[i, j] = self.exitflag_us_array[i, j] == 1.0
+
+		todo = [cell for cell in self.walkOrder() if cell not in done]
+		todo.reverse()
+
+		with open(resultsFile, 'a') as f, ProcessPoolExecutor(max_workers=processes) as pool:
+			pending = {}
+
+			def submit():
+				i, j = todo.pop()
+				center_os, center_us = self.predictCell(solved_os, solved_us, i, j)
+				future = pool.submit(solveFeasibilityCell, self, i, j, center_os, center_us, peakLoads)
+				pending[future] = (i, j)
+
+			while len(todo) > 0 and len(pending) < processes:
+				submit()
+
+			while len(pending) > 0:
+				finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+				for future in finished:
+					i, j = pending.pop(future)
+					values, evaluations = future.result()
+
+					self.storeCell(i, j, values)
+					self.evaluations += evaluations
+					solved_os[i, j] = self.exitflag_os_array[i, j] == 1.0
+					solved_us[i, j] = self.exitflag_us_array[i, j] == 1.0
+
+					f.write(str(i) + ' ' + str(j) + ' ' + ' '.join(repr(float(x)) for x in values) + '\n')
+					f.flush()
+					os.fsync(f.fileno())
+
+					if len(todo) > 0:
+						submit()
+
+		return self.overShootLimit_array, self.underShootLimit_array, self.TCW_array
+
+	def saveResults(self, folder, runID):
+		"""
+		Saves the grid axes and result arrays with np.savetxt, with
+		the file names used by the feasibility chart scripts, e.g.
+		folder/runID+'overShootLimit_array.txt'.
+
+		Parameters
+		----------
+		folder : str
+			output folder
+		runID : str
+			prefix of the output file names
+		"""
+
+		prefix = os.path.join(folder, runID)
+		param_name = 'LD_array' if self.mode == 'lift' else 'betaRatio_array'
+
+		np.savetxt(prefix + 'vinf_kms_array.txt', self.vinf_kms_array)
+		np.savetxt(prefix + 'v0_kms_array.txt', self.v0_kms_array)
+		np.savetxt(prefix + param_name + '.txt', self.param_array)
+		np.savetxt(prefix + 'overShootLimit_array.txt', self.overShootLimit_array)
+		np.savetxt(prefix + 'exitflag_os_array.txt', self.exitflag_os_array)
+		np.savetxt(prefix + 'undershootLimit_array.txt', self.underShootLimit_array)
+		np.savetxt(prefix + 'exitflag_us_array.txt', self.exitflag_us_array)
+		np.savetxt(prefix + 'TCW_array.txt', self.TCW_array)
+
+		if self.peakLoads is True:
+			np.savetxt(prefix + 'acc_net_g_max_array.txt', self.acc_net_g_max_array)
+			np.savetxt(prefix + 'stag_pres_atm_max_array.txt', self.stag_pres_atm_max_array)
+			np.savetxt(prefix + 'q_stag_total_max_array.txt', self.q_stag_total_max_array)
+			np.savetxt(prefix + 'heatload_max_array.txt', self.heatload_max_array)
+
+
+def solveFeasibilityCell(grid, i, j, center_os, center_us, peakLoads):
+	"""
+	Worker function for FeasibilityGrid.computeFeasibilityParallel(),
+	solves a single grid cell in a pool process.
+
+	Parameters
+	----------
+	grid : FeasibilityGrid
+		feasibility grid object
+	i : int
+		V_infty index
+	j : int
+		L/D or beta ratio index
+	center_os : float
+		predicted overshoot limit, deg, or None
+	center_us : float
+		predicted undershoot limit, deg, or None
+	peakLoads : bool
+		if True, compute the peak loads
+
+	Returns
+	----------
+	values : list
+		cell values in the order of FeasibilityGrid.cellFields
+	evaluations : int
+		number of trajectory propogations in the limit searches
+	"""
+
+	grid.evaluations = 0
+	values = grid.solveCell(i, j, center_os, center_us, peakLoads)
+
+	return values, grid.evaluations
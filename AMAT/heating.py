@@ -0,0 +1,311 @@
+# SOURCE FILENAME : heating.py
+# DATE CREATED    : 10/18/2026, 15:10 MT
+# DATE MODIFIED   : 10/18/2026, 15:10 MT
+# REMARKS         : Registry of the stagnation-point convective and
+#                   radiative heating correlations by planet. The
+#                   correlations are vectorized and broadcast over a
+#                   trajectory x nose radius grid.
+
+import numpy as np
+from scipy.interpolate import interp1d
+
+
+# Tauber-Sutton radiative heating velocity function f(V) for Earth
+# entry, built once at import
+TauberSuttonfV = interp1d(np.array([9000.0, 10000.0, 11000.0, 12000.0, 13000.0, 14000.0, 15000.0, 16000.0]),
+						  np.array([1.5, 35, 151, 359, 660, 1065, 1550, 2040]), kind='linear',
+						  fill_value=(0.0, 2040), bounds_error=False)
+
+
+class SuttonGraves:
+	"""
+	Sutton-Graves convective stagnation-point heating correlation,
+	q = k*sqrt(rho/RN)*v^3
+
+	Sources : Sutton-Graves relationships, NASA Neptune Orbiter
+	with Probes Vision Report, Bienstock et al.
+
+	Attributes
+	----------
+	k : float
+		Sutton-Graves constant for the planet atmosphere
+	"""
+
+	def __init__(self, k):
+		self.k = k
+
+	def __call__(self, rho, v, RN):
+		"""
+		Parameters
+		----------
+		rho : numpy.ndarray
+			density, kg/m3
+		v : numpy.ndarray
+			planet-relative speed, m/s
+		RN : float or numpy.ndarray
+			nose radius, m
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			convective stagnation-point heating rate, W/cm2
+		"""
+
+		return self.k * (rho/RN)**0.5 * v**3.0
+
+
+def convectiveIceGiant(rho, v, RN):
+	"""
+	Convective stagnation-point heating correlation for Uranus and
+	Neptune entry.
+
+	REF: NASA Vision Neptune orbiter with probes,
+	Contract No. NNH04CC41C Final Report, 2005
+
+	Parameters
+	----------
+	rho : numpy.ndarray
+		density, kg/m3
+	v : numpy.ndarray
+		planet-relative speed, m/s
+	RN : float or numpy.ndarray
+		nose radius, m
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		convective stagnation-point heating rate, W/cm2
+	"""
+
+	return 2.24008E-7 * rho**0.452130 * v**2.691800 * np.sqrt(0.291/RN)
+
+
+def radiativeVenus(rho, v, RN):
+	"""
+	Radiative stagnation-point heating correlation for Venus entry,
+	with three velocity regimes.
+
+	REF : Criag and Lyne, Parametric Study of Venus Aerocapture, 2005
+
+	Parameters
+	----------
+	rho : numpy.ndarray
+		density, kg/m3
+	v : numpy.ndarray
+		planet-relative speed, m/s
+	RN : float or numpy.ndarray
+		nose radius, m
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		radiative stagnation-point heating rate, W/cm2
+	"""
+
+	# coefficient and velocity exponent of the three velocity regimes
+	regimes = [v < 8000.0, v < 10000.0]
+	C = np.select(regimes, [3.33E-34, 1.22E-16], 3.07E-48)
+	n = np.select(regimes, [10.0, 5.5], 13.4)
+
+	return C*v**n*rho**1.2*RN**0.49
+
+
+def radiativeEarth(rho, v, RN):
+	"""
+	Tauber-Sutton radiative stagnation-point heating correlation for
+	Earth entry.
+
+	REF : Brandis and Johnston, Characterization of Stagnation-Point
+	Heat Flux for Earth Entry, 2014
+
+	Parameters
+	----------
+	rho : numpy.ndarray
+		density, kg/m3
+	v : numpy.ndarray
+		planet-relative speed, m/s
+	RN : float or numpy.ndarray
+		nose radius, m
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		radiative stagnation-point heating rate, W/cm2
+	"""
+
+	C = 4.736E4
+	a = 0.6
+	b = 1.22
+
+	return C*RN**a*rho**b*TauberSuttonfV(v)
+
+
+def radiativeGasGiant(rho, v, RN):
+	"""
+	Radiative stagnation-point heating correlation for Jupiter and
+	Saturn entry.
+
+	Source: JUPITER ENTRY PROBE FEASIBILITY STUDY FROM THE ESTEC CDF
+	TEAM HEAT FLUX EVALUATION & TPS DEFINITION
+
+	Parameters
+	----------
+	rho : numpy.ndarray
+		density, kg/m3
+	v : numpy.ndarray
+		planet-relative speed, m/s
+	RN : float or numpy.ndarray
+		nose radius, m
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		radiative stagnation-point heating rate, W/cm2
+	"""
+
+	return (9.7632379E-40*(2*RN)**(-0.17905)*rho**1.763827469*v**10.993852)*1E3/1E4
+
+
+def radiativeIceGiant(rho, v, RN):
+	"""
+	Radiative stagnation-point heating correlation for Uranus and
+	Neptune entry.
+
+	REF: NASA Vision Neptune orbiter with probes,
+	Contract No. NNH04CC41C Final Report, 2005
+
+	Parameters
+	----------
+	rho : numpy.ndarray
+		density, kg/m3
+	v : numpy.ndarray
+		planet-relative speed, m/s
+	RN : float or numpy.ndarray
+		nose radius, m
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		radiative stagnation-point heating rate, W/cm2
+	"""
+
+	return 8.125812E-3*rho**0.498140*(v/10000)**15.113*(RN/0.291)
+
+
+def radiativeNone(rho, v, RN):
+	"""
+	Zero radiative heating, used for Mars and Titan where no
+	correlation is available, though radiative heating may not be
+	negligible under certain conditions.
+
+	Parameters
+	----------
+	rho : numpy.ndarray
+		density, kg/m3
+	v : numpy.ndarray
+		planet-relative speed, m/s
+	RN : float or numpy.ndarray
+		nose radius, m
+
+	Returns
+	----------
+	ans : numpy.ndarray
+		zero array of the broadcast shape of the arguments
+	"""
+
+	return np.zeros(np.broadcast(rho, v, RN).shape)
+
+
+class HeatingRegistry:
+	"""
+	The HeatingRegistry class holds the stagnation-point convective
+	and radiative heating correlations by planet identifier.
+
+	A correlation is a callable correlation(rho, v, RN) which returns
+	the heat rate (W/cm2) for density rho (kg/m3), planet-relative
+	speed v (m/s) and nose radius RN (m). Correlations must broadcast
+	over their arguments, so that with rho and v as columns and RN
+	as a row a trajectory x nose radius grid is evaluated in a
+	single call.
+
+	The vehicles use the module level registry, user correlations
+	are added with registry.register().
+
+	Attributes
+	----------
+	convectiveCorrelations : dict
+		convective heating correlation by planet identifier
+	radiativeCorrelations : dict
+		radiative heating correlation by planet identifier
+	"""
+
+	def __init__(self):
+		self.convectiveCorrelations = {}
+		self.radiativeCorrelations = {}
+
+	def register(self, planetID, convective=None, radiative=None):
+		"""
+		Adds or replaces the heating correlations for a planet.
+
+		Parameters
+		----------
+		planetID : str
+			planet identifier, as in planet.Planet.ID
+		convective : callable, optional
+			convective heating correlation, kept if None
+		radiative : callable, optional
+			radiative heating correlation, kept if None
+		"""
+
+		if convective is not None:
+			self.convectiveCorrelations[planetID] = convective
+		if radiative is not None:
+			self.radiativeCorrelations[planetID] = radiative
+
+	def convective(self, planetID):
+		"""
+		Returns the convective heating correlation for a planet,
+		or None if none is registered.
+
+		Parameters
+		----------
+		planetID : str
+			planet identifier
+
+		Returns
+		----------
+		ans : callable
+			convective heating correlation
+		"""
+
+		return self.convectiveCorrelations.get(planetID)
+
+	def radiative(self, planetID):
+		"""
+		Returns the radiative heating correlation for a planet,
+		or None if none is registered.
+
+		Parameters
+		----------
+		planetID : str
+			planet identifier
+
+		Returns
+		----------
+		ans : callable
+			radiative heating correlation
+		"""
+
+		return self.radiativeCorrelations.get(planetID)
+
+
+registry = HeatingRegistry()
+
+registry.register('VENUS', SuttonGraves(1.8960E-8), radiativeVenus)
+registry.register('EARTH', SuttonGraves(1.7623E-8), radiativeEarth)
+registry.register('MARS', SuttonGraves(1.8980E-8), radiativeNone)
+registry.register('JUPITER', SuttonGraves(0.6556E-8), radiativeGasGiant)
+registry.register('SATURN', SuttonGraves(0.6356E-8), radiativeGasGiant)
+registry.register('TITAN', SuttonGraves(1.7407E-8), radiativeNone)
+registry.register('URANUS', convectiveIceGiant, radiativeIceGiant)
+registry.register('NEPTUNE', convectiveIceGiant, radiativeIceGiant)
@@ -0,0 +1,916 @@
+# SOURCE FILENAME : montecarlo.py
+# DATE CREATED    : 10/18/2026, 17:20 MT
+# DATE MODIFIED   : 10/18/2026, 21:00 MT
+# REMARKS         : Monte Carlo executor for guided aerocapture
+#                   trajectories. The dispersions of each run are drawn
+#                   from an independent generator seeded with the
+#                   campaign master seed and the run index, so that
+#                   runs can be spread over a process pool and the
+#                   results are identical for any number of workers.
+#                   The results of a campaign are appended as rows of
+#                   a columnar binary store, one file per column, from
+#                   which an interrupted campaign is resumed. Latin
+#                   hypercube, scrambled Sobol and stratified designs
+#                   of the dispersions, with variance reduction
+#                   diagnostics.
+
+import copy
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.integrate import cumulative_trapezoid
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from AMAT.planet import DensityProfileBank
+
+
+# modulation type of the guided propogation method used by each
+# Monte Carlo driver
+GUIDANCE = {
+	'propogateGuidedEntry': 'lift',
+	'propogateGuidedEntry2': 'lift',
+	'propogateGuidedEntryD': 'drag',
+	'propogateGuidedEntryD2': 'drag',
+}
+
+# dispersions and outcomes of a run, in the order of a result row
+DISPERSIONS = ['atmfile', 'profile', 'efpa', 'atmSigma', 'LD']
+OUTCOMES = ['terminal_apoapsis', 'apoapsis_error', 'terminal_periapsis',
+			'periapsis_raise_DV', 'apoapsis_raise_DV',
+			'acc_net_g_max', 'q_stag_max', 'heatload_max']
+
+# dispersion sampling strategies: independent pseudo-random draws,
+# Latin hypercube, scrambled Sobol sequence, and pseudo-random draws
+# with the (atmosphere file, profile) pair stratified over the runs
+SAMPLERS = ['random', 'lhs', 'sobol', 'stratified']
+
+# campaign summary arrays written to the main folder
+SUMMARIES = ['terminal_apoapsis', 'terminal_periapsis', 'periapsis_raise_DV',
+			 'apoapsis_raise_DV', 'acc_net_g_max', 'q_stag_max', 'heatload_max']
+
+# columns of the results store, the run index and the atmosphere file
+# (an index into the header list of files) and profile no. are stored
+# as integers
+RESULTS_DIRNAME = 'results'
+RESULTS_HEADER = 'header.json'
+RESULTS_COLUMNS = [('run', '<i8'), ('atmfile', '<i8'), ('profile', '<i8')] + \
+				  [(name, '<f8') for name in DISPERSIONS[2:] + OUTCOMES]
+
+# vehicle, atmosphere file, dispersion, guidance and solver parameters
+# recorded in the header of the results store, a campaign is only
+# resumed with the same values. Parameters not set for a modulation
+# type are recorded as None.
+CAMPAIGN_PARAMETERS = ['mass', 'beta', 'LD', 'A', 'alpha', 'RN', 'CD', 'CL', 'beta1', 'betaRatio',
+					   'NPOS', 'NMONTE', 'heightCol', 'densLowCol', 'densAvgCol', 'densHighCol',
+					   'densTotalCol', 'densSD_percCol', 'heightInKmFlag',
+					   'nominalEFPA', 'EFPA_1sigma_value', 'atmSigmaFactor', 'nominalLD', 'LD_1sigma_value',
+					   'nominalbeta1', 'beta1_1sigma_value',
+					   'target_peri_km', 'target_apo_km', 'target_apo_km_tol',
+					   'timeStep', 'timeStepEntry', 'timeStepExit', 'dt', 'maxTimeSecs', 'maxRollRate',
+					   'Ghdot', 'Gq', 'v_switch_kms', 'lowAlt_km', 'numPoints_lowAlt', 'hdot_threshold',
+					   'tol', 'method']
+
+
+class MonteCarloExecutor:
+	"""
+	The MonteCarloExecutor class runs the guided trajectories of a
+	Monte Carlo campaign set up with Vehicle.setupMonteCarloSimulation()
+	or one of its drag modulation variants.
+
+	The dispersions of a run are mapped from a point of the unit
+	hypercube, one dimension per entry of DISPERSIONS. With the
+	'random' sampler, the point of run i is drawn from a
+	numpy.random.Generator seeded with [masterSeed, i], independent of
+	every other run and of the global random state. The other
+	samplers take the point from a design of the N runs of the
+	campaign, see setDesign(), seeded with the master seed and N.
+	Each run propogates a fresh copy of the vehicle, so a run does not
+	depend on the runs before it and the results are bit-identical for
+	any number of workers.
+
+	Attributes
+	----------
+	vehicle : vehicle.Vehicle
+		copy of the vehicle at the start of the campaign, used as the
+		template of each run
+	guidance : str
+		name of the guided propogation method of Vehicle
+	modulation : str
+		'lift' or 'drag', modulation type of the guidance
+	earthAtmosphere : bool
+		if True, the atmosphere files are read with
+		Planet.loadMonteCarloDensityFile3()
+	integrateHeatload : bool
+		if True, the max. heat load of a run is integrated from the
+		heat rate, in kJ/cm2, instead of the max. of heatload_full
+	masterSeed : int
+		campaign master seed
+	workers : int
+		number of worker processes, None for all cores
+	initialState : tuple
+		reference initial state of the vehicle, same order as
+		Vehicle.setInitialState() without the EFPA
+	bank : planet.DensityProfileBank
+		density profiles of the atmosphere files, each file is added
+		on its first use in a process
+	sampler : str
+		dispersion sampling strategy, one of SAMPLERS
+	design : numpy.ndarray
+		unit hypercube points of the runs, shape (N, len(DISPERSIONS)),
+		None until set with setDesign()
+	"""
+
+	def __init__(self, vehicle, guidance, earthAtmosphere=False, integrateHeatload=False,
+				 masterSeed=None, workers=1, sampler='random'):
+		"""
+		Initializes the MonteCarloExecutor.
+
+		Parameters
+		----------
+		vehicle : vehicle.Vehicle
+			vehicle object, with the Monte Carlo simulation set up
+		guidance : str
+			name of the guided propogation method of Vehicle, a key
+			of GUIDANCE
+		earthAtmosphere : bool, optional
+			if True, the atmosphere files are read with
+			Planet.loadMonteCarloDensityFile3(), default=False
+		integrateHeatload : bool, optional
+			if True, the max. heat load of a run is integrated from
+			the heat rate, default=False
+		masterSeed : int, optional
+			campaign master seed, default=None draws a fresh seed
+			from the OS entropy source
+		workers : int, optional
+			number of worker processes, default=1 runs in the
+			calling process, None uses all cores
+		sampler : str, optional
+			dispersion sampling strategy, one of SAMPLERS,
+			default='random'
+		"""
+
+		if guidance not in GUIDANCE:
+			raise ValueError("Monte Carlo guidance must be one of " + str(list(GUIDANCE)) + ".")
+		if sampler not in SAMPLERS:
+			raise ValueError("Monte Carlo sampler must be one of " + str(SAMPLERS) + ".")
+
+		self.guidance = guidance
+		self.modulation = GUIDANCE[guidance]
+		self.earthAtmosphere = earthAtmosphere
+		self.integrateHeatload = integrateHeatload
+
+		if masterSeed is None:
+			masterSeed = np.random.SeedSequence().entropy
+		self.masterSeed = int(masterSeed)
+		self.workers = workers
+
+		ref = vehicle.vehicleCopy
+		self.initialState = (ref.h0_km_ref, ref.theta0_deg_ref, ref.phi0_deg_ref, ref.v0_kms_ref,
+							 ref.psi0_deg_ref, ref.drange0_km_ref, ref.heatLoad0_ref)
+
+		# the template carries neither the reference copy nor the
+		# last trajectory, which may hold a deferred loads callback
+		self.vehicle = copy.copy(vehicle)
+		self.vehicle.vehicleCopy = None
+		self.vehicle.trajectory = None
+
+		self.bank = DensityProfileBank(vehicle.NPOS)
+
+		self.sampler = sampler
+		self.design = None
+
+	def generator(self, runIndex):
+		"""
+		Returns the random generator of a run.
+
+		Parameters
+		----------
+		runIndex : int
+			run index, zero indexed
+
+		Returns
+		----------
+		ans : numpy.random.Generator
+			generator seeded with [masterSeed, runIndex]
+		"""
+
+		return np.random.default_rng([self.masterSeed, runIndex])
+
+	def setDesign(self, N):
+		"""
+		Sets the unit hypercube points of the N runs of a campaign,
+		for the 'lhs', 'sobol' and 'stratified' samplers. The design
+		is seeded with [masterSeed, N, sampler index], so a campaign
+		resumed with the same N gets the same design.
+
+		'lhs' : Latin hypercube, each dimension is split in N equal
+		strata with one run in each.
+
+		'sobol' : scrambled Sobol sequence, the first N points of a
+		sequence of 2^ceil(log2(N)) points. The balance properties of
+		the sequence hold best for N a power of 2.
+
+		'stratified' : the points of the 'random' sampler, with the
+		(atmosphere file, profile) pairs split in N equal strata with
+		one run in each, so that the files are sampled in proportion
+		and the profiles of each file are spread out.
+
+		Parameters
+		----------
+		N : int
+			Number of trajectories
+		"""
+
+		if self.sampler == 'random':
+			self.design = None
+			return
+
+		d = len(DISPERSIONS)
+		rng = np.random.default_rng([self.masterSeed, N, SAMPLERS.index(self.sampler)])
+
+		if self.sampler == 'lhs':
+			design = qmc.LatinHypercube(d, seed=rng).random(N)
+		elif self.sampler == 'sobol':
+			m = int(np.ceil(np.log2(max(N, 1))))
+			design = qmc.Sobol(d, scramble=True, seed=rng).random_base2(m)[0:N]
+		else:
+			design = np.array([self.generator(i).random(d) for i in range(N)]).reshape(N, d)
+
+			# pair index k = file index*NMONTE + profile index,
+			# stratified over the runs, mapped back to the centers of
+			# the file and profile cells
+			nfiles = len(self.vehicle.atmfiles)
+			NMONTE = self.vehicle.NMONTE
+			u = (rng.permutation(N) + design[:, 0])/N
+			k = np.minimum((u*nfiles*NMONTE).astype(int), nfiles*NMONTE - 1)
+			design[:, 0] = (k//NMONTE + 0.5)/nfiles
+			design[:, 1] = (k % NMONTE + 0.5)/NMONTE
+
+		self.design = design
+
+	def unitSample(self, runIndex):
+		"""
+		Returns the unit hypercube point of a run.
+
+		Parameters
+		----------
+		runIndex : int
+			run index, zero indexed
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			point in [0, 1)^len(DISPERSIONS)
+		"""
+
+		if self.sampler == 'random':
+			return self.generator(runIndex).random(len(DISPERSIONS))
+
+		if self.design is None or runIndex >= len(self.design):
+			raise ValueError("The '" + self.sampler + "' sampler requires setDesign() for run index " +
+							 str(runIndex) + ".")
+
+		return self.design[runIndex]
+
+	def sample(self, runIndex):
+		"""
+		Returns the dispersions of a run: the atmosphere file, the
+		profile no., the EFPA, the mean density sigma deviation and,
+		for lift modulation, the L/D. The file and profile are
+		uniform over the atmfiles and 1 to NMONTE, the others normal.
+
+		Parameters
+		----------
+		runIndex : int
+			run index, zero indexed
+
+		Returns
+		----------
+		ans : dict
+			dispersions of the run, keys of DISPERSIONS
+		"""
+
+		vehicle = self.vehicle
+		u = self.unitSample(runIndex)
+
+		# keep the normal quantiles finite
+		z = ndtri(np.clip(u[2:], 2.0**-53, 1.0 - 2.0**-53))
+
+		atmfile = vehicle.atmfiles[min(int(u[0]*len(vehicle.atmfiles)), len(vehicle.atmfiles) - 1)]
+		profile = min(int(u[1]*vehicle.NMONTE), vehicle.NMONTE - 1) + 1
+		efpa = vehicle.nominalEFPA + vehicle.EFPA_1sigma_value*z[0]
+
+		if self.modulation == 'lift':
+			atmSigma = vehicle.atmSigmaFactor*z[1]
+			LD = vehicle.nominalLD + vehicle.LD_1sigma_value*z[2]
+		else:
+			atmSigma = z[1]
+			LD = 0.0
+
+		return {'atmfile': atmfile, 'profile': profile, 'efpa': float(efpa),
+				'atmSigma': float(atmSigma), 'LD': float(LD)}
+
+	def designDiagnostics(self, N):
+		"""
+		Returns diagnostics of the dispersions of the first N runs,
+		which can be compared between samplers before any trajectory
+		is run.
+
+		Parameters
+		----------
+		N : int
+			Number of trajectories
+
+		Returns
+		----------
+		ans : dict
+			'discrepancy' : centered L2 discrepancy of the continuous
+			dispersions (EFPA, sigma and, for lift modulation, L/D),
+			lower is more uniform
+			'fileCounts' : numpy.ndarray, number of runs per
+			atmosphere file
+			'profiles' : int, number of distinct (file, profile) pairs
+		"""
+
+		if self.sampler != 'random' and (self.design is None or len(self.design) != N):
+			self.setDesign(N)
+
+		U = np.array([self.unitSample(i) for i in range(N)]).reshape(N, len(DISPERSIONS))
+		dims = [2, 3, 4] if self.modulation == 'lift' else [2, 3]
+
+		nfiles = len(self.vehicle.atmfiles)
+		files = np.minimum((U[:, 0]*nfiles).astype(int), nfiles - 1)
+		profiles = np.minimum((U[:, 1]*self.vehicle.NMONTE).astype(int), self.vehicle.NMONTE - 1)
+
+		return {'discrepancy': float(qmc.discrepancy(U[:, dims])),
+				'fileCounts': np.bincount(files, minlength=nfiles),
+				'profiles': len(set(zip(files.tolist(), profiles.tolist())))}
+
+	def simulate(self, runIndex):
+		"""
+		Propogates the guided trajectory of a run on a fresh copy of
+		the vehicle.
+
+		Parameters
+		----------
+		runIndex : int
+			run index, zero indexed
+
+		Returns
+		----------
+		ans : dict
+			dispersions and outcomes of the run, keys of DISPERSIONS
+			and OUTCOMES
+		"""
+
+		result = self.sample(runIndex)
+		vehicle = copy.deepcopy(self.vehicle)
+		planet = vehicle.planetObj
+
+		if result['atmfile'] not in self.bank:
+			if self.earthAtmosphere is True:
+				ATM = planet.loadMonteCarloDensityFile3(result['atmfile'], vehicle.heightCol, vehicle.densAvgCol,
+														vehicle.densSD_percCol, vehicle.densTotalCol,
+														vehicle.heightInKmFlag)
+			else:
+				ATM = planet.loadMonteCarloDensityFile2(result['atmfile'], vehicle.heightCol, vehicle.densLowCol,
+														vehicle.densAvgCol, vehicle.densHighCol,
+														vehicle.densTotalCol, vehicle.heightInKmFlag)
+			self.bank.add(result['atmfile'], *ATM)
+
+		planet.density_int = self.bank.densityInterpolator(result['atmfile'], result['profile'],
+														   result['atmSigma'])
+
+		h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, drange0_km, heatLoad0 = self.initialState
+		vehicle.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, result['efpa'],
+								drange0_km, heatLoad0)
+
+		if self.modulation == 'lift':
+			getattr(vehicle, self.guidance)(vehicle.timeStep, vehicle.dt, vehicle.maxTimeSecs)
+		else:
+			getattr(vehicle, self.guidance)(vehicle.timeStepEntry, vehicle.timeStepExit, vehicle.dt,
+											vehicle.maxTimeSecs)
+
+		if self.integrateHeatload is True:
+			heatload_max = max(cumulative_trapezoid(vehicle.q_stag_total_full, vehicle.t_min_full*60,
+													initial=0))/1e3
+		else:
+			heatload_max = max(vehicle.heatload_full)
+
+		result['terminal_apoapsis'] = float(vehicle.terminal_apoapsis)
+		result['apoapsis_error'] = float(vehicle.apoapsis_perc_error)
+		result['terminal_periapsis'] = float(vehicle.terminal_periapsis)
+		result['periapsis_raise_DV'] = float(vehicle.periapsis_raise_DV)
+		result['apoapsis_raise_DV'] = float(vehicle.apoapsis_raise_DV)
+		result['acc_net_g_max'] = float(max(vehicle.acc_net_g_full))
+		result['q_stag_max'] = float(max(vehicle.q_stag_total_full))
+		result['heatload_max'] = float(heatload_max)
+
+		return result
+
+	def run(self, runIndices):
+		"""
+		Simulates a sequence of runs, in the calling process or over
+		a process pool.
+
+		Parameters
+		----------
+		runIndices : iterable
+			run indices, zero indexed
+
+		Returns
+		----------
+		ans : iterator
+			(runIndex, result) pairs in the order of runIndices, as
+			the runs complete
+		"""
+
+		runIndices = list(runIndices)
+
+		if self.workers == 1:
+			for runIndex in runIndices:
+				yield runIndex, self.simulate(runIndex)
+			return
+
+		with ProcessPoolExecutor(max_workers=self.workers, initializer=initializeWorker,
+								 initargs=(self,)) as pool:
+			for runIndex, result in zip(runIndices, pool.map(simulateWorker, runIndices)):
+				yield runIndex, result
+
+	def campaignSettings(self):
+		"""
+		Returns the settings of the campaign other than the master
+		seed and sampler, which are recorded in the header of the
+		results store: the guided propogation method and its options,
+		the planet, the reference initial state and the
+		CAMPAIGN_PARAMETERS of the vehicle.
+
+		Returns
+		----------
+		ans : dict
+			campaign settings, JSON serializable
+		"""
+
+		settings = {'guidance': self.guidance,
+					'earthAtmosphere': self.earthAtmosphere,
+					'integrateHeatload': self.integrateHeatload,
+					'planet': self.vehicle.planetObj.ID,
+					'initialState': [jsonValue(x) for x in self.initialState]}
+
+		for name in CAMPAIGN_PARAMETERS:
+			settings[name] = jsonValue(getattr(self.vehicle, name, None))
+
+		return settings
+
+	def runCampaign(self, N, mainFolder, legacyText=False, flushEvery=20, resume=False):
+		"""
+		Runs N trajectories, appending the dispersions and outcomes of
+		each run to the results store in mainFolder/results/, and
+		writes the summary arrays to mainFolder/*_arr.txt at the end
+		of the campaign.
+
+		The store is the checkpoint of the campaign. With resume=True,
+		the runs already in the store of mainFolder are skipped and
+		only the missing run indices are simulated. As the dispersions
+		of a run only depend on the master seed and run index (and N,
+		for a design sampler), the resumed campaign gives the same
+		results as an uninterrupted one. A ValueError is raised if
+		the store was written with a different master seed, sampler,
+		atmosphere files or campaignSettings().
+
+		Parameters
+		----------
+		N : int
+			Number of trajectories
+		mainFolder : str
+			path where data is to be stored
+		legacyText : bool, optional
+			if True, the dispersions and outcomes of each run are also
+			exported to mainFolder/#i/*.txt, default=False
+		flushEvery : int, optional
+			number of runs buffered between writes to the results
+			store, default=20
+		resume : bool, optional
+			if True, resumes the campaign in mainFolder if it exists,
+			default=False requires that mainFolder does not exist
+
+		Returns
+		----------
+		ans : MonteCarloResults
+			results of the campaign
+		"""
+
+		os.makedirs(mainFolder, exist_ok=resume)
+
+		self.setDesign(N)
+		designSize = None if self.sampler == 'random' else N
+
+		sink = MonteCarloSink(mainFolder, self.vehicle.atmfiles, self.masterSeed, flushEvery, resume,
+							  self.sampler, designSize, self.campaignSettings())
+		runIndices = [i for i in range(N) if i not in sink.completed]
+
+		# buffered rows are saved if the campaign is interrupted
+		try:
+			for i, result in self.run(runIndices):
+				sink.append(i, result)
+
+				print("BATCH :" + str(mainFolder) + ", RUN #: " + str(i + 1) + ", PROF: " + str(result['atmfile']) +
+					  ", SAMPLE #: " + str(result['profile']) + ", EFPA: " + str('{:.2f}'.format(result['efpa'])) +
+					  ", SIGMA: " + str('{:.2f}'.format(result['atmSigma'])) +
+					  ", APO : " + str('{:.2f}'.format(result['terminal_apoapsis'])))
+		finally:
+			sink.flush()
+
+		results = loadMonteCarloResults(mainFolder)
+		results.exportText(runFolders=legacyText)
+
+		return results
+
+
+def jsonValue(value):
+	"""
+	Returns a value as a JSON serializable Python object.
+
+	Parameters
+	----------
+	value : object
+		value, numpy scalars and arrays are converted
+
+	Returns
+	----------
+	ans : object
+		value
+	"""
+
+	if isinstance(value, (np.generic, np.ndarray)):
+		return value.tolist()
+
+	return value
+
+
+# executor of a worker process, set by initializeWorker()
+workerExecutor = None
+
+
+def initializeWorker(executor):
+	"""
+	Sets the executor of a worker process.
+
+	Parameters
+	----------
+	executor : MonteCarloExecutor
+		executor of the campaign
+	"""
+
+	global workerExecutor
+	workerExecutor = executor
+
+
+def simulateWorker(runIndex):
+	"""
+	Simulates a run in a worker process.
+
+	Parameters
+	----------
+	runIndex : int
+		run index, zero indexed
+
+	Returns
+	----------
+	ans : dict
+		dispersions and outcomes of the run
+	"""
+
+	return workerExecutor.simulate(runIndex)
+
+
+class MonteCarloSink:
+	"""
+	The MonteCarloSink class appends the results of a Monte Carlo
+	campaign to a columnar binary store, a directory with a JSON
+	header and one raw little-endian file per column of
+	RESULTS_COLUMNS. Each run is one row. Rows are buffered in memory
+	and appended to the column files in batches, so the I/O of a
+	campaign is proportional to the number of runs.
+
+	Attributes
+	----------
+	folder : str
+		results store directory
+	atmfiles : list
+		atmosphere files of the campaign, the atmfile column holds
+		indices into this list
+	flushEvery : int
+		number of rows buffered between writes
+	rows : list
+		buffered rows, not yet written
+	completed : set
+		run indices of the rows in the store
+	"""
+
+	def __init__(self, mainFolder, atmfiles, masterSeed, flushEvery=20, resume=False, sampler='random',
+				 designSize=None, settings=None):
+		"""
+		Creates the results store in mainFolder/results/, or with
+		resume=True, reopens the existing store for appending.
+
+		Parameters
+		----------
+		mainFolder : str
+			campaign folder
+		atmfiles : list
+			atmosphere files of the campaign
+		masterSeed : int
+			campaign master seed, recorded in the header
+		flushEvery : int, optional
+			number of rows buffered between writes, default=20
+		resume : bool, optional
+			if True and the store exists, reopens it, default=False
+		sampler : str, optional
+			dispersion sampler of the campaign, recorded in the
+			header, default='random'
+		designSize : int, optional
+			number of runs of the design of a design sampler,
+			recorded in the header, default=None
+		settings : dict, optional
+			further settings of the campaign, see
+			MonteCarloExecutor.campaignSettings(), recorded in the
+			header, default=None
+		"""
+
+		self.folder = os.path.join(mainFolder, RESULTS_DIRNAME)
+		self.atmfiles = list(atmfiles)
+		self.atmfileIndex = {atmfile: j for j, atmfile in enumerate(self.atmfiles)}
+		self.flushEvery = flushEvery
+		self.rows = []
+		self.completed = set()
+
+		campaign = {'masterSeed': masterSeed, 'sampler': sampler, 'designSize': designSize}
+		if settings is not None:
+			campaign.update(settings)
+
+		# as read back from the header
+		campaign = json.loads(json.dumps(campaign))
+
+		if resume is True and os.path.exists(os.path.join(self.folder, RESULTS_HEADER)):
+			self.reopen(campaign)
+			return
+
+		os.makedirs(self.folder)
+
+		header = {'columns': RESULTS_COLUMNS, 'atmfiles': self.atmfiles}
+		header.update(campaign)
+		with open(os.path.join(self.folder, RESULTS_HEADER), 'w') as f:
+			json.dump(header, f, indent=1)
+
+		for name, dtype in RESULTS_COLUMNS:
+			open(os.path.join(self.folder, name + '.bin'), 'wb').close()
+
+	def reopen(self, campaign):
+		"""
+		Reopens an existing store, after checking that it belongs to
+		the same campaign. Rows which were only partially written
+		are truncated from the column files.
+
+		Parameters
+		----------
+		campaign : dict
+			master seed, sampler, design size and settings of the
+			campaign, each must match the header
+		"""
+
+		with open(os.path.join(self.folder, RESULTS_HEADER)) as f:
+			header = json.load(f)
+
+		for key, value in campaign.items():
+			if key not in header or header[key] != value:
+				raise ValueError("Monte Carlo results in " + self.folder + " were run with " + key + " " +
+								 str(header.get(key)) + ", not " + str(value) + ".")
+		if header['atmfiles'] != self.atmfiles:
+			raise ValueError("Monte Carlo results in " + self.folder + " were run with different atmfiles.")
+
+		columnfiles = [(os.path.join(self.folder, name + '.bin'), np.dtype(dtype).itemsize)
+					   for name, dtype in RESULTS_COLUMNS]
+		nrows = min(os.path.getsize(columnfile)//itemsize for columnfile, itemsize in columnfiles)
+
+		for columnfile, itemsize in columnfiles:
+			os.truncate(columnfile, nrows*itemsize)
+
+		self.completed = set(np.fromfile(columnfiles[0][0], dtype=RESULTS_COLUMNS[0][1]).tolist())
+
+	def append(self, runIndex, result):
+		"""
+		Appends the result of a run, writing the buffered rows if
+		flushEvery rows are buffered.
+
+		Parameters
+		----------
+		runIndex : int
+			run index, zero indexed
+		result : dict
+			dispersions and outcomes of the run, as returned by
+			MonteCarloExecutor.simulate()
+		"""
+
+		row = dict(result)
+		row['run'] = runIndex
+		row['atmfile'] = self.atmfileIndex[result['atmfile']]
+		self.rows.append(row)
+		self.completed.add(runIndex)
+
+		if len(self.rows) >= self.flushEvery:
+			self.flush()
+
+	def flush(self):
+		"""
+		Appends the buffered rows to the column files.
+		"""
+
+		if len(self.rows) == 0:
+			return
+
+		for name, dtype in RESULTS_COLUMNS:
+			values = np.array([row[name] for row in self.rows], dtype=dtype)
+			with open(os.path.join(self.folder, name + '.bin'), 'ab') as f:
+				f.write(values.tobytes())
+
+		self.rows = []
+
+
+class MonteCarloResults:
+	"""
+	The MonteCarloResults class holds the results of a Monte Carlo
+	campaign read from its results store, ordered by run index.
+
+	The column of each dispersion and outcome is exposed as
+	<name>_arr, e.g. terminal_apoapsis_arr, heatload_max_arr, and
+	atmfile_arr for the atmosphere file of each run.
+
+	Attributes
+	----------
+	mainFolder : str
+		campaign folder
+	masterSeed : int
+		campaign master seed
+	atmfiles : list
+		atmosphere files of the campaign
+	columns : dict
+		column values, numpy.ndarray, by column name
+	"""
+
+	def __init__(self, mainFolder, masterSeed, atmfiles, columns):
+		self.mainFolder = mainFolder
+		self.masterSeed = masterSeed
+		self.atmfiles = atmfiles
+		self.columns = columns
+
+	def __len__(self):
+		return len(self.columns['run'])
+
+	def __getattr__(self, name):
+		columns = self.__dict__.get('columns', {})
+
+		if name == 'atmfile_arr':
+			return np.array(self.atmfiles)[columns['atmfile']]
+		if name.endswith('_arr') and name[:-4] in columns:
+			return columns[name[:-4]]
+
+		raise AttributeError("'MonteCarloResults' object has no attribute '" + name + "'")
+
+	def exportText(self, runFolders=False):
+		"""
+		Writes the summary arrays to mainFolder/*_arr.txt and
+		optionally the dispersions and outcomes of each run to
+		mainFolder/#i/*.txt, in the text layout of the original
+		Monte Carlo drivers.
+
+		Parameters
+		----------
+		runFolders : bool, optional
+			if True, also writes the mainFolder/#i/ folders,
+			default=False
+		"""
+
+		for name in SUMMARIES:
+			np.savetxt(os.path.join(self.mainFolder, name + '_arr.txt'), self.columns[name])
+
+		if runFolders is False:
+			return
+
+		atmfile_arr = self.atmfile_arr
+
+		for k, i in enumerate(self.columns['run']):
+			runFolder = os.path.join(self.mainFolder, '#' + str(i + 1))
+			os.makedirs(runFolder, exist_ok=True)
+
+			np.savetxt(os.path.join(runFolder, 'atmfile.txt'), np.array([atmfile_arr[k]]), fmt='%s')
+			for name in DISPERSIONS[1:] + OUTCOMES[0:5]:
+				np.savetxt(os.path.join(runFolder, name + '.txt'), np.array([self.columns[name][k]]))
+
+
+def loadMonteCarloResults(mainFolder):
+	"""
+	Reads the results store of a Monte Carlo campaign. Rows which
+	were only partially written, if the campaign was interrupted
+	during a write, are ignored.
+
+	Parameters
+	----------
+	mainFolder : str
+		campaign folder
+
+	Returns
+	----------
+	ans : MonteCarloResults
+		results of the campaign, ordered by run index
+	"""
+
+	folder = os.path.join(mainFolder, RESULTS_DIRNAME)
+
+	with open(os.path.join(folder, RESULTS_HEADER)) as f:
+		header = json.load(f)
+
+	columns = {}
+	for name, dtype in header['columns']:
+		columns[name] = np.fromfile(os.path.join(folder, name + '.bin'), dtype=dtype)
+
+	nrows = min(len(values) for values in columns.values())
+	order = np.argsort(columns['run'][0:nrows], kind='mergesort')
+	columns = {name: values[0:nrows][order] for name, values in columns.items()}
+
+	return MonteCarloResults(mainFolder, header['masterSeed'], header['atmfiles'], columns)
+
+
+def campaignMasterSeed(mainFolder):
+	"""
+	Returns the master seed of the campaign stored in mainFolder.
+
+	Parameters
+	----------
+	mainFolder : str
+		campaign folder
+
+	Returns
+	----------
+	ans : int
+		campaign master seed, None if mainFolder holds no results store
+	"""
+
+	headerfile = os.path.join(mainFolder, RESULTS_DIRNAME, RESULTS_HEADER)
+
+	if not os.path.exists(headerfile):
+		return None
+
+	with open(headerfile) as f:
+		return json.load(f)['masterSeed']
+
+
+def varianceReduction(statistic, baseline, design):
+	"""
+	Estimates the variance reduction of a sampling strategy from
+	replicate campaigns, e.g. campaigns of the same size run with
+	different master seeds with the 'random' sampler (baseline) and
+	with a design sampler (design).
+
+	Parameters
+	----------
+	statistic : callable
+		function of a campaign which returns the estimate of
+		interest, e.g. lambda results:
+		np.percentile(results.terminal_apoapsis_arr, 99.87)
+	baseline : list
+		replicate campaigns of the baseline sampler, e.g.
+		MonteCarloResults, at least 2
+	design : list
+		replicate campaigns of the sampler to assess, at least 2
+
+	Returns
+	----------
+	ans : dict
+		'baselineMean', 'baselineStd' : mean and standard deviation
+		of the statistic over the baseline replicates
+		'designMean', 'designStd' : same, over the design replicates
+		'varianceRatio' : baseline variance / design variance, the
+		factor by which the design sampler reduces the variance
+		'equivalentRuns' : number of baseline runs which give the
+		variance of a design campaign, varianceRatio x runs per
+		baseline campaign
+	"""
+
+	if len(baseline) < 2 or len(design) < 2:
+		raise ValueError("varianceReduction requires at least 2 replicates of each sampler.")
+
+	baselineValues = np.array([statistic(results) for results in baseline], dtype=float)
+	designValues = np.array([statistic(results) for results in design], dtype=float)
+
+	baselineVar = np.var(baselineValues, ddof=1)
+	designVar = np.var(designValues, ddof=1)
+	varianceRatio = baselineVar/designVar if designVar > 0 else np.inf
+
+	return {'baselineMean': float(np.mean(baselineValues)), 'baselineStd': float(np.sqrt(baselineVar)),
+			'designMean': float(np.mean(designValues)), 'designStd': float(np.sqrt(designVar)),
+			'varianceRatio': float(varianceRatio),
+			'equivalentRuns': float(varianceRatio*np.mean([len(results) for results in baseline]))}
@@ -1,8 +1,12 @@
 import numpy as np
 from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
 from matplotlib import rcParams
 import matplotlib.pyplot as plt
 from scipy.integrate import cumulative_trapezoid
+import copy
+
+from AMAT.atmstore import loadAtmosphereTable
 
 
 class Planet:
@@ -67,13 +71,13 @@ class Planet:
 		Array containing density values from atm. look up dat file
 	ATM_sonic : numpy.ndarray
 		Array containing computed sonic speed values
-	temp_int : scipy.interpolate.interpolate.interp1d
+	temp_int : UniformGridInterpolator or scipy.interpolate.interp1d
 		Function which interpolates temperature as function of height
-	pressure_int : scipy.interpolate.interpolate.interp1d
+	pressure_int : UniformGridInterpolator or scipy.interpolate.interp1d
 		Function which interpolates pressure as function of height
-	density_int : scipy.interpolate.interpolate.interp1d
+	density_int : UniformGridInterpolator or scipy.interpolate.interp1d
 		Function which interpolates density as function of height
-	sonic_int : scipy.interpolate.interpolate.interp1d
+	sonic_int : UniformGridInterpolator or scipy.interpolate.interp1d
 		Function which interpolates sonic speed as function of height
 	"""
 
@@ -252,7 +256,8 @@ class Planet:
 		Parameters
 		----------
 		datfile : str
-			file containing atmospheric lookup table
+			file containing atmospheric lookup table, or the table
+			in a packed store, see atmstore.AtmosphereCache
 		heightCol : int
 			column number of height values, assumes unit = meters 
 			(first column = 0, second column = 1, etc.)
@@ -273,7 +278,10 @@ class Planet:
 			False by default
 		"""
 	
-		self.ATM = np.loadtxt(datfile)
+		# parsed once and cached, or read from a packed atmosphere
+		# store, see atmstore.AtmosphereCache. The shared table is
+		# read-only, self.ATM is a writable copy as from np.loadtxt()
+		self.ATM = np.array(loadAtmosphereTable(datfile))
 
 		if heightInKmFlag is True:
 			# convert heightCol from km to meters
@@ -302,10 +310,46 @@ class Planet:
 		# might go above the altitude for which atmospheric data is available, or 
 		# go below the surface where at atmpospheric data is available.
 
-		self.temp_int = interp1d(self.ATM_height, self.ATM_temp, kind=intType, fill_value=0.0, bounds_error=False)
-		self.pressure_int = interp1d(self.ATM_height, self.ATM_pressure, kind=intType, fill_value=0.0, bounds_error=False)
-		self.density_int = interp1d(self.ATM_height, self.ATM_density, kind=intType, fill_value=0.0, bounds_error=False)
-		self.sonic_int = interp1d(self.ATM_height, self.ATM_sonic, kind=intType, fill_value=1E20, bounds_error=False)
+		# For tables on a uniform height grid, createInterpolator() returns 
+		# a UniformGridInterpolator which gives the same values as interp1d 
+		# using direct index arithmetic.
+
+		self.temp_int = self.createInterpolator(self.ATM_height, self.ATM_temp, intType, 0.0)
+		self.pressure_int = self.createInterpolator(self.ATM_height, self.ATM_pressure, intType, 0.0)
+		self.density_int = self.createInterpolator(self.ATM_height, self.ATM_density, intType, 0.0)
+		self.sonic_int = self.createInterpolator(self.ATM_height, self.ATM_sonic, intType, 1E20)
+
+	def createInterpolator(self, x, y, kind='cubic', fill_value=0.0):
+		"""
+		Returns an interpolating function for the lookup table y(x).
+
+		If x is a uniform grid and kind is 'linear' or 'cubic', a
+		UniformGridInterpolator is returned. Otherwise, falls back
+		to scipy.interpolate.interp1d. Both return fill_value 
+		outside the range of x.
+
+		Parameters
+		----------
+		x : numpy.ndarray
+			independent variable of the lookup table
+		y : numpy.ndarray
+			dependent variable of the lookup table
+		kind : str, optional
+			interpolation type: 'linear', 'quadratic' or 'cubic'
+			defaults to 'cubic'
+		fill_value : float, optional
+			value returned outside the range of x, default=0.0
+
+		Returns
+		----------
+		ans : UniformGridInterpolator or scipy.interpolate.interp1d
+			interpolating function
+		"""
+
+		if kind in ['linear', 'cubic'] and UniformGridInterpolator.isUniform(x):
+			return UniformGridInterpolator(x, y, kind=kind, fill_value=fill_value)
+		else:
+			return interp1d(x, y, kind=kind, fill_value=fill_value, bounds_error=False)
 
 	def density(self, h):
 		"""
@@ -343,6 +387,78 @@ class Planet:
 			# trajectory goes below the surface during propagation
 			return self.rho0
 
+	def densityAndSonic(self, h):
+		"""
+		Returns atmospheric density, as in density(), and sonic speed,
+		scalar values, at altitude h (in meters). If the density and 
+		sonic speed tables are on the same uniform grid, both are 
+		interpolated with a single table lookup.
+
+		Parameters
+		----------
+		h : float
+			altitude in meters
+
+		Returns
+		----------
+		rho : float
+			atmospheric density at height h
+		sonic : float
+			atmospheric sonic speed at height h
+		"""
+
+		density_int = self.density_int
+		sonic_int = self.sonic_int
+
+		if 0 <= h <= self.h_thres:
+			if type(density_int) is UniformGridInterpolator and density_int.sharesGrid(sonic_int):
+				return density_int.evaluatePair(sonic_int, h)
+			return float(density_int(h)), float(sonic_int(h))
+
+		elif h > self.h_thres:
+			return 0, float(sonic_int(h))
+
+		else:
+			return self.rho0, float(sonic_int(h))
+
+	def densityDerivative(self, h):
+		"""
+		Returns the derivative of atmospheric density with respect 
+		to altitude, scalar value, at altitude h (in meters), 
+		consistent with density()
+
+		Parameters
+		----------
+		h : float
+			altitude in meters
+
+		Returns
+		----------
+		ans : float
+			density gradient at height h, kg/m4
+		"""
+
+		if 0 <= h <= self.h_thres:
+			if isinstance(self.density_int, UniformGridInterpolator):
+				return self.density_int.derivative(h)
+			else:
+				# central difference for general interpolating functions,
+				# one-sided within half a step of the ends of the table
+				# where the central difference would read the fill value
+				h_lo = self.density_int.x[0]
+				h_hi = self.density_int.x[-1]
+
+				if h - 0.5 < h_lo:
+					h_m, h_p = h, h + 1.0
+				elif h + 0.5 > h_hi:
+					h_m, h_p = h - 1.0, h
+				else:
+					h_m, h_p = h - 0.5, h + 0.5
+
+				return float(self.density_int(h_p)) - float(self.density_int(h_m))
+		else:
+			return 0.0
+
 	def tempvectorized(self, h):
 		"""
 		Returns atmospheric temperature, vector
@@ -607,6 +723,33 @@ class Planet:
 		ans = self.rho2(rbar, theta, phi)/self.rho0
 		return ans
 
+	def rhobarvectorized(self, rbar):
+		"""
+		Returns non-dimensional density rhobar = rho / rho0, vector
+		at non-dimensional radial distance array rbar[:], with the
+		same treatment of altitudes above h_thres and below the
+		surface as density()
+
+		Parameters
+		----------
+		rbar : numpy.ndarray
+			nondimensional radial distance rbar[:]
+			measured from the planet center
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			non-dimensional density at rbar[:]
+		"""
+		h = rbar*self.RP - self.RP
+		ans = np.zeros(len(h))
+
+		inside = (h >= 0) & (h <= self.h_thres)
+		ans[inside] = self.density_int(h[inside])
+		ans[h < 0] = self.rho0
+
+		return ans/self.rho0
+
 	def checkAtmProfiles(self, h0=0.0, dh=1000.0):
 		"""
 		Function to check the loaded atmospheric profile data.
@@ -852,7 +995,8 @@ class Planet:
 		Parameters
 		----------
 		atmfile : str
-			filename, contains mean density profile data
+			filename, contains mean density profile data, or the
+			table in a packed store, see atmstore.AtmosphereCache
 		heightCol : int
 			column number of height values, assumes unit = meters 
 			(first column = 0, second column = 1, etc.)
@@ -883,8 +1027,9 @@ class Planet:
 
 		""" 
 		
-		# load data from textfile using np.loadtxt()
-		ATM = np.loadtxt(atmfile)
+		# load data from textfile, parsed once and cached, or read 
+		# from a packed atmosphere store, see atmstore.AtmosphereCache
+		ATM = loadAtmosphereTable(atmfile)
 		
 		if heightInKmFlag is True:
 			# convert heightCol from km to meters
@@ -910,7 +1055,8 @@ class Planet:
 		Parameters
 		----------
 		atmfile : str
-			filename, contains mean density profile data
+			filename, contains mean density profile data, or the
+			table in a packed store, see atmstore.AtmosphereCache
 		heightCol : int
 			column number of height values, assumes unit = meters 
 			(first column = 0, second column = 1, etc.)
@@ -939,8 +1085,9 @@ class Planet:
 
 		""" 
 		
-		# load data from textfile using np.loadtxt()
-		ATM = np.loadtxt(atmfile)
+		# load data from textfile, parsed once and cached, or read 
+		# from a packed atmosphere store, see atmstore.AtmosphereCache
+		ATM = loadAtmosphereTable(atmfile)
 		
 		if heightInKmFlag is True:
 			# convert heightCol from km to meters
@@ -1002,7 +1149,9 @@ class Planet:
 	def loadAtmosphereModel5(self, ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, ATM_density_pert, sigmaValue, NPOS, i):
 		"""
 		Read and create density_int for a single entry from a list 
-		of perturbed monte carlo density profiles.
+		of perturbed monte carlo density profiles. For repeated 
+		selections from the same files, DensityProfileBank gives the 
+		same profiles without rebuilding the interpolation function.
 		
 		Parameters
 		----------
@@ -1087,3 +1236,447 @@ class Planet:
 
 		density_int = interp1d(h_array, d_array, kind='linear', fill_value=0.0, bounds_error=False)
 		return density_int
+
+
+class UniformGridInterpolator:
+	"""
+	Piecewise polynomial interpolation of a lookup table on a 
+	uniform grid, which gives the same values as 
+	scipy.interpolate.interp1d with kind='linear' or 'cubic'
+	and bounds_error=False.
+
+	The polynomial coefficients of each interval are computed once, 
+	so that a query only needs the interval index, which is found 
+	by direct index arithmetic instead of a binary search.
+
+	Attributes
+	----------
+	x : numpy.ndarray
+		grid points, sorted in ascending order
+	y : numpy.ndarray
+		values at the grid points
+	kind : str
+		interpolation type: 'linear' or 'cubic'
+	fill_value : float
+		value returned outside the range of x
+	c : numpy.ndarray
+		polynomial coefficients of each interval, highest power 
+		first, shape (k+1, len(x)-1), in terms of (xq - x[i])
+	"""
+
+	def __init__(self, x, y, kind='cubic', fill_value=0.0):
+		"""
+		Computes the polynomial coefficients of each interval.
+
+		Parameters
+		----------
+		x : numpy.ndarray
+			uniform grid points
+		y : numpy.ndarray
+			values at the grid points
+		kind : str, optional
+			interpolation type: 'linear' or 'cubic',
+			defaults to 'cubic'
+		fill_value : float, optional
+			value returned outside the range of x, default=0.0
+		"""
+
+		order = np.argsort(x, kind='mergesort')
+		self.x = np.array(x, dtype=float)[order]
+		self.y = np.array(y, dtype=float)[order]
+		self.kind = kind
+		self.fill_value = fill_value
+
+		if kind not in ['linear', 'cubic']:
+			raise ValueError("UniformGridInterpolator supports kind='linear' or 'cubic'.")
+
+		self.n = len(self.x)
+		self.x_lo = self.x[0]
+		self.x_hi = self.x[-1]
+		self.inv_dx = (self.n - 1) / (self.x_hi - self.x_lo)
+
+		# python lists for the scalar path
+		self._x_list = self.x.tolist()
+		self.setCoefficients()
+
+	def setCoefficients(self):
+		"""
+		Computes the polynomial coefficients of each interval from
+		the values y at the grid points.
+		"""
+		if self.kind == 'linear':
+			slope = (self.y[1:] - self.y[:-1]) / (self.x[1:] - self.x[:-1])
+			self.c = np.vstack((slope, self.y[:-1]))
+		else:
+			# same not-a-knot spline as interp1d, expanded about the
+			# left end of each interval
+			spline = make_interp_spline(self.x, self.y, k=3)
+			xl = self.x[:-1]
+			self.c = np.vstack((spline(xl, nu=3)/6.0, spline(xl, nu=2)/2.0, spline(xl, nu=1), self.y[:-1]))
+
+		self._c_list = self.c.T.tolist()
+
+	def withValues(self, y):
+		"""
+		Returns an interpolator of the same kind on the same grid,
+		with new values at the grid points. The grid is not sorted
+		or checked again.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			values at the grid points, in the (ascending) order of x
+
+		Returns
+		----------
+		ans : UniformGridInterpolator
+			interpolator of y
+		"""
+		ans = copy.copy(self)
+		ans.y = np.array(y, dtype=float)
+		ans.setCoefficients()
+		return ans
+
+	@staticmethod
+	def isUniform(x, rtol=1E-9):
+		"""
+		Checks if x is a uniform grid (in any order).
+
+		Parameters
+		----------
+		x : numpy.ndarray
+			grid points
+		rtol : float, optional
+			relative tolerance on the grid spacing
+
+		Returns
+		----------
+		ans : bool
+			True if x is a uniform grid with at least 4 points
+		"""
+		x = np.sort(np.asarray(x, dtype=float))
+		if len(x) < 4:
+			return False
+		dx = np.diff(x)
+		return bool(dx[0] > 0 and np.all(np.abs(dx - dx[0]) <= rtol*dx[0]))
+
+	def locate(self, xq):
+		"""
+		Returns the interval index of a scalar query point inside 
+		the grid range.
+
+		Parameters
+		----------
+		xq : float
+			query point, x[0] <= xq <= x[-1]
+
+		Returns
+		----------
+		i : int
+			interval index, x[i] <= xq <= x[i+1]
+		"""
+		i = int((xq - self.x_lo)*self.inv_dx)
+		if i > self.n - 2:
+			i = self.n - 2
+		# guard against round off in the grid spacing
+		if xq < self._x_list[i]:
+			i = i - 1
+		elif xq > self._x_list[i+1] and i < self.n - 2:
+			i = i + 1
+		return i
+
+	def evaluate(self, xq):
+		"""
+		Returns the interpolated value at a scalar query point.
+
+		Parameters
+		----------
+		xq : float
+			query point
+
+		Returns
+		----------
+		ans : float
+			interpolated value, fill_value outside the grid range
+		"""
+		if not (self.x_lo <= xq <= self.x_hi):
+			return self.fill_value
+
+		i = self.locate(xq)
+		s = xq - self._x_list[i]
+		ans = 0.0
+		for ck in self._c_list[i]:
+			ans = ans*s + ck
+		return ans
+
+	def sharesGrid(self, other):
+		"""
+		Checks if another interpolator is a UniformGridInterpolator
+		on the same grid, so that both can be evaluated with a
+		single interval lookup using evaluatePair().
+
+		Parameters
+		----------
+		other : object
+			interpolating function
+
+		Returns
+		----------
+		ans : bool
+			True if other is a UniformGridInterpolator on the same grid
+		"""
+		return type(other) is UniformGridInterpolator and other.n == self.n and \
+			   other.x_lo == self.x_lo and other.x_hi == self.x_hi
+
+	def evaluatePair(self, other, xq):
+		"""
+		Returns the interpolated values of this interpolator and of
+		another interpolator on the same grid at a scalar query point,
+		locating the interval once.
+
+		Parameters
+		----------
+		other : UniformGridInterpolator
+			interpolator on the same grid, see sharesGrid()
+		xq : float
+			query point
+
+		Returns
+		----------
+		ans : float
+			interpolated value of this interpolator
+		ans_other : float
+			interpolated value of the other interpolator
+		"""
+		if not (self.x_lo <= xq <= self.x_hi):
+			return self.fill_value, other.fill_value
+
+		i = self.locate(xq)
+		s = xq - self._x_list[i]
+		ans = 0.0
+		for ck in self._c_list[i]:
+			ans = ans*s + ck
+		ans_other = 0.0
+		for ck in other._c_list[i]:
+			ans_other = ans_other*s + ck
+		return ans, ans_other
+
+	def derivative(self, xq):
+		"""
+		Returns the derivative of the interpolant at a scalar query 
+		point.
+
+		Parameters
+		----------
+		xq : float
+			query point
+
+		Returns
+		----------
+		ans : float
+			derivative of the interpolant, 0.0 outside the grid range
+		"""
+		if not (self.x_lo <= xq <= self.x_hi):
+			return 0.0
+
+		i = self.locate(xq)
+		s = xq - self._x_list[i]
+		c = self._c_list[i]
+		k = len(c) - 1
+		ans = 0.0
+		for j in range(k):
+			ans = ans*s + (k - j)*c[j]
+		return ans
+
+	def evaluateArray(self, xq):
+		"""
+		Returns the interpolated values at an array of query points.
+
+		Parameters
+		----------
+		xq : numpy.ndarray
+			query points
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			interpolated values, fill_value outside the grid range
+		"""
+		xq = np.asarray(xq, dtype=float)
+		ans = np.full(xq.shape, self.fill_value, dtype=float)
+
+		inside = (xq >= self.x_lo) & (xq <= self.x_hi)
+		xi = xq[inside]
+
+		# xi is inside the grid range, so the index only needs to be
+		# capped at the last interval, and the round off guard can
+		# not leave the grid
+		i = np.minimum(((xi - self.x_lo)*self.inv_dx).astype(np.intp), self.n - 2)
+		i = i - (xi < self.x[i]) + (xi > self.x[i+1])
+
+		s = xi - self.x[i]
+		val = self.c[0][i]
+		for ck in self.c[1:]:
+			val = val*s + ck[i]
+		ans[inside] = val
+
+		return ans
+
+	def __call__(self, xq):
+		"""
+		Returns the interpolated value(s) at xq, scalar or array.
+		"""
+		if isinstance(xq, (np.ndarray, list, tuple)):
+			return self.evaluateArray(xq)
+		return self.evaluate(xq)
+
+
+class DensityProfileBank:
+	"""
+	The DensityProfileBank class holds the Monte Carlo density 
+	profiles of GRAM-Model output files, each reshaped once into 
+	(NMONTE, NPOS) arrays of the height, the average density, the 
+	+1 sigma and -1 sigma deviations of the mean density, and the 
+	perturbations.
+
+	A dispersed profile is selected by (file, profile no., sigma), 
+	with the same values as Planet.loadAtmosphereModel5(). If the 
+	profiles of a file share a uniform height grid, the profile is 
+	served as a UniformGridInterpolator on the grid prepared once 
+	for the file, so that no interpolator is set up from scratch 
+	for each selection.
+
+	Attributes
+	----------
+	NPOS : int
+		NPOS value from GRAM model output, the number of heights in
+		each profile
+	files : dict
+		profile arrays of each file, by file name, see add()
+	"""
+
+	def __init__(self, NPOS):
+		"""
+		Initializes the DensityProfileBank.
+
+		Parameters
+		----------
+		NPOS : int
+			NPOS value from GRAM model output
+		"""
+
+		self.NPOS = NPOS
+		self.files = {}
+
+	def __contains__(self, atmfile):
+		return atmfile in self.files
+
+	def add(self, atmfile, ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, ATM_density_pert):
+		"""
+		Adds the profiles of a file, as returned by 
+		Planet.loadMonteCarloDensityFile2() or 
+		Planet.loadMonteCarloDensityFile3().
+
+		Parameters
+		----------
+		atmfile : str
+			filename, key of the profiles in the bank
+		ATM_height : numpy.ndarray
+			height array, m
+		ATM_density_low : numpy.ndarray
+			low density array, kg/m3
+		ATM_density_avg : numpy.ndarray
+			avg. density array, kg/m3
+		ATM_density_high : numpy.ndarray
+			high density array, kg/m3
+		ATM_density_pert : numpy.ndarray
+			1 sigma mean deviation from avg
+		"""
+
+		NMONTE = len(ATM_height)//self.NPOS
+		shape = (NMONTE, self.NPOS)
+
+		def reshape(x):
+			return np.asarray(x, dtype=float)[0:NMONTE*self.NPOS].reshape(shape)
+
+		height = reshape(ATM_height)
+		avg = reshape(ATM_density_avg)
+
+		profiles = {'height': height, 'avg': avg,
+					'pSigma': reshape(ATM_density_high) - avg,
+					'nSigma': avg - reshape(ATM_density_low),
+					'pert': reshape(ATM_density_pert),
+					'grid': None, 'order': None}
+
+		# interpolator template on the height grid, if it is uniform
+		# and shared by all profiles
+		if UniformGridInterpolator.isUniform(height[0]) and np.all(height == height[0]):
+			profiles['order'] = np.argsort(height[0], kind='mergesort')
+			profiles['grid'] = UniformGridInterpolator(height[0], avg[0], kind='linear', fill_value=0.0)
+
+		self.files[atmfile] = profiles
+
+	def profile(self, atmfile, i, sigmaValue):
+		"""
+		Returns a dispersed density profile.
+
+		Parameters
+		----------
+		atmfile : str
+			filename of the profiles
+		i : int
+			index of atmospheric profile, 1 to NMONTE
+		sigmaValue : float
+			mean density profile sigma deviation value
+
+		Returns
+		----------
+		h_array : numpy.ndarray
+			height array, m
+		d_array : numpy.ndarray
+			density array, kg/m3
+		"""
+
+		profiles = self.files[atmfile]
+		k = int(i) - 1
+
+		if not (0 <= k < len(profiles['avg'])):
+			raise IndexError("Profile " + str(i) + " is not in 1 to " + str(len(profiles['avg'])) + 
+							 " for " + str(atmfile) + ".")
+
+		# only one of the +/- sigma deviations applies, as with 
+		# Planet.pSigmaFunc() and Planet.nSigmaFunc()
+		if sigmaValue >= 0:
+			d_array = profiles['avg'][k] + profiles['pSigma'][k]*sigmaValue
+		else:
+			d_array = profiles['avg'][k] + profiles['nSigma'][k]*sigmaValue
+
+		return profiles['height'][k], d_array + profiles['pert'][k]
+
+	def densityInterpolator(self, atmfile, i, sigmaValue):
+		"""
+		Returns the density interpolation function of a dispersed 
+		profile, for use as Planet.density_int.
+
+		Parameters
+		----------
+		atmfile : str
+			filename of the profiles
+		i : int
+			index of atmospheric profile, 1 to NMONTE
+		sigmaValue : float
+			mean density profile sigma deviation value
+
+		Returns
+		----------
+		density_int : UniformGridInterpolator or scipy.interpolate.interp1d
+			density interpolation function
+		"""
+
+		h_array, d_array = self.profile(atmfile, i, sigmaValue)
+		grid = self.files[atmfile]['grid']
+
+		if grid is not None:
+			return grid.withValues(d_array[self.files[atmfile]['order']])
+
+		return interp1d(h_array, d_array, kind='linear', fill_value=0.0, bounds_error=False)
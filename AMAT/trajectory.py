@@ -0,0 +1,431 @@
+# SOURCE FILENAME : trajectory.py
+# DATE CREATED    : 10/18/2026, 12:20 MT
+# DATE MODIFIED   : 10/18/2026, 16:10 MT
+# REMARKS         : Compact result of a single trajectory propogation.
+#                   The truncated state and the derived loads are held
+#                   in one contiguous array, plot units are computed
+#                   on demand and the loads may be deferred to first
+#                   access. Growable log used to accumulate the
+#                   trajectory over the guidance cycles.
+
+import numpy as np
+from scipy.integrate import cumulative_trapezoid
+
+
+class TrajectoryRow:
+	"""
+	Descriptor which exposes one row of the TrajectoryResult buffer
+	as a numpy.ndarray view.
+
+	Attributes
+	----------
+	row : int
+		row index in the buffer
+	load : bool
+		if True, the row is a derived load, which is computed on
+		first access if deferred with TrajectoryResult.deferLoads(),
+		and is None until set otherwise
+	"""
+
+	def __init__(self, row, load=False):
+		self.row = row
+		self.load = load
+
+	def __get__(self, obj, objtype=None):
+		if obj is None:
+			return self
+		if self.load is True and obj.loadsComputed is False and obj.computeLoads() is False:
+			return None
+		return obj.data[self.row]
+
+
+class TrajectoryResult:
+	"""
+	The TrajectoryResult class holds the truncated trajectory of a
+	single propogation in SI units, and the derived loads, as rows
+	of a single contiguous array. Plot unit quantities are computed
+	from the SI rows on access.
+
+	Attributes
+	----------
+	planetObj : planet.Planet
+		planet object associated with the trajectory
+	data : numpy.ndarray
+		buffer of shape (len(fields), N), one row per field
+	loadsComputed : bool
+		True if the load rows have been set with setLoads()
+	loadsCallback : callable
+		deferred computation of the load rows, set with deferLoads(),
+		None if not deferred or already computed
+	tc : numpy.ndarray
+		time, sec
+	rc : numpy.ndarray
+		radial distance, m
+	thetac : numpy.ndarray
+		longitude, rad
+	phic : numpy.ndarray
+		latitude, rad
+	vc : numpy.ndarray
+		speed, m/s
+	psic : numpy.ndarray
+		heading angle, rad
+	gammac : numpy.ndarray
+		flight path angle, rad
+	drangec : numpy.ndarray
+		downrange, m
+	acc_net_g : numpy.ndarray
+		acceleration load, Earth g
+	acc_drag_g : numpy.ndarray
+		drag acceleration, Earth g
+	dyn_pres_atm : numpy.ndarray
+		dynamic pressure, atm
+	stag_pres_atm : numpy.ndarray
+		stagnation pressure, atm
+	q_stag_con : numpy.ndarray
+		stagnation-point convective heat rate, W/cm2
+	q_stag_rad : numpy.ndarray
+		stagnation-point radiative heat rate, W/cm2
+	q_stag_total : numpy.ndarray
+		stagnation-point total heat rate, W/cm2
+	heatload : numpy.ndarray
+		stagnation-point heat load, J/cm2
+	"""
+
+	stateFields = ['tc', 'rc', 'thetac', 'phic', 'vc', 'psic', 'gammac', 'drangec']
+	loadFields = ['acc_net_g', 'acc_drag_g', 'dyn_pres_atm', 'stag_pres_atm',
+				  'q_stag_con', 'q_stag_rad', 'q_stag_total', 'heatload']
+	fields = stateFields + loadFields
+
+	tc = TrajectoryRow(0)
+	rc = TrajectoryRow(1)
+	thetac = TrajectoryRow(2)
+	phic = TrajectoryRow(3)
+	vc = TrajectoryRow(4)
+	psic = TrajectoryRow(5)
+	gammac = TrajectoryRow(6)
+	drangec = TrajectoryRow(7)
+
+	acc_net_g = TrajectoryRow(8, load=True)
+	acc_drag_g = TrajectoryRow(9, load=True)
+	dyn_pres_atm = TrajectoryRow(10, load=True)
+	stag_pres_atm = TrajectoryRow(11, load=True)
+	q_stag_con = TrajectoryRow(12, load=True)
+	q_stag_rad = TrajectoryRow(13, load=True)
+	q_stag_total = TrajectoryRow(14, load=True)
+	heatload = TrajectoryRow(15, load=True)
+
+	def __init__(self, planetObj, tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, index):
+		"""
+		Initializes the TrajectoryResult from the non-dimensional
+		solver output, truncated to the first index points.
+
+		Parameters
+		----------
+		planetObj : planet.Planet
+			planet object associated with the trajectory
+		tbar : numpy.ndarray
+			non-dimensional time
+		rbar : numpy.ndarray
+			non-dimensional radial distance
+		theta : numpy.ndarray
+			longitude, rad
+		phi : numpy.ndarray
+			latitude, rad
+		vbar : numpy.ndarray
+			non-dimensional speed
+		psi : numpy.ndarray
+			heading angle, rad
+		gamma : numpy.ndarray
+			flight path angle, rad
+		drangebar : numpy.ndarray
+			non-dimensional downrange
+		index : int
+			array index of detected event location /
+			max index if no event detected
+		"""
+
+		self.planetObj = planetObj
+		self.data = np.empty((len(self.fields), index))
+		self.loadsComputed = False
+		self.loadsCallback = None
+
+		# dimensionalize directly into the buffer, as in
+		# Planet.dimensionalize()
+		np.multiply(planetObj.tau, tbar[0:index], out=self.data[0])
+		np.multiply(rbar[0:index], planetObj.RP, out=self.data[1])
+		self.data[2] = theta[0:index]
+		self.data[3] = phi[0:index]
+		np.multiply(vbar[0:index], planetObj.Vref, out=self.data[4])
+		self.data[5] = psi[0:index]
+		self.data[6] = gamma[0:index]
+		np.multiply(drangebar[0:index], planetObj.RP, out=self.data[7])
+
+	def __len__(self):
+		return self.data.shape[1]
+
+	def setLoads(self, acc_net_g, acc_drag_g, dyn_pres_atm, stag_pres_atm, q_stag_con, q_stag_rad, heatload0=0):
+		"""
+		Sets the load rows of the buffer. The total heat rate is the
+		sum of the convective and radiative heat rates, and the heat
+		load its cumulative time integral.
+
+		Parameters
+		----------
+		acc_net_g : numpy.ndarray
+			acceleration load, Earth g
+		acc_drag_g : numpy.ndarray
+			drag acceleration, Earth g
+		dyn_pres_atm : numpy.ndarray
+			dynamic pressure, atm
+		stag_pres_atm : numpy.ndarray
+			stagnation pressure, atm
+		q_stag_con : numpy.ndarray
+			stagnation-point convective heat rate, W/cm2
+		q_stag_rad : numpy.ndarray
+			stagnation-point radiative heat rate, W/cm2
+		heatload0 : float, optional
+			initial heat load, J/cm2, added to the time integral of
+			the heat rate, default=0
+		"""
+
+		data = self.data
+		data[8] = acc_net_g
+		data[9] = acc_drag_g
+		data[10] = dyn_pres_atm
+		data[11] = stag_pres_atm
+		data[12] = q_stag_con
+		data[13] = q_stag_rad
+		np.add(data[12], data[13], out=data[14])
+		data[15] = cumulative_trapezoid(data[14], data[0], initial=0)
+		data[15] += heatload0
+
+		self.loadsComputed = True
+
+	def deferLoads(self, callback):
+		"""
+		Defers the computation of the load rows to the first access
+		of any load row. callback(trajectory) is called once, and 
+		must set the loads with setLoads().
+
+		Parameters
+		----------
+		callback : callable
+			function of the TrajectoryResult which sets its loads
+		"""
+
+		self.loadsCallback = callback
+
+	def computeLoads(self):
+		"""
+		Computes the deferred load rows, if not already computed.
+
+		Returns
+		----------
+		ans : bool
+			True if the load rows are available
+		"""
+
+		if self.loadsComputed is False and self.loadsCallback is not None:
+			callback = self.loadsCallback
+			self.loadsCallback = None
+			callback(self)
+
+		return self.loadsComputed
+
+	@property
+	def t_minc(self):
+		"""time, min"""
+		return self.tc/60.0
+
+	@property
+	def h_kmc(self):
+		"""altitude, km"""
+		return (self.rc - self.planetObj.RP)*1E-3
+
+	@property
+	def v_kmsc(self):
+		"""speed, km/s"""
+		return self.vc*1E-3
+
+	@property
+	def phi_degc(self):
+		"""latitude, deg"""
+		return self.phic*180/np.pi
+
+	@property
+	def psi_degc(self):
+		"""heading angle, deg"""
+		return self.psic*180/np.pi
+
+	@property
+	def theta_degc(self):
+		"""longitude, deg"""
+		return self.thetac*180/np.pi
+
+	@property
+	def gamma_degc(self):
+		"""flight path angle, deg"""
+		return self.gammac*180/np.pi
+
+	@property
+	def drange_kmc(self):
+		"""downrange, km"""
+		return self.drangec*1.0E-3
+
+
+class TrajectoryAttribute:
+	"""
+	Descriptor which exposes an attribute of the last
+	TrajectoryResult of a vehicle (stored in its trajectory
+	attribute) under the same name on the vehicle, or None if no
+	trajectory has been propogated.
+
+	A value assigned to the attribute, None included, replaces it 
+	on the vehicle until the next propogation assigns a new 
+	trajectory, see TrajectorySlot. The TrajectoryResult itself is
+	not modified.
+
+	Attributes
+	----------
+	name : str
+		attribute name
+	"""
+
+	def __init__(self, name):
+		self.name = name
+
+	def __get__(self, obj, objtype=None):
+		if obj is None:
+			return self
+
+		values = obj.__dict__.get('_trajectoryValues', {})
+		if self.name in values:
+			return values[self.name]
+
+		trajectory = obj.__dict__.get('trajectory')
+		if trajectory is None:
+			return None
+
+		return getattr(trajectory, self.name)
+
+	def __set__(self, obj, value):
+		# a new dict, so that shallow copies of the vehicle do not
+		# share their assigned values
+		values = dict(obj.__dict__.get('_trajectoryValues', {}))
+		values[self.name] = value
+		obj.__dict__['_trajectoryValues'] = values
+
+
+class TrajectorySlot:
+	"""
+	Descriptor which holds the last TrajectoryResult of a vehicle.
+	Assigning a trajectory discards the values assigned to the 
+	TrajectoryAttribute attributes of the vehicle.
+	"""
+
+	def __get__(self, obj, objtype=None):
+		if obj is None:
+			return self
+		return obj.__dict__.get('trajectory')
+
+	def __set__(self, obj, value):
+		obj.__dict__['trajectory'] = value
+		obj.__dict__['_trajectoryValues'] = {}
+
+
+class TrajectoryLog:
+	"""
+	The TrajectoryLog class accumulates named arrays which grow by
+	a guidance cycle at a time. Each field is stored in a buffer
+	whose capacity is doubled when full, so that appending is
+	amortized O(1) per value instead of copying the whole array on
+	every cycle. The fields are finalized into arrays of exactly
+	the logged length once at the end of the run.
+
+	Attributes
+	----------
+	capacity : int
+		initial capacity of each field buffer
+	buffers : dict
+		field buffers, numpy.ndarray, by field name
+	lengths : dict
+		number of logged values, int, by field name
+	"""
+
+	def __init__(self, capacity=1024):
+		"""
+		Initializes the TrajectoryLog object.
+
+		Parameters
+		----------
+		capacity : int, optional
+			initial capacity of each field buffer, default=1024
+		"""
+
+		self.capacity = capacity
+		self.buffers = {}
+		self.lengths = {}
+
+	def append(self, name, values):
+		"""
+		Appends a value or an array of values to a field, creating
+		the field if required.
+
+		Parameters
+		----------
+		name : str
+			field name
+		values : float or numpy.ndarray
+			value(s) to append
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			view of all the values logged for the field. The view
+			is invalidated by the next append to the field.
+		"""
+
+		values = np.atleast_1d(values)
+
+		if name not in self.buffers:
+			self.buffers[name] = np.empty(max(self.capacity, len(values)))
+			self.lengths[name] = 0
+
+		buffer = self.buffers[name]
+		n = self.lengths[name]
+		m = n + len(values)
+
+		if m > len(buffer):
+			buffer = np.empty(max(2*len(buffer), m))
+			buffer[0:n] = self.buffers[name][0:n]
+			self.buffers[name] = buffer
+
+		buffer[n:m] = values
+		self.lengths[name] = m
+
+		return buffer[0:m]
+
+	def __getitem__(self, name):
+		"""
+		Returns a view of all the values logged for a field.
+		"""
+
+		return self.buffers[name][0:self.lengths[name]]
+
+	def finalize(self, name):
+		"""
+		Returns the values logged for a field as an array of
+		exactly the logged length.
+
+		Parameters
+		----------
+		name : str
+			field name
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			logged values
+		"""
+
+		return self[name].copy()
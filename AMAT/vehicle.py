@@ -6,9 +6,14 @@ from scipy.integrate import odeint
 from scipy.integrate import solve_ivp
 from scipy.integrate import cumulative_trapezoid
 import copy
-import random as rd
+import math
 import os
 
+from AMAT.trajectory import TrajectoryResult, TrajectoryAttribute, TrajectorySlot, TrajectoryLog
+from AMAT.heating import registry as heatingRegistry
+from AMAT.aerodynamics import loadAeroTable
+from AMAT.montecarlo import MonteCarloExecutor, campaignMasterSeed
+
 
 class Vehicle:
 	"""
@@ -76,6 +81,10 @@ class Vehicle:
 	exitflag : int
 		flag to indicate and classify event occurence 
 		or lack of it			
+	trajectory : trajectory.TrajectoryResult
+		result of the last propogation. The truncated trajectory 
+		and load attributes below are read from it, unless they 
+		are assigned, see trajectory.TrajectoryAttribute.
 	tc : numpy.ndarray
 		truncated time array, sec
 	rc : numpy.ndarray
@@ -143,6 +152,9 @@ class Vehicle:
 		Gq term for vehicle equilibrium glide phase guidance
 	v_switch_kms : float
 		speed below which eq. glide phase is terminated
+	predictorNfev : int
+		number of RHS evaluations of the apoapsis predictor in the
+		last guided run
 	t_step_array : numpy.ndarray
 		time step array for guided aerocapture trajectory, min
 	delta_deg_array : numpy.ndarray
@@ -311,9 +323,70 @@ class Vehicle:
 	userDefinedCDMach : bool
 		if set to True, will use a user defined function for 
 		CD(Mach) set by setCDMachFunction(), default=False
+	aeroTable : aerodynamics.AeroTable
+		tabulated CD and CL as a function of Mach no. (and angle of 
+		attack) set by setAeroTable(), overrides the constant CD, CL
+		and the user defined CD(Mach) if set, default=None
+	fusedEOM : bool
+		if set to True, solveTrajectory() and solveTrajectory2()
+		use the fused right-hand side EOMFused() / EOM2Fused(),
+		default=True
+	eventTermination : bool
+		if set to True, the propogation is stopped at the skip out
+		and trap in altitudes using root-located solver events
+		instead of being integrated for the full time and truncated,
+		default=False
+	analyticJacobian : bool
+		if set to True, the analytic Jacobian EOMJacobian() is
+		supplied to the implicit solvers, default=True
+	method : str
+		solve_ivp integration method used by solveTrajectory2(),
+		default='RK45'
+	nfev : int
+		number of right hand side evaluations in the last
+		call to the solver
+	njev : int
+		number of Jacobian evaluations in the last call to 
+		the solver
+	largestStep : float
+		largest step size in the last call to solveTrajectory2()
+		or solveTrajectoryEvents(), seconds, passed as the first
+		step of the next guidance cycle by the guided propogators
 
 	"""
 
+	# last propogated trajectory, and its truncated state and loads
+	trajectory = TrajectorySlot()
+
+	# truncated trajectory and loads of the last propogation, 
+	# read from self.trajectory
+	tc = TrajectoryAttribute('tc')
+	rc = TrajectoryAttribute('rc')
+	thetac = TrajectoryAttribute('thetac')
+	phic = TrajectoryAttribute('phic')
+	vc = TrajectoryAttribute('vc')
+	psic = TrajectoryAttribute('psic')
+	gammac = TrajectoryAttribute('gammac')
+	drangec = TrajectoryAttribute('drangec')
+
+	t_minc = TrajectoryAttribute('t_minc')
+	h_kmc = TrajectoryAttribute('h_kmc')
+	v_kmsc = TrajectoryAttribute('v_kmsc')
+	phi_degc = TrajectoryAttribute('phi_degc')
+	psi_degc = TrajectoryAttribute('psi_degc')
+	theta_degc = TrajectoryAttribute('theta_degc')
+	gamma_degc = TrajectoryAttribute('gamma_degc')
+	drange_kmc = TrajectoryAttribute('drange_kmc')
+
+	acc_net_g = TrajectoryAttribute('acc_net_g')
+	acc_drag_g = TrajectoryAttribute('acc_drag_g')
+	dyn_pres_atm = TrajectoryAttribute('dyn_pres_atm')
+	stag_pres_atm = TrajectoryAttribute('stag_pres_atm')
+	q_stag_con = TrajectoryAttribute('q_stag_con')
+	q_stag_rad = TrajectoryAttribute('q_stag_rad')
+	q_stag_total = TrajectoryAttribute('q_stag_total')
+	heatload = TrajectoryAttribute('heatload')
+
 	def __init__(self, vehicleID, mass, beta, LD, A, alpha, RN, planetObj, userDefinedCDMach=False):
 		"""
 		Initializes vehicle object with properties such as mass, 
@@ -351,6 +424,7 @@ class Vehicle:
 		self.RN = RN
 		self.planetObj = planetObj
 		self.userDefinedCDMach = userDefinedCDMach
+		self.aeroTable = None
 
 		# Compute other required non dimensional quantities
 		self.Abar = self.A / (self.mass / (self.planetObj.rho0*self.planetObj.RP))
@@ -358,6 +432,18 @@ class Vehicle:
 		self.CD = self.mass / (self.beta*self.A)
 		self.CL = self.LD * self.CD
 
+		# solver options and work buffer for the fused EOM
+		self.fusedEOM = True
+		self.eventTermination = False
+		self.analyticJacobian = True
+		self.method = 'RK45'
+		self.terminalPredictor = False
+		self.nfev = None
+		self.njev = None
+		self.largestStep = None
+		self.predictorNfev = 0
+		self._dydt = np.empty(7)
+
 		self.h0_km = None
 		self.theta0_deg = None
 		self.phi0_deg = None
@@ -382,33 +468,7 @@ class Vehicle:
 		self.index = None
 		self.exitflag = None
 
-		self.tc = None
-		self.rc = None
-		self.thetac = None
-		self.phic = None
-		self.vc = None
-		self.psic = None
-		self.gammac = None
-		self.drangec = None
-
-		self.t_minc = None
-		self.h_kmc = None
-		self.v_kmsc = None
-		self.phi_degc = None
-		self.psi_degc = None
-		self.theta_degc = None
-		self.gamma_degc = None
-		self.drange_kmc = None
-
-		self.acc_net_g = None
-		self.acc_drag_g = None
-
-		self.dyn_pres_atm = None
-		self.stag_pres_atm = None
-		self.q_stag_con = None
-		self.q_stag_rad = None
-		self.q_stag_total = None
-		self.heatload = None
+		self.trajectory = None
 
 		self.terminal_r = None
 		self.terminal_v = None
@@ -512,6 +572,109 @@ class Vehicle:
 
 		self.CDMach = func
 
+	def setAeroTable(self, aeroTable):
+		"""
+		Set the tabulated aerodynamic database, CD and CL as a 
+		function of Mach no. (and angle of attack, evaluated at 
+		the vehicle alpha). Set to None to use the constant CD, CL.
+
+		Parameters
+		------------
+		aeroTable : aerodynamics.AeroTable
+			aerodynamic table
+		"""
+
+		self.aeroTable = aeroTable
+
+	def loadAeroTable(self, datfile, machCol, CDCol, CLCol, alphaCol=None):
+		"""
+		Load the tabulated aerodynamic database from a text file,
+		see aerodynamics.loadAeroTable().
+
+		Parameters
+		------------
+		datfile : str
+			file containing the aerodynamic database
+		machCol : int
+			column number (zero indexed) of the Mach no.
+		CDCol : int
+			column number (zero indexed) of the drag coefficient
+		CLCol : int
+			column number (zero indexed) of the lift coefficient
+		alphaCol : int, optional
+			column number (zero indexed) of the angle of attack,
+			in the same units as the vehicle alpha
+		"""
+
+		self.setAeroTable(loadAeroTable(datfile, machCol, CDCol, CLCol, alphaCol))
+
+	def aeroCoefficients(self, h, v):
+		"""
+		Returns the atmospheric density and the vehicle drag and
+		lift coefficients at a single instance. With an aerodynamic
+		table, density and sonic speed come from a single atmosphere
+		lookup.
+
+		Parameters
+		----------
+		h : float
+			altitude, m
+		v : float
+			planet-relative speed, m/s
+
+		Returns
+		----------
+		rho : float
+			atmospheric density, kg/m3
+		CD : float
+			drag coefficient
+		CL : float
+			lift coefficient
+		"""
+
+		if self.aeroTable is not None:
+			rho, sonic = self.planetObj.densityAndSonic(h)
+			CD, CL = self.aeroTable.evaluate(v/sonic, self.alpha)
+			return rho, CD, CL
+
+		rho = self.planetObj.density(h)
+
+		if self.userDefinedCDMach is True:
+			return rho, self.CDMach(v/float(self.planetObj.sonic_int(h))), self.CL
+
+		return rho, self.CD, self.CL
+
+	def aeroCoefficientsVectorized(self, r, v):
+		"""
+		Vectorized version of aeroCoefficients()
+
+		Parameters
+		----------
+		r : numpy.ndarray
+			radial position array, m
+		v : numpy.ndarray
+			planet-relative speed array, m/s
+
+		Returns
+		----------
+		rho : numpy.ndarray
+			atmospheric density array, kg/m3
+		CD : numpy.ndarray
+			drag coefficient array
+		CL : numpy.ndarray
+			lift coefficient array
+		"""
+
+		rho_vec = self.planetObj.rhovectorized(r)
+
+		if self.aeroTable is not None:
+			CD_vec, CL_vec = self.aeroTable.evaluateArray(self.computeMach(r, v), self.alpha)
+		elif self.userDefinedCDMach is True:
+			CD_vec, CL_vec = self.CDMach(self.computeMach(r, v)), self.CL*np.ones(len(v))
+		else:
+			CD_vec, CL_vec = self.CD*np.ones(len(v)), self.CL*np.ones(len(v))
+
+		return rho_vec, CD_vec, CL_vec
 
 	def setInitialState(self, h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg, drange0_km, heatLoad0):
 		"""
@@ -562,25 +725,59 @@ class Vehicle:
 		self.drange0_km_ref = copy.deepcopy(drange0_km)
 		self.heatLoad0_ref = copy.deepcopy(heatLoad0)
 
-	def setSolverParams(self, tol):
+	def setSolverParams(self, tol, fusedEOM=None, eventTermination=None, analyticJacobian=None, method=None,
+						terminalPredictor=None):
 		"""
-		Set the solver parameters.
+		Set the solver parameters. Options which are not passed
+		keep their current value.
 
 		Parameters
 		----------
 		tol : float
 			solver tolerance, currently both abstol and reltol
 			are set to this value
+		fusedEOM : bool, optional
+			if True, use the fused right-hand side EOMFused() /
+			EOM2Fused() in place of EOM() / EOM2(), initially True
+		eventTermination : bool, optional
+			if True, stop the propogation at the skip out altitude
+			h_skip, the trap in altitude h_trap, or when the 
+			flight-path angle reaches -88 deg, initially False
+		analyticJacobian : bool, optional
+			if True, supply the analytic Jacobian EOMJacobian() to 
+			odeint in solveTrajectory(), and to solve_ivp in 
+			solveTrajectory2() when an implicit method is used,
+			initially True
+		method : str, optional
+			solve_ivp integration method used by solveTrajectory2(),
+			e.g. 'RK45', 'Radau', 'BDF', 'LSODA', initially 'RK45'
+		terminalPredictor : bool, optional
+			if True, the onboard apoapsis predictors only integrate
+			till the atmospheric exit event and compute the apoapsis
+			from the terminal state, see 
+			predictTerminalApoapsisAltitudeKm(), initially False
 		"""
 
 		self.tol = tol
 
+		if fusedEOM is not None:
+			self.fusedEOM = fusedEOM
+		if eventTermination is not None:
+			self.eventTermination = eventTermination
+		if analyticJacobian is not None:
+			self.analyticJacobian = analyticJacobian
+		if method is not None:
+			self.method = method
+		if terminalPredictor is not None:
+			self.terminalPredictor = terminalPredictor
+
 
 	def qStagConvective(self,r,v):
 		"""
-		This function defines the convective stagnation-point 
-		heating relationships. Edit the parameters in the
-		source-code if you wish to modify these values.
+		This function computes the convective stagnation-point 
+		heating rate using the correlation registered for the 
+		planet in heating.registry. Register a correlation there 
+		if you wish to modify or add one.
 
 		Sources : Sutton-Graves relationships, NASA Neptune Orbiter 
 		with Probes Vision Report, Bienstock et al.
@@ -598,63 +795,20 @@ class Vehicle:
 			convective stagnation-point heating rate array, W/cm2
 		"""
 
-		if self.planetObj.ID == 'VENUS':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 1.8960E-8 * (rho_vec[:]/self.RN)**0.5 * v[:]**3.0
-			return ans
-
-		elif self.planetObj.ID == 'EARTH':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 1.7623E-8 * (rho_vec[:]/self.RN)**0.5 * v[:]**3.0
-			return ans
-
-		elif self.planetObj.ID == 'MARS':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 1.8980E-8 * (rho_vec[:]/self.RN)**0.5 * v[:]**3.0
-			return ans
-
-		elif self.planetObj.ID == 'JUPITER':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 0.6556E-8 * (rho_vec[:]/self.RN)**0.5 * v[:]**3.0
-			return ans
-
-		elif self.planetObj.ID == 'SATURN':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 0.6356E-8 * (rho_vec[:]/self.RN)**0.5 * v[:]**3.0
-			return ans
-
-		elif self.planetObj.ID == 'TITAN':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 1.7407E-8 * (rho_vec[:]/self.RN)**0.5 * v[:]**3.0
-			return ans
-
-		elif self.planetObj.ID == 'URANUS':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 2.24008E-7 * rho_vec[:]**0.452130 * v[:]**2.691800 * np.sqrt(0.291/self.RN)
-			return ans
-
-		elif self.planetObj.ID == 'NEPTUNE':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			ans[:] = 2.24008E-7 * rho_vec[:]**0.452130 * v[:]**2.691800 * np.sqrt(0.291/self.RN)
-			return ans
+		correlation = heatingRegistry.convective(self.planetObj.ID)
 
-		else:
+		if correlation is None:
 			print(" >>> ERR : Invalid planet identifier provided.")
-			
+			return None
+
+		return correlation(self.planetObj.rhovectorized(r), v, self.RN)
 
 	def qStagRadiative(self,r,v):
 		"""
-		This function defines the radiative stagnation-point 
-		heating relationships. Edit the parameters in the
-		source-code if you wish to modify these values.
+		This function computes the radiative stagnation-point 
+		heating rate using the correlation registered for the 
+		planet in heating.registry. Register a correlation there 
+		if you wish to modify or add one.
 
 		Radiative heating is currently set to 0 for Mars 
 		and Titan, though these may not be negligible
@@ -679,100 +833,56 @@ class Vehicle:
 			radiative stagnation-point heating rate array, W/cm2
 		"""
 
-		if self.planetObj.ID == 'VENUS':
-			
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-
-			# REF : Criag and Lyne, Parametric Study of Venus Aerocapture, 2005
-
-			for i in range(0, len(r)):
-				if v[i] < 8000.0:
-					ans[i] = 3.33E-34*v[i]**10.0*rho_vec[i]**1.2*self.RN**0.49
-				elif v[i] >= 8000.0 and v[i] < 10000.0:
-					ans[i] = 1.22E-16*v[i]**5.5*rho_vec[i]**1.2*self.RN**0.49
-				else:
-					ans[i] = 3.07E-48*v[i]**13.4*rho_vec[i]**1.2*self.RN**0.49
-
-			return ans
-
-		elif self.planetObj.ID == 'EARTH':
-			
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-
-			#REF : Brandis and Johnston, Characterization of Stagnation-Point 
-			# Heat Flux for Earth Entry, 2014
+		correlation = heatingRegistry.radiative(self.planetObj.ID)
 
-			# Tauber-Sutton radiative heating correlation
-			C = 4.736E4
-			xx = np.array([9000.0, 10000.0, 11000.0, 12000.0, 13000.0,
-			              14000.0, 15000.0, 16000.0])
-			yy = np.array([1.5, 35, 151, 359, 660, 1065, 1550, 2040])
-
-			fV = interp1d(xx, yy, kind='linear', fill_value=(0.0, 2040), bounds_error=False)
+		if correlation is None:
+			print(" >>> ERR : Invalid planet identifier provided.")
+			return None
 
-			for i in range(0, len(r)):
-				a = 0.6
-				b = 1.22
-				ans[i] = C*self.RN**a*rho_vec[i]**b*float(fV(v[i]))
+		return correlation(self.planetObj.rhovectorized(r), v, self.RN)
 
-			return ans
+	def qStagHeating(self, r, v, RN):
+		"""
+		Computes the convective and radiative stagnation-point heating 
+		rates with a single density evaluation. If RN is an array of 
+		nose radii, the rates are computed over the trajectory x nose
+		radius grid in one pass.
 
-		elif self.planetObj.ID == 'MARS':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			#REF : Not available; set qrad = 0
-			return ans
+		Parameters
+		----------
+		r : numpy.ndarray
+			radial distance solution array of trajectory, m
+		v : numpy.ndarray
+			planet-relative speed array of trajectory, m/s
+		RN : float or numpy.ndarray
+			nose radius, or array of nose radii, m
 
-		elif self.planetObj.ID == 'JUPITER':
-			
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
+		Returns
+		----------
+		q_stag_con : numpy.ndarray
+			convective stagnation-point heating rate, W/cm2, 
+			shape (len(r),) or (len(r), len(RN))
+		q_stag_rad : numpy.ndarray
+			radiative stagnation-point heating rate, W/cm2,
+			shape (len(r),) or (len(r), len(RN))
+		"""
 
-			ans[:] = (9.7632379E-40*(2*self.RN)**(-0.17905)*(rho_vec[:])**1.763827469*v[:]**10.993852)*1E3/1E4
-			# Source: UPITER ENTRY PROBE FEASIBILITY STUDY FROM THE 
-			# ESTEC CDF TEAM HEAT FLUX EVALUATION & TPS DEFINITION
-			return ans
+		convective = heatingRegistry.convective(self.planetObj.ID)
+		radiative = heatingRegistry.radiative(self.planetObj.ID)
 
-		elif self.planetObj.ID == 'SATURN':
-			
-			ans  = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-
-			ans[:] = (9.7632379E-40*(2*self.RN)**(-0.17905)*(rho_vec[:])**1.763827469*v[:]**10.993852)*1E3/1E4
-			# Source: UPITER ENTRY PROBE FEASIBILITY STUDY FROM THE 
-			# ESTEC CDF TEAM HEAT FLUX EVALUATION & TPS DEFINITION
-			return ans
-
-		elif self.planetObj.ID == 'TITAN':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-			#REF : Not available; set qrad = 0
-			return ans
-
-		elif self.planetObj.ID == 'URANUS':
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
-
-			# REF: NASA Vision Neptune orbiter with probes, 
-			# Contract No. NNH04CC41C Final Report, 2005
-			ans[:] = 8.125812E-3*rho_vec[:]**0.498140*(v[:]/10000)**15.113*(self.RN/0.291)
-			return ans
-
-		elif self.planetObj.ID == 'NEPTUNE':
-			
-			ans = np.zeros(len(r))
-			rho_vec = self.planetObj.rhovectorized(r)
+		if convective is None or radiative is None:
+			print(" >>> ERR : Invalid planet identifier provided.")
+			return None
 
-			# REF: NASA Vision Neptune orbiter with probes, 
-			# Contract No. NNH04CC41C Final Report, 2005
+		rho_vec = self.planetObj.rhovectorized(r)
+		v = np.asarray(v)
 
-			ans[:] = 8.125812E-3*rho_vec[:]**0.498140*(v[:]/10000)**15.113*(self.RN/0.291)
-			return ans
+		if np.ndim(RN) > 0:
+			rho_vec = rho_vec[:, np.newaxis]
+			v = v[:, np.newaxis]
+			RN = np.asarray(RN)[np.newaxis, :]
 
-		else:
-			print(" >>> ERR : Invalid planet identifier provided.")
+		return convective(rho_vec, v, RN), radiative(rho_vec, v, RN)
 
 	def qStagTotal(self, r, v):
 		"""
@@ -792,12 +902,9 @@ class Vehicle:
 			total stagnation-point heating rate array, W/cm2
 		"""
 
-		ans = np.zeros(len(r))
-		qStagCon = self.qStagConvective(r, v)
-		qStagRad = self.qStagRadiative(r, v)
-		ans = qStagCon + qStagRad
+		qStagCon, qStagRad = self.qStagHeating(r, v, self.RN)
 
-		return ans
+		return qStagCon + qStagRad
 
 	def L(self, r, theta, phi, v):
 		"""
@@ -822,7 +929,9 @@ class Vehicle:
 
 		"""
 
-		ans = 0.5*self.planetObj.rho(r, theta, phi)*v**2.0*self.A*self.CL
+		rho, CD, CL = self.aeroCoefficients(r - self.planetObj.RP, v)
+
+		ans = 0.5*rho*v**2.0*self.A*CL
 		return ans
 	
 	def Lvectorized(self, r, theta, phi, v):
@@ -852,8 +961,8 @@ class Vehicle:
 		"""
 
 		ans = np.zeros(len(r))
-		rho_vec = self.planetObj.rhovectorized(r)
-		ans[:] = 0.5*rho_vec[:]*v[:]**2.0*self.A*self.CL
+		rho_vec, CD_vec, CL_vec = self.aeroCoefficientsVectorized(r, v)
+		ans[:] = 0.5*rho_vec[:]*v[:]**2.0*self.A*CL_vec[:]
 		return ans
 
 	def D(self, r, theta, phi, v):
@@ -879,13 +988,9 @@ class Vehicle:
 
 		"""
 
-		if self.userDefinedCDMach is True:
-			self.CD1 = self.CDMach(self.computeMachScalar(r, v))
-
-		else:
-			self.CD1 = self.CD
+		rho, self.CD1, CL = self.aeroCoefficients(r - self.planetObj.RP, v)
 
-		ans = 0.5*self.planetObj.rho(r, theta, phi)*v**2.0*self.A*self.CD1
+		ans = 0.5*rho*v**2.0*self.A*self.CD1
 		return ans
 
 	def Dvectorized(self, r, theta, phi, v):
@@ -915,12 +1020,7 @@ class Vehicle:
 		"""
 
 		ans = np.zeros(len(r))
-		rho_vec = self.planetObj.rhovectorized(r)
-		
-		if self.userDefinedCDMach is True:
-			self.CD_vec = self.CDMach(self.computeMach(r,v))
-		else:
-			self.CD_vec = self.CD*np.ones(len(v))
+		rho_vec, self.CD_vec, CL_vec = self.aeroCoefficientsVectorized(r, v)
 
 		ans[:] = 0.5*rho_vec[:]*v[:]**2.0*self.A*self.CD_vec[:]
 
@@ -950,7 +1050,9 @@ class Vehicle:
 
 		"""
 
-		ans = 0.5*self.planetObj.rhobar(rbar,theta,phi)*vbar**2.0*self.Abar*self.CL
+		rho, CD, CL = self.aeroCoefficients(rbar*self.planetObj.RP - self.planetObj.RP, vbar*self.planetObj.Vref)
+
+		ans = 0.5*(rho/self.planetObj.rho0)*vbar**2.0*self.Abar*CL
 		return ans
 
 	def Dbar(self, rbar, theta, phi, vbar):
@@ -976,12 +1078,9 @@ class Vehicle:
 			non-dimensional aerodynamic drag force
 
 		"""
-		if self.userDefinedCDMach is True:
-			self.CD1 = self.CDMach(self.computeMachScalar(rbar*self.planetObj.RP,vbar*self.planetObj.Vref))
-		else:
-			self.CD1 = self.CD
+		rho, self.CD1, CL = self.aeroCoefficients(rbar*self.planetObj.RP - self.planetObj.RP, vbar*self.planetObj.Vref)
 
-		ans = 0.5*self.planetObj.rhobar(rbar,theta,phi)*vbar**2.0*self.Abar*self.CD1
+		ans = 0.5*(rho/self.planetObj.rho0)*vbar**2.0*self.Abar*self.CD1
 		return ans
 
 	def a_s(self, r, theta, phi, v, delta):
@@ -1670,7 +1769,369 @@ class Vehicle:
 		]
 		return dydt
 
-	def solveTrajectory(self, rbar0, theta0, phi0, vbar0, psi0,	gamma0, drangebar0, t_sec, dt, delta):
+	def fusedRHS(self, y, delta, out):
+		"""
+		Evaluates the right hand side of the EoMs in a single pass,
+		computing the shared trigonometric terms and the density
+		lookup once, and writing the derivatives into out.
+
+		Gives the same result as EOM(), without building the
+		intermediate list or calling the individual acceleration
+		and gravity term functions.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			trajectory state vector
+		delta : float
+			bank angle, rad
+		out : numpy.ndarray
+			array of length 7 into which dydt is written
+
+		Returns
+		----------
+		out : numpy.ndarray
+			derivate vector of state, process equations
+
+		"""
+
+		# unpack as python floats, scalar arithmetic on numpy floats is slower
+		rbar, theta, phi, vbar, psi, gamma, drangebar = np.asarray(y, dtype=float).tolist()
+		planetObj = self.planetObj
+
+		sin_phi = math.sin(phi)
+		cos_phi = math.cos(phi)
+		sin_gamma = math.sin(gamma)
+		cos_gamma = math.cos(gamma)
+		sin_psi = math.sin(psi)
+		cos_psi = math.cos(psi)
+		OMEGAbar = planetObj.OMEGAbar
+
+		# aerodynamic accelerations, single density lookup
+		rho, self.CD1, CL = self.aeroCoefficients(rbar*planetObj.RP - planetObj.RP, vbar*planetObj.Vref)
+		rhobar = rho/planetObj.rho0
+
+		qA = 0.5*rhobar*vbar**2.0*self.Abar
+		Lbar = qA*CL
+		a_sbar = -1.0*qA*self.CD1/self.mbar
+		a_nbar = Lbar*math.cos(delta)/self.mbar
+		a_wbar = Lbar*math.sin(delta)/self.mbar
+
+		# gravity terms, gthetabar = 0
+		rbar4 = rbar**4.0
+		rbar5 = rbar**5.0
+		grbar = -1.0/(rbar**2.0) \
+				+ (1.5*planetObj.J2/rbar4)*(3.0*sin_phi*sin_phi - 1.0) \
+				+ (2.0*planetObj.J3/rbar5)*(5.0*sin_phi**3.0 - 3.0*sin_phi)
+		gphibar = (-3.0*planetObj.J2/rbar4)*sin_phi*cos_phi \
+				+ (1.5*planetObj.J3/rbar5)*cos_phi*(1.0 - 5.0*sin_phi*sin_phi)
+
+		gnbar = cos_gamma*grbar - sin_gamma*sin_psi*gphibar
+		gsbar = sin_gamma*grbar + cos_gamma*sin_psi*gphibar
+		gwbar = cos_psi*gphibar
+
+		# centrifugal and Coriolis terms
+		cos_gamma_reg = cos_gamma + 1e-2
+		cfvbar = OMEGAbar**2.0*rbar*cos_phi*(sin_gamma*cos_phi - cos_gamma*sin_phi*sin_psi)
+		cfpsibar = (-1.0*OMEGAbar**2.0*rbar/(vbar*cos_gamma_reg))*sin_phi*cos_phi*cos_psi
+		cfgammabar = (OMEGAbar**2.0*rbar/vbar)*cos_phi*(cos_gamma*cos_phi + sin_gamma*sin_phi*sin_psi)
+		copsibar = 2.0*OMEGAbar*((sin_gamma/cos_gamma_reg)*cos_phi*sin_psi - sin_phi)
+		cogammabar = 2.0*OMEGAbar*cos_phi*cos_psi
+
+		out[0] = vbar*sin_gamma
+		out[1] = (vbar*cos_gamma*cos_psi)/(rbar*cos_phi)
+		out[2] = (vbar*cos_gamma*sin_psi)/rbar
+		out[3] = a_sbar + gsbar + cfvbar
+		out[4] = (a_wbar + gwbar)/(vbar*cos_gamma_reg) \
+				- (1.0*vbar/rbar)*cos_gamma*cos_psi*math.tan(phi) \
+				+ cfpsibar + copsibar
+		out[5] = (a_nbar + gnbar)/vbar + (vbar/rbar)*cos_gamma + cfgammabar + cogammabar
+		out[6] = vbar*cos_gamma
+
+		return out
+
+	def EOMFused(self, y, t, delta):
+		"""
+		Fused version of EOM() for use with odeint. The derivatives
+		are written into a work array owned by the vehicle, which
+		odeint copies after each call.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			trajectory state vector
+		t : numpy.ndarray
+			trajectory time vector
+		delta : float
+			bank angle, rad
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			derivate vector of state, process equations
+
+		"""
+		return self.fusedRHS(y, delta, self._dydt)
+
+	def EOM2Fused(self, t, y, delta):
+		"""
+		Fused version of EOM2() for use with solve_ivp.
+
+		solve_ivp keeps references to previously returned
+		derivatives (e.g. after a rejected step), so a fresh copy
+		of the work array is returned.
+
+		Parameters
+		----------
+		t : numpy.ndarray
+			trajectory time vector
+		y : numpy.ndarray
+			trajectory state vector
+		delta : float
+			bank angle, rad
+
+		Returns
+		----------
+		ans : numpy.ndarray
+			derivate vector of state, process equations
+
+		"""
+		return self.fusedRHS(y, delta, self._dydt).copy()
+
+	def EOMJacobian(self, y, t, delta):
+		"""
+		Analytic Jacobian of the non-dimensional EoMs, J[i, j] =
+		d(dydt[i]) / dy[j], including the J2/J3 gravity terms, the
+		planet rotation terms, and the density gradient from the
+		atmosphere lookup table. Signature as required by the Dfun
+		argument of odeint.
+
+		If a user defined CD(Mach) function is used, CD is treated
+		as locally constant.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			trajectory state vector
+		t : numpy.ndarray
+			trajectory time vector
+		delta : float
+			bank angle, rad
+
+		Returns
+		----------
+		J : numpy.ndarray
+			Jacobian matrix, shape (7, 7)
+
+		"""
+
+		# unpack as python floats, scalar arithmetic on numpy floats is slower
+		rbar, theta, phi, vbar, psi, gamma, drangebar = np.asarray(y, dtype=float).tolist()
+		planetObj = self.planetObj
+		J2 = planetObj.J2
+		J3 = planetObj.J3
+		OMEGAbar = planetObj.OMEGAbar
+		OMEGAbar2 = OMEGAbar**2.0
+
+		sp = math.sin(phi)
+		cp = math.cos(phi)
+		tp = math.tan(phi)
+		sg = math.sin(gamma)
+		cg = math.cos(gamma)
+		ss = math.sin(psi)
+		cs = math.cos(psi)
+		C = cg + 1e-2
+
+		# aerodynamic accelerations and their derivatives
+		h = rbar*planetObj.RP - planetObj.RP
+		rho, CD1, CL = self.aeroCoefficients(h, vbar*planetObj.Vref)
+		rhobar = rho/planetObj.rho0
+		drhobar = planetObj.densityDerivative(h)*planetObj.RP/planetObj.rho0
+
+		kD = self.Abar*CD1/self.mbar
+		kL = self.Abar*CL/self.mbar
+
+		a_s_r = -0.5*drhobar*vbar**2.0*kD
+		a_s_v = -1.0*rhobar*vbar*kD
+		a_n = 0.5*rhobar*vbar**2.0*kL*math.cos(delta)
+		a_n_r = 0.5*drhobar*vbar**2.0*kL*math.cos(delta)
+		a_n_v = rhobar*vbar*kL*math.cos(delta)
+		a_w = 0.5*rhobar*vbar**2.0*kL*math.sin(delta)
+		a_w_r = 0.5*drhobar*vbar**2.0*kL*math.sin(delta)
+		a_w_v = rhobar*vbar*kL*math.sin(delta)
+
+		# gravity terms and their derivatives
+		gr = -1.0/rbar**2.0 + (1.5*J2/rbar**4.0)*(3.0*sp*sp - 1.0) + (2.0*J3/rbar**5.0)*(5.0*sp**3.0 - 3.0*sp)
+		gr_r = 2.0/rbar**3.0 - (6.0*J2/rbar**5.0)*(3.0*sp*sp - 1.0) - (10.0*J3/rbar**6.0)*(5.0*sp**3.0 - 3.0*sp)
+		gr_p = (9.0*J2/rbar**4.0)*sp*cp + (2.0*J3/rbar**5.0)*(15.0*sp*sp*cp - 3.0*cp)
+
+		gp = (-3.0*J2/rbar**4.0)*sp*cp + (1.5*J3/rbar**5.0)*cp*(1.0 - 5.0*sp*sp)
+		gp_r = (12.0*J2/rbar**5.0)*sp*cp - (7.5*J3/rbar**6.0)*cp*(1.0 - 5.0*sp*sp)
+		gp_p = (-3.0*J2/rbar**4.0)*(cp*cp - sp*sp) + (1.5*J3/rbar**5.0)*(-1.0*sp + 5.0*sp**3.0 - 10.0*sp*cp*cp)
+
+		# centrifugal and Coriolis terms and their derivatives
+		cfv_r = OMEGAbar2*cp*(sg*cp - cg*sp*ss)
+		cfv_p = OMEGAbar2*rbar*(-2.0*sg*sp*cp - cg*ss*(cp*cp - sp*sp))
+		cfv_s = -1.0*OMEGAbar2*rbar*cg*sp*cp*cs
+		cfv_g = OMEGAbar2*rbar*(cg*cp*cp + sg*sp*cp*ss)
+
+		cfpsi = (-1.0*OMEGAbar2*rbar/(vbar*C))*sp*cp*cs
+		cfpsi_r = cfpsi/rbar
+		cfpsi_v = -1.0*cfpsi/vbar
+		cfpsi_p = (-1.0*OMEGAbar2*rbar/(vbar*C))*(cp*cp - sp*sp)*cs
+		cfpsi_s = (OMEGAbar2*rbar/(vbar*C))*sp*cp*ss
+		cfpsi_g = cfpsi*sg/C
+
+		cfgamma_bracket = cg*cp + sg*sp*ss
+		cfgamma = (OMEGAbar2*rbar/vbar)*cp*cfgamma_bracket
+		cfgamma_r = cfgamma/rbar
+		cfgamma_v = -1.0*cfgamma/vbar
+		cfgamma_p = (OMEGAbar2*rbar/vbar)*(-1.0*sp*cfgamma_bracket + cp*(-1.0*cg*sp + sg*cp*ss))
+		cfgamma_s = (OMEGAbar2*rbar/vbar)*cp*sg*sp*cs
+		cfgamma_g = (OMEGAbar2*rbar/vbar)*cp*(-1.0*sg*cp + cg*sp*ss)
+
+		copsi_p = 2.0*OMEGAbar*(-1.0*(sg/C)*sp*ss - cp)
+		copsi_s = 2.0*OMEGAbar*(sg/C)*cp*cs
+		copsi_g = 2.0*OMEGAbar*cp*ss*(cg*C + sg*sg)/(C*C)
+
+		cogamma_p = -2.0*OMEGAbar*sp*cs
+		cogamma_s = -2.0*OMEGAbar*cp*ss
+
+		W = a_w + cs*gp
+		N = a_n + cg*gr - sg*ss*gp
+
+		J = np.zeros((7, 7))
+
+		# rbar
+		J[0, 3] = sg
+		J[0, 5] = vbar*cg
+
+		# theta
+		f1 = (vbar*cg*cs)/(rbar*cp)
+		J[1, 0] = -1.0*f1/rbar
+		J[1, 2] = f1*tp
+		J[1, 3] = (cg*cs)/(rbar*cp)
+		J[1, 4] = -1.0*(vbar*cg*ss)/(rbar*cp)
+		J[1, 5] = -1.0*(vbar*sg*cs)/(rbar*cp)
+
+		# phi
+		J[2, 0] = -1.0*(vbar*cg*ss)/rbar**2.0
+		J[2, 3] = (cg*ss)/rbar
+		J[2, 4] = (vbar*cg*cs)/rbar
+		J[2, 5] = -1.0*(vbar*sg*ss)/rbar
+
+		# vbar
+		J[3, 0] = a_s_r + sg*gr_r + cg*ss*gp_r + cfv_r
+		J[3, 2] = sg*gr_p + cg*ss*gp_p + cfv_p
+		J[3, 3] = a_s_v
+		J[3, 4] = cg*cs*gp + cfv_s
+		J[3, 5] = cg*gr - sg*ss*gp + cfv_g
+
+		# psi
+		J[4, 0] = (a_w_r + cs*gp_r)/(vbar*C) + (vbar/rbar**2.0)*cg*cs*tp + cfpsi_r
+		J[4, 2] = (cs*gp_p)/(vbar*C) - (vbar/rbar)*cg*cs/(cp*cp) + cfpsi_p + copsi_p
+		J[4, 3] = a_w_v/(vbar*C) - W/(vbar**2.0*C) - (1.0/rbar)*cg*cs*tp + cfpsi_v
+		J[4, 4] = (-1.0*ss*gp)/(vbar*C) + (vbar/rbar)*cg*ss*tp + cfpsi_s + copsi_s
+		J[4, 5] = W*sg/(vbar*C*C) + (vbar/rbar)*sg*cs*tp + cfpsi_g + copsi_g
+
+		# gamma
+		J[5, 0] = (a_n_r + cg*gr_r - sg*ss*gp_r)/vbar - (vbar/rbar**2.0)*cg + cfgamma_r
+		J[5, 2] = (cg*gr_p - sg*ss*gp_p)/vbar + cfgamma_p + cogamma_p
+		J[5, 3] = a_n_v/vbar - N/vbar**2.0 + cg/rbar + cfgamma_v
+		J[5, 4] = (-1.0*sg*cs*gp)/vbar + cfgamma_s + cogamma_s
+		J[5, 5] = (-1.0*sg*gr - cg*ss*gp)/vbar - (vbar/rbar)*sg + cfgamma_g
+
+		# drangebar
+		J[6, 3] = cg
+		J[6, 5] = -1.0*vbar*sg
+
+		return J
+
+	def EOM2Jacobian(self, t, y, delta):
+		"""
+		Analytic Jacobian of the non-dimensional EoMs, see
+		EOMJacobian(). Signature as required by the jac argument of
+		solve_ivp.
+
+		Parameters
+		----------
+		t : numpy.ndarray
+			trajectory time vector
+		y : numpy.ndarray
+			trajectory state vector
+		delta : float
+			bank angle, rad
+
+		Returns
+		----------
+		J : numpy.ndarray
+			Jacobian matrix, shape (7, 7)
+
+		"""
+		return self.EOMJacobian(y, t, delta)
+
+	def EOMVariational(self, y, t, delta):
+		"""
+		Augmented EoMs for propogating the trajectory together with
+		its sensitivity to the entry flight-path angle. The first
+		seven components are the non-dimensional state, the last
+		seven are d(state)/d(gamma0) which obey the variational
+		equations dS/dt = J(y) S. Signature as required by odeint.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			augmented state vector, shape (14,)
+		t : numpy.ndarray
+			trajectory time vector
+		delta : float
+			bank angle, rad
+
+		Returns
+		----------
+		dydt : numpy.ndarray
+			time derivative of the augmented state vector
+
+		"""
+		dydt = np.empty(14)
+		if self.fusedEOM is True:
+			dydt[0:7] = self.EOMFused(y[0:7], t, delta)
+		else:
+			dydt[0:7] = self.EOM(y[0:7], t, delta)
+		dydt[7:14] = self.EOMJacobian(y[0:7], t, delta).dot(y[7:14])
+
+		return dydt
+
+	def EOMVariationalJacobian(self, y, t, delta):
+		"""
+		Block diagonal approximation of the Jacobian of the
+		augmented EoMs, see EOMVariational(). The second derivative
+		terms d(J S)/dy are neglected. Signature as required by the
+		Dfun argument of odeint.
+
+		Parameters
+		----------
+		y : numpy.ndarray
+			augmented state vector, shape (14,)
+		t : numpy.ndarray
+			trajectory time vector
+		delta : float
+			bank angle, rad
+
+		Returns
+		----------
+		JJ : numpy.ndarray
+			Jacobian matrix, shape (14, 14)
+
+		"""
+		J = self.EOMJacobian(y[0:7], t, delta)
+		JJ = np.zeros((14, 14))
+		JJ[0:7, 0:7] = J
+		JJ[7:14, 7:14] = J
+
+		return JJ
+
+	def solveTrajectory(self, rbar0,theta0, phi0, vbar0, psi0,	gamma0, drangebar0, t_sec, dt, delta):
 		"""
 		Function to propogate a single atmospheric entry trajectory 
 		given entry interface / other initial conditions and
@@ -1730,7 +2191,12 @@ class Vehicle:
 		
 		# use scipy odeint to solve for the entry trajectory using initial 
 		# conditions xbar_0 and vehicle parameters in args
-		xbar = odeint(self.EOM, xbar_0, tbar, rtol=self.tol, atol=self.tol, args=(delta,))
+		EOM = self.EOMFused if self.fusedEOM is True else self.EOM
+		Dfun = self.EOMJacobian if self.analyticJacobian is True else None
+		xbar, info = odeint(EOM, xbar_0, tbar, rtol=self.tol, atol=self.tol, args=(delta,), Dfun=Dfun,
+							full_output=True)
+		self.nfev = int(info['nfe'][-1])
+		self.njev = int(info['nje'][-1])
 
 		# extract solution from odeint into solution variable vectors
 		rbar = xbar[:, 0]    # radial distance rbar solution
@@ -1743,18 +2209,11 @@ class Vehicle:
 
 		return tbar, rbar, theta, phi, vbar, psi, gamma, drangebar
 
-	def hit_EFPA_90(self, t, y, delta):
-		return y[5] + 88*np.pi/180
-	hit_EFPA_90.terminal = True
-
-	def solveTrajectory2(self, rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta):
+	def solveTrajectorySensitivity(self, rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta):
 		"""
-		Function to propogate a single atmospheric entry trajectory
-		given entry interface / other initial conditions and
-		bank angle delta.
-
-		Reference 1: Vinh, Chapter 3.
-		Reference 2: Lescynzki, MS Thesis, NPS.
+		Propogates a single atmospheric entry trajectory together with 
+		the state transition matrix column d(state)/d(gamma0), by 
+		integrating the variational equations alongside the EoMs.
 
 		Parameters
 		----------
@@ -1797,51 +2256,408 @@ class Vehicle:
 			flight-path angle, rad
 		drangebar : numpy.ndarray
 			downrange solution, meters
+		S : numpy.ndarray
+			sensitivity of the non-dimensional state to the entry 
+			flight-path angle, per rad, shape (len(tbar), 7)
 		"""
 
-		# store nondimensional initial conditions in xbar_0
-		xbar_0 = [rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0]
+		# augmented initial conditions, d(state)/d(gamma0) = e_gamma at t=0
+		xbar_0 = np.array([rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0,
+						   0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0])
 
-		# discretize time interval [0,time] in steps of dt
-		tbar = np.arange(0, (t_sec + dt) / self.planetObj.tau, dt / self.planetObj.tau)
+		tbar = np.arange(0, (t_sec+dt)/self.planetObj.tau, dt/self.planetObj.tau)
 
-		# use scipy odeint to solve for the entry trajectory using initial
-		# conditions xbar_0 and vehicle parameters in args
-		xbar = solve_ivp(self.EOM2, (0, tbar[-1]), xbar_0, t_eval=tbar, rtol=self.tol, atol=self.tol, events=self.hit_EFPA_90, args=(delta,))
+		# the sensitivities are only needed to Newton step accuracy,
+		# use looser tolerances for them
+		tol = np.concatenate((np.full(7, self.tol), np.full(7, np.sqrt(self.tol))))
 
-		tbar = xbar.t
-		# extract solution from odeint into solution variable vectors
-		rbar = xbar.y[0, :]  # radial distance rbar solution
-		theta = xbar.y[1, :]   # longitude theta solution
-		phi = xbar.y[2, :]   # latitude phi solution
-		vbar = xbar.y[3, :]  # velocity vbar solution
-		psi = xbar.y[4, :]   # heading angle psi solution
-		gamma = xbar.y[5, :]   # flight path angle solution
-		drangebar = xbar.y[6, :]   # downrange solution
+		xbar, info = odeint(self.EOMVariational, xbar_0, tbar, rtol=tol, atol=tol, args=(delta,),
+							Dfun=self.EOMVariationalJacobian, full_output=True)
+		self.nfev = int(info['nfe'][-1])
+		self.njev = int(info['nje'][-1])
 
-		return tbar, rbar, theta, phi, vbar, psi, gamma, drangebar
+		return tbar, xbar[:, 0], xbar[:, 1], xbar[:, 2], xbar[:, 3], xbar[:, 4], xbar[:, 5], xbar[:, 6], \
+			xbar[:, 7:14]
 
-	def convertToPlotUnits(self, t, r, v, phi, psi, theta, gamma, drange):
+	def hit_EFPA_90(self, t, y, delta):
+		return y[5] + 88*np.pi/180
+	hit_EFPA_90.terminal = True
+
+	def solveTrajectory2(self, rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+						 first_step=None):
 		"""
-		Convert state vector components to units appropriate 
-		for evolution plots.
+		Function to propogate a single atmospheric entry trajectory
+		given entry interface / other initial conditions and
+		bank angle delta.
+
+		Reference 1: Vinh, Chapter 3.
+		Reference 2: Lescynzki, MS Thesis, NPS.
 
 		Parameters
 		----------
-		t : numpy.ndarray
-			time array, sec
-		r : numpy.ndarray
-			radial distance array, m
-		v : numpy.ndarray
-			speed array, m
-		phi : numpy.ndarray
-			latitude array, rad
-		psi : numpy.ndarray
-			heading angle array, rad
-		theta : numpy.ndarray
-			longitude array, rad
-		gamma : numpy.ndarray
-			flight path angle array, rad
+		rbar0 : float
+			non-dimensional radial distance initial condition
+		theta0 : float
+			longitude initial condition, rad
+		phi0 : float
+			latatitude initial condition, rad
+		vbar0 : float
+			non-dimensional planet-relative speed initial condition
+		psi0 : float
+			heading angle initial condition, rad
+		gamma0 : float
+			entry flight-path angle initial condition, rad
+		drangebar0 : float
+			non-dimensional downrange initial condition
+		t_sec : float
+			time in seconds for which propogation is done
+		dt : float
+			max. time step size in seconds
+		delta : float
+			bank angle command, rad
+		first_step : float, optional
+			initial step size of the solver, seconds, not used by
+			the BDF and LSODA methods, default=None lets the solver
+			choose it
+
+		Returns
+		----------
+		tbar : numpy.ndarray
+			nondimensional time at which solution is computed
+		rbar : numpy.ndarray
+			nondimensional radial distance solution
+		theta : numpy.ndarray
+			longitude solution, rad
+		phi : numpy.ndarray
+			latitude array, rad
+		vbar : numpy.ndarray
+			nondimensional velocity solution
+		psi : numpy.ndarray, rad
+			heading angle solution, rad
+		gamma : numpy.ndarray
+			flight-path angle, rad
+		drangebar : numpy.ndarray
+			downrange solution, meters
+		"""
+
+		# store nondimensional initial conditions in xbar_0
+		xbar_0 = [rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0]
+
+		# discretize time interval [0,time] in steps of dt
+		tbar = np.arange(0, (t_sec + dt) / self.planetObj.tau, dt / self.planetObj.tau)
+
+		# use scipy odeint to solve for the entry trajectory using initial
+		# conditions xbar_0 and vehicle parameters in args
+		EOM2 = self.EOM2Fused if self.fusedEOM is True else self.EOM2
+		# the Jacobian is only passed to the implicit methods, the
+		# explicit ones warn about an unused jac argument
+		options = {}
+		if self.analyticJacobian is True and self.method in ['Radau', 'BDF', 'LSODA']:
+			options['jac'] = self.EOM2Jacobian
+		# the multistep methods restart at first order, and are less
+		# accurate from a large first step than from their own one
+		if first_step is not None and self.method not in ['BDF', 'LSODA']:
+			first_step = min(first_step/self.planetObj.tau, tbar[-1])
+		else:
+			first_step = None
+		xbar = solve_ivp(EOM2, (0, tbar[-1]), xbar_0, method=self.method, dense_output=True, rtol=self.tol,
+						 atol=self.tol, events=self.hit_EFPA_90, args=(delta,), first_step=first_step, **options)
+		self.nfev = xbar.nfev
+		self.njev = xbar.njev
+		self.largestStep = np.max(np.diff(xbar.t))*self.planetObj.tau if len(xbar.t) > 1 else None
+
+		# evaluate the solution on the output grid up to the event
+		tbar = tbar[tbar <= xbar.t[-1]]
+		xbar_t = xbar.sol(tbar)
+
+		# extract solution from odeint into solution variable vectors
+		rbar = xbar_t[0, :]  # radial distance rbar solution
+		theta = xbar_t[1, :]   # longitude theta solution
+		phi = xbar_t[2, :]   # latitude phi solution
+		vbar = xbar_t[3, :]  # velocity vbar solution
+		psi = xbar_t[4, :]   # heading angle psi solution
+		gamma = xbar_t[5, :]   # flight path angle solution
+		drangebar = xbar_t[6, :]   # downrange solution
+
+		return tbar, rbar, theta, phi, vbar, psi, gamma, drangebar
+
+	def hit_h_skip(self, t, y, delta):
+		return y[0] - (self.planetObj.RP + self.planetObj.h_skip)/self.planetObj.RP
+	hit_h_skip.terminal = True
+	hit_h_skip.direction = 1
+
+	def hit_h_trap(self, t, y, delta):
+		return y[0] - (self.planetObj.RP + self.planetObj.h_trap)/self.planetObj.RP
+	hit_h_trap.terminal = True
+	hit_h_trap.direction = -1
+
+	def solveTrajectoryEvents(self, rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+							  method='LSODA', first_step=None):
+		"""
+		Function to propogate a single atmospheric entry trajectory
+		given entry interface / other initial conditions and
+		bank angle delta, stopping at the first skip out (h_skip),
+		trap in (h_trap) or hit_EFPA_90 event.
+
+		The event is root-located by the solver, and the state at 
+		the event is appended to the solution so that the 
+		trajectory ends exactly at the event. The event is 
+		returned, pass it to classifyTrajectory().
+
+		Parameters
+		----------
+		rbar0 : float
+			non-dimensional radial distance initial condition
+		theta0 : float
+			longitude initial condition, rad
+		phi0 : float
+			latatitude initial condition, rad
+		vbar0 : float
+			non-dimensional planet-relative speed initial condition
+		psi0 : float
+			heading angle initial condition, rad
+		gamma0 : float
+			entry flight-path angle initial condition, rad
+		drangebar0 : float
+			non-dimensional downrange initial condition
+		t_sec : float
+			max. time in seconds for which propogation is done
+		dt : float
+			max. time step size in seconds
+		delta : float
+			bank angle command, rad
+		method : str, optional
+			solve_ivp integration method, default='LSODA'
+		first_step : float, optional
+			initial step size of the solver, seconds, not used by
+			the BDF and LSODA methods, default=None lets the solver
+			choose it
+
+		Returns
+		----------
+		tbar : numpy.ndarray
+			nondimensional time at which solution is computed
+		rbar : numpy.ndarray
+			nondimensional radial distance solution
+		theta : numpy.ndarray
+			longitude solution, rad
+		phi : numpy.ndarray
+			latitude array, rad
+		vbar : numpy.ndarray
+			nondimensional velocity solution
+		psi : numpy.ndarray, rad
+			heading angle solution, rad
+		gamma : numpy.ndarray
+			flight-path angle, rad
+		drangebar : numpy.ndarray
+			downrange solution, meters
+		eventFlag : float
+			event at which the propogation was stopped, 
+			1.0 = skip out, -1.0 = trap in, 0.0 = none
+		"""
+
+		# store nondimensional initial conditions in xbar_0
+		xbar_0 = [rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0]
+
+		# discretize time interval [0,time] in steps of dt
+		tbar = np.arange(0, (t_sec + dt) / self.planetObj.tau, dt / self.planetObj.tau)
+
+		EOM2 = self.EOM2Fused if self.fusedEOM is True else self.EOM2
+		options = {}
+		if self.analyticJacobian is True and method in ['Radau', 'BDF', 'LSODA']:
+			options['jac'] = self.EOM2Jacobian
+		events = [self.hit_h_skip, self.hit_h_trap, self.hit_EFPA_90]
+		# the multistep methods restart at first order, and are less
+		# accurate from a large first step than from their own one
+		if first_step is not None and method not in ['BDF', 'LSODA']:
+			first_step = min(first_step/self.planetObj.tau, tbar[-1])
+		else:
+			first_step = None
+		xbar = solve_ivp(EOM2, (0, tbar[-1]), xbar_0, method=method, dense_output=True, rtol=self.tol,
+						 atol=self.tol, events=events, args=(delta,), first_step=first_step, **options)
+		self.nfev = xbar.nfev
+		self.njev = xbar.njev
+		self.largestStep = np.max(np.diff(xbar.t))*self.planetObj.tau if len(xbar.t) > 1 else None
+
+		# evaluate the solution on the output grid up to the event
+		tbar = tbar[tbar <= xbar.t[-1]]
+		xbar_t = xbar.sol(tbar)
+
+		# append the root-located event state to the solution
+		eventFlag = 0.0
+		for i, flag in enumerate([1.0, -1.0, 0.0]):
+			if len(xbar.t_events[i]) > 0:
+				eventFlag = flag
+				if xbar.t_events[i][0] > tbar[-1]:
+					tbar = np.append(tbar, xbar.t_events[i][0])
+					xbar_t = np.hstack((xbar_t, xbar.y_events[i][0].reshape(7, 1)))
+				break
+
+		rbar = xbar_t[0, :]  # radial distance rbar solution
+		theta = xbar_t[1, :]  # longitude theta solution
+		phi = xbar_t[2, :]  # latitude phi solution
+		vbar = xbar_t[3, :]  # velocity vbar solution
+		psi = xbar_t[4, :]  # heading angle psi solution
+		gamma = xbar_t[5, :]  # flight path angle solution
+		drangebar = xbar_t[6, :]  # downrange solution
+
+		return tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, eventFlag
+
+	def solveTerminalState(self, rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, delta, method):
+		"""
+		Propogates a single atmospheric entry trajectory until the skip
+		out, trap in or -88 deg flight-path angle event, or t_sec, and
+		only returns the terminal state. No output grid is evaluated.
+
+		Parameters
+		----------
+		rbar0 : float
+			non-dimensional radial distance initial condition
+		theta0 : float
+			longitude initial condition, rad
+		phi0 : float
+			latatitude initial condition, rad
+		vbar0 : float
+			non-dimensional planet-relative speed initial condition
+		psi0 : float
+			heading angle initial condition, rad
+		gamma0 : float
+			entry flight-path angle initial condition, rad
+		drangebar0 : float
+			non-dimensional downrange initial condition
+		t_sec : float
+			max. time in seconds for which propogation is done
+		delta : float
+			bank angle command, rad
+		method : str
+			solve_ivp integration method
+
+		Returns
+		----------
+		xbar : numpy.ndarray
+			non-dimensional terminal state [rbar, theta, phi, vbar,
+			psi, gamma, drangebar]
+		eventFlag : float
+			event at which the propogation was stopped, 
+			1.0 = skip out, -1.0 = trap in, 0.0 = none
+		"""
+
+		xbar_0 = [rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0]
+
+		EOM2 = self.EOM2Fused if self.fusedEOM is True else self.EOM2
+		options = {}
+		if self.analyticJacobian is True and method in ['Radau', 'BDF', 'LSODA']:
+			options['jac'] = self.EOM2Jacobian
+		events = [self.hit_h_skip, self.hit_h_trap, self.hit_EFPA_90]
+		xbar = solve_ivp(EOM2, (0, t_sec/self.planetObj.tau), xbar_0, method=method, rtol=self.tol,
+						 atol=self.tol, events=events, args=(delta,), **options)
+		self.nfev = xbar.nfev
+		self.njev = xbar.njev
+
+		eventFlag = 0.0
+		for i, flag in enumerate([1.0, -1.0, 0.0]):
+			if len(xbar.t_events[i]) > 0:
+				eventFlag = flag
+				break
+
+		return xbar.y[:, -1], eventFlag
+
+	def solveEntryTrajectory(self, rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+							 solver='odeint', first_step=None):
+		"""
+		Propogates a single atmospheric entry trajectory with 
+		solveTrajectory() or solveTrajectory2(), or with 
+		solveTrajectoryEvents() if self.eventTermination is True, 
+		and returns the event at which the propogation was stopped 
+		for classifyTrajectory().
+
+		Parameters
+		----------
+		rbar0 : float
+			non-dimensional radial distance initial condition
+		theta0 : float
+			longitude initial condition, rad
+		phi0 : float
+			latatitude initial condition, rad
+		vbar0 : float
+			non-dimensional planet-relative speed initial condition
+		psi0 : float
+			heading angle initial condition, rad
+		gamma0 : float
+			entry flight-path angle initial condition, rad
+		drangebar0 : float
+			non-dimensional downrange initial condition
+		t_sec : float
+			time in seconds for which propogation is done
+		dt : float
+			max. time step size in seconds
+		delta : float
+			bank angle command, rad
+		solver : str, optional
+			'odeint' to use solveTrajectory() / LSODA, 'solve_ivp'
+			to use solveTrajectory2() / self.method, default='odeint'
+		first_step : float, optional
+			initial step size of the solver, seconds, not used by
+			the BDF and LSODA methods, default=None lets the solver
+			choose it
+
+		Returns
+		----------
+		tbar : numpy.ndarray
+			nondimensional time at which solution is computed
+		rbar : numpy.ndarray
+			nondimensional radial distance solution
+		theta : numpy.ndarray
+			longitude solution, rad
+		phi : numpy.ndarray
+			latitude array, rad
+		vbar : numpy.ndarray
+			nondimensional velocity solution
+		psi : numpy.ndarray, rad
+			heading angle solution, rad
+		gamma : numpy.ndarray
+			flight-path angle, rad
+		drangebar : numpy.ndarray
+			downrange solution, meters
+		eventFlag : float
+			event at which the propogation was stopped, 
+			1.0 = skip out, -1.0 = trap in, 0.0 = none
+		"""
+
+		if self.eventTermination is True:
+			method = 'LSODA' if solver == 'odeint' else self.method
+			return self.solveTrajectoryEvents(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+											  method, first_step)
+
+		if solver == 'odeint':
+			solution = self.solveTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
+		else:
+			solution = self.solveTrajectory2(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+											 first_step)
+
+		return (*solution, 0.0)
+
+	def convertToPlotUnits(self, t, r, v, phi, psi, theta, gamma, drange):
+		"""
+		Convert state vector components to units appropriate 
+		for evolution plots.
+
+		Parameters
+		----------
+		t : numpy.ndarray
+			time array, sec
+		r : numpy.ndarray
+			radial distance array, m
+		v : numpy.ndarray
+			speed array, m
+		phi : numpy.ndarray
+			latitude array, rad
+		psi : numpy.ndarray
+			heading angle array, rad
+		theta : numpy.ndarray
+			longitude array, rad
+		gamma : numpy.ndarray
+			flight path angle array, rad
 		drange : numpy.ndarray
 			downrange array, meters
 
@@ -1911,7 +2727,7 @@ class Vehicle:
 		
 		return heatrate/10000.0
 
-	def classifyTrajectory(self, r):
+	def classifyTrajectory(self, r, eventFlag=0.0):
 		"""
 		This function checks the trajectory for "events" which are 
 		used to truncate the trajectory
@@ -1940,6 +2756,9 @@ class Vehicle:
 		----------
 		r : numpy.ndarray
 			dimensional radial distance solution, meters
+		eventFlag : float, optional
+			event at which the propogation was stopped, as returned
+			by solveTrajectoryEvents(), default=0.0
 
 		Returns
 		----------
@@ -1951,6 +2770,11 @@ class Vehicle:
 
 		
 		"""
+		# If the propogation was stopped at a skip out or trap in
+		# event, the trajectory already ends at the event location
+		if eventFlag != 0.0:
+			return len(r), eventFlag
+
 		# Compute altitude history for radial distance solution
 		h = self.planetObj.computeH(r)
 
@@ -2233,9 +3057,7 @@ class Vehicle:
 			Mach no.
 		
 		"""
-		stat_pres = np.float(self.planetObj.pressure_int(r - self.planetObj.RP))
-		stat_temp = np.float(self.planetObj.temp_int(r - self.planetObj.RP))
-		sonic_spd = np.float(self.planetObj.sonic_int(r - self.planetObj.RP))
+		sonic_spd = float(self.planetObj.sonic_int(r - self.planetObj.RP))
 		mach = v/sonic_spd
 
 		return mach
@@ -2291,23 +3113,14 @@ class Vehicle:
 			max. heatload, J/cm2
 		
 		"""
-		
-		# store the current vehicle nose radius in a temporary variable
-		temp_var = self.RN
 
-		q_stag_max = np.zeros(len(rn_array))
-		heatload = np.zeros(len(rn_array))
-		count = 0
+		# heating rates over the trajectory x nose radius grid, 
+		# with a single density evaluation
+		q_stag_con, q_stag_rad = self.qStagHeating(rc, vc, rn_array)
+		q_stag = q_stag_con + q_stag_rad
 
-		for RN in rn_array:
-			self.RN = RN       # reset the nose radius to values from rn_array 
-
-			q_stag = self.qStagTotal(rc,vc)
-			q_stag_max[count] = max(q_stag)
-			heatload[count] = cumulative_trapezoid(q_stag, tc, initial=0)[-1]
-			count = count+1
-
-		self.RN = temp_var   # set the nose radius to original value of nose radius
+		q_stag_max = np.max(q_stag, axis=0)
+		heatload = cumulative_trapezoid(q_stag, tc, axis=0, initial=0)[-1]
 
 		return q_stag_max, heatload
 
@@ -2431,7 +3244,8 @@ class Vehicle:
 		"""
 		Propogates the vehicle state for a specified time using 
 		initial conditions, vehicle properties, and 
-		atmospheric profile data.
+		atmospheric profile data. The trajectory loads are 
+		computed on first access, see deferTrajectoryLoads().
 		
 		Parameters
 		----------
@@ -2475,50 +3289,69 @@ class Vehicle:
 																						  gamma0, drange0)
 		
 		# Solve for the entry trajectory
-		tbar,rbar,theta,phi,vbar,psi,gamma,drangebar = self.solveTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0,
-																			drangebar0, t_sec, dt, delta)
+		tbar,rbar,theta,phi,vbar,psi,gamma,drangebar,eventFlag = \
+			self.solveEntryTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
 		# Note : solver returns non-dimensional variables
-		# Convert to dimensional variables for plotting
-		t, r, theta, phi, v, psi, gamma, drange = self.planetObj.dimensionalize(tbar, rbar, theta, phi, vbar, psi,
-																				gamma, drangebar)
-
-		# dimensional state variables are in SI units
-		# convert to more rational units for plotting
-		t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km = \
-			self.convertToPlotUnits(t, r, v, phi, psi, theta, gamma, drange)
 
 		# classify trajectory
-		self.index, self.exitflag = self.classifyTrajectory(r)
+		self.index, self.exitflag = self.classifyTrajectory(rbar*self.planetObj.RP, eventFlag)
 
-		# truncate trajectory
-		self.tc, self.rc, self.thetac, self.phic, self.vc, self.psic, self.gammac, self.drangec = \
-											self.truncateTrajectory(t, r, theta, phi, v, psi, gamma, drange, self.index)
-		self.t_minc, self.h_kmc, self.v_kmsc, self.phi_degc, self.psi_degc, self.theta_degc, self.gamma_degc, self.drange_kmc = \
-			self.truncateTrajectory(t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km, self.index)
+		# truncate and dimensionalize the trajectory into a single 
+		# result buffer, plot units are computed from it on access
+		self.trajectory = TrajectoryResult(self.planetObj, tbar, rbar, theta, phi, vbar, psi, gamma, drangebar,
+										   self.index)
 
-		# compute acceleration loads
-		self.acc_net_g = self.computeAccelerationLoad(self.tc, self.rc, self.thetac, self.phic, self.vc, self.index, delta)
-		# compute drag acceleration 
-		self.acc_drag_g = self.computeAccelerationDrag(self.tc, self.rc, self.thetac, self.phic, self.vc, self.index,delta)
+		# acceleration loads, drag acceleration, dynamic and 
+		# stagnation pressure, stagnation point convective and 
+		# radiative heating rate and heating load are computed 
+		# on first access
+		self.deferTrajectoryLoads(delta, 0)
 
-		# compute dynamic pressure
-		self.dyn_pres_atm = self.computeDynPres(self.rc, self.vc)/1.01325E5
-		# compute stagnation pressure
-		self.stag_pres_atm = self.computeStagPres(self.rc, self.vc)/1.01325E5
+	def deferTrajectoryLoads(self, delta, heatload0):
+		"""
+		Defers the computation of the loads of the last propogated 
+		trajectory (acceleration loads, drag acceleration, dynamic 
+		and stagnation pressure, stagnation point heating rates and
+		heat load) to the first access of any of them. 
 
-		# compute stagnation point convective and radiative heating rate
-		self.q_stag_con = self.qStagConvective(self.rc, self.vc)
-		self.q_stag_rad = self.qStagRadiative (self.rc, self.vc)
-		# compute total stagnation point heating rate
-		self.q_stag_total = self.q_stag_con + self.q_stag_rad
-		# compute stagnation point heating load
-		self.heatload = cumulative_trapezoid(self.q_stag_total, self.tc, initial=0)
+		The loads are computed with a shallow copy of the vehicle 
+		and planet taken now, so changes to the vehicle parameters
+		or atmosphere tables made before the first access do not 
+		affect them. The loads are cached in the TrajectoryResult 
+		until the next propogation replaces it.
 
-	def propogateEntry2(self, t_sec, dt, delta_deg):
+		Parameters
+		----------
+		delta : float
+			bank angle, rad
+		heatload0 : float
+			initial heat load, J/cm2
+		"""
+
+		vehicleCopy = copy.copy(self)
+		vehicleCopy.planetObj = copy.copy(self.planetObj)
+		vehicleCopy.trajectory = None
+
+		def computeLoads(trajectory):
+			tc, rc, thetac, phic, vc = trajectory.tc, trajectory.rc, trajectory.thetac, trajectory.phic, trajectory.vc
+			index = len(trajectory)
+
+			trajectory.setLoads(
+				vehicleCopy.computeAccelerationLoad(tc, rc, thetac, phic, vc, index, delta),
+				vehicleCopy.computeAccelerationDrag(tc, rc, thetac, phic, vc, index, delta),
+				vehicleCopy.computeDynPres(rc, vc)/1.01325E5,
+				vehicleCopy.computeStagPres(rc, vc)/1.01325E5,
+				*vehicleCopy.qStagHeating(rc, vc, vehicleCopy.RN),
+				heatload0=heatload0)
+
+		self.trajectory.deferLoads(computeLoads)
+
+	def propogateEntry2(self, t_sec, dt, delta_deg, first_step=None):
 		"""
 		Propogates the vehicle state for a specified time using
 		initial conditions, vehicle properties, and
-		atmospheric profile data.
+		atmospheric profile data. The trajectory loads are
+		computed on first access, see deferTrajectoryLoads().
 
 		Parameters
 		----------
@@ -2528,6 +3361,11 @@ class Vehicle:
 			max. time step, seconds
 		delta_deg : float
 			bank angle command, deg
+		first_step : float, optional
+			initial step size of the solver, seconds, e.g. the
+			largestStep of the previous guidance cycle, not used
+			by the BDF and LSODA methods, default=None lets the
+			solver choose it
 
 		"""
 
@@ -2562,49 +3400,83 @@ class Vehicle:
 			self.planetObj.nonDimState(r0, theta0, phi0, v0, psi0, gamma0, drange0)
 
 		# Solve for the entry trajectory
-		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar = \
-			self.solveTrajectory2(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
+		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, eventFlag = \
+			self.solveEntryTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+									  'solve_ivp', first_step)
 		# Note : solver returns non-dimensional variables
-		# Convert to dimensional variables for plotting
-		t, r, theta, phi, v, psi, gamma, drange = \
-			self.planetObj.dimensionalize(tbar, rbar, theta, phi, vbar, psi, gamma, drangebar)
-
-		# dimensional state variables are in SI units
-		# convert to more rational units for plotting
-		t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km \
-			= self.convertToPlotUnits(t, r, v, phi, psi, theta, gamma, drange)
 
 		# classify trajectory
-		self.index, self.exitflag = self.classifyTrajectory(r)
+		self.index, self.exitflag = self.classifyTrajectory(rbar * self.planetObj.RP, eventFlag)
 
-		# truncate trajectory
-		self.tc, self.rc, self.thetac, self.phic, self.vc, self.psic, self.gammac, self.drangec \
-			= self.truncateTrajectory(t, r, theta, phi, v, psi, gamma, drange, self.index)
-		self.t_minc, self.h_kmc, self.v_kmsc, self.phi_degc, self.psi_degc, \
-		self.theta_degc, self.gamma_degc, self.drange_kmc = \
-			self.truncateTrajectory(t_min, h_km, v_kms, phi_deg, psi_deg,
-									theta_deg, gamma_deg, drange_km, self.index)
-		# compute acceleration loads
-		self.acc_net_g = self.computeAccelerationLoad(self.tc, self.rc, self.thetac, self.phic, self.vc, self.index, delta)
-		# compute drag acceleration
-		self.acc_drag_g = self.computeAccelerationDrag(self.tc, self.rc, self.thetac, self.phic, self.vc, self.index, delta)
-		# compute dynamic pressure
-		self.dyn_pres_atm = self.computeDynPres(self.rc, self.vc) / 1.01325E5
-		# compute stagnation pressure
-		self.stag_pres_atm = self.computeStagPres(self.rc, self.vc) / 1.01325E5
+		# truncate and dimensionalize the trajectory into a single
+		# result buffer, plot units are computed from it on access
+		self.trajectory = TrajectoryResult(self.planetObj, tbar, rbar, theta, phi, vbar, psi, gamma, drangebar,
+										   self.index)
 
-		# compute stagnation point convective and radiative heating rate
-		self.q_stag_con = self.qStagConvective(self.rc, self.vc)
-		self.q_stag_rad = self.qStagRadiative(self.rc, self.vc)
-		# compute total stagnation point heating rate
-		self.q_stag_total = self.q_stag_con + self.q_stag_rad
-		# compute stagnation point heating load
-		self.heatload = cumulative_trapezoid(self.q_stag_total, self.tc, initial=self.heatLoad0)
+		# acceleration loads, drag acceleration, dynamic and
+		# stagnation pressure, stagnation point convective and
+		# radiative heating rate and heating load are computed 
+		# on first access
+		self.deferTrajectoryLoads(delta, self.heatLoad0)
+
+	def propogateEntrySensitivity(self, t_sec, dt, delta_deg):
+		"""
+		Propogates the vehicle state for a specified time together
+		with its sensitivity to the entry flight-path angle. Only
+		the truncated trajectory state, index and exitflag are
+		computed, and the sensitivity of the truncated trajectory
+		is stored in dstate_dgamma0.
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : float
+			bank angle command, deg
+
+		"""
+
+		h0 = self.h0_km*1.0E3
+		theta0 = self.theta0_deg*np.pi/180.0
+		phi0 = self.phi0_deg*np.pi/180.0
+		v0 = self.v0_kms*1.000E3
+		psi0 = self.psi0_deg*np.pi/180.0
+		gamma0 = self.gamma0_deg*np.pi/180.0
+		drange0 = self.drange0_km*1E3
+
+		delta = delta_deg*np.pi/180.0
+
+		r0 = self.planetObj.computeR(h0)
+
+		rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0 = self.planetObj.nonDimState(r0, theta0, phi0, v0, psi0,
+																						  gamma0, drange0)
+
+		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, S = \
+			self.solveTrajectorySensitivity(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
+
+		self.index, self.exitflag = self.classifyTrajectory(rbar*self.planetObj.RP)
+
+		self.trajectory = TrajectoryResult(self.planetObj, tbar, rbar, theta, phi, vbar, psi, gamma, drangebar,
+										   self.index)
+
+		# non-dimensional sensitivity of the truncated trajectory, per rad
+		self.dstate_dgamma0 = S[0:self.index, :]
 
 	def dummyVehicle(self, density_mes_int):
 		"""
 		Create a copy of the vehicle object which uses a 
-		measured density profile for propogation.
+		measured density profile for propogation, used as the 
+		context of the onboard predictor.
+
+		The vehicle and planet are copied shallowly, so the 
+		copy shares all parameters, atmosphere tables and the 
+		trajectory history of the vehicle, and only the density
+		source of the planet is replaced. The cost of the copy 
+		does not depend on the length of the trajectory history. 
+		Propogating the copy rebinds its own state attributes 
+		and does not affect this vehicle.
 
 		Parameters
 		-----------
@@ -2617,11 +3489,12 @@ class Vehicle:
 			dummy vehicle object
 
 		"""
-		planetCopy = copy.deepcopy(self.planetObj)
+		planetCopy = copy.copy(self.planetObj)
 		planetCopy.density_int = density_mes_int
 
-		vehicleCopy = copy.deepcopy(self)
+		vehicleCopy = copy.copy(self)
 		vehicleCopy.planetObj = planetCopy
+		vehicleCopy.trajectory = None
 
 		return vehicleCopy
 
@@ -2703,13 +3576,7 @@ class Vehicle:
 		# density_mes_int which is the measured 
 		# density function.
 		
-		planetCopy = copy.deepcopy(self.planetObj)
-		planetCopy.density_int = density_mes_int
-
-		# Create a copy of the vehicle object so it does 
-		# not affect the existing vehicle state variables
-		vehicleCopy = copy.deepcopy(self)
-		vehicleCopy.planetObj = planetCopy
+		vehicleCopy = self.dummyVehicle(density_mes_int)
 
 
 		# Define entry conditions at entry interface
@@ -2744,8 +3611,9 @@ class Vehicle:
 			vehicleCopy.planetObj.nonDimState(r0,theta0,phi0,v0,psi0,gamma0,drange0)
 		
 		# Solve for the entry trajectory
-		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar = \
-		vehicleCopy.solveTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
+		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, eventFlag = \
+		vehicleCopy.solveEntryTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
+		self.predictorNfev += vehicleCopy.nfev
 		# Note : solver returns non-dimensional variables
 		# Convert to dimensional variables for plotting
 		t, r, theta, phi, v, psi, gamma, drange = \
@@ -2757,7 +3625,7 @@ class Vehicle:
 			vehicleCopy.convertToPlotUnits(t, r, v, phi, psi, theta, gamma, drange)
 
 		# classify trajectory
-		index, exitflag = vehicleCopy.classifyTrajectory(r)
+		index, exitflag = vehicleCopy.classifyTrajectory(r, eventFlag)
 		# truncate trajectory
 		tc,rc,thetac,phic,vc,psic,gammac,drangec = \
 			vehicleCopy.truncateTrajectory(t, r, theta, phi, v, psi, gamma, drange, index)
@@ -2774,12 +3642,11 @@ class Vehicle:
 		stag_pres_atm = vehicleCopy.computeStagPres(rc, vc)/1.01325E5
 
 	    # compute stagnation point convective and radiative heating rate
-		q_stag_con = vehicleCopy.qStagConvective(rc, vc)
-		q_stag_rad = vehicleCopy.qStagRadiative (rc, vc)
+		q_stag_con, q_stag_rad = vehicleCopy.qStagHeating(rc, vc, vehicleCopy.RN)
 		# compute total stagnation point heating rate
 		q_stag_total = q_stag_con + q_stag_rad
 		# compute stagnation point heating load
-		heatload = cumulative_trapezoid(q_stag_total , tc, initial=heatLoad0)
+		heatload = cumulative_trapezoid(q_stag_total , tc, initial=0) + heatLoad0
 
 		return t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, \
 				gamma_degc, drange_kmc, exitflag, acc_net_g, dyn_pres_atm, \
@@ -2863,13 +3730,7 @@ class Vehicle:
 		# density_mes_int which is the measured
 		# density function.
 
-		planetCopy = copy.deepcopy(self.planetObj)
-		planetCopy.density_int = density_mes_int
-
-		# Create a copy of the vehicle object so it does
-		# not affect the existing vehicle state variables
-		vehicleCopy = copy.deepcopy(self)
-		vehicleCopy.planetObj = planetCopy
+		vehicleCopy = self.dummyVehicle(density_mes_int)
 
 		# Define entry conditions at entry interface
 		# Convert initial state variables from input/plot
@@ -2902,8 +3763,10 @@ class Vehicle:
 			vehicleCopy.planetObj.nonDimState(r0, theta0, phi0, v0, psi0, gamma0, drange0)
 
 		# Solve for the entry trajectory
-		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar = \
-			vehicleCopy.solveTrajectory2(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta)
+		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, eventFlag = \
+			vehicleCopy.solveEntryTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec, dt, delta,
+											 'solve_ivp')
+		self.predictorNfev += vehicleCopy.nfev
 		# Note : solver returns non-dimensional variables
 		# Convert to dimensional variables for plotting
 		t, r, theta, phi, v, psi, gamma, drange = \
@@ -2914,7 +3777,7 @@ class Vehicle:
 		t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km \
 			= vehicleCopy.convertToPlotUnits(t, r, v, phi, psi, theta, gamma, drange)
 		# classify trajectory
-		index, exitflag = vehicleCopy.classifyTrajectory(r)
+		index, exitflag = vehicleCopy.classifyTrajectory(r, eventFlag)
 		# truncate trajectory
 		tc, rc, thetac, phic, vc, psic, gammac, drangec \
 			= vehicleCopy.truncateTrajectory(t, r, theta, phi, v, psi, gamma, drange, index)
@@ -2931,12 +3794,11 @@ class Vehicle:
 		stag_pres_atm = vehicleCopy.computeStagPres(rc, vc) / 1.01325E5
 
 		# compute stagnation point convective and radiative heating rate
-		q_stag_con = vehicleCopy.qStagConvective(rc, vc)
-		q_stag_rad = vehicleCopy.qStagRadiative(rc, vc)
+		q_stag_con, q_stag_rad = vehicleCopy.qStagHeating(rc, vc, vehicleCopy.RN)
 		# compute total stagnation point heating rate
 		q_stag_total = q_stag_con + q_stag_rad
 		# compute stagnation point heating load
-		heatload = cumulative_trapezoid(q_stag_total, tc, initial=heatLoad0)
+		heatload = cumulative_trapezoid(q_stag_total, tc, initial=0) + heatLoad0
 
 		return t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, \
 				gamma_degc, drange_kmc, exitflag, acc_net_g, dyn_pres_atm, \
@@ -3041,14 +3903,15 @@ class Vehicle:
 		return ans
 
 
-	def hitsTargetApoapsis(self, t_sec, dt, delta_deg,targetApopasisAltitude_km):
+	def computeApoapsisError(self, t_sec, dt, delta_deg, targetApopasisAltitude_km):
 		"""
-		This function is used to check if the vehicle undershoots 
-		or overshoots. Does not include effect of planet rotation
-		to compute inertial speed.
+		Computes the difference between the apoapsis altitude of the
+		post atmospheric exit orbit and the target apoapsis altitude.
+		Does not include effect of planet rotation to compute inertial
+		speed.
 
-		Returns +1 if the vehicle is captured into an orbit with the 
-		required target apoapsis alt, -1 otherwise.
+		Trajectories which do not exit above planet.h_low return -inf
+		(undershoot), hyperbolic exit orbits return +inf (overshoot).
 
 		Parameters
 		----------
@@ -3063,8 +3926,8 @@ class Vehicle:
 		
 		Returns
 		----------
-		ans : int
-			-1 indicates overshoot, +1 indicates undershoot
+		err : float
+			apoapsis altitude minus target apoapsis altitude, km
 		
 		"""
 		self.propogateEntry(t_sec, dt, delta_deg)
@@ -3097,29 +3960,64 @@ class Vehicle:
 
 		terminal_alt = (self.terminal_r - self.planetObj.RP)/1000.0
 
+		# if terminal altitude (km) < planet.h_low, then assume undershoot
+		if terminal_alt < self.planetObj.h_low/1000.0:
+			return -np.inf
+
+		# hyperbolic orbit at the exit state, overshoot
+		if self.terminal_a < 0:
+			return np.inf
+
+		return self.hp_km - targetApopasisAltitude_km
+
+	def hitsTargetApoapsis(self, t_sec, dt, delta_deg,targetApopasisAltitude_km):
+		"""
+		This function is used to check if the vehicle undershoots 
+		or overshoots. Does not include effect of planet rotation
+		to compute inertial speed.
+
+		Returns +1 if the vehicle is captured into an orbit with the 
+		required target apoapsis alt, -1 otherwise.
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : float
+			bank angle command, deg
+		targetApopasisAltitude_km : float
+			target apoapsis altitude , km
+		
+		Returns
+		----------
+		ans : int
+			-1 indicates overshoot, +1 indicates undershoot
+		
+		"""
+		err = self.computeApoapsisError(t_sec, dt, delta_deg, targetApopasisAltitude_km)
+
 		# if computed apoapsis altitude exceeds target apoapsis altitude
 		# or if orbit is hyperbolic at the exit state, return -1.0
 		# else if computed apoapsis altitude falls short of
 		# target apoapsis altitude return 1.0
-		if self.hp_km >= targetApopasisAltitude_km or self.terminal_a < 0:
+		if err >= 0:
 			ans = -1.0
 		else:
 			ans = 1.0
-
-		# if terminal altitude (km) < planet.h_low, then assume undershoot
-		if terminal_alt < self.planetObj.h_low/1000.0:
-			ans = 1.0
 	
 		return ans
 
-	def hitsTargetApoapsis2(self, t_sec, dt, delta_deg, targetApopasisAltitude_km):
+	def computeApoapsisError2(self, t_sec, dt, delta_deg, targetApopasisAltitude_km):
 		"""
-		This function is used to check if the vehicle undershoots 
-		or overshoots. Includes effect of planet rotation to 
-		calculate inertial speed.
+		Computes the difference between the apoapsis altitude of the
+		post atmospheric exit orbit and the target apoapsis altitude.
+		Includes effect of planet rotation to calculate inertial 
+		speed.
 
-		Returns +1 if the vehicle is captured into an orbit with the 
-		required target apoapsis alt, -1 otherwise.
+		Trajectories which do not exit above planet.h_low return -inf
+		(undershoot), hyperbolic exit orbits return +inf (overshoot).
 
 		Parameters
 		----------
@@ -3134,8 +4032,8 @@ class Vehicle:
 		
 		Returns
 		----------
-		ans : int
-			-1 indicates overshoot, +1 indicates undershoot
+		err : float
+			apoapsis altitude minus target apoapsis altitude, km
 		
 		"""
 		self.propogateEntry2(t_sec, dt, delta_deg)
@@ -3199,37 +4097,408 @@ class Vehicle:
 		terminal_E = self.computeEnergyScalar(terminal_r, v_ie_mag)
 		terminal_h = self.computeAngMomScalar(terminal_r, v_ie_mag, terminal_fpa_ie_rad)
 
-		# Compute semi-major axis and eccentricity of the post atmospheric exit orbit
-		terminal_a = self.computeSemiMajorAxisScalar(terminal_E)
-		terminal_e = self.computeEccScalar(terminal_h, terminal_E)
+		# Compute semi-major axis and eccentricity of the post atmospheric exit orbit
+		terminal_a = self.computeSemiMajorAxisScalar(terminal_E)
+		terminal_e = self.computeEccScalar(terminal_h, terminal_E)
+
+		# Compute apoapsis radius, apoapsis altitude, apoapsis altitude in KM
+		rp = terminal_a*(1.0+terminal_e)
+		hp = rp - self.planetObj.RP
+		hp_km = hp / 1.0E3
+
+		terminal_alt = (terminal_r - self.planetObj.RP)/1000.0
+
+		# if terminal altitude (km) < planet.h_low, then assume undershoot
+		if terminal_alt < self.planetObj.h_low/1000.0:
+			return -np.inf
+
+		# hyperbolic orbit at the exit state, overshoot
+		if terminal_a < 0:
+			return np.inf
+
+		return hp_km - targetApopasisAltitude_km
+
+	def hitsTargetApoapsis2(self, t_sec, dt, delta_deg, targetApopasisAltitude_km):
+		"""
+		This function is used to check if the vehicle undershoots 
+		or overshoots. Includes effect of planet rotation to 
+		calculate inertial speed.
+
+		Returns +1 if the vehicle is captured into an orbit with the 
+		required target apoapsis alt, -1 otherwise.
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : float
+			bank angle command, deg
+		targetApopasisAltitude_km : float
+			target apoapsis altitude , km
+		
+		Returns
+		----------
+		ans : int
+			-1 indicates overshoot, +1 indicates undershoot
+		
+		"""
+		err = self.computeApoapsisError2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
+
+		# if computed apoapsis altitude exceeds target apoapsis altitude
+		# or if orbit is hyperbolic at the exit state, return -1.0
+		# else if computed apoapsis altitude falls short of
+		# target apoapsis altitude return 1.0
+		if err >= 0:
+			ans = -1.0
+		else:
+			ans = 1.0
+	
+		return ans
+
+	def computeApoapsisSensitivity(self, t_sec, dt, delta_deg, targetApopasisAltitude_km):
+		"""
+		Computes the apoapsis altitude error at atmospheric exit and 
+		its derivative with respect to the entry flight-path angle,
+		using the state transition matrix from 
+		propogateEntrySensitivity(). Does not include effect of planet 
+		rotation to compute inertial speed.
+
+		The sign of the error is consistent with hitsTargetApoapsis():
+		error >= 0 corresponds to -1 (overshoot), error < 0 to +1.
+		Trajectories which do not exit the atmosphere return
+		error = -inf, hyperbolic exit orbits return error = +inf, 
+		with derivative NaN.
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : float
+			bank angle command, deg
+		targetApopasisAltitude_km : float
+			target apoapsis altitude , km
+
+		Returns
+		----------
+		err : float
+			apoapsis altitude minus target apoapsis altitude, km
+		derr : float
+			derivative of err with respect to the entry flight-path
+			angle, km/deg
+		"""
+		self.propogateEntrySensitivity(t_sec, dt, delta_deg)
+
+		GM = self.planetObj.GM
+		r = self.rc[self.index-1]
+		v = self.vc[self.index-1]
+		g = self.gammac[self.index-1]
+
+		if (r - self.planetObj.RP)/1000.0 < self.planetObj.h_low/1000.0:
+			return -np.inf, np.nan
+
+		E = self.computeEnergyScalar(r, v)
+		h = self.computeAngMomScalar(r, v, g)
+		a = self.computeSemiMajorAxisScalar(E)
+		e = self.computeEccScalar(h, E)
+
+		if a < 0:
+			return np.inf, np.nan
+
+		hp_km = (a*(1.0 + e) - self.planetObj.RP)/1.0E3
+
+		# chain rule from the non-dimensional exit state to the apoapsis altitude
+		dS = self.dstate_dgamma0[self.index-1]
+		dr = dS[0]*self.planetObj.RP
+		dv = dS[3]*self.planetObj.Vref
+		dg = dS[5]
+
+		dE = (GM/r**2.0)*dr + v*dv
+		dh = v*np.cos(g)*dr + r*np.cos(g)*dv - r*v*np.sin(g)*dg
+		da = (GM/(2.0*E**2.0))*dE
+		de = (h**2.0*dE + 2.0*E*h*dh)/(GM**2.0*e)
+		dhp_km = (da*(1.0 + e) + a*de)/1.0E3
+
+		return hp_km - targetApopasisAltitude_km, dhp_km*np.pi/180.0
+
+	def findEFPALimitNewton(self, t_sec, dt, delta_deg, gamma0_deg_guess_low,
+							gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km):
+		"""
+		Computes the entry flight-path angle for which a constant 
+		bank angle trajectory exits with the target apoapsis altitude,
+		using a bracketed Newton iteration on the apoapsis altitude 
+		error. Does not include effect of planet rotation.
+
+		The bracket is kept on the apoapsis altitude error of plain
+		propogations, computeApoapsisError(), as for the bisection 
+		algorithm. Newton steps are taken from the end of the bracket
+		with the smaller error, with the derivative from the state 
+		transition matrix, see computeApoapsisSensitivity(). A step 
+		smaller than gamma_deg_tol is lengthened to just past the 
+		predicted limit, so that the bracket closes around it. 
+		Near the limit, the secant slope of the last Newton step is
+		used instead of the derivative when the two agree to 10%, 
+		which saves the more expensive propogation. Bisection steps 
+		are taken instead when both ends have no exit or a hyperbolic
+		exit, when the step leaves the bracket, or when it is not 
+		below half the step before last.
+
+		The iteration stops when the bracket is smaller than 
+		gamma_deg_tol, and its end on the same side of the limit as 
+		gamma0_deg_guess_high is returned, so the result agrees with 
+		that of the bisection algorithm to gamma_deg_tol, provided the
+		solver tolerance resolves the apoapsis altitude error to this
+		accuracy. The number of propogations, with and without the 
+		state transition matrix, is stored in corridorEvaluations.
+
+		The apoapsis altitude error must be continuous at the limit.
+		This is not the case for the full lift down overshoot limit,
+		where it jumps from a finite value to no exit, and Newton 
+		steps take more propogations than bisection.
+
+		Parameters
+		----------
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : float
+			bank angle command, deg
+		gamma0_deg_guess_low : float
+			lower bound for the guess of limit FPA, deg
+		gamma0_deg_guess_high : float
+			upper bound for the guess of limit FPA, deg
+		gamma_deg_tol : float
+			desired accuracy for computation of the limit, deg
+		targetApopasisAltitude_km : float
+			target apoapsis altitude , km
+
+		Returns
+		----------
+		EFPALimit : float
+			limit EFPA, deg
+		exitflag : float
+			flag to indicate if a solution could not be found for the 
+			limit EFPA
+
+		exitflag = 1.0 indicates limit was found.
+		exitflag = 0.0 indicates limit was not found 
+		within user specified bounds.
+		"""
+
+		temp_var = self.gamma0_deg
+
+		# apoapsis error and its derivative at each propogated entry
+		# flight-path angle
+		errors = {}
+		derivatives = {}
+
+		def evaluate(gamma0_deg):
+			if gamma0_deg not in errors:
+				self.gamma0_deg = gamma0_deg
+				errors[gamma0_deg] = self.computeApoapsisError(t_sec, dt, delta_deg, targetApopasisAltitude_km)
+			return errors[gamma0_deg]
+
+		def derivative(gamma0_deg):
+			if gamma0_deg not in derivatives:
+				self.gamma0_deg = gamma0_deg
+				derivatives[gamma0_deg] = self.computeApoapsisSensitivity(t_sec, dt, delta_deg,
+																		  targetApopasisAltitude_km)[1]
+			return derivatives[gamma0_deg]
+
+		# same convention as hitsTargetApoapsis(), -1 overshoot, +1 undershoot
+		def sign(err):
+			return -1.0 if err >= 0 else 1.0
+
+		x_lo = gamma0_deg_guess_low
+		x_hi = gamma0_deg_guess_high
+		f_lo = evaluate(x_lo)
+		f_hi = evaluate(x_hi)
+
+		if sign(f_lo)*sign(f_hi) > 0:
+			self.corridorEvaluations = len(errors)
+			self.gamma0_deg = temp_var
+			return 0.0, 0.0
+
+		s_lo = sign(f_lo)
+
+		# step sizes of the last two iterations, and the last Newton
+		# step base point, error and derivative
+		steps = [abs(x_hi - x_lo)]*2
+		x_base, f_base, df_base = np.nan, np.nan, np.nan
+
+		while abs(x_hi - x_lo) > gamma_deg_tol:
+			# Newton step from the end of the bracket with the smaller
+			# error, bisection if it is not available, leaves the 
+			# bracket or is not below half the step before last
+			x, f = (x_lo, f_lo) if abs(f_lo) < abs(f_hi) else (x_hi, f_hi)
+			x_new = np.nan
+
+			if np.isfinite(f):
+				df = np.nan
+				# secant slope from the last Newton step, if it agrees
+				# with the derivative there
+				if x != x_base:
+					slope = (f - f_base)/(x - x_base)
+					if abs(slope - df_base) < 0.1*abs(df_base):
+						df = slope
+				if not np.isfinite(df):
+					df = derivative(x)
+				x_base, f_base, df_base = x, f, df
+
+				if np.isfinite(df) and df != 0:
+					dx = -f/df
+					# step just past the predicted limit
+					if abs(dx) < 0.75*gamma_deg_tol:
+						dx = dx + np.copysign(0.25*gamma_deg_tol, dx)
+					if abs(dx) <= 0.5*steps[0]:
+						x_new = x + dx
+
+			if not min(x_lo, x_hi) < x_new < max(x_lo, x_hi):
+				x_new = 0.5*(x_lo + x_hi)
+
+			steps = [steps[1], abs(x_new - x)]
+
+			f_new = evaluate(x_new)
+
+			if sign(f_new) == s_lo:
+				x_lo, f_lo = x_new, f_new
+			else:
+				x_hi, f_hi = x_new, f_new
+
+		self.corridorEvaluations = len(errors) + len(derivatives)
+		self.gamma0_deg = temp_var
+
+		return x_hi, 1.0
+
+	def findCorridorLimit(self, apoapsisError, t_sec, dt, delta_deg, gamma0_deg_guess_low,
+						  gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km, method='bisection'):
+		"""
+		Bracketing root finder for the entry flight-path angle at 
+		which a constant bank angle trajectory exits with the target 
+		apoapsis altitude. Shared by the overshoot, undershoot and 
+		drag modulation limit searches.
+
+		Works on the continuous apoapsis altitude error returned by
+		apoapsisError (computeApoapsisError or computeApoapsisError2).
+		Each entry flight-path angle is propogated at most once, the 
+		bracket end values are kept between iterations.
+
+		With method='illinois', the Illinois variant of regula falsi
+		is used, falling back to bisection when either end value is 
+		infinite (no exit, or hyperbolic exit) or when the bracket 
+		does not shrink by half in two iterations. With 
+		method='bisection' the result is identical to that of plain 
+		bisection on the sign of the error.
+
+		Parameters
+		----------
+		apoapsisError : method
+			function returning the apoapsis altitude error in km, with
+			signature (t_sec, dt, delta_deg, targetApopasisAltitude_km)
+		t_sec : float
+			propogation time, seconds
+		dt : float
+			max. time step, seconds
+		delta_deg : float
+			bank angle command, deg
+		gamma0_deg_guess_low : float
+			lower bound for the guess of limit FPA, deg
+		gamma0_deg_guess_high : float
+			upper bound for the guess of limit FPA, deg
+		gamma_deg_tol : float
+			desired accuracy for computation of the limit, deg
+		targetApopasisAltitude_km : float
+			target apoapsis altitude , km
+		method : str, optional
+			'illinois' or 'bisection', default='bisection'
+
+		Returns
+		----------
+		EFPALimit : float
+			end of the final bracket on the same side of the limit
+			as gamma0_deg_guess_high, deg
+		exitflag : float
+			flag to indicate if a solution could not be found for the 
+			limit EFPA
+
+		exitflag = 1.0 indicates limit was found.
+		exitflag = 0.0 indicates limit was not found 
+		within user specified bounds.
+		"""
+
+		temp_var = self.gamma0_deg
+
+		# apoapsis error of each propogated entry flight-path angle
+		cache = {}
+
+		def evaluate(gamma0_deg):
+			if gamma0_deg not in cache:
+				self.gamma0_deg = gamma0_deg
+				cache[gamma0_deg] = apoapsisError(t_sec, dt, delta_deg, targetApopasisAltitude_km)
+			return cache[gamma0_deg]
+
+		# same convention as hitsTargetApoapsis(), -1 overshoot, +1 undershoot
+		def sign(err):
+			return -1.0 if err >= 0 else 1.0
+
+		x_lo = gamma0_deg_guess_low
+		x_hi = gamma0_deg_guess_high
+		f_lo = evaluate(x_lo)
+		f_hi = evaluate(x_hi)
+
+		if sign(f_lo)*sign(f_hi) > 0:
+			self.corridorEvaluations = len(cache)
+			self.gamma0_deg = temp_var
+			return 0.0, 0.0
+
+		s_lo = sign(f_lo)
+
+		# Illinois bookkeeping, end which was retained in the last
+		# iteration and bracket width two iterations back
+		retained = 0
+		widths = [2.0*abs(x_hi - x_lo)]*2
+
+		while abs(x_hi - x_lo) > gamma_deg_tol:
+			x_mid = 0.5*(x_lo + x_hi)
+
+			if method == 'bisection' or not (np.isfinite(f_lo) and np.isfinite(f_hi)) or \
+				abs(x_hi - x_lo) > 0.5*widths[0]:
+				x_new = x_mid
+			else:
+				x_new = (x_lo*f_hi - x_hi*f_lo)/(f_hi - f_lo)
+				if not min(x_lo, x_hi) < x_new < max(x_lo, x_hi):
+					x_new = x_mid
+
+			widths = [widths[1], abs(x_hi - x_lo)]
 
-		# Compute apoapsis radius, apoapsis altitude, apoapsis altitude in KM
-		rp = terminal_a*(1.0+terminal_e)
-		hp = rp - self.planetObj.RP
-		hp_km = hp / 1.0E3
+			f_new = evaluate(x_new)
 
-		terminal_alt = (terminal_r - self.planetObj.RP)/1000.0
+			if sign(f_new) == s_lo:
+				x_lo, f_lo = x_new, f_new
+				# high end retained twice in a row, halve its weight
+				if retained == 1:
+					f_hi = 0.5*f_hi
+				retained = 1
+			else:
+				x_hi, f_hi = x_new, f_new
+				if retained == -1:
+					f_lo = 0.5*f_lo
+				retained = -1
 
-		# if computed apoapsis altitude exceeds target apoapsis altitude
-		# or if orbit is hyperbolic at the exit state, return -1.0
-		# else if computed apoapsis altitude falls short of
-		# target apoapsis altitude return 1.0
-		if hp_km >= targetApopasisAltitude_km or terminal_a<0:
-			ans = -1.0
-		else:
-			ans = 1.0
+		self.corridorEvaluations = len(cache)
+		self.gamma0_deg = temp_var
 
-		# if terminal altitude (km) < planet.h_low, then assume undershoot
-		if terminal_alt < self.planetObj.h_low/1000.0:
-			ans = 1.0
-	
-		return ans
+		return x_hi, 1.0
 
 	def findOverShootLimit(self, t_sec, dt, gamma0_deg_guess_low,
-							gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km):
+							gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km, method='bisection'):
 		"""
 		Computes the overshoot limit entry flight-path angle
-		for aerocapture vehicle using bisection algorithm.
+		for aerocapture vehicle.
 
 		This is shallowest entry flight path angle for which a full lift down
 		trajectory gets the vehicle captured into a post atmospheric exit orbit 
@@ -3239,7 +4508,7 @@ class Vehicle:
 		with an accuracy of at least 10 decimal places to ensure the correct 
 		atmospheric trajectory is simulated. 
 
-		A bisection algorithm is used to compute the overshoot limit.
+		The limit is computed with findCorridorLimit().
 
 		
 		Parameters
@@ -3256,6 +4525,12 @@ class Vehicle:
 			desired accuracy for computation of the overshoot limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois' or 'bisection', see 
+			findCorridorLimit(), default='bisection'. 'newton' is not
+			supported, the apoapsis altitude error jumps from a 
+			finite value to no exit at this limit, see 
+			findEFPALimitNewton()
 		
 		Returns
 		----------
@@ -3272,66 +4547,24 @@ class Vehicle:
 		
 		delta_deg = 180.0 # full lift down bank angle
 
-		temp_var = self.gamma0_deg
-		
-		# compute the apoapsis altitude flag for the lower bound entry 
-		# flight path angle and the upper bound entry flight path angle
-		self.gamma0_deg = gamma0_deg_guess_low
-		ans1 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-		self.gamma0_deg = gamma0_deg_guess_high
-		ans2 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)	
-		
-		# if product of above flags is negative, then overshoot limit is 
-		# within user specified bounds, proceed to bisection.
-		if ans1*ans2<0:
-			# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds target \
-			# apoapsis altitude or is not captured.")
-			# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not hit \
-			# target apospasis but is captured.")
-			# print("Overshoot limit is within user specified bounds.
-			# Beginning bisection search...")
-			# print("")
-			# bisection algorithm begins here, while abs(ub-lb)>tol continue bisection
-			while abs(gamma0_deg_guess_high - gamma0_deg_guess_low)>gamma_deg_tol:
-				gamma0_deg_guess_mid = 0.5*(gamma0_deg_guess_low+gamma0_deg_guess_high)
-				self.gamma0_deg = gamma0_deg_guess_low
-				ans1 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_mid
-				ans2 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_high
-				ans3 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				# reset upper / lower bounds as appropriate
-				if ans1*ans2<0:
-					# print('ans1*ans2<0')
-					gamma0_deg_guess_high = gamma0_deg_guess_mid
-				elif ans2*ans3<0:
-					# print('ans2*ans3<0')
-					gamma0_deg_guess_low = gamma0_deg_guess_mid
-				# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds target apoapsis altitude or is not captured.")
-				# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not hit target
-				# apospasis but is captured.")
-				# print("")
-				# set overShootLimit to upper bound
-				# set exitflag to 1.0
-				overShootLimit = gamma0_deg_guess_high
-				exitflag_os = 1.0
-		
-		# if product of flags is positive, overshootlimit is outside user specified bounds, 
-		# print warning message.
-		else:
-			print("Overshoot limit is outside user specified bounds.")
-			overShootLimit = 0.0
-			exitflag_os = 0.0
+		if method not in ['illinois', 'bisection']:
+			raise ValueError("Method '" + str(method) + "' is not supported by findOverShootLimit().")
 
-		self.gamma0_deg = temp_var
+		overShootLimit, exitflag_os = self.findCorridorLimit(self.computeApoapsisError, t_sec, dt, delta_deg,
+														gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+														targetApopasisAltitude_km, method)
+
+		# if a limit could not be bracketed, print warning message.
+		if exitflag_os == 0.0:
+			print("Overshoot limit is outside user specified bounds.")
 
 		return overShootLimit, exitflag_os
 
 	def findOverShootLimit2(self,t_sec, dt, gamma0_deg_guess_low,
-								gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km):
+								gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km, method='bisection'):
 		"""
 		Computes the overshoot limit entry flight-path angle
-		for aerocapture vehicle using bisection algorithm.
+		for aerocapture vehicle.
 		Includes effect of planet rotation on inertial speed.
 
 		This is shallowest entry flight path angle for which a full lift down
@@ -3342,7 +4575,7 @@ class Vehicle:
 		with an accuracy of at least 10 decimal places to ensure the correct 
 		atmospheric trajectory is simulated. 
 
-		A bisection algorithm is used to compute the overshoot limit.
+		The limit is computed with findCorridorLimit().
 
 		
 		Parameters
@@ -3359,6 +4592,9 @@ class Vehicle:
 			desired accuracy for computation of the overshoot limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois' or 'bisection', see 
+			findCorridorLimit(), default='bisection'
 		
 		Returns
 		----------
@@ -3373,68 +4609,24 @@ class Vehicle:
 		within user specified bounds.
 		"""
 		
-		delta_deg = 180.0   # full lift down bank angle
+		delta_deg = 180.0 # full lift down bank angle
 
-		temp_var = self.gamma0_deg
-		
-		# compute the apoapsis altitude flag for the lower bound entry 
-		# flight path angle and the upper bound entry flight path angle
-		self.gamma0_deg = gamma0_deg_guess_low
-		ans1 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-		self.gamma0_deg = gamma0_deg_guess_high
-		ans2 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)	
-		
-		# if product of above flags is negative, then overshoot limit is 
-		# within user specified bounds, proceed to bisection.
-		if ans1*ans2 < 0:
-			# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds target \
-			# apoapsis altitude or is not captured.")
-			# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not hit \
-			# target apospasis but is captured.")
-			# print("Overshoot limit is within user specified bounds.")
-			# Beginning bisection search...")
-			# print("")
-			# bisection algorithm begins here, while abs(ub-lb)>tol continue bisection
-			while abs(gamma0_deg_guess_high - gamma0_deg_guess_low)>gamma_deg_tol:
-				gamma0_deg_guess_mid = 0.5*(gamma0_deg_guess_low+gamma0_deg_guess_high)
-				self.gamma0_deg = gamma0_deg_guess_low
-				ans1 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_mid
-				ans2 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_high
-				ans3 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				# reset upper / lower bounds as appropriate
-				if ans1*ans2 < 0:
-					# print('ans1*ans2<0')
-					gamma0_deg_guess_high = gamma0_deg_guess_mid
-				elif ans2*ans3 < 0:
-					# print('ans2*ans3<0')
-					gamma0_deg_guess_low = gamma0_deg_guess_mid
-				# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds target apoapsis altitude or is not captured.")
-				# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not hit target apospasis but is captured.")
-				# print("")
-				# set overShootLimit to upper bound
-				# set exitflag to 1.0
-				overShootLimit = gamma0_deg_guess_high
-				exitflag_os = 1.0
-		
-		# if product of flags is positive, overshootlimit is outside user specified bounds, 
-		# print warning message.
-		else:
-			print("Overshoot limit is outside user specified bounds.")
-			overShootLimit = 0.0
-			exitflag_os = 0.0
+		overShootLimit, exitflag_os = self.findCorridorLimit(self.computeApoapsisError2, t_sec, dt, delta_deg,
+														gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+														targetApopasisAltitude_km, method)
 
-		self.gamma0_deg = temp_var
+		# if a limit could not be bracketed, print warning message.
+		if exitflag_os == 0.0:
+			print("Overshoot limit is outside user specified bounds.")
 
 		return overShootLimit, exitflag_os
 
 
 	def findUnderShootLimit(self, t_sec, dt, gamma0_deg_guess_low,\
-							gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km):
+							gamma0_deg_guess_high, gamma_deg_tol, targetApopasisAltitude_km, method='bisection'):
 		"""
 		Computes the undershoot limit entry flight-path angle
-		for aerocapture vehicle using bisection algorithm.
+		for aerocapture vehicle.
 
 		This is steepest entry flight path angle for which a full lift up
 		trajectory gets the vehicle captured into a post atmospheric exit orbit 
@@ -3444,7 +4636,7 @@ class Vehicle:
 		with an accuracy of at least 6 decimal places to ensure the correct 
 		atmospheric trajectory is simulated. 
 
-		A bisection algorithm is used to compute the undershoot limit.
+		The limit is computed with findCorridorLimit().
 
 		
 		Parameters
@@ -3461,6 +4653,11 @@ class Vehicle:
 			desired accuracy for computation of the overshoot limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois', 'bisection' or 'newton'.
+			'illinois' and 'bisection' use findCorridorLimit(), 'newton'
+			uses the bracketed Newton iteration findEFPALimitNewton(),
+			default='bisection'
 		
 		Returns
 		----------
@@ -3477,66 +4674,26 @@ class Vehicle:
 		
 		delta_deg = 0.0 # full lift up bank angle
 
-		temp_var = self.gamma0_deg
-
-		# compute the apoapsis altitude flag for the lower bound 
-		# entry flight path angle and the upper bound entry flight path angle
-		self.gamma0_deg = gamma0_deg_guess_low
-		ans1 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-		self.gamma0_deg = gamma0_deg_guess_high
-		ans2 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)	
-		# if product of above flags is negative, then overshoot limit is 
-		# within user specified bounds, proceed to bisection.
-		if ans1*ans2<0:
-			# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds \
-			# target apoapsis altitude or is not captured.")
-			# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not \
-			# hit target apospasis but is captured.")
-			# print("Overshoot limit is within user specified bounds.
-			# Beginning bisection search...")
-			# print("")
-			# bisection algorithm begins here, while abs(ub-lb)>tol continue bisection
-			while abs(gamma0_deg_guess_high - gamma0_deg_guess_low)>gamma_deg_tol:
-				gamma0_deg_guess_mid = 0.5*(gamma0_deg_guess_low+gamma0_deg_guess_high)
-				self.gamma0_deg = gamma0_deg_guess_low
-				ans1 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_mid
-				ans2 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_high
-				ans3 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				# reset upper / lower bounds as appropriate
-				if ans1*ans2<0:
-					# print('ans1*ans2<0')
-					gamma0_deg_guess_high = gamma0_deg_guess_mid
-				elif ans2*ans3<0:
-					# print('ans2*ans3<0')
-					gamma0_deg_guess_low = gamma0_deg_guess_mid
-				#print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds target apoapsis\
-				# altitude or is not captured.")
-				#print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not hit target \
-				#apoapsis but is captured.")
-				#print("")
-				# set overShootLimit to upper bound
-				# set exitflag to 1.0
-				underShootLimit = gamma0_deg_guess_high
-				exitflag_us = 1.0
-		
-		# if product of flags is positive, overshootlimit is outside user specified bounds, 
-		# print warning message.
+		if method == 'newton':
+			underShootLimit, exitflag_us = self.findEFPALimitNewton(t_sec, dt, delta_deg, gamma0_deg_guess_low,
+															gamma0_deg_guess_high, gamma_deg_tol,
+															targetApopasisAltitude_km)
 		else:
-			print("Undershoot limit is outside user specified bounds.")
-			underShootLimit = 0.0
-			exitflag_us = 0.0
+			underShootLimit, exitflag_us = self.findCorridorLimit(self.computeApoapsisError, t_sec, dt, delta_deg,
+															gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+															targetApopasisAltitude_km, method)
 
-		self.gamma0_deg = temp_var
+		# if a limit could not be bracketed, print warning message.
+		if exitflag_us == 0.0:
+			print("Undershoot limit is outside user specified bounds.")
 
 		return underShootLimit, exitflag_us
 
 	def findUnderShootLimit2(self, t_sec, dt, gamma0_deg_guess_low,
-							gamma0_deg_guess_high,gamma_deg_tol, targetApopasisAltitude_km):
+							gamma0_deg_guess_high,gamma_deg_tol, targetApopasisAltitude_km, method='bisection'):
 		"""
 		Computes the undershoot limit entry flight-path angle
-		for aerocapture vehicle using bisection algorithm.
+		for aerocapture vehicle.
 		Includes effect of planet rotation on inertial speed.
 
 		This is steepest entry flight path angle for which a full lift up
@@ -3547,7 +4704,7 @@ class Vehicle:
 		with an accuracy of at least 6 decimal places to ensure the correct 
 		atmospheric trajectory is simulated. 
 
-		A bisection algorithm is used to compute the undershoot limit.
+		The limit is computed with findCorridorLimit().
 
 		
 		Parameters
@@ -3564,6 +4721,9 @@ class Vehicle:
 			desired accuracy for computation of the overshoot limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois' or 'bisection', see 
+			findCorridorLimit(), default='bisection'
 		
 		Returns
 		----------
@@ -3578,60 +4738,15 @@ class Vehicle:
 		within user specified bounds.
 		"""
 		
-		delta_deg = 0.0   # full lift up bank angle
+		delta_deg = 0.0 # full lift up bank angle
 
-		temp_var = self.gamma0_deg
+		underShootLimit, exitflag_us = self.findCorridorLimit(self.computeApoapsisError2, t_sec, dt, delta_deg,
+														gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+														targetApopasisAltitude_km, method)
 
-		# compute the apoapsis altitude flag for the lower bound 
-		# entry flight path angle and the upper bound entry flight path angle
-		self.gamma0_deg = gamma0_deg_guess_low
-		ans1 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-		self.gamma0_deg = gamma0_deg_guess_high
-		ans2 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)	
-		# if product of above flags is negative, then overshoot limit is 
-		# within user specified bounds, proceed to bisection.
-		if ans1*ans2 < 0:
-			# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds \
-			# target apoapsis altitude or is not captured.")
-			# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not \
-			# hit target apospasis but is captured.")
-			# print("Overshoot limit is within user specified bounds.
-			# Beginning bisection search...")
-			# print("")
-			# bisection algorithm begins here, while abs(ub-lb)>tol continue bisection
-			while abs(gamma0_deg_guess_high - gamma0_deg_guess_low) > gamma_deg_tol:
-				gamma0_deg_guess_mid = 0.5*(gamma0_deg_guess_low+gamma0_deg_guess_high)
-				self.gamma0_deg = gamma0_deg_guess_low
-				ans1 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_mid
-				ans2 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				self.gamma0_deg = gamma0_deg_guess_high
-				ans3 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				# reset upper / lower bounds as appropriate
-				if ans1*ans2 < 0:
-					# print('ans1*ans2<0')
-					gamma0_deg_guess_high = gamma0_deg_guess_mid
-				elif ans2*ans3 < 0:
-					# print('ans2*ans3<0')
-					gamma0_deg_guess_low  = gamma0_deg_guess_mid
-				# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. exceeds target apoapsis\
-				# altitude or is not captured.")
-				# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. does not hit target \
-				# apoapsis but is captured.")
-				# print("")
-				# set overShootLimit to upper bound
-				# set exitflag to 1.0
-				underShootLimit = gamma0_deg_guess_high
-				exitflag_us = 1.0
-		
-		# if product of flags is positive, overshootlimit is outside user specified bounds, 
-		# print warning message.
-		else:
+		# if a limit could not be bracketed, print warning message.
+		if exitflag_us == 0.0:
 			print("Undershoot limit is outside user specified bounds.")
-			underShootLimit    = 0.0
-			exitflag_us        = 0.0
-
-		self.gamma0_deg = temp_var
 
 		return underShootLimit, exitflag_us
 
@@ -3757,12 +4872,12 @@ class Vehicle:
 		self.betaRatio = betaRatio
 
 	def findEFPALimitD(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
-							targetApopasisAltitude_km):
+							targetApopasisAltitude_km, method='bisection'):
 		"""
 		This function computes the limiting EFPA for drag modulation
 		aerocapture. Does not include planetary rotation correction.
 
-		A bisection algorithm is used to compute the limit.
+		The limit is computed with findCorridorLimit().
 
 		Parameters
 		----------
@@ -3778,6 +4893,11 @@ class Vehicle:
 			desired accuracy for computation of the limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois', 'bisection' or 'newton'.
+			'illinois' and 'bisection' use findCorridorLimit(), 'newton'
+			uses the bracketed Newton iteration findEFPALimitNewton(),
+			default='bisection'
 		
 		Returns
 		----------
@@ -3799,57 +4919,18 @@ class Vehicle:
 
 		self.LD = 0.0
 
-		self.gamma0_deg = gamma0_deg_guess_low
-		ans1 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-		self.gamma0_deg = gamma0_deg_guess_high
-		ans2 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-		
-		# if product of above flags is negative, then overshoot limit is within user 
-		# specified bounds, proceed to bisection.
-		if ans1*ans2 < 0:
-			# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. does not meet target \
-			# apoapsis altitude.")
-			# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. exceeds target
-			# apoapsis altitude.")
-			# print("Undershoot limit is within user specified bounds. Beginning
-			# bisection search...")
-			# print("")
-			# bisection algorithm begins here, while abs(ub-lb)>tol continue bisection
-			while abs(gamma0_deg_guess_high - gamma0_deg_guess_low) > gamma_deg_tol:
-				gamma0_deg_guess_mid = 0.5*(gamma0_deg_guess_low+gamma0_deg_guess_high)
-
-				self.gamma0_deg = gamma0_deg_guess_low
-				ans1 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-				self.gamma0_deg = gamma0_deg_guess_mid
-				ans2 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-				
-				self.gamma0_deg = gamma0_deg_guess_high				
-				ans3 = self.hitsTargetApoapsis(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-				if ans1*ans2 < 0:
-					gamma0_deg_guess_high = gamma0_deg_guess_mid
-				elif ans2*ans3 < 0:
-					gamma0_deg_guess_low = gamma0_deg_guess_mid
-
-				# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. does not meet\
-				# target apoapsis altitude.")
-				# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. exceeds target\
-				# apoapsis altitude.")
-				# print("")
-
-				# set overShootLimit to lower bound
-				# set exitflag to 1.0
-				EFPALimit = gamma0_deg_guess_high
-				exitflag = 1.0
-
-		# if product of flags is positive, overshootlimit is outside user \
-		# specified bounds, print warning message.
+		if method == 'newton':
+			EFPALimit, exitflag = self.findEFPALimitNewton(t_sec, dt, delta_deg, gamma0_deg_guess_low,
+														   gamma0_deg_guess_high, gamma_deg_tol,
+														   targetApopasisAltitude_km)
 		else:
+			EFPALimit, exitflag = self.findCorridorLimit(self.computeApoapsisError, t_sec, dt, delta_deg,
+														 gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+														 targetApopasisAltitude_km, method)
+
+		# if a limit could not be bracketed, print warning message.
+		if exitflag == 0.0:
 			print("EFPA limit is outside user specified bounds.")
-			EFPALimit = 0.0
-			exitflag = 0.0
 
 		self.gamma0_deg = temp_var_1
 		self.LD = temp_var_2
@@ -3857,12 +4938,12 @@ class Vehicle:
 		return EFPALimit, exitflag
 
 	def findEFPALimitD2(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
-					   targetApopasisAltitude_km):
+					   targetApopasisAltitude_km, method='bisection'):
 		"""
 		This function computes the limiting EFPA for drag modulation
 		aerocapture. Includes planetary rotation correction. Includes planet rotation.
 
-		A bisection algorithm is used to compute the limit.
+		The limit is computed with findCorridorLimit().
 
 		Parameters
 		----------
@@ -3878,6 +4959,9 @@ class Vehicle:
 			desired accuracy for computation of the limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois' or 'bisection', see 
+			findCorridorLimit(), default='bisection'
 
 		Returns
 		----------
@@ -3899,57 +4983,13 @@ class Vehicle:
 
 		self.LD = 0.0
 
-		self.gamma0_deg = gamma0_deg_guess_low
-		ans1 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-		self.gamma0_deg = gamma0_deg_guess_high
-		ans2 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-		# if product of above flags is negative, then overshoot limit is within user
-		# specified bounds, proceed to bisection.
-		if ans1 * ans2 < 0:
-			# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. does not meet target \
-			# apoapsis altitude.")
-			# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. exceeds target
-			# apoapsis altitude.")
-			# print("Undershoot limit is within user specified bounds. Beginning
-			# bisection search...")
-			# print("")
-			# bisection algorithm begins here, while abs(ub-lb)>tol continue bisection
-			while abs(gamma0_deg_guess_high - gamma0_deg_guess_low) > gamma_deg_tol:
-				gamma0_deg_guess_mid = 0.5 * (gamma0_deg_guess_low + gamma0_deg_guess_high)
-
-				self.gamma0_deg = gamma0_deg_guess_low
-				ans1 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-				self.gamma0_deg = gamma0_deg_guess_mid
-				ans2 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-				self.gamma0_deg = gamma0_deg_guess_high
-				ans3 = self.hitsTargetApoapsis2(t_sec, dt, delta_deg, targetApopasisAltitude_km)
-
-				if ans1 * ans2 < 0:
-					gamma0_deg_guess_high = gamma0_deg_guess_mid
-				elif ans2 * ans3 < 0:
-					gamma0_deg_guess_low = gamma0_deg_guess_mid
-
-				# print("EFPA = "+str(gamma0_deg_guess_low)+ " deg. does not meet\
-				# target apoapsis altitude.")
-				# print("EFPA = "+str(gamma0_deg_guess_high)+" deg. exceeds target\
-				# apoapsis altitude.")
-				# print("")
-
-				# set overShootLimit to lower bound
-				# set exitflag to 1.0
-				EFPALimit = gamma0_deg_guess_high
-				exitflag = 1.0
-
-		# if product of flags is positive, overshootlimit is outside user \
-		# specified bounds, print warning message.
-		else:
+		EFPALimit, exitflag = self.findCorridorLimit(self.computeApoapsisError2, t_sec, dt, delta_deg,
+													 gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
+													 targetApopasisAltitude_km, method)
+
+		# if a limit could not be bracketed, print warning message.
+		if exitflag == 0.0:
 			print("EFPA limit is outside user specified bounds.")
-			EFPALimit = 0.0
-			exitflag = 0.0
 
 		self.gamma0_deg = temp_var_1
 		self.LD = temp_var_2
@@ -3957,7 +4997,7 @@ class Vehicle:
 		return EFPALimit, exitflag
 
 	def findUnderShootLimitD(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
-									targetApopasisAltitude_km):
+									targetApopasisAltitude_km, method='bisection'):
 		"""
 		This function computes the limiting undershoot 
 		EFPA for drag modulation aerocapture. Does not include planet rotation.
@@ -3976,6 +5016,9 @@ class Vehicle:
 			desired accuracy for computation of the limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois', 'bisection' or 'newton',
+			see findEFPALimitD(), default='bisection'
 		
 		Returns
 		----------
@@ -3996,12 +5039,12 @@ class Vehicle:
 		
 		underShootLimitD, exitflagD_us = self.findEFPALimitD(t_sec, dt, gamma0_deg_guess_low,
 															gamma0_deg_guess_high, gamma_deg_tol,
-															targetApopasisAltitude_km)
+															targetApopasisAltitude_km, method)
 
 		return underShootLimitD, exitflagD_us
 
 	def findUnderShootLimitD2(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
-							 targetApopasisAltitude_km):
+							 targetApopasisAltitude_km, method='bisection'):
 		"""
 		This function computes the limiting undershoot
 		EFPA for drag modulation aerocapture. Includes planet rotation.
@@ -4020,6 +5063,9 @@ class Vehicle:
 			desired accuracy for computation of the limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois' or 'bisection', see 
+			findEFPALimitD2(), default='bisection'
 
 		Returns
 		----------
@@ -4040,12 +5086,12 @@ class Vehicle:
 
 		underShootLimitD, exitflagD_us = self.findEFPALimitD2(t_sec, dt, gamma0_deg_guess_low,
 															 gamma0_deg_guess_high, gamma_deg_tol,
-															 targetApopasisAltitude_km)
+															 targetApopasisAltitude_km, method)
 
 		return underShootLimitD, exitflagD_us
 
 	def findOverShootLimitD(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
-								targetApopasisAltitude_km):
+								targetApopasisAltitude_km, method='bisection'):
 		"""
 		This function computes the limiting overshoot 
 		EFPA for drag modulation aerocapture. Does not include planet rotation.
@@ -4064,6 +5110,9 @@ class Vehicle:
 			desired accuracy for computation of the limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois', 'bisection' or 'newton',
+			see findEFPALimitD(), default='bisection'
 		
 		Returns
 		----------
@@ -4082,13 +5131,13 @@ class Vehicle:
 		self.CD = self.mass / (self.beta*self.A)
 		
 		overShootLimitD,exitflagD_os = self.findEFPALimitD(t_sec,dt,gamma0_deg_guess_low,
-										gamma0_deg_guess_high,gamma_deg_tol, targetApopasisAltitude_km)
+										gamma0_deg_guess_high,gamma_deg_tol, targetApopasisAltitude_km, method)
 		# print('overShootLimit: '+str(overShootLimitD))
 		
 		return overShootLimitD, exitflagD_os
 
 	def findOverShootLimitD2(self, t_sec, dt, gamma0_deg_guess_low, gamma0_deg_guess_high, gamma_deg_tol,
-							targetApopasisAltitude_km):
+							targetApopasisAltitude_km, method='bisection'):
 		"""
 		This function computes the limiting overshoot
 		EFPA for drag modulation aerocapture. Includes planet rotation.
@@ -4107,6 +5156,9 @@ class Vehicle:
 			desired accuracy for computation of the limit, deg
 		targetApopasisAltitude_km : float
 			target apoapsis altitude , km
+		method : str, optional
+			root finding method, 'illinois' or 'bisection', see 
+			findEFPALimitD2(), default='bisection'
 
 		Returns
 		----------
@@ -4126,7 +5178,7 @@ class Vehicle:
 
 		overShootLimitD, exitflagD_os = self.findEFPALimitD2(t_sec, dt, gamma0_deg_guess_low,
 															gamma0_deg_guess_high, gamma_deg_tol,
-															targetApopasisAltitude_km)
+															targetApopasisAltitude_km, method)
 		# print('overShootLimit: '+str(overShootLimitD))
 
 		return overShootLimitD, exitflagD_os
@@ -4573,6 +5625,74 @@ class Vehicle:
 
 		return DeltaCMD_deg, Delta_deg_ini
 
+	def predictTerminalApoapsisAltitudeKm(self, h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg,
+										  drange0_km, t_sec, delta_deg, density_mes_int, method, jettison=False):
+		"""
+		Terminal state only apoapsis predictor used by the 
+		predictApoapsisAltitudeKm_* functions when 
+		self.terminalPredictor is True. Propogates the vehicle state 
+		using the measured density only until the atmospheric exit 
+		event, without evaluating the trajectory on an output grid or 
+		computing the loads and heating. The number of RHS evaluations
+		is added to self.predictorNfev.
+
+		Parameters
+		----------
+		h0_km : float
+			current vehicle altitude, km
+		theta0_deg : float
+			current vehicle longitude, deg
+		phi0_deg : float
+			current vehicle latitude, deg
+		v0_kms : float
+			current vehicle speed, km/s
+		gamma0_deg : float
+			current FPA, deg
+		psi0_deg : float
+			current heading angle, deg
+		drange0_km : float
+			current downrange, km
+		t_sec : float
+			max. propogation time, seconds
+		delta_deg : float
+			commanded bank angle, deg
+		density_mes_int : scipy.interpolate.interpolate.interp1d
+			measured density interpolation function
+		method : str
+			solve_ivp integration method
+		jettison : bool, optional
+			if True, propogate with the drag skirt jettisoned 
+			(ballistic coeff. beta1*betaRatio), default=False
+
+		Returns
+		----------
+		terminal_apoapsis_km : float
+			apoapsis altitude at the terminal state, km
+		"""
+
+		vehicleCopy = self.dummyVehicle(density_mes_int)
+
+		if jettison is True:
+			vehicleCopy.beta = self.beta1*self.betaRatio
+			vehicleCopy.CD = self.mass/(vehicleCopy.beta*self.A)
+
+		r0 = vehicleCopy.planetObj.computeR(h0_km*1.0E3)
+
+		rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0 = \
+			vehicleCopy.planetObj.nonDimState(r0, theta0_deg*np.pi/180.0, phi0_deg*np.pi/180.0, v0_kms*1.000E3,
+											  psi0_deg*np.pi/180.0, gamma0_deg*np.pi/180.0, drange0_km*1E3)
+
+		(rbar, theta, phi, vbar, psi, gamma, drangebar), _ = \
+			vehicleCopy.solveTerminalState(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, t_sec,
+										   delta_deg*np.pi/180.0, method)
+
+		self.predictorNfev += vehicleCopy.nfev
+
+		terminal_apoapsis_km = self.compute_ApoapsisAltitudeKm(rbar*self.planetObj.RP, vbar*self.planetObj.Vref,
+															   gamma, theta, phi, psi)
+
+		return terminal_apoapsis_km
+
 	def predictApoapsisAltitudeKm_withLiftUp(self, h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg,
 											 drange0_km, heatLoad0, t_sec, dt, delta_deg, density_mes_int):
 		"""
@@ -4608,6 +5728,10 @@ class Vehicle:
 
 		"""
 
+		if self.terminalPredictor is True:
+			return self.predictTerminalApoapsisAltitudeKm(h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg,
+														  drange0_km, t_sec, delta_deg, density_mes_int, 'LSODA')
+
 		t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, gamma_degc, drange_kmc, exitflag, acc_net_g,\
 		dyn_pres_atm, stag_pres_atm, q_stag_total, heatload, acc_drag_g = \
 	    self.propogateEntry_util(h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg, drange0_km,
@@ -4655,6 +5779,10 @@ class Vehicle:
 
 		"""
 
+		if self.terminalPredictor is True:
+			return self.predictTerminalApoapsisAltitudeKm(h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg,
+														  drange0_km, t_sec, delta_deg, density_mes_int, self.method)
+
 		t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, gamma_degc, \
 		drange_kmc, exitflag, acc_net_g, dyn_pres_atm, stag_pres_atm, q_stag_total, \
 		heatload, acc_drag_g = \
@@ -4803,6 +5931,14 @@ class Vehicle:
 			max. time for propogation, seconds
 
 		"""
+
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
+		# RHS evaluations of the apoapsis predictor in this run
+		self.predictorNfev = 0
 		
 		counter = 0
 
@@ -4811,34 +5947,35 @@ class Vehicle:
 
 		h_skip_km = self.planetObj.h_skip / 1000.0
 
-		self.t_step_array = np.array([0.0])
-		self.delta_deg_array = np.array([0.0])
-		self.hdot_array = np.array([0.0])
-		self.hddot_array = np.array([0.0])
-		self.qref_array = np.array([0.0])
-		self.q_array = np.array([0.0])
-		self.h_step_array = np.array([0.0])
-		self.acc_step_array = np.array([0.0])
-		self.acc_drag_array = np.array([0.0])
-		self.density_mes_array = np.array([0.0])
+		self.t_step_array = steps.append('t_step_array', 0.0)
+		self.delta_deg_array = steps.append('delta_deg_array', 0.0)
+		self.hdot_array = steps.append('hdot_array', 0.0)
+		self.hddot_array = steps.append('hddot_array', 0.0)
+		self.qref_array = steps.append('qref_array', 0.0)
+		self.q_array = steps.append('q_array', 0.0)
+		self.h_step_array = steps.append('h_step_array', 0.0)
+		self.acc_step_array = steps.append('acc_step_array', 0.0)
+		self.acc_drag_array = steps.append('acc_drag_array', 0.0)
+		self.density_mes_array = steps.append('density_mes_array', 0.0)
+		self.hdotref_array = steps.append('hdotref_array', 0.0)
 
 		self.propogateEntry(1.0, dt, 0.0)
 
-		t_min = self.t_minc
-		h_km = self.h_kmc
-		v_kms = self.v_kmsc
-		phi_deg = self.phi_degc
-		psi_deg = self.psi_degc
-		theta_deg = self.theta_degc
-		gamma_deg = self.gamma_degc
-		drange_km = self.drange_kmc
-
-		acc_net_g = self.acc_net_g
-		dyn_pres_atm = self.dyn_pres_atm
-		stag_pres_atm = self.stag_pres_atm
-		q_stag_total = self.q_stag_total
-		heatload = self.heatload
-		acc_drag_g = self.acc_drag_g
+		t_min = log.append('t_min', self.t_minc)
+		h_km = log.append('h_km', self.h_kmc)
+		v_kms = log.append('v_kms', self.v_kmsc)
+		phi_deg = log.append('phi_deg', self.phi_degc)
+		psi_deg = log.append('psi_deg', self.psi_degc)
+		theta_deg = log.append('theta_deg', self.theta_degc)
+		gamma_deg = log.append('gamma_deg', self.gamma_degc)
+		drange_km = log.append('drange_km', self.drange_kmc)
+
+		acc_net_g = log.append('acc_net_g', self.acc_net_g)
+		dyn_pres_atm = log.append('dyn_pres_atm', self.dyn_pres_atm)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm)
+		q_stag_total = log.append('q_stag_total', self.q_stag_total)
+		heatload = log.append('heatload', self.heatload)
+		acc_drag_g = log.append('acc_drag_g', self.acc_drag_g)
 
 		# Set the current vehicle speed here.
 		self.h_current_km = h_km[-1]
@@ -4935,40 +6072,40 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time 
 			t_min_c = t_min_c + t_min[-1]
 
-			self.t_step_array = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array = np.append(self.hdot_array, hdoti)
-			self.qref_array = np.append(self.qref_array, qrefi)
-			self.q_array = np.append(self.q_array, qi)
-			self.h_step_array = np.append(self.h_step_array, h0_km)
+			self.t_step_array = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array = steps.append('hdot_array', hdoti)
+			self.qref_array = steps.append('qref_array', qrefi)
+			self.q_array = steps.append('q_array', qi)
+			self.h_step_array = steps.append('h_step_array', h0_km)
 
-			self.hdotref_array = np.zeros(len(self.t_step_array))
+			self.hdotref_array = steps.append('hdotref_array', 0.0)
 			self.hddoti = (self.hdot_array[-1] - self.hdot_array[-2]) / (self.t_step_array[-1]*60.0 - self.t_step_array[-2]*60.0)
-			self.hddot_array = np.append(self.hddot_array, self.hddoti)
-			self.acc_step_array = np.append(self.acc_step_array, self.acc_net_g[-1])
-			self.acc_drag_array = np.append(self.acc_drag_array, self.acc_drag_g[-1])
+			self.hddot_array = steps.append('hddot_array', self.hddoti)
+			self.acc_step_array = steps.append('acc_step_array', self.acc_net_g[-1])
+			self.acc_drag_array = steps.append('acc_drag_array', self.acc_drag_g[-1])
 
 			# Update time and other solution vectors
-			t_min = np.concatenate((t_min, t_min_c), axis=0)
-			h_km = np.concatenate((h_km , h_km_c ), axis=0)
-			v_kms = np.concatenate((v_kms, v_kms_c ), axis=0)
-			phi_deg = np.concatenate((phi_deg, phi_deg_c ), axis=0)
-			psi_deg = np.concatenate((psi_deg, psi_deg_c ), axis=0)
-			theta_deg = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min = log.append('t_min', t_min_c)
+			h_km = log.append('h_km', h_km_c)
+			v_kms = log.append('v_kms', v_kms_c)
+			phi_deg = log.append('phi_deg', phi_deg_c)
+			psi_deg = log.append('psi_deg', psi_deg_c)
+			theta_deg = log.append('theta_deg', theta_deg_c)
+			gamma_deg = log.append('gamma_deg', gamma_deg_c)
+			drange_km = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g = np.concatenate((acc_net_g,acc_net_g_c), axis=0)
-			acc_drag_g = np.concatenate((acc_drag_g,acc_drag_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c),axis=0)
-			stag_pres_atm = np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload = np.concatenate((heatload, heatload_c), axis=0)
-
-			self.acc_step_array = np.append(self.acc_step_array, acc_net_g[-1])
+			acc_net_g = log.append('acc_net_g', acc_net_g_c)
+			acc_drag_g = log.append('acc_drag_g', acc_drag_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm = log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload = log.append('heatload', heatload_c)
+
+			self.acc_step_array = steps.append('acc_step_array', acc_net_g[-1])
 			density_mes = 2*self.mass*acc_drag_g[-1]*self.planetObj.EARTHG / (self.CD*self.A*(0.5*(vi+v_kms[-1]*1E3))**2.0)
-			self.density_mes_array = np.append(self.density_mes_array, density_mes)
+			self.density_mes_array = steps.append('density_mes_array', density_mes)
 
 			if hdoti > self.hdot_threshold and customFlag == 0:
 				self.density_mes_int, self.minAlt = self.createDensityMeasuredFunction(self.h_step_array,
@@ -5004,20 +6141,32 @@ class Vehicle:
 				break
 
 		
-		self.t_min_eg = t_min
-		self.h_km_eg = h_km
-		self.v_kms_eg = v_kms
-		self.theta_deg_eg = theta_deg	
-		self.phi_deg_eg = phi_deg
-		self.psi_deg_eg = psi_deg
-		self.gamma_deg_eg = gamma_deg
-		self.drange_km_eg = drange_km
-		
-		self.acc_net_g_eg = acc_net_g
-		self.dyn_pres_atm_eg = dyn_pres_atm
-		self.stag_pres_atm_eg = stag_pres_atm
-		self.q_stag_total_eg = q_stag_total
-		self.heatload_eg = heatload
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hddot_array = steps.finalize('hddot_array')
+		self.qref_array = steps.finalize('qref_array')
+		self.q_array = steps.finalize('q_array')
+		self.h_step_array = steps.finalize('h_step_array')
+		self.acc_step_array = steps.finalize('acc_step_array')
+		self.acc_drag_array = steps.finalize('acc_drag_array')
+		self.density_mes_array = steps.finalize('density_mes_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+
+		self.t_min_eg = log.finalize('t_min')
+		self.h_km_eg = log.finalize('h_km')
+		self.v_kms_eg = log.finalize('v_kms')
+		self.theta_deg_eg = log.finalize('theta_deg')
+		self.phi_deg_eg = log.finalize('phi_deg')
+		self.psi_deg_eg = log.finalize('psi_deg')
+		self.gamma_deg_eg = log.finalize('gamma_deg')
+		self.drange_km_eg = log.finalize('drange_km')
+		
+		self.acc_net_g_eg = log.finalize('acc_net_g')
+		self.dyn_pres_atm_eg = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_eg = log.finalize('stag_pres_atm')
+		self.q_stag_total_eg = log.finalize('q_stag_total')
+		self.heatload_eg = log.finalize('heatload')
 
 	def propogateEquilibriumGlide2(self, timeStep, dt, maxTimeSecs):
 		"""
@@ -5034,6 +6183,14 @@ class Vehicle:
 
 		"""
 
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
+		# RHS evaluations of the apoapsis predictor in this run
+		self.predictorNfev = 0
+
 		counter = 0
 
 		# -------------------------------------------
@@ -5041,34 +6198,35 @@ class Vehicle:
 
 		h_skip_km = self.planetObj.h_skip / 1000.0
 
-		self.t_step_array = np.array([0.0])
-		self.delta_deg_array = np.array([0.0])
-		self.hdot_array = np.array([0.0])
-		self.hddot_array = np.array([0.0])
-		self.qref_array = np.array([0.0])
-		self.q_array = np.array([0.0])
-		self.h_step_array = np.array([0.0])
-		self.acc_step_array = np.array([0.0])
-		self.acc_drag_array = np.array([0.0])
-		self.density_mes_array = np.array([0.0])
+		self.t_step_array = steps.append('t_step_array', 0.0)
+		self.delta_deg_array = steps.append('delta_deg_array', 0.0)
+		self.hdot_array = steps.append('hdot_array', 0.0)
+		self.hddot_array = steps.append('hddot_array', 0.0)
+		self.qref_array = steps.append('qref_array', 0.0)
+		self.q_array = steps.append('q_array', 0.0)
+		self.h_step_array = steps.append('h_step_array', 0.0)
+		self.acc_step_array = steps.append('acc_step_array', 0.0)
+		self.acc_drag_array = steps.append('acc_drag_array', 0.0)
+		self.density_mes_array = steps.append('density_mes_array', 0.0)
+		self.hdotref_array = steps.append('hdotref_array', 0.0)
 
 		self.propogateEntry2(1.0, dt, 0.0)
 
-		t_min = self.t_minc
-		h_km = self.h_kmc
-		v_kms = self.v_kmsc
-		phi_deg = self.phi_degc
-		psi_deg = self.psi_degc
-		theta_deg = self.theta_degc
-		gamma_deg = self.gamma_degc
-		drange_km = self.drange_kmc
-
-		acc_net_g = self.acc_net_g
-		dyn_pres_atm = self.dyn_pres_atm
-		stag_pres_atm = self.stag_pres_atm
-		q_stag_total = self.q_stag_total
-		heatload = self.heatload
-		acc_drag_g = self.acc_drag_g
+		t_min = log.append('t_min', self.t_minc)
+		h_km = log.append('h_km', self.h_kmc)
+		v_kms = log.append('v_kms', self.v_kmsc)
+		phi_deg = log.append('phi_deg', self.phi_degc)
+		psi_deg = log.append('psi_deg', self.psi_degc)
+		theta_deg = log.append('theta_deg', self.theta_degc)
+		gamma_deg = log.append('gamma_deg', self.gamma_degc)
+		drange_km = log.append('drange_km', self.drange_kmc)
+
+		acc_net_g = log.append('acc_net_g', self.acc_net_g)
+		dyn_pres_atm = log.append('dyn_pres_atm', self.dyn_pres_atm)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm)
+		q_stag_total = log.append('q_stag_total', self.q_stag_total)
+		heatload = log.append('heatload', self.heatload)
+		acc_drag_g = log.append('acc_drag_g', self.acc_drag_g)
 
 		# Set the current vehicle speed here.
 		self.h_current_km = h_km[-1]
@@ -5144,7 +6302,8 @@ class Vehicle:
 			# propogate the vehicle state to 1 second in advance from
 			# the current state using the commanded bank angle deltaCMD
 			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg, drange0_km, Ji)
-			self.propogateEntry2(timeStep, dt, DeltaCMD_deg)
+			# the solver starts with the step size of the previous cycle
+			self.propogateEntry2(timeStep, dt, DeltaCMD_deg, self.largestStep)
 
 			t_min_c = self.t_minc
 			h_km_c = self.h_kmc
@@ -5165,40 +6324,40 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time
 			t_min_c = t_min_c + t_min[-1]
 
-			self.t_step_array = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array = np.append(self.hdot_array, hdoti)
-			self.qref_array = np.append(self.qref_array, qrefi)
-			self.q_array = np.append(self.q_array, qi)
-			self.h_step_array = np.append(self.h_step_array, h0_km)
+			self.t_step_array = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array = steps.append('hdot_array', hdoti)
+			self.qref_array = steps.append('qref_array', qrefi)
+			self.q_array = steps.append('q_array', qi)
+			self.h_step_array = steps.append('h_step_array', h0_km)
 
-			self.hdotref_array = np.zeros(len(self.t_step_array))
+			self.hdotref_array = steps.append('hdotref_array', 0.0)
 			self.hddoti = (self.hdot_array[-1] - self.hdot_array[-2]) / (self.t_step_array[-1] * 60.0 - self.t_step_array[-2] * 60.0)
-			self.hddot_array = np.append(self.hddot_array, self.hddoti)
-			self.acc_step_array = np.append(self.acc_step_array, self.acc_net_g[-1])
-			self.acc_drag_array = np.append(self.acc_drag_array, self.acc_drag_g[-1])
+			self.hddot_array = steps.append('hddot_array', self.hddoti)
+			self.acc_step_array = steps.append('acc_step_array', self.acc_net_g[-1])
+			self.acc_drag_array = steps.append('acc_drag_array', self.acc_drag_g[-1])
 
 			# Update time and other solution vectors
-			t_min = np.concatenate((t_min, t_min_c), axis=0)
-			h_km = np.concatenate((h_km, h_km_c), axis=0)
-			v_kms = np.concatenate((v_kms, v_kms_c), axis=0)
-			phi_deg = np.concatenate((phi_deg, phi_deg_c), axis=0)
-			psi_deg = np.concatenate((psi_deg, psi_deg_c), axis=0)
-			theta_deg = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min = log.append('t_min', t_min_c)
+			h_km = log.append('h_km', h_km_c)
+			v_kms = log.append('v_kms', v_kms_c)
+			phi_deg = log.append('phi_deg', phi_deg_c)
+			psi_deg = log.append('psi_deg', psi_deg_c)
+			theta_deg = log.append('theta_deg', theta_deg_c)
+			gamma_deg = log.append('gamma_deg', gamma_deg_c)
+			drange_km = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g = np.concatenate((acc_net_g, acc_net_g_c), axis=0)
-			acc_drag_g = np.concatenate((acc_drag_g, acc_drag_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c), axis=0)
-			stag_pres_atm = np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload = np.concatenate((heatload, heatload_c), axis=0)
-
-			self.acc_step_array = np.append(self.acc_step_array, acc_net_g[-1])
+			acc_net_g = log.append('acc_net_g', acc_net_g_c)
+			acc_drag_g = log.append('acc_drag_g', acc_drag_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm = log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload = log.append('heatload', heatload_c)
+
+			self.acc_step_array = steps.append('acc_step_array', acc_net_g[-1])
 			density_mes = 2 * self.mass * acc_drag_g[-1] * self.planetObj.EARTHG / (self.CD * self.A * (0.5 * (vi + v_kms[-1] * 1E3)) ** 2.0)
-			self.density_mes_array = np.append(self.density_mes_array, density_mes)
+			self.density_mes_array = steps.append('density_mes_array', density_mes)
 
 			if hdoti > self.hdot_threshold and customFlag == 0:
 				self.density_mes_int, self.minAlt = \
@@ -5237,20 +6396,32 @@ class Vehicle:
 			if h_current_km > self.planetObj.h_skip / 1000 - 2.0:
 				break
 
-		self.t_min_eg = t_min
-		self.h_km_eg = h_km
-		self.v_kms_eg = v_kms
-		self.theta_deg_eg = theta_deg
-		self.phi_deg_eg = phi_deg
-		self.psi_deg_eg = psi_deg
-		self.gamma_deg_eg = gamma_deg
-		self.drange_km_eg = drange_km
-
-		self.acc_net_g_eg = acc_net_g
-		self.dyn_pres_atm_eg = dyn_pres_atm
-		self.stag_pres_atm_eg = stag_pres_atm
-		self.q_stag_total_eg = q_stag_total
-		self.heatload_eg = heatload
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hddot_array = steps.finalize('hddot_array')
+		self.qref_array = steps.finalize('qref_array')
+		self.q_array = steps.finalize('q_array')
+		self.h_step_array = steps.finalize('h_step_array')
+		self.acc_step_array = steps.finalize('acc_step_array')
+		self.acc_drag_array = steps.finalize('acc_drag_array')
+		self.density_mes_array = steps.finalize('density_mes_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+
+		self.t_min_eg = log.finalize('t_min')
+		self.h_km_eg = log.finalize('h_km')
+		self.v_kms_eg = log.finalize('v_kms')
+		self.theta_deg_eg = log.finalize('theta_deg')
+		self.phi_deg_eg = log.finalize('phi_deg')
+		self.psi_deg_eg = log.finalize('psi_deg')
+		self.gamma_deg_eg = log.finalize('gamma_deg')
+		self.drange_km_eg = log.finalize('drange_km')
+
+		self.acc_net_g_eg = log.finalize('acc_net_g')
+		self.dyn_pres_atm_eg = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_eg = log.finalize('stag_pres_atm')
+		self.q_stag_total_eg = log.finalize('q_stag_total')
+		self.heatload_eg = log.finalize('heatload')
 
 	def propogateExitPhase(self, timeStep, dt, maxTimeSecs):
 		"""
@@ -5266,26 +6437,32 @@ class Vehicle:
 			max. time for propogation, seconds
 
 		"""
+
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
 		self.t_switch = self.t_min_eg[-1]
 		self.h_switch = self.h_km_eg[-1]
 		self.v_switch = self.v_kms_eg[-1]
 		self.p_switch = self.delta_deg_array[-1]
 
 		
-		t_min = self.t_min_eg
-		h_km = self.h_km_eg
-		v_kms = self.v_kms_eg
-		theta_deg = self.theta_deg_eg
-		phi_deg = self.phi_deg_eg
-		psi_deg = self.psi_deg_eg
-		gamma_deg = self.gamma_deg_eg
-		drange_km = self.drange_km_eg
-
-		acc_net_g = self.acc_net_g_eg
-		dyn_pres_atm = self.dyn_pres_atm_eg
-		stag_pres_atm = self.stag_pres_atm_eg
-		q_stag_total = self.q_stag_total_eg
-		heatload = self.heatload_eg
+		t_min = log.append('t_min', self.t_min_eg)
+		h_km = log.append('h_km', self.h_km_eg)
+		v_kms = log.append('v_kms', self.v_kms_eg)
+		theta_deg = log.append('theta_deg', self.theta_deg_eg)
+		phi_deg = log.append('phi_deg', self.phi_deg_eg)
+		psi_deg = log.append('psi_deg', self.psi_deg_eg)
+		gamma_deg = log.append('gamma_deg', self.gamma_deg_eg)
+		drange_km = log.append('drange_km', self.drange_km_eg)
+
+		acc_net_g = log.append('acc_net_g', self.acc_net_g_eg)
+		dyn_pres_atm = log.append('dyn_pres_atm', self.dyn_pres_atm_eg)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm_eg)
+		q_stag_total = log.append('q_stag_total', self.q_stag_total_eg)
+		heatload = log.append('heatload', self.heatload_eg)
 	
 		# Set the current altitude to the terminal altitude of
 		# the equlibrium glide phase (km).
@@ -5303,6 +6480,12 @@ class Vehicle:
 
 		Delta_deg_ini = self.p_switch
 		
+		self.t_step_array = steps.append('t_step_array', self.t_step_array)
+		self.delta_deg_array = steps.append('delta_deg_array', self.delta_deg_array)
+		self.hdot_array = steps.append('hdot_array', self.hdot_array)
+		self.hdotref_array = steps.append('hdotref_array', self.hdotref_array)
+		self.hddot_array = steps.append('hddot_array', self.hddot_array)
+
 		while h_current_km < h_skip_km:
 			# print(minAlt)
 			# Reset the initial conditions to the terminal conditions of 
@@ -5367,32 +6550,32 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time 
 			t_min_c = t_min_c + t_min[-1]
 
-			self.t_step_array = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array = np.append(self.hdot_array, hdoti)
-			self.hdotref_array = np.append(self.hdotref_array, hdot_refi)
+			self.t_step_array = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array = steps.append('hdot_array', hdoti)
+			self.hdotref_array = steps.append('hdotref_array', hdot_refi)
 
 			self.hddoti = (self.hdot_array[-1] - self.hdot_array[-2]) / \
 									   (self.t_step_array[-1]*60.0 - self.t_step_array[-2]*60.0)
 
-			self.hddot_array = np.append(self.hddot_array, self.hddoti)
+			self.hddot_array = steps.append('hddot_array', self.hddoti)
 
 			# Update time and other solution vectors
-			t_min = np.concatenate((t_min, t_min_c), axis=0)
-			h_km = np.concatenate((h_km , h_km_c ), axis=0)
-			v_kms = np.concatenate((v_kms, v_kms_c ), axis=0)
-			phi_deg = np.concatenate((phi_deg, phi_deg_c ), axis=0)
-			psi_deg = np.concatenate((psi_deg, psi_deg_c ), axis=0)
-			theta_deg = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min = log.append('t_min', t_min_c)
+			h_km = log.append('h_km', h_km_c)
+			v_kms = log.append('v_kms', v_kms_c)
+			phi_deg = log.append('phi_deg', phi_deg_c)
+			psi_deg = log.append('psi_deg', psi_deg_c)
+			theta_deg = log.append('theta_deg', theta_deg_c)
+			gamma_deg = log.append('gamma_deg', gamma_deg_c)
+			drange_km = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g = np.concatenate((acc_net_g,acc_net_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c),axis=0)
-			stag_pres_atm = np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload = np.concatenate((heatload, heatload_c), axis=0)
+			acc_net_g = log.append('acc_net_g', acc_net_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm = log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload = log.append('heatload', heatload_c)
 
 			terminal_apoapsis_km = self.compute_ApoapsisAltitudeKm(
 								   self.planetObj.RP+h_km[-1]*1E3, v_kms[-1]*1E3,
@@ -5408,20 +6591,26 @@ class Vehicle:
 			h_current_km  = h_km[-1]
 			t_current_min = t_min[-1]
 
-		self.t_min_full = t_min
-		self.h_km_full = h_km
-		self.v_kms_full = v_kms
-		self.theta_deg_full = theta_deg	
-		self.phi_deg_full = phi_deg
-		self.psi_deg_full = psi_deg
-		self.gamma_deg_full = gamma_deg
-		self.drange_km_full = drange_km
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+		self.hddot_array = steps.finalize('hddot_array')
+
+		self.t_min_full = log.finalize('t_min')
+		self.h_km_full = log.finalize('h_km')
+		self.v_kms_full = log.finalize('v_kms')
+		self.theta_deg_full = log.finalize('theta_deg')
+		self.phi_deg_full = log.finalize('phi_deg')
+		self.psi_deg_full = log.finalize('psi_deg')
+		self.gamma_deg_full = log.finalize('gamma_deg')
+		self.drange_km_full = log.finalize('drange_km')
 		
-		self.acc_net_g_full = acc_net_g
-		self.dyn_pres_atm_full = dyn_pres_atm
-		self.stag_pres_atm_full = stag_pres_atm
-		self.q_stag_total_full = q_stag_total
-		self.heatload_full = heatload
+		self.acc_net_g_full = log.finalize('acc_net_g')
+		self.dyn_pres_atm_full = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_full = log.finalize('stag_pres_atm')
+		self.q_stag_total_full = log.finalize('q_stag_total')
+		self.heatload_full = log.finalize('heatload')
 
 
 		self.terminal_apoapsis  = self.compute_ApoapsisAltitudeKm(
@@ -5456,25 +6645,31 @@ class Vehicle:
 			max. time for propogation, seconds
 
 		"""
+
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
 		self.t_switch = self.t_min_eg[-1]
 		self.h_switch = self.h_km_eg[-1]
 		self.v_switch = self.v_kms_eg[-1]
 		self.p_switch = self.delta_deg_array[-1]
 
-		t_min = self.t_min_eg
-		h_km = self.h_km_eg
-		v_kms = self.v_kms_eg
-		theta_deg = self.theta_deg_eg
-		phi_deg = self.phi_deg_eg
-		psi_deg = self.psi_deg_eg
-		gamma_deg = self.gamma_deg_eg
-		drange_km = self.drange_km_eg
-
-		acc_net_g = self.acc_net_g_eg
-		dyn_pres_atm = self.dyn_pres_atm_eg
-		stag_pres_atm = self.stag_pres_atm_eg
-		q_stag_total = self.q_stag_total_eg
-		heatload = self.heatload_eg
+		t_min = log.append('t_min', self.t_min_eg)
+		h_km = log.append('h_km', self.h_km_eg)
+		v_kms = log.append('v_kms', self.v_kms_eg)
+		theta_deg = log.append('theta_deg', self.theta_deg_eg)
+		phi_deg = log.append('phi_deg', self.phi_deg_eg)
+		psi_deg = log.append('psi_deg', self.psi_deg_eg)
+		gamma_deg = log.append('gamma_deg', self.gamma_deg_eg)
+		drange_km = log.append('drange_km', self.drange_km_eg)
+
+		acc_net_g = log.append('acc_net_g', self.acc_net_g_eg)
+		dyn_pres_atm = log.append('dyn_pres_atm', self.dyn_pres_atm_eg)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm_eg)
+		q_stag_total = log.append('q_stag_total', self.q_stag_total_eg)
+		heatload = log.append('heatload', self.heatload_eg)
 
 		# Set the current altitude to the terminal altitude of
 		# the equlibrium glide phase (km).
@@ -5492,6 +6687,12 @@ class Vehicle:
 
 		Delta_deg_ini = self.p_switch
 
+		self.t_step_array = steps.append('t_step_array', self.t_step_array)
+		self.delta_deg_array = steps.append('delta_deg_array', self.delta_deg_array)
+		self.hdot_array = steps.append('hdot_array', self.hdot_array)
+		self.hdotref_array = steps.append('hdotref_array', self.hdotref_array)
+		self.hddot_array = steps.append('hddot_array', self.hddot_array)
+
 		while h_current_km < h_skip_km:
 			# print(minAlt)
 			# Reset the initial conditions to the terminal conditions of
@@ -5536,7 +6737,8 @@ class Vehicle:
 			# propogate the vehicle state to advance from the current
 			# state using the commanded bank angle deltaCMD
 			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg, drange0_km, Ji)
-			self.propogateEntry2(timeStep, dt, DeltaCMD_deg)
+			# the solver starts with the step size of the previous cycle
+			self.propogateEntry2(timeStep, dt, DeltaCMD_deg, self.largestStep)
 
 			t_min_c = self.t_minc
 			h_km_c = self.h_kmc
@@ -5557,32 +6759,32 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time
 			t_min_c = t_min_c + t_min[-1]
 
-			self.t_step_array = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array = np.append(self.hdot_array, hdoti)
-			self.hdotref_array = np.append(self.hdotref_array, hdot_refi)
+			self.t_step_array = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array = steps.append('hdot_array', hdoti)
+			self.hdotref_array = steps.append('hdotref_array', hdot_refi)
 
 			self.hddoti = (self.hdot_array[-1] - self.hdot_array[-2]) / \
 						  (self.t_step_array[-1] * 60.0 - self.t_step_array[-2] * 60.0)
 
-			self.hddot_array = np.append(self.hddot_array, self.hddoti)
+			self.hddot_array = steps.append('hddot_array', self.hddoti)
 
 			# Update time and other solution vectors
-			t_min = np.concatenate((t_min, t_min_c), axis=0)
-			h_km = np.concatenate((h_km, h_km_c), axis=0)
-			v_kms = np.concatenate((v_kms, v_kms_c), axis=0)
-			phi_deg = np.concatenate((phi_deg, phi_deg_c), axis=0)
-			psi_deg = np.concatenate((psi_deg, psi_deg_c), axis=0)
-			theta_deg = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min = log.append('t_min', t_min_c)
+			h_km = log.append('h_km', h_km_c)
+			v_kms = log.append('v_kms', v_kms_c)
+			phi_deg = log.append('phi_deg', phi_deg_c)
+			psi_deg = log.append('psi_deg', psi_deg_c)
+			theta_deg = log.append('theta_deg', theta_deg_c)
+			gamma_deg = log.append('gamma_deg', gamma_deg_c)
+			drange_km = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g = np.concatenate((acc_net_g, acc_net_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c), axis=0)
-			stag_pres_atm = np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload = np.concatenate((heatload, heatload_c), axis=0)
+			acc_net_g = log.append('acc_net_g', acc_net_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm = log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload = log.append('heatload', heatload_c)
 
 			terminal_apoapsis_km = self.compute_ApoapsisAltitudeKm(
 				self.planetObj.RP + h_km[-1] * 1E3, v_kms[-1] * 1E3,
@@ -5597,20 +6799,26 @@ class Vehicle:
 			h_current_km = h_km[-1]
 			t_current_min = t_min[-1]
 
-		self.t_min_full = t_min
-		self.h_km_full = h_km
-		self.v_kms_full = v_kms
-		self.theta_deg_full = theta_deg
-		self.phi_deg_full = phi_deg
-		self.psi_deg_full = psi_deg
-		self.gamma_deg_full = gamma_deg
-		self.drange_km_full = drange_km
-
-		self.acc_net_g_full = acc_net_g
-		self.dyn_pres_atm_full = dyn_pres_atm
-		self.stag_pres_atm_full = stag_pres_atm
-		self.q_stag_total_full = q_stag_total
-		self.heatload_full = heatload
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+		self.hddot_array = steps.finalize('hddot_array')
+
+		self.t_min_full = log.finalize('t_min')
+		self.h_km_full = log.finalize('h_km')
+		self.v_kms_full = log.finalize('v_kms')
+		self.theta_deg_full = log.finalize('theta_deg')
+		self.phi_deg_full = log.finalize('phi_deg')
+		self.psi_deg_full = log.finalize('psi_deg')
+		self.gamma_deg_full = log.finalize('gamma_deg')
+		self.drange_km_full = log.finalize('drange_km')
+
+		self.acc_net_g_full = log.finalize('acc_net_g')
+		self.dyn_pres_atm_full = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_full = log.finalize('stag_pres_atm')
+		self.q_stag_total_full = log.finalize('q_stag_total')
+		self.heatload_full = log.finalize('heatload')
 
 		self.terminal_apoapsis = self.compute_ApoapsisAltitudeKm(
 			self.planetObj.RP + h_km[-1] * 1E3, v_kms[-1] * 1E3,
@@ -5667,7 +6875,6 @@ class Vehicle:
 		self.propogateEquilibriumGlide2(timeStep, dt, maxTimeSecs)
 		self.propogateExitPhase2(timeStep, dt, maxTimeSecs)
 
-
 	def setupMonteCarloSimulation(self, NPOS, NMONTE, atmfiles, heightCol, densLowCol, densAvgCol,
 								densHighCol, densTotalCol, heightInKmFlag, nominalEFPA,  EFPA_1sigma_value,
 								nominalLD, LD_1sigma_value, timeStep, dt, maxTimeSecs, atmSigmaFactor=1):
@@ -5739,217 +6946,93 @@ class Vehicle:
 		self.atmSigmaFactor = atmSigmaFactor
 
 
-	def runMonteCarlo(self, N, mainFolder):
+	def _runMonteCarloCampaign(self, guidance, N, mainFolder, masterSeed=None, workers=1, legacyText=False,
+							   resume=False, sampler='random', **flags):
 		"""
-		Run a Monte Carlo simulation for lift modulation
-		aerocapture.
+		Runs a Monte Carlo campaign with a guided propogation method,
+		shared by runMonteCarlo(), runMonteCarlo2(), runMonteCarloD(),
+		runMonteCarloD2() and runMonteCarloD_Earth().
+
+		The dispersions of run i are drawn from a generator seeded
+		with [masterSeed, i], or taken from a design of the N runs
+		seeded with the master seed, the results do not depend on
+		the number of workers.
+
+		The results are appended to a binary store in
+		mainFolder/results/, and the summary arrays are written to
+		mainFolder/*_arr.txt at the end of the campaign.
 
 		Parameters
 		--------
+		guidance : str
+			name of the guided propogation method, see
+			montecarlo.GUIDANCE
 		N : int
 			Number of trajectories
 		mainFolder : str
 			path where data is to be stored
-		"""
-
-		terminal_apoapsis_arr = np.zeros(N)
-		terminal_periapsis_arr = np.zeros(N)
-		periapsis_raise_DV_arr = np.zeros(N)
-		apoapsis_raise_DV_arr = np.zeros(N)
-		acc_net_g_max_arr = np.zeros(N)
-		q_stag_max_arr = np.zeros(N)
-		heatload_max_arr = np.zeros(N)
-
-		h0_km = self.vehicleCopy.h0_km_ref
-		theta0_deg = self.vehicleCopy.theta0_deg_ref
-		phi0_deg = self.vehicleCopy.phi0_deg_ref
-		v0_kms = self.vehicleCopy.v0_kms_ref
-		psi0_deg = self.vehicleCopy.psi0_deg_ref
-		drange0_km = self.vehicleCopy.drange0_km_ref
-		heatLoad0 = self.vehicleCopy.heatLoad0_ref
-
-		os.makedirs(mainFolder)
-
-		for i in range(N):
-			selected_atmfile  = rd.choice(self.atmfiles)
-			selected_profile = rd.randint(1, self.NMONTE)
-			selected_efpa = np.random.normal(self.nominalEFPA, self.EFPA_1sigma_value)
-			selected_atmSigma = np.random.normal(0, self.atmSigmaFactor)
-			selected_LD = np.random.normal(self.nominalLD, self.LD_1sigma_value)
-
-			ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, \
-			ATM_density_pert = self.planetObj.loadMonteCarloDensityFile2(selected_atmfile, self.heightCol,
-										self.densLowCol,  self.densAvgCol, self.densHighCol, self.densTotalCol,
-										self.heightInKmFlag)
-			self.planetObj.density_int = self.planetObj.loadAtmosphereModel5(ATM_height,
-										 ATM_density_low, ATM_density_avg, ATM_density_high,
-										 ATM_density_pert, selected_atmSigma, self.NPOS,
-										 selected_profile)
-
-			
-			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, selected_efpa, drange0_km, heatLoad0)
-			self.propogateGuidedEntry(self.timeStep, self.dt, self.maxTimeSecs)
-
-			terminal_apoapsis = self.terminal_apoapsis
-			apoapsis_error = self.apoapsis_perc_error
-			terminal_periapsis = self.terminal_periapsis
-
-			periapsis_raise_DV = self.periapsis_raise_DV
-			apoapsis_raise_DV = self.apoapsis_raise_DV
-
-
-			terminal_apoapsis_arr[i] = self.terminal_apoapsis
-			terminal_periapsis_arr[i] = self.terminal_periapsis
-
-			periapsis_raise_DV_arr[i] = self.periapsis_raise_DV
-			apoapsis_raise_DV_arr[i] = self.apoapsis_raise_DV
-
-			acc_net_g_max_arr[i] = max(self.acc_net_g_full)
-			q_stag_max_arr[i] = max(self.q_stag_total_full)
-			heatload_max_arr[i] = max(self.heatload_full)
-
-			print("BATCH :"+str(mainFolder)+", RUN #: "+str(i+1)+", PROF: "+str(selected_atmfile) +
-					", SAMPLE #: "+str(selected_profile)+", EFPA: "+str('{:.2f}'.format(selected_efpa,2)) +
-					", SIGMA: "+str('{:.2f}'.format(selected_atmSigma, 2))+", LD: "+str('{:.2f}'.format(selected_LD, 2))+
-					", APO : "+str('{:.2f}'.format(terminal_apoapsis, 2)))
+		masterSeed : int, optional
+			campaign master seed, default=None draws a fresh seed,
+			or reuses the seed of the campaign being resumed, which
+			is stored in self.masterSeed
+		workers : int, optional
+			number of worker processes, default=1 runs in the
+			calling process, None uses all cores
+		legacyText : bool, optional
+			if True, the dispersions and outcomes of each run are
+			also exported to mainFolder/#i/*.txt, default=False
+		resume : bool, optional
+			if True, resumes an interrupted campaign in mainFolder,
+			running only the missing run indices, default=False
+		sampler : str, optional
+			dispersion sampling strategy, 'random', 'lhs' (Latin
+			hypercube), 'sobol' (scrambled Sobol) or 'stratified'
+			(over the atmosphere files and profiles), see
+			montecarlo.MonteCarloExecutor.setDesign(), default='random'
+		**flags
+			earthAtmosphere and integrateHeatload options of
+			montecarlo.MonteCarloExecutor
 
-			os.makedirs(mainFolder+'/'+'#'+str(i+1))
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'atmfile.txt', np.array([selected_atmfile]), fmt='%s')
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'profile.txt', np.array([selected_profile]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'efpa.txt', np.array([selected_efpa]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'atmSigma.txt', np.array([selected_atmSigma]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'LD.txt', np.array([selected_LD]))
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'terminal_apoapsis.txt', np.array([terminal_apoapsis]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'apoapsis_error.txt', np.array([apoapsis_error]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'terminal_periapsis.txt', np.array([terminal_periapsis]))
+		Returns
+		----------
+		ans : montecarlo.MonteCarloResults
+			results of the campaign, also readable from mainFolder
+			with montecarlo.loadMonteCarloResults()
+		"""
 
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'periapsis_raise_DV.txt', np.array([periapsis_raise_DV]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'apoapsis_raise_DV.txt', np.array([apoapsis_raise_DV]))
+		if resume is True and masterSeed is None:
+			masterSeed = campaignMasterSeed(mainFolder)
 
+		executor = MonteCarloExecutor(self, guidance, masterSeed=masterSeed, workers=workers, sampler=sampler,
+									  **flags)
+		self.masterSeed = executor.masterSeed
+		return executor.runCampaign(N, mainFolder, legacyText, resume=resume)
 
-			np.savetxt(mainFolder+'/'+'terminal_apoapsis_arr.txt', terminal_apoapsis_arr)
-			np.savetxt(mainFolder+'/'+'terminal_periapsis_arr.txt', terminal_periapsis_arr)
+	def runMonteCarlo(self, N, mainFolder, masterSeed=None, workers=1, legacyText=False, resume=False,
+					  sampler='random'):
+		"""
+		Run a Monte Carlo simulation for lift modulation
+		aerocapture.
 
-			np.savetxt(mainFolder+'/'+'periapsis_raise_DV_arr.txt', periapsis_raise_DV_arr)
-			np.savetxt(mainFolder+'/'+'apoapsis_raise_DV_arr.txt', apoapsis_raise_DV_arr)
+		Runs the campaign with propogateGuidedEntry(), see
+		_runMonteCarloCampaign() for the parameters and the results.
+		"""
 
-			np.savetxt(mainFolder+'/'+'acc_net_g_max_arr.txt', acc_net_g_max_arr)
-			np.savetxt(mainFolder+'/'+'q_stag_max_arr.txt', q_stag_max_arr)
-			np.savetxt(mainFolder+'/'+'heatload_max_arr.txt', heatload_max_arr)
+		return self._runMonteCarloCampaign('propogateGuidedEntry', N, mainFolder, masterSeed, workers,
+										   legacyText, resume, sampler)
 
-	def runMonteCarlo2(self, N, mainFolder):
+	def runMonteCarlo2(self, N, mainFolder, masterSeed=None, workers=1, legacyText=False, resume=False,
+					  sampler='random'):
 		"""
 		Run a Monte Carlo simulation for lift modulation
 		aerocapture.
 
-		Parameters
-		--------
-		N : int
-			Number of trajectories
-		mainFolder : str
-			path where data is to be stored
+		Runs the campaign with propogateGuidedEntry2(), see
+		_runMonteCarloCampaign() for the parameters and the results.
 		"""
 
-		terminal_apoapsis_arr = np.zeros(N)
-		terminal_periapsis_arr = np.zeros(N)
-		periapsis_raise_DV_arr = np.zeros(N)
-		apoapsis_raise_DV_arr = np.zeros(N)
-		acc_net_g_max_arr = np.zeros(N)
-		q_stag_max_arr = np.zeros(N)
-		heatload_max_arr = np.zeros(N)
-
-		h0_km = self.vehicleCopy.h0_km_ref
-		theta0_deg = self.vehicleCopy.theta0_deg_ref
-		phi0_deg = self.vehicleCopy.phi0_deg_ref
-		v0_kms = self.vehicleCopy.v0_kms_ref
-		psi0_deg = self.vehicleCopy.psi0_deg_ref
-		drange0_km = self.vehicleCopy.drange0_km_ref
-		heatLoad0 = self.vehicleCopy.heatLoad0_ref
-
-		os.makedirs(mainFolder)
-
-		for i in range(N):
-			selected_atmfile = rd.choice(self.atmfiles)
-
-			# selected_profile   = 65
-			selected_profile = rd.randint(1, self.NMONTE)
-			# selected_efpa     = -11.53
-			selected_efpa = np.random.normal(self.nominalEFPA, self.EFPA_1sigma_value)
-			# selected_atmSigma = +0.0
-			selected_atmSigma = np.random.normal(0, self.atmSigmaFactor)
-			selected_LD = np.random.normal(self.nominalLD, self.LD_1sigma_value)
-
-			ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, \
-			ATM_density_pert = self.planetObj.loadMonteCarloDensityFile2( \
-				selected_atmfile, self.heightCol, \
-				self.densLowCol, self.densAvgCol,
-				self.densHighCol, self.densTotalCol, self.heightInKmFlag)
-			self.planetObj.density_int = self.planetObj.loadAtmosphereModel5(ATM_height, \
-																			 ATM_density_low, ATM_density_avg,
-																			 ATM_density_high, \
-																			 ATM_density_pert, selected_atmSigma,
-																			 self.NPOS, \
-																			 selected_profile)
-
-			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, \
-								 psi0_deg, selected_efpa, drange0_km, heatLoad0)
-			self.propogateGuidedEntry2(self.timeStep, self.dt, self.maxTimeSecs)
-
-			terminal_apoapsis = self.terminal_apoapsis
-			apoapsis_error = self.apoapsis_perc_error
-			terminal_periapsis = self.terminal_periapsis
-
-			periapsis_raise_DV = self.periapsis_raise_DV
-			apoapsis_raise_DV = self.apoapsis_raise_DV
-
-			terminal_apoapsis_arr[i] = self.terminal_apoapsis
-			terminal_periapsis_arr[i] = self.terminal_periapsis
-
-			periapsis_raise_DV_arr[i] = self.periapsis_raise_DV
-			apoapsis_raise_DV_arr[i] = self.apoapsis_raise_DV
-
-			acc_net_g_max_arr[i] = max(self.acc_net_g_full)
-			q_stag_max_arr[i] = max(self.q_stag_total_full)
-			heatload_max_arr[i] = max(cumulative_trapezoid(self.q_stag_total_full, self.t_min_full*60, initial=0))/1e3
-
-			print("RUN #: " + str(i + 1) + ", SAMPLE #: " + str(selected_profile) + ", EFPA: " + str(
-				'{:.2f}'.format(selected_efpa, 2)) + ", SIGMA: " + str(
-				'{:.2f}'.format(selected_atmSigma, 2)) + ", LD: " + str(
-				'{:.2f}'.format(selected_LD, 2)) + ", APO : " + str('{:.2f}'.format(terminal_apoapsis, 2)))
-
-			os.makedirs(mainFolder + '/' + '#' + str(i + 1))
-
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'atmfile.txt', np.array([selected_atmfile]),
-					   fmt='%s')
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'profile.txt', np.array([selected_profile]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'efpa.txt', np.array([selected_efpa]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'atmSigma.txt', np.array([selected_atmSigma]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'LD.txt', np.array([selected_LD]))
-
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'terminal_apoapsis.txt',
-					   np.array([terminal_apoapsis]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'apoapsis_error.txt', np.array([apoapsis_error]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'terminal_periapsis.txt',
-					   np.array([terminal_periapsis]))
-
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'periapsis_raise_DV.txt',
-					   np.array([periapsis_raise_DV]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'apoapsis_raise_DV.txt',
-					   np.array([apoapsis_raise_DV]))
-
-			np.savetxt(mainFolder + '/' + 'terminal_apoapsis_arr.txt', terminal_apoapsis_arr)
-			np.savetxt(mainFolder + '/' + 'terminal_periapsis_arr.txt', terminal_periapsis_arr)
-
-			np.savetxt(mainFolder + '/' + 'periapsis_raise_DV_arr.txt', periapsis_raise_DV_arr)
-			np.savetxt(mainFolder + '/' + 'apoapsis_raise_DV_arr.txt', apoapsis_raise_DV_arr)
-
-			np.savetxt(mainFolder + '/' + 'acc_net_g_max_arr.txt', acc_net_g_max_arr)
-			np.savetxt(mainFolder + '/' + 'q_stag_max_arr.txt', q_stag_max_arr)
-			np.savetxt(mainFolder + '/' + 'heatload_max_arr.txt', heatload_max_arr)
-
-
+		return self._runMonteCarloCampaign('propogateGuidedEntry2', N, mainFolder, masterSeed, workers,
+										   legacyText, resume, sampler, integrateHeatload=True)
 
 	def setDragEntryPhaseParams(self, v_switch_kms,\
 								lowAlt_km, numPoints_lowAlt, hdot_threshold):
@@ -5997,42 +7080,51 @@ class Vehicle:
 
 		"""
 
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
+		# RHS evaluations of the apoapsis predictor in this run
+		self.predictorNfev = 0
+
 		# Set the ballistic coeff = beta1 for entry phase
 		# Re-calculate CD based on new beta value
 		self.beta    = self.beta1
 		self.CD      = self.mass / (self.beta*self.A)
 		
 		# Initialize solution arrays
-		self.t_step_array      = np.array([0.0])
-		self.delta_deg_array   = np.array([0.0])
-		self.hdot_array        = np.array([0.0])
-		self.hddot_array       = np.array([0.0])
-		self.qref_array        = np.array([0.0])
-		self.q_array           = np.array([0.0])
-		self.h_step_array      = np.array([0.0])
-		self.acc_step_array    = np.array([0.0])
-		self.acc_drag_array    = np.array([0.0])
-		self.density_mes_array = np.array([0.0])
+		self.t_step_array      = steps.append('t_step_array', 0.0)
+		self.delta_deg_array   = steps.append('delta_deg_array', 0.0)
+		self.hdot_array        = steps.append('hdot_array', 0.0)
+		self.hddot_array       = steps.append('hddot_array', 0.0)
+		self.qref_array        = steps.append('qref_array', 0.0)
+		self.q_array           = steps.append('q_array', 0.0)
+		self.h_step_array      = steps.append('h_step_array', 0.0)
+		self.acc_step_array    = steps.append('acc_step_array', 0.0)
+		self.acc_drag_array    = steps.append('acc_drag_array', 0.0)
+		self.density_mes_array = steps.append('density_mes_array', 0.0)
+		self.hdotref_array = steps.append('hdotref_array', 0.0)
 
 		# Propogate for 1 second from EI 
 		self.propogateEntry(1.0, dt, 0.0)
 
 		# Store solution at end of 1 sec 
-		t_min     = self.t_minc
-		h_km      = self.h_kmc
-		v_kms     = self.v_kmsc
-		phi_deg   = self.phi_degc
-		psi_deg   = self.psi_degc
-		theta_deg = self.theta_degc
-		gamma_deg = self.gamma_degc
-		drange_km = self.drange_kmc
-
-		acc_net_g     =  self.acc_net_g
-		dyn_pres_atm  =  self.dyn_pres_atm 
-		stag_pres_atm =  self.stag_pres_atm
-		q_stag_total  =  self.q_stag_total
-		heatload      =  self.heatload
-		acc_drag_g    =  self.acc_drag_g
+		t_min     = log.append('t_min', self.t_minc)
+		h_km      = log.append('h_km', self.h_kmc)
+		v_kms     = log.append('v_kms', self.v_kmsc)
+		phi_deg   = log.append('phi_deg', self.phi_degc)
+		psi_deg   = log.append('psi_deg', self.psi_degc)
+		theta_deg = log.append('theta_deg', self.theta_degc)
+		gamma_deg = log.append('gamma_deg', self.gamma_degc)
+		drange_km = log.append('drange_km', self.drange_kmc)
+
+		acc_net_g     = log.append('acc_net_g', self.acc_net_g)
+		dyn_pres_atm  = log.append('dyn_pres_atm', self.dyn_pres_atm)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm)
+		q_stag_total  = log.append('q_stag_total', self.q_stag_total)
+		heatload      = log.append('heatload', self.heatload)
+		acc_drag_g    = log.append('acc_drag_g', self.acc_drag_g)
 
 		# Set the current vehicle speed here.
 		self.h_current_km  = h_km[-1]
@@ -6103,44 +7195,44 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time 
 			t_min_c                 = t_min_c + t_min[-1]
 
-			self.t_step_array             = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array          = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array               = np.append(self.hdot_array, hdoti)
+			self.t_step_array             = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array          = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array               = steps.append('hdot_array', hdoti)
 			
-			self.q_array                  = np.append(self.q_array, qi)
-			self.h_step_array             = np.append(self.h_step_array, h0_km)
+			self.q_array                  = steps.append('q_array', qi)
+			self.h_step_array             = steps.append('h_step_array', h0_km)
 
-			self.hdotref_array            = np.zeros(len(self.t_step_array))
+			self.hdotref_array            = steps.append('hdotref_array', 0.0)
 			self.hddoti                   = (self.hdot_array[-1] - self.hdot_array[-2]) / \
 											(self.t_step_array[-1]*60.0 - \
 											 self.t_step_array[-2]*60.0)
-			self.hddot_array              = np.append(self.hddot_array, self.hddoti)
-			self.acc_step_array           = np.append(self.acc_step_array, self.acc_net_g[-1])
-			self.acc_drag_array           = np.append(self.acc_drag_array, self.acc_drag_g[-1])
+			self.hddot_array              = steps.append('hddot_array', self.hddoti)
+			self.acc_step_array           = steps.append('acc_step_array', self.acc_net_g[-1])
+			self.acc_drag_array           = steps.append('acc_drag_array', self.acc_drag_g[-1])
 
 			# Update time and other solution vectors
-			t_min        = np.concatenate((t_min, t_min_c), axis=0)
-			h_km         = np.concatenate((h_km , h_km_c ), axis=0)
-			v_kms        = np.concatenate((v_kms, v_kms_c ), axis=0)
-			phi_deg      = np.concatenate((phi_deg, phi_deg_c ), axis=0)
-			psi_deg      = np.concatenate((psi_deg, psi_deg_c ), axis=0)
-			theta_deg    = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg    = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km    = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min        = log.append('t_min', t_min_c)
+			h_km         = log.append('h_km', h_km_c)
+			v_kms        = log.append('v_kms', v_kms_c)
+			phi_deg      = log.append('phi_deg', phi_deg_c)
+			psi_deg      = log.append('psi_deg', psi_deg_c)
+			theta_deg    = log.append('theta_deg', theta_deg_c)
+			gamma_deg    = log.append('gamma_deg', gamma_deg_c)
+			drange_km    = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g    = np.concatenate((acc_net_g,acc_net_g_c), axis=0)
-			acc_drag_g   = np.concatenate((acc_drag_g,acc_drag_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c),axis=0)
-			stag_pres_atm= np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload     = np.concatenate((heatload, heatload_c), axis=0)
-
-			self.acc_step_array           = np.append(self.acc_step_array, acc_net_g[-1])
+			acc_net_g    = log.append('acc_net_g', acc_net_g_c)
+			acc_drag_g   = log.append('acc_drag_g', acc_drag_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm= log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload     = log.append('heatload', heatload_c)
+
+			self.acc_step_array           = steps.append('acc_step_array', acc_net_g[-1])
 			density_mes                   = 2*self.mass*acc_drag_g[-1]*\
 											self.planetObj.EARTHG / \
 											(self.CD*self.A*(0.5*(vi+v_kms[-1]*1E3))**2.0)
-			self.density_mes_array        = np.append(self.density_mes_array, density_mes)
+			self.density_mes_array        = steps.append('density_mes_array', density_mes)
 
 			if hdoti > self.hdot_threshold and customFlag == 0:
 				self.density_mes_int, self.minAlt = \
@@ -6174,20 +7266,32 @@ class Vehicle:
 				break
 
 		
-		self.t_min_en     = t_min
-		self.h_km_en      = h_km
-		self.v_kms_en     = v_kms
-		self.theta_deg_en = theta_deg	
-		self.phi_deg_en   = phi_deg
-		self.psi_deg_en   = psi_deg
-		self.gamma_deg_en = gamma_deg
-		self.drange_km_en = drange_km
-		
-		self.acc_net_g_en    = acc_net_g
-		self.dyn_pres_atm_en = dyn_pres_atm
-		self.stag_pres_atm_en= stag_pres_atm
-		self.q_stag_total_en = q_stag_total
-		self.heatload_en     = heatload
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hddot_array = steps.finalize('hddot_array')
+		self.qref_array = steps.finalize('qref_array')
+		self.q_array = steps.finalize('q_array')
+		self.h_step_array = steps.finalize('h_step_array')
+		self.acc_step_array = steps.finalize('acc_step_array')
+		self.acc_drag_array = steps.finalize('acc_drag_array')
+		self.density_mes_array = steps.finalize('density_mes_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+
+		self.t_min_en     = log.finalize('t_min')
+		self.h_km_en      = log.finalize('h_km')
+		self.v_kms_en     = log.finalize('v_kms')
+		self.theta_deg_en = log.finalize('theta_deg')
+		self.phi_deg_en   = log.finalize('phi_deg')
+		self.psi_deg_en   = log.finalize('psi_deg')
+		self.gamma_deg_en = log.finalize('gamma_deg')
+		self.drange_km_en = log.finalize('drange_km')
+		
+		self.acc_net_g_en    = log.finalize('acc_net_g')
+		self.dyn_pres_atm_en = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_en= log.finalize('stag_pres_atm')
+		self.q_stag_total_en = log.finalize('q_stag_total')
+		self.heatload_en     = log.finalize('heatload')
 
 	def propogateEntryPhaseD2(self, timeStep, dt, maxTimeSecs):
 		"""
@@ -6208,42 +7312,51 @@ class Vehicle:
 
 		"""
 
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
+		# RHS evaluations of the apoapsis predictor in this run
+		self.predictorNfev = 0
+
 		# Set the ballistic coeff = beta1 for entry phase
 		# Re-calculate CD based on new beta value
 		self.beta = self.beta1
 		self.CD = self.mass / (self.beta * self.A)
 
 		# Initialize solution arrays
-		self.t_step_array = np.array([0.0])
-		self.delta_deg_array = np.array([0.0])
-		self.hdot_array = np.array([0.0])
-		self.hddot_array = np.array([0.0])
-		self.qref_array = np.array([0.0])
-		self.q_array = np.array([0.0])
-		self.h_step_array = np.array([0.0])
-		self.acc_step_array = np.array([0.0])
-		self.acc_drag_array = np.array([0.0])
-		self.density_mes_array = np.array([0.0])
+		self.t_step_array = steps.append('t_step_array', 0.0)
+		self.delta_deg_array = steps.append('delta_deg_array', 0.0)
+		self.hdot_array = steps.append('hdot_array', 0.0)
+		self.hddot_array = steps.append('hddot_array', 0.0)
+		self.qref_array = steps.append('qref_array', 0.0)
+		self.q_array = steps.append('q_array', 0.0)
+		self.h_step_array = steps.append('h_step_array', 0.0)
+		self.acc_step_array = steps.append('acc_step_array', 0.0)
+		self.acc_drag_array = steps.append('acc_drag_array', 0.0)
+		self.density_mes_array = steps.append('density_mes_array', 0.0)
+		self.hdotref_array = steps.append('hdotref_array', 0.0)
 
 		# Propogate for 1 second from EI
 		self.propogateEntry2(1.0, dt, 0.0)
 
 		# Store solution at end of 1 sec
-		t_min = self.t_minc
-		h_km = self.h_kmc
-		v_kms = self.v_kmsc
-		phi_deg = self.phi_degc
-		psi_deg = self.psi_degc
-		theta_deg = self.theta_degc
-		gamma_deg = self.gamma_degc
-		drange_km = self.drange_kmc
-
-		acc_net_g = self.acc_net_g
-		dyn_pres_atm = self.dyn_pres_atm
-		stag_pres_atm = self.stag_pres_atm
-		q_stag_total = self.q_stag_total
-		heatload = self.heatload
-		acc_drag_g = self.acc_drag_g
+		t_min = log.append('t_min', self.t_minc)
+		h_km = log.append('h_km', self.h_kmc)
+		v_kms = log.append('v_kms', self.v_kmsc)
+		phi_deg = log.append('phi_deg', self.phi_degc)
+		psi_deg = log.append('psi_deg', self.psi_degc)
+		theta_deg = log.append('theta_deg', self.theta_degc)
+		gamma_deg = log.append('gamma_deg', self.gamma_degc)
+		drange_km = log.append('drange_km', self.drange_kmc)
+
+		acc_net_g = log.append('acc_net_g', self.acc_net_g)
+		dyn_pres_atm = log.append('dyn_pres_atm', self.dyn_pres_atm)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm)
+		q_stag_total = log.append('q_stag_total', self.q_stag_total)
+		heatload = log.append('heatload', self.heatload)
+		acc_drag_g = log.append('acc_drag_g', self.acc_drag_g)
 
 		# Set the current vehicle speed here.
 		self.h_current_km = h_km[-1]
@@ -6293,7 +7406,8 @@ class Vehicle:
 			# propogate the vehicle state to the next time step.
 			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg, \
 								 drange0_km, Ji)
-			self.propogateEntry2(timeStep, dt, DeltaCMD_deg)
+			# the solver starts with the step size of the previous cycle
+			self.propogateEntry2(timeStep, dt, DeltaCMD_deg, self.largestStep)
 
 			t_min_c = self.t_minc
 			h_km_c = self.h_kmc
@@ -6314,44 +7428,44 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time
 			t_min_c = t_min_c + t_min[-1]
 
-			self.t_step_array = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array = np.append(self.hdot_array, hdoti)
+			self.t_step_array = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array = steps.append('hdot_array', hdoti)
 
-			self.q_array = np.append(self.q_array, qi)
-			self.h_step_array = np.append(self.h_step_array, h0_km)
+			self.q_array = steps.append('q_array', qi)
+			self.h_step_array = steps.append('h_step_array', h0_km)
 
-			self.hdotref_array = np.zeros(len(self.t_step_array))
+			self.hdotref_array = steps.append('hdotref_array', 0.0)
 			self.hddoti = (self.hdot_array[-1] - self.hdot_array[-2]) / \
 						  (self.t_step_array[-1] * 60.0 - \
 						   self.t_step_array[-2] * 60.0)
-			self.hddot_array = np.append(self.hddot_array, self.hddoti)
-			self.acc_step_array = np.append(self.acc_step_array, self.acc_net_g[-1])
-			self.acc_drag_array = np.append(self.acc_drag_array, self.acc_drag_g[-1])
+			self.hddot_array = steps.append('hddot_array', self.hddoti)
+			self.acc_step_array = steps.append('acc_step_array', self.acc_net_g[-1])
+			self.acc_drag_array = steps.append('acc_drag_array', self.acc_drag_g[-1])
 
 			# Update time and other solution vectors
-			t_min = np.concatenate((t_min, t_min_c), axis=0)
-			h_km = np.concatenate((h_km, h_km_c), axis=0)
-			v_kms = np.concatenate((v_kms, v_kms_c), axis=0)
-			phi_deg = np.concatenate((phi_deg, phi_deg_c), axis=0)
-			psi_deg = np.concatenate((psi_deg, psi_deg_c), axis=0)
-			theta_deg = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min = log.append('t_min', t_min_c)
+			h_km = log.append('h_km', h_km_c)
+			v_kms = log.append('v_kms', v_kms_c)
+			phi_deg = log.append('phi_deg', phi_deg_c)
+			psi_deg = log.append('psi_deg', psi_deg_c)
+			theta_deg = log.append('theta_deg', theta_deg_c)
+			gamma_deg = log.append('gamma_deg', gamma_deg_c)
+			drange_km = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g = np.concatenate((acc_net_g, acc_net_g_c), axis=0)
-			acc_drag_g = np.concatenate((acc_drag_g, acc_drag_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c), axis=0)
-			stag_pres_atm = np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload = np.concatenate((heatload, heatload_c), axis=0)
-
-			self.acc_step_array = np.append(self.acc_step_array, acc_net_g[-1])
+			acc_net_g = log.append('acc_net_g', acc_net_g_c)
+			acc_drag_g = log.append('acc_drag_g', acc_drag_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm = log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload = log.append('heatload', heatload_c)
+
+			self.acc_step_array = steps.append('acc_step_array', acc_net_g[-1])
 			density_mes = 2 * self.mass * acc_drag_g[-1] * \
 						  self.planetObj.EARTHG / \
 						  (self.CD * self.A * (0.5 * (vi + v_kms[-1] * 1E3)) ** 2.0)
-			self.density_mes_array = np.append(self.density_mes_array, density_mes)
+			self.density_mes_array = steps.append('density_mes_array', density_mes)
 
 			if hdoti > self.hdot_threshold and customFlag == 0:
 				self.density_mes_int, self.minAlt = \
@@ -6385,20 +7499,32 @@ class Vehicle:
 			if h_current_km > self.planetObj.h_skip / 1000 - 1.0:
 				break
 
-		self.t_min_en = t_min
-		self.h_km_en = h_km
-		self.v_kms_en = v_kms
-		self.theta_deg_en = theta_deg
-		self.phi_deg_en = phi_deg
-		self.psi_deg_en = psi_deg
-		self.gamma_deg_en = gamma_deg
-		self.drange_km_en = drange_km
-
-		self.acc_net_g_en = acc_net_g
-		self.dyn_pres_atm_en = dyn_pres_atm
-		self.stag_pres_atm_en = stag_pres_atm
-		self.q_stag_total_en = q_stag_total
-		self.heatload_en = heatload
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hddot_array = steps.finalize('hddot_array')
+		self.qref_array = steps.finalize('qref_array')
+		self.q_array = steps.finalize('q_array')
+		self.h_step_array = steps.finalize('h_step_array')
+		self.acc_step_array = steps.finalize('acc_step_array')
+		self.acc_drag_array = steps.finalize('acc_drag_array')
+		self.density_mes_array = steps.finalize('density_mes_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+
+		self.t_min_en = log.finalize('t_min')
+		self.h_km_en = log.finalize('h_km')
+		self.v_kms_en = log.finalize('v_kms')
+		self.theta_deg_en = log.finalize('theta_deg')
+		self.phi_deg_en = log.finalize('phi_deg')
+		self.psi_deg_en = log.finalize('psi_deg')
+		self.gamma_deg_en = log.finalize('gamma_deg')
+		self.drange_km_en = log.finalize('drange_km')
+
+		self.acc_net_g_en = log.finalize('acc_net_g')
+		self.dyn_pres_atm_en = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_en = log.finalize('stag_pres_atm')
+		self.q_stag_total_en = log.finalize('q_stag_total')
+		self.heatload_en = log.finalize('heatload')
 
 	def predictApoapsisAltitudeKm_afterJettision(self, h0_km, theta0_deg, \
 						phi0_deg, v0_kms, gamma0_deg, psi0_deg, drange0_km,\
@@ -6444,6 +7570,11 @@ class Vehicle:
 
 		"""
 
+		if self.terminalPredictor is True:
+			return self.predictTerminalApoapsisAltitudeKm(h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg,
+														  drange0_km, t_sec, delta_deg, density_mes_int, 'LSODA',
+														  jettison=True)
+
 		t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, gamma_degc,\
 		drange_kmc, exitflag, acc_net_g, dyn_pres_atm, stag_pres_atm, q_stag_total,\
 		heatload, acc_drag_g = \
@@ -6502,6 +7633,11 @@ class Vehicle:
 
 		"""
 
+		if self.terminalPredictor is True:
+			return self.predictTerminalApoapsisAltitudeKm(h0_km, theta0_deg, phi0_deg, v0_kms, gamma0_deg, psi0_deg,
+														  drange0_km, t_sec, delta_deg, density_mes_int, self.method,
+														  jettison=True)
+
 		t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, gamma_degc, \
 		drange_kmc, exitflag, acc_net_g, dyn_pres_atm, stag_pres_atm, q_stag_total, \
 		heatload, acc_drag_g = \
@@ -6599,13 +7735,7 @@ class Vehicle:
 		"""
 		
 		
-		planetCopy = copy.deepcopy(self.planetObj)
-		planetCopy.density_int = density_mes_int
-
-		# Create a copy of the vehicle object so it does 
-		# not affect the existing vehicle state variables
-		vehicleCopy = copy.deepcopy(self)
-		vehicleCopy.planetObj = planetCopy
+		vehicleCopy = self.dummyVehicle(density_mes_int)
 
 		# Set the beta value used by the propogator to be
 		# the higher ballistic coefficient value.
@@ -6645,9 +7775,10 @@ class Vehicle:
 		vehicleCopy.planetObj.nonDimState(r0,theta0,phi0,v0,psi0,gamma0,drange0)
 		
 		# Solve for the entry trajectory
-		tbar,rbar,theta,phi,vbar,psi,gamma,drangebar   = \
-		vehicleCopy.solveTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, \
+		tbar,rbar,theta,phi,vbar,psi,gamma,drangebar,eventFlag = \
+		vehicleCopy.solveEntryTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, \
 			drangebar0, t_sec, dt, delta)	
+		self.predictorNfev += vehicleCopy.nfev
 		# Note : solver returns non-dimensional variables
 		# Convert to dimensional variables for plotting
 		t,r,theta,phi,v,psi,gamma,drange               = \
@@ -6659,7 +7790,7 @@ class Vehicle:
 		t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km \
 		= vehicleCopy.convertToPlotUnits(t,r,v,phi,psi,theta,gamma,drange)
 		# classify trajectory
-		index,exitflag = vehicleCopy.classifyTrajectory(r)
+		index,exitflag = vehicleCopy.classifyTrajectory(r, eventFlag)
 		# truncate trajectory
 		tc,rc,thetac,phic,vc,psic,gammac,drangec\
 		       = vehicleCopy.truncateTrajectory(t,r,theta,phi,v,psi,gamma,drange,\
@@ -6680,8 +7811,7 @@ class Vehicle:
 		stag_pres_atm        = vehicleCopy.computeStagPres(rc,vc)/(1.01325E5)
 
 	    # compute stagnation point convective and radiative heating rate
-		q_stag_con      = vehicleCopy.qStagConvective(rc,vc)
-		q_stag_rad      = vehicleCopy.qStagRadiative (rc,vc)
+		q_stag_con, q_stag_rad = vehicleCopy.qStagHeating(rc, vc, vehicleCopy.RN)
 		# compute total stagnation point heating rate
 		q_stag_total    = q_stag_con + q_stag_rad
 		# compute stagnation point heating load
@@ -6772,13 +7902,7 @@ class Vehicle:
 		density function.
 		"""
 
-		planetCopy = copy.deepcopy(self.planetObj)
-		planetCopy.density_int = density_mes_int
-
-		# Create a copy of the vehicle object so it does
-		# not affect the existing vehicle state variables
-		vehicleCopy = copy.deepcopy(self)
-		vehicleCopy.planetObj = planetCopy
+		vehicleCopy = self.dummyVehicle(density_mes_int)
 
 		# Set the beta value used by the propogator to be
 		# the higher ballistic coefficient value.
@@ -6817,9 +7941,10 @@ class Vehicle:
 			vehicleCopy.planetObj.nonDimState(r0, theta0, phi0, v0, psi0, gamma0, drange0)
 
 		# Solve for the entry trajectory
-		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar = \
-			vehicleCopy.solveTrajectory2(rbar0, theta0, phi0, vbar0, psi0, gamma0, \
-										drangebar0, t_sec, dt, delta)
+		tbar, rbar, theta, phi, vbar, psi, gamma, drangebar, eventFlag = \
+			vehicleCopy.solveEntryTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, \
+											 drangebar0, t_sec, dt, delta, 'solve_ivp')
+		self.predictorNfev += vehicleCopy.nfev
 		# Note : solver returns non-dimensional variables
 		# Convert to dimensional variables for plotting
 		t, r, theta, phi, v, psi, gamma, drange = \
@@ -6831,7 +7956,7 @@ class Vehicle:
 		t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km \
 			= vehicleCopy.convertToPlotUnits(t, r, v, phi, psi, theta, gamma, drange)
 		# classify trajectory
-		index, exitflag = vehicleCopy.classifyTrajectory(r)
+		index, exitflag = vehicleCopy.classifyTrajectory(r, eventFlag)
 		# truncate trajectory
 		tc, rc, thetac, phic, vc, psic, gammac, drangec \
 			= vehicleCopy.truncateTrajectory(t, r, theta, phi, v, psi, gamma, drange, \
@@ -6852,13 +7977,12 @@ class Vehicle:
 		stag_pres_atm = vehicleCopy.computeStagPres(rc, vc) / (1.01325E5)
 
 		# compute stagnation point convective and radiative heating rate
-		q_stag_con = vehicleCopy.qStagConvective(rc, vc)
-		q_stag_rad = vehicleCopy.qStagRadiative(rc, vc)
+		q_stag_con, q_stag_rad = vehicleCopy.qStagHeating(rc, vc, vehicleCopy.RN)
 		# compute total stagnation point heating rate
 		q_stag_total = q_stag_con + q_stag_rad
 		# compute stagnation point heating load
 		heatload = cumulative_trapezoid(q_stag_total, tc, \
-							initial=heatLoad0)
+							initial=0) + heatLoad0
 
 		return t_minc, h_kmc, v_kmsc, phi_degc, psi_degc, theta_degc, \
 			   gamma_degc, drange_kmc, exitflag, acc_net_g, dyn_pres_atm, \
@@ -6879,6 +8003,11 @@ class Vehicle:
 
 		"""
 
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
 		self.beta        = self.beta1*self.betaRatio
 		self.CD          = self.mass/(self.beta*self.A)
 
@@ -6889,20 +8018,20 @@ class Vehicle:
 		self.p_switch = self.delta_deg_array[-1]
 
 		
-		t_min     = self.t_min_en
-		h_km      = self.h_km_en
-		v_kms     = self.v_kms_en
-		theta_deg = self.theta_deg_en
-		phi_deg   = self.phi_deg_en
-		psi_deg   = self.psi_deg_en
-		gamma_deg = self.gamma_deg_en
-		drange_km = self.drange_km_en
-
-		acc_net_g     = self.acc_net_g_en
-		dyn_pres_atm  = self.dyn_pres_atm_en
-		stag_pres_atm = self.stag_pres_atm_en
-		q_stag_total  = self.q_stag_total_en
-		heatload      = self.heatload_en
+		t_min     = log.append('t_min', self.t_min_en)
+		h_km      = log.append('h_km', self.h_km_en)
+		v_kms     = log.append('v_kms', self.v_kms_en)
+		theta_deg = log.append('theta_deg', self.theta_deg_en)
+		phi_deg   = log.append('phi_deg', self.phi_deg_en)
+		psi_deg   = log.append('psi_deg', self.psi_deg_en)
+		gamma_deg = log.append('gamma_deg', self.gamma_deg_en)
+		drange_km = log.append('drange_km', self.drange_km_en)
+
+		acc_net_g     = log.append('acc_net_g', self.acc_net_g_en)
+		dyn_pres_atm  = log.append('dyn_pres_atm', self.dyn_pres_atm_en)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm_en)
+		q_stag_total  = log.append('q_stag_total', self.q_stag_total_en)
+		heatload      = log.append('heatload', self.heatload_en)
 	
 		# Set the current altitude to the terminal altitude of
 		# the equlibrium glide phase (km).
@@ -6917,6 +8046,12 @@ class Vehicle:
 		Ji           = self.heatload_en[-1]
 
 		#print('Exit Phase Guidance Initiated')
+		self.t_step_array = steps.append('t_step_array', self.t_step_array)
+		self.delta_deg_array = steps.append('delta_deg_array', self.delta_deg_array)
+		self.hdot_array = steps.append('hdot_array', self.hdot_array)
+		self.hdotref_array = steps.append('hdotref_array', self.hdotref_array)
+		self.hddot_array = steps.append('hddot_array', self.hddot_array)
+
 		while h_current_km < h_skip_km:
 			# print(minAlt)
 			# Reset the initial conditions to the terminal conditions of 
@@ -6981,32 +8116,32 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time 
 			t_min_c      = t_min_c + t_min[-1]
 
-			self.t_step_array        = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array     = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array          = np.append(self.hdot_array, hdoti)
-			self.hdotref_array       = np.append(self.hdotref_array, hdot_refi)
+			self.t_step_array        = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array     = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array          = steps.append('hdot_array', hdoti)
+			self.hdotref_array       = steps.append('hdotref_array', hdot_refi)
 
 			self.hddoti              = (self.hdot_array[-1] - self.hdot_array[-2]) / \
 									   (self.t_step_array[-1]*60.0 - self.t_step_array[-2]*60.0)
 
-			self.hddot_array         = np.append(self.hddot_array, self.hddoti)
+			self.hddot_array         = steps.append('hddot_array', self.hddoti)
 
 			# Update time and other solution vectors
-			t_min        = np.concatenate((t_min, t_min_c), axis=0)
-			h_km         = np.concatenate((h_km , h_km_c ), axis=0)
-			v_kms        = np.concatenate((v_kms, v_kms_c ), axis=0)
-			phi_deg      = np.concatenate((phi_deg, phi_deg_c ), axis=0)
-			psi_deg      = np.concatenate((psi_deg, psi_deg_c ), axis=0)
-			theta_deg    = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg    = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km    = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min        = log.append('t_min', t_min_c)
+			h_km         = log.append('h_km', h_km_c)
+			v_kms        = log.append('v_kms', v_kms_c)
+			phi_deg      = log.append('phi_deg', phi_deg_c)
+			psi_deg      = log.append('psi_deg', psi_deg_c)
+			theta_deg    = log.append('theta_deg', theta_deg_c)
+			gamma_deg    = log.append('gamma_deg', gamma_deg_c)
+			drange_km    = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g    = np.concatenate((acc_net_g,acc_net_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c),axis=0)
-			stag_pres_atm= np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload     = np.concatenate((heatload, heatload_c), axis=0)
+			acc_net_g    = log.append('acc_net_g', acc_net_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm= log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload     = log.append('heatload', heatload_c)
 
 			terminal_apoapsis_km = self.compute_ApoapsisAltitudeKm(\
 								   self.planetObj.RP+h_km[-1]*1E3, v_kms[-1]*1E3, \
@@ -7025,20 +8160,26 @@ class Vehicle:
 			h_current_km  = h_km[-1]
 			t_current_min = t_min[-1]
 
-		self.t_min_full     = t_min
-		self.h_km_full      = h_km
-		self.v_kms_full     = v_kms
-		self.theta_deg_full = theta_deg	
-		self.phi_deg_full   = phi_deg
-		self.psi_deg_full   = psi_deg
-		self.gamma_deg_full = gamma_deg
-		self.drange_km_full = drange_km
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+		self.hddot_array = steps.finalize('hddot_array')
+
+		self.t_min_full     = log.finalize('t_min')
+		self.h_km_full      = log.finalize('h_km')
+		self.v_kms_full     = log.finalize('v_kms')
+		self.theta_deg_full = log.finalize('theta_deg')
+		self.phi_deg_full   = log.finalize('phi_deg')
+		self.psi_deg_full   = log.finalize('psi_deg')
+		self.gamma_deg_full = log.finalize('gamma_deg')
+		self.drange_km_full = log.finalize('drange_km')
 		
-		self.acc_net_g_full    = acc_net_g
-		self.dyn_pres_atm_full = dyn_pres_atm
-		self.stag_pres_atm_full= stag_pres_atm
-		self.q_stag_total_full = q_stag_total
-		self.heatload_full     = heatload
+		self.acc_net_g_full    = log.finalize('acc_net_g')
+		self.dyn_pres_atm_full = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_full= log.finalize('stag_pres_atm')
+		self.q_stag_total_full = log.finalize('q_stag_total')
+		self.heatload_full     = log.finalize('heatload')
 
 
 		self.terminal_apoapsis  = self.compute_ApoapsisAltitudeKm(
@@ -7074,6 +8215,11 @@ class Vehicle:
 
 		"""
 
+		# growable logs of the trajectory and of the guidance cycle
+		# quantities, finalized into arrays at the end of the phase
+		log = TrajectoryLog()
+		steps = TrajectoryLog()
+
 		self.beta = self.beta1 * self.betaRatio
 		self.CD = self.mass / (self.beta * self.A)
 
@@ -7082,20 +8228,20 @@ class Vehicle:
 		self.v_switch = self.v_kms_en[-1]
 		self.p_switch = self.delta_deg_array[-1]
 
-		t_min = self.t_min_en
-		h_km = self.h_km_en
-		v_kms = self.v_kms_en
-		theta_deg = self.theta_deg_en
-		phi_deg = self.phi_deg_en
-		psi_deg = self.psi_deg_en
-		gamma_deg = self.gamma_deg_en
-		drange_km = self.drange_km_en
-
-		acc_net_g = self.acc_net_g_en
-		dyn_pres_atm = self.dyn_pres_atm_en
-		stag_pres_atm = self.stag_pres_atm_en
-		q_stag_total = self.q_stag_total_en
-		heatload = self.heatload_en
+		t_min = log.append('t_min', self.t_min_en)
+		h_km = log.append('h_km', self.h_km_en)
+		v_kms = log.append('v_kms', self.v_kms_en)
+		theta_deg = log.append('theta_deg', self.theta_deg_en)
+		phi_deg = log.append('phi_deg', self.phi_deg_en)
+		psi_deg = log.append('psi_deg', self.psi_deg_en)
+		gamma_deg = log.append('gamma_deg', self.gamma_deg_en)
+		drange_km = log.append('drange_km', self.drange_km_en)
+
+		acc_net_g = log.append('acc_net_g', self.acc_net_g_en)
+		dyn_pres_atm = log.append('dyn_pres_atm', self.dyn_pres_atm_en)
+		stag_pres_atm = log.append('stag_pres_atm', self.stag_pres_atm_en)
+		q_stag_total = log.append('q_stag_total', self.q_stag_total_en)
+		heatload = log.append('heatload', self.heatload_en)
 
 		# Set the current altitude to the terminal altitude of
 		# the equlibrium glide phase (km).
@@ -7110,6 +8256,12 @@ class Vehicle:
 		Ji = self.heatload_en[-1]
 
 		# print('Exit Phase Guidance Initiated')
+		self.t_step_array = steps.append('t_step_array', self.t_step_array)
+		self.delta_deg_array = steps.append('delta_deg_array', self.delta_deg_array)
+		self.hdot_array = steps.append('hdot_array', self.hdot_array)
+		self.hdotref_array = steps.append('hdotref_array', self.hdotref_array)
+		self.hddot_array = steps.append('hddot_array', self.hddot_array)
+
 		while h_current_km < h_skip_km:
 			# print(minAlt)
 			# Reset the initial conditions to the terminal conditions of
@@ -7152,7 +8304,8 @@ class Vehicle:
 			# state using the commanded bank angle deltaCMD
 			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, psi0_deg, gamma0_deg, \
 								 drange0_km, Ji)
-			self.propogateEntry2(timeStep, dt, DeltaCMD_deg)
+			# the solver starts with the step size of the previous cycle
+			self.propogateEntry2(timeStep, dt, DeltaCMD_deg, self.largestStep)
 
 			t_min_c = self.t_minc
 			h_km_c = self.h_kmc
@@ -7173,32 +8326,32 @@ class Vehicle:
 			# Update the time solution array to account for non-zero start time
 			t_min_c = t_min_c + t_min[-1]
 
-			self.t_step_array = np.append(self.t_step_array, t_min[-1])
-			self.delta_deg_array = np.append(self.delta_deg_array, DeltaCMD_deg)
-			self.hdot_array = np.append(self.hdot_array, hdoti)
-			self.hdotref_array = np.append(self.hdotref_array, hdot_refi)
+			self.t_step_array = steps.append('t_step_array', t_min[-1])
+			self.delta_deg_array = steps.append('delta_deg_array', DeltaCMD_deg)
+			self.hdot_array = steps.append('hdot_array', hdoti)
+			self.hdotref_array = steps.append('hdotref_array', hdot_refi)
 
 			self.hddoti = (self.hdot_array[-1] - self.hdot_array[-2]) / \
 						  (self.t_step_array[-1] * 60.0 - self.t_step_array[-2] * 60.0)
 
-			self.hddot_array = np.append(self.hddot_array, self.hddoti)
+			self.hddot_array = steps.append('hddot_array', self.hddoti)
 
 			# Update time and other solution vectors
-			t_min = np.concatenate((t_min, t_min_c), axis=0)
-			h_km = np.concatenate((h_km, h_km_c), axis=0)
-			v_kms = np.concatenate((v_kms, v_kms_c), axis=0)
-			phi_deg = np.concatenate((phi_deg, phi_deg_c), axis=0)
-			psi_deg = np.concatenate((psi_deg, psi_deg_c), axis=0)
-			theta_deg = np.concatenate((theta_deg, theta_deg_c), axis=0)
-			gamma_deg = np.concatenate((gamma_deg, gamma_deg_c), axis=0)
-			drange_km = np.concatenate((drange_km, drange_km_c), axis=0)
+			t_min = log.append('t_min', t_min_c)
+			h_km = log.append('h_km', h_km_c)
+			v_kms = log.append('v_kms', v_kms_c)
+			phi_deg = log.append('phi_deg', phi_deg_c)
+			psi_deg = log.append('psi_deg', psi_deg_c)
+			theta_deg = log.append('theta_deg', theta_deg_c)
+			gamma_deg = log.append('gamma_deg', gamma_deg_c)
+			drange_km = log.append('drange_km', drange_km_c)
 
 			# Update entry parameter vectors
-			acc_net_g = np.concatenate((acc_net_g, acc_net_g_c), axis=0)
-			dyn_pres_atm = np.concatenate((dyn_pres_atm, dyn_pres_atm_c), axis=0)
-			stag_pres_atm = np.concatenate((stag_pres_atm, stag_pres_atm_c), axis=0)
-			q_stag_total = np.concatenate((q_stag_total, q_stag_total_c), axis=0)
-			heatload = np.concatenate((heatload, heatload_c), axis=0)
+			acc_net_g = log.append('acc_net_g', acc_net_g_c)
+			dyn_pres_atm = log.append('dyn_pres_atm', dyn_pres_atm_c)
+			stag_pres_atm = log.append('stag_pres_atm', stag_pres_atm_c)
+			q_stag_total = log.append('q_stag_total', q_stag_total_c)
+			heatload = log.append('heatload', heatload_c)
 
 			terminal_apoapsis_km = self.compute_ApoapsisAltitudeKm( \
 				self.planetObj.RP + h_km[-1] * 1E3, v_kms[-1] * 1E3, \
@@ -7216,20 +8369,26 @@ class Vehicle:
 			h_current_km = h_km[-1]
 			t_current_min = t_min[-1]
 
-		self.t_min_full = t_min
-		self.h_km_full = h_km
-		self.v_kms_full = v_kms
-		self.theta_deg_full = theta_deg
-		self.phi_deg_full = phi_deg
-		self.psi_deg_full = psi_deg
-		self.gamma_deg_full = gamma_deg
-		self.drange_km_full = drange_km
-
-		self.acc_net_g_full = acc_net_g
-		self.dyn_pres_atm_full = dyn_pres_atm
-		self.stag_pres_atm_full = stag_pres_atm
-		self.q_stag_total_full = q_stag_total
-		self.heatload_full = heatload
+		self.t_step_array = steps.finalize('t_step_array')
+		self.delta_deg_array = steps.finalize('delta_deg_array')
+		self.hdot_array = steps.finalize('hdot_array')
+		self.hdotref_array = steps.finalize('hdotref_array')
+		self.hddot_array = steps.finalize('hddot_array')
+
+		self.t_min_full = log.finalize('t_min')
+		self.h_km_full = log.finalize('h_km')
+		self.v_kms_full = log.finalize('v_kms')
+		self.theta_deg_full = log.finalize('theta_deg')
+		self.phi_deg_full = log.finalize('phi_deg')
+		self.psi_deg_full = log.finalize('psi_deg')
+		self.gamma_deg_full = log.finalize('gamma_deg')
+		self.drange_km_full = log.finalize('drange_km')
+
+		self.acc_net_g_full = log.finalize('acc_net_g')
+		self.dyn_pres_atm_full = log.finalize('dyn_pres_atm')
+		self.stag_pres_atm_full = log.finalize('stag_pres_atm')
+		self.q_stag_total_full = log.finalize('q_stag_total')
+		self.heatload_full = log.finalize('heatload')
 
 		self.terminal_apoapsis = self.compute_ApoapsisAltitudeKm(
 			self.planetObj.RP + h_km[-1] * 1E3, v_kms[-1] * 1E3,
@@ -7290,8 +8449,6 @@ class Vehicle:
 		self.propogateEntryPhaseD2(timeStepEntry, dt, maxTimeSecs)
 		self.propogateExitPhaseD2(timeStepExit, dt, maxTimeSecs)
 
-
-
 	def setupMonteCarloSimulationD(self, NPOS, NMONTE, atmfiles,
 								  heightCol, densLowCol, densAvgCol,
 								  densHighCol, densTotalCol, heightInKmFlag,
@@ -7445,333 +8602,42 @@ class Vehicle:
 		self.maxTimeSecs = maxTimeSecs
 
 
-	def runMonteCarloD(self, N, mainFolder):
+	def runMonteCarloD(self, N, mainFolder, masterSeed=None, workers=1, legacyText=False, resume=False,
+					  sampler='random'):
 		"""
 		Run a Monte Carlo simulation for drag modulation
 		aerocapture.
 
-		Parameters
-		--------
-		N : int
-			Number of trajectories
-		mainFolder : str
-			path where data is to be stored
+		Runs the campaign with propogateGuidedEntryD(), see
+		_runMonteCarloCampaign() for the parameters and the results.
 		"""
 
+		return self._runMonteCarloCampaign('propogateGuidedEntryD', N, mainFolder, masterSeed, workers,
+										   legacyText, resume, sampler)
 
-		terminal_apoapsis_arr = np.zeros(N)
-		terminal_periapsis_arr= np.zeros(N)
-		periapsis_raise_DV_arr= np.zeros(N)
-		apoapsis_raise_DV_arr = np.zeros(N)
-		acc_net_g_max_arr     = np.zeros(N)
-		q_stag_max_arr        = np.zeros(N)
-		heatload_max_arr      = np.zeros(N)
-
-		h0_km      = self.vehicleCopy.h0_km_ref
-		theta0_deg = self.vehicleCopy.theta0_deg_ref
-		phi0_deg   = self.vehicleCopy.phi0_deg_ref
-		v0_kms     = self.vehicleCopy.v0_kms_ref
-		psi0_deg   = self.vehicleCopy.psi0_deg_ref
-		drange0_km = self.vehicleCopy.drange0_km_ref
-		heatLoad0  = self.vehicleCopy.heatLoad0_ref
-
-		os.makedirs(mainFolder)
-	
-		
-		for i in range(N):
-			selected_atmfile  = rd.choice(self.atmfiles)
-			
-			#selected_profile   = 65
-			selected_profile  = rd.randint(1,self.NMONTE)
-			#selected_efpa     = -11.53
-			selected_efpa     = np.random.normal(self.nominalEFPA, self.EFPA_1sigma_value)
-			#selected_atmSigma = +0.0
-			selected_atmSigma = np.random.normal(0,1)
-
-			selected_LD       = 0.0
-
-			ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, \
-			ATM_density_pert = self.planetObj.loadMonteCarloDensityFile2(\
-				               selected_atmfile, self.heightCol, \
-				               self.densLowCol,  self.densAvgCol, 
-				               self.densHighCol, self.densTotalCol, self.heightInKmFlag)
-			self.planetObj.density_int = self.planetObj.loadAtmosphereModel5(ATM_height, \
-										 ATM_density_low, ATM_density_avg, ATM_density_high, \
-										 ATM_density_pert, selected_atmSigma, self.NPOS, \
-										 selected_profile)
-
-			
-			self.setInitialState(h0_km,theta0_deg,phi0_deg,v0_kms,\
-						         psi0_deg,selected_efpa,drange0_km,heatLoad0)
-			self.propogateGuidedEntryD(self.timeStepEntry, self.timeStepExit,  self.dt, self.maxTimeSecs)
-
-			terminal_apoapsis = self.terminal_apoapsis
-			apoapsis_error    = self.apoapsis_perc_error
-			terminal_periapsis= self.terminal_periapsis
-
-			periapsis_raise_DV = self.periapsis_raise_DV
-			apoapsis_raise_DV =  self.apoapsis_raise_DV
-
-
-			terminal_apoapsis_arr[i] = self.terminal_apoapsis
-			terminal_periapsis_arr[i]= self.terminal_periapsis
-
-			periapsis_raise_DV_arr[i]= self.periapsis_raise_DV
-			apoapsis_raise_DV_arr[i] = self.apoapsis_raise_DV
-
-			acc_net_g_max_arr[i]     = max(self.acc_net_g_full)
-			q_stag_max_arr[i]        = max(self.q_stag_total_full)
-			heatload_max_arr[i]      = max(self.heatload_full)
-
-			print("BATCH :"+str(mainFolder)+", RUN #: "+str(i+1)+", PROF: "+str(selected_atmfile)+", SAMPLE #: "+str(selected_profile)+", EFPA: "+str('{:.2f}'.format(selected_efpa,2))+", SIGMA: "+str('{:.2f}'.format(selected_atmSigma,2))+", APO : "+str('{:.2f}'.format(terminal_apoapsis,2)))
-
-
-			os.makedirs(mainFolder+'/'+'#'+str(i+1))
-
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'atmfile.txt',np.array([selected_atmfile]), fmt='%s')
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'profile.txt',np.array([selected_profile]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'efpa.txt',np.array([selected_efpa]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'atmSigma.txt',np.array([selected_atmSigma]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'LD.txt',np.array([selected_LD]))
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'terminal_apoapsis.txt',np.array([terminal_apoapsis]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'apoapsis_error.txt',np.array([apoapsis_error]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'terminal_periapsis.txt',np.array([terminal_periapsis]))
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'periapsis_raise_DV.txt',np.array([periapsis_raise_DV]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'apoapsis_raise_DV.txt',np.array([apoapsis_raise_DV]))
-
-
-			np.savetxt(mainFolder+'/'+'terminal_apoapsis_arr.txt',terminal_apoapsis_arr)
-			np.savetxt(mainFolder+'/'+'terminal_periapsis_arr.txt',terminal_periapsis_arr)
-
-			np.savetxt(mainFolder+'/'+'periapsis_raise_DV_arr.txt',periapsis_raise_DV_arr)
-			np.savetxt(mainFolder+'/'+'apoapsis_raise_DV_arr.txt', apoapsis_raise_DV_arr)
-
-			np.savetxt(mainFolder+'/'+'acc_net_g_max_arr.txt',acc_net_g_max_arr)
-			np.savetxt(mainFolder+'/'+'q_stag_max_arr.txt',q_stag_max_arr)
-			np.savetxt(mainFolder+'/'+'heatload_max_arr.txt',heatload_max_arr)
-
-	def runMonteCarloD2(self, N, mainFolder):
+	def runMonteCarloD2(self, N, mainFolder, masterSeed=None, workers=1, legacyText=False, resume=False,
+					  sampler='random'):
 		"""
 		Run a Monte Carlo simulation for drag modulation
 		aerocapture with new solver.
 
-		Parameters
-		--------
-		N : int
-			Number of trajectories
-		mainFolder : str
-			path where data is to be stored
+		Runs the campaign with propogateGuidedEntryD2(), see
+		_runMonteCarloCampaign() for the parameters and the results.
 		"""
 
-		terminal_apoapsis_arr = np.zeros(N)
-		terminal_periapsis_arr = np.zeros(N)
-		periapsis_raise_DV_arr = np.zeros(N)
-		apoapsis_raise_DV_arr = np.zeros(N)
-		acc_net_g_max_arr = np.zeros(N)
-		q_stag_max_arr = np.zeros(N)
-		heatload_max_arr = np.zeros(N)
-
-		h0_km = self.vehicleCopy.h0_km_ref
-		theta0_deg = self.vehicleCopy.theta0_deg_ref
-		phi0_deg = self.vehicleCopy.phi0_deg_ref
-		v0_kms = self.vehicleCopy.v0_kms_ref
-		psi0_deg = self.vehicleCopy.psi0_deg_ref
-		drange0_km = self.vehicleCopy.drange0_km_ref
-		heatLoad0 = self.vehicleCopy.heatLoad0_ref
-
-		os.makedirs(mainFolder)
-
-		for i in range(N):
-			selected_atmfile = rd.choice(self.atmfiles)
-
-			# selected_profile   = 65
-			selected_profile = rd.randint(1, self.NMONTE)
-			# selected_efpa     = -11.53
-			selected_efpa = np.random.normal(self.nominalEFPA, self.EFPA_1sigma_value)
-			# selected_atmSigma = +0.0
-			selected_atmSigma = np.random.normal(0, 1)
-
-			selected_LD = 0.0
-
-			ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, \
-			ATM_density_pert = self.planetObj.loadMonteCarloDensityFile2( \
-				selected_atmfile, self.heightCol, \
-				self.densLowCol, self.densAvgCol,
-				self.densHighCol, self.densTotalCol, self.heightInKmFlag)
-
-			self.planetObj.density_int = self.planetObj.loadAtmosphereModel5(ATM_height, \
-																			 ATM_density_low, ATM_density_avg,
-																			 ATM_density_high, \
-																			 ATM_density_pert, selected_atmSigma,
-																			 self.NPOS, \
-																			 selected_profile)
-
-			self.setInitialState(h0_km, theta0_deg, phi0_deg, v0_kms, \
-								 psi0_deg, selected_efpa, drange0_km, heatLoad0)
-			self.propogateGuidedEntryD2(self.timeStepEntry, self.timeStepExit, self.dt, self.maxTimeSecs)
-
-			terminal_apoapsis = self.terminal_apoapsis
-			apoapsis_error = self.apoapsis_perc_error
-			terminal_periapsis = self.terminal_periapsis
-
-			periapsis_raise_DV = self.periapsis_raise_DV
-			apoapsis_raise_DV = self.apoapsis_raise_DV
-
-			terminal_apoapsis_arr[i] = self.terminal_apoapsis
-			terminal_periapsis_arr[i] = self.terminal_periapsis
-
-			periapsis_raise_DV_arr[i] = self.periapsis_raise_DV
-			apoapsis_raise_DV_arr[i] = self.apoapsis_raise_DV
-
-			acc_net_g_max_arr[i] = max(self.acc_net_g_full)
-			q_stag_max_arr[i] = max(self.q_stag_total_full)
-			heatload_max_arr[i] = max(cumulative_trapezoid(self.q_stag_total_full, self.t_min_full*60, initial=0))/1e3
-
-			print("RUN #: " + str(i + 1) + ", PROF: " + str(
-				selected_atmfile) + ", SAMPLE #: " + str(selected_profile) + ", EFPA: " + str(
-				'{:.2f}'.format(selected_efpa, 2)) + ", SIGMA: " + str(
-				'{:.2f}'.format(selected_atmSigma, 2)) + ", APO : " + str('{:.2f}'.format(terminal_apoapsis, 2)))
-
-			os.makedirs(mainFolder + '/' + '#' + str(i + 1))
-
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'atmfile.txt', np.array([selected_atmfile]),
-					   fmt='%s')
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'profile.txt', np.array([selected_profile]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'efpa.txt', np.array([selected_efpa]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'atmSigma.txt', np.array([selected_atmSigma]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'LD.txt', np.array([selected_LD]))
-
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'terminal_apoapsis.txt',
-					   np.array([terminal_apoapsis]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'apoapsis_error.txt', np.array([apoapsis_error]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'terminal_periapsis.txt',
-					   np.array([terminal_periapsis]))
-
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'periapsis_raise_DV.txt',
-					   np.array([periapsis_raise_DV]))
-			np.savetxt(mainFolder + '/' + '#' + str(i + 1) + '/' + 'apoapsis_raise_DV.txt',
-					   np.array([apoapsis_raise_DV]))
-
-			np.savetxt(mainFolder + '/' + 'terminal_apoapsis_arr.txt', terminal_apoapsis_arr)
-			np.savetxt(mainFolder + '/' + 'terminal_periapsis_arr.txt', terminal_periapsis_arr)
-
-			np.savetxt(mainFolder + '/' + 'periapsis_raise_DV_arr.txt', periapsis_raise_DV_arr)
-			np.savetxt(mainFolder + '/' + 'apoapsis_raise_DV_arr.txt', apoapsis_raise_DV_arr)
-
-			np.savetxt(mainFolder + '/' + 'acc_net_g_max_arr.txt', acc_net_g_max_arr)
-			np.savetxt(mainFolder + '/' + 'q_stag_max_arr.txt', q_stag_max_arr)
-			np.savetxt(mainFolder + '/' + 'heatload_max_arr.txt', heatload_max_arr)
-
+		return self._runMonteCarloCampaign('propogateGuidedEntryD2', N, mainFolder, masterSeed, workers,
+										   legacyText, resume, sampler, integrateHeatload=True)
 
-	def runMonteCarloD_Earth(self, N, mainFolder):
+	def runMonteCarloD_Earth(self, N, mainFolder, masterSeed=None, workers=1, legacyText=False, resume=False,
+					  sampler='random'):
 		"""
 		Run a Monte Carlo simulation for drag modulation
 		aerocapture. (Earth application)
 
-		Parameters
-		--------
-		N : int
-			Number of trajectories
-		mainFolder : str
-			path where data is to be stored
+		Runs the campaign with propogateGuidedEntryD(), see
+		_runMonteCarloCampaign() for the parameters and the results.
 		"""
 
-
-		terminal_apoapsis_arr = np.zeros(N)
-		terminal_periapsis_arr= np.zeros(N)
-		periapsis_raise_DV_arr= np.zeros(N)
-		apoapsis_raise_DV_arr = np.zeros(N)
-		acc_net_g_max_arr     = np.zeros(N)
-		q_stag_max_arr        = np.zeros(N)
-		heatload_max_arr      = np.zeros(N)
-
-		h0_km      = self.vehicleCopy.h0_km_ref
-		theta0_deg = self.vehicleCopy.theta0_deg_ref
-		phi0_deg   = self.vehicleCopy.phi0_deg_ref
-		v0_kms     = self.vehicleCopy.v0_kms_ref
-		psi0_deg   = self.vehicleCopy.psi0_deg_ref
-		drange0_km = self.vehicleCopy.drange0_km_ref
-		heatLoad0  = self.vehicleCopy.heatLoad0_ref
-
-		os.makedirs(mainFolder)
-	
-		
-		for i in range(N):
-			selected_atmfile  = rd.choice(self.atmfiles)
-			
-			#selected_profile   = 65
-			selected_profile  = rd.randint(1,self.NMONTE)
-			#selected_efpa     = -11.53
-			selected_efpa     = np.random.normal(self.nominalEFPA, self.EFPA_1sigma_value)
-			#selected_atmSigma = +0.0
-			selected_atmSigma = np.random.normal(0,1)
-
-			selected_LD       = 0.0
-
-			ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, \
-			ATM_density_pert = self.planetObj.loadMonteCarloDensityFile3(\
-				               selected_atmfile, self.heightCol, \
-				               self.densAvgCol,  self.densSD_percCol,\
-				               self.densTotalCol, self.heightInKmFlag)
-			
-			self.planetObj.density_int = self.planetObj.loadAtmosphereModel5(ATM_height, \
-										 ATM_density_low, ATM_density_avg, ATM_density_high, \
-										 ATM_density_pert, selected_atmSigma, self.NPOS, \
-										 selected_profile)
-
-			
-			self.setInitialState(h0_km,theta0_deg,phi0_deg,v0_kms,\
-						         psi0_deg,selected_efpa,drange0_km,heatLoad0)
-			self.propogateGuidedEntryD(self.timeStepEntry, self.timeStepExit,  self.dt, self.maxTimeSecs)
-
-			terminal_apoapsis = self.terminal_apoapsis
-			apoapsis_error    = self.apoapsis_perc_error
-			terminal_periapsis= self.terminal_periapsis
-
-			periapsis_raise_DV = self.periapsis_raise_DV
-			apoapsis_raise_DV =  self.apoapsis_raise_DV
-
-
-			terminal_apoapsis_arr[i] = self.terminal_apoapsis
-			terminal_periapsis_arr[i]= self.terminal_periapsis
-
-			periapsis_raise_DV_arr[i]= self.periapsis_raise_DV
-			apoapsis_raise_DV_arr[i] = self.apoapsis_raise_DV
-
-			acc_net_g_max_arr[i]     = max(self.acc_net_g_full)
-			q_stag_max_arr[i]        = max(self.q_stag_total_full)
-			heatload_max_arr[i]      = max(self.heatload_full)
-
-			print("BATCH :"+str(mainFolder)+", RUN #: "+str(i+1)+", PROF: "+str(selected_atmfile)+", SAMPLE #: "+str(selected_profile)+", EFPA: "+str('{:.2f}'.format(selected_efpa,2))+", SIGMA: "+str('{:.2f}'.format(selected_atmSigma,2))+", APO : "+str('{:.2f}'.format(terminal_apoapsis,2)))
-
-
-			os.makedirs(mainFolder+'/'+'#'+str(i+1))
-
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'atmfile.txt',np.array([selected_atmfile]), fmt='%s')
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'profile.txt',np.array([selected_profile]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'efpa.txt',np.array([selected_efpa]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'atmSigma.txt',np.array([selected_atmSigma]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'LD.txt',np.array([selected_LD]))
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'terminal_apoapsis.txt',np.array([terminal_apoapsis]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'apoapsis_error.txt',np.array([apoapsis_error]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'terminal_periapsis.txt',np.array([terminal_periapsis]))
-
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'periapsis_raise_DV.txt',np.array([periapsis_raise_DV]))
-			np.savetxt(mainFolder+'/'+'#'+str(i+1)+'/'+'apoapsis_raise_DV.txt',np.array([apoapsis_raise_DV]))
-
-
-			np.savetxt(mainFolder+'/'+'terminal_apoapsis_arr.txt',terminal_apoapsis_arr)
-			np.savetxt(mainFolder+'/'+'terminal_periapsis_arr.txt',terminal_periapsis_arr)
-
-			np.savetxt(mainFolder+'/'+'periapsis_raise_DV_arr.txt',periapsis_raise_DV_arr)
-			np.savetxt(mainFolder+'/'+'apoapsis_raise_DV_arr.txt', apoapsis_raise_DV_arr)
-
-			np.savetxt(mainFolder+'/'+'acc_net_g_max_arr.txt',acc_net_g_max_arr)
-			np.savetxt(mainFolder+'/'+'q_stag_max_arr.txt',q_stag_max_arr)
-			np.savetxt(mainFolder+'/'+'heatload_max_arr.txt',heatload_max_arr)
+		return self._runMonteCarloCampaign('propogateGuidedEntryD', N, mainFolder, masterSeed, workers,
+										   legacyText, resume, sampler, earthAtmosphere=True)
 
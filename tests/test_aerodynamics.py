@@ -0,0 +1,138 @@
+"""
+test_aerodynamics.py
+
+Tests for the tabulated aerodynamic database
+
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from scipy.interpolate import interp1d, RegularGridInterpolator
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.vehicle import Vehicle
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
+
+try:
+	from AMAT.aerodynamics import AeroTable, loadAeroTable
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import AeroTable, loadAeroTable from AMAT.aerodynamics")
+
+
+class TestAeroTable(unittest.TestCase):
+	"""
+	Check the table interpolation against numpy / scipy.
+	"""
+
+	mach = np.array([0.0, 0.5, 0.8, 1.0, 1.2, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0])
+	alpha = np.array([-10.0, -5.0, 0.0, 5.0, 10.0])
+
+	def test_mach_table(self):
+		CD = 0.9 + 0.5*np.tanh(self.mach - 1.0)
+		CL = 0.3*CD
+		table = AeroTable(self.mach[::-1], CD[::-1], CL[::-1])
+
+		machq = np.linspace(-1.0, 35.0, 721)
+		CDq, CLq = table.evaluateArray(machq)
+		np.testing.assert_allclose(CDq, np.interp(machq, self.mach, CD), rtol=1E-13)
+		np.testing.assert_allclose(CLq, np.interp(machq, self.mach, CL), rtol=1E-13)
+
+		for i in range(0, len(machq), 10):
+			self.assertEqual(table.evaluate(machq[i]), (CDq[i], CLq[i]))
+
+	def test_mach_alpha_table(self):
+		M, A = np.meshgrid(self.mach, self.alpha, indexing='ij')
+		CD = 0.9 + 0.5*np.tanh(M - 1.0) + 1E-3*A**2
+		CL = 0.02*A*CD
+		table = AeroTable(self.mach, CD, CL, self.alpha)
+
+		rng = np.random.default_rng(1)
+		machq = rng.uniform(0.0, 30.0, 500)
+		alphaq = rng.uniform(-10.0, 10.0, 500)
+		points = np.column_stack((machq, alphaq))
+		CDq, CLq = table.evaluateArray(machq, alphaq)
+		np.testing.assert_allclose(CDq, RegularGridInterpolator((self.mach, self.alpha), CD)(points), rtol=1E-12)
+		np.testing.assert_allclose(CLq, RegularGridInterpolator((self.mach, self.alpha), CL)(points), rtol=1E-12, atol=1E-14)
+
+		for i in range(0, 500, 25):
+			CDi, CLi = table.evaluate(machq[i], alphaq[i])
+			self.assertAlmostEqual(CDi, CDq[i], delta=1E-14)
+			self.assertAlmostEqual(CLi, CLq[i], delta=1E-14)
+
+		# clamped to the table boundary
+		self.assertEqual(table.evaluate(40.0, 20.0), (CD[-1, -1], CL[-1, -1]))
+
+	def test_invalid_table(self):
+		with self.assertRaises(ValueError):
+			AeroTable([1.0, 1.0], [1.0, 1.0], [0.0, 0.0])
+		with self.assertRaises(ValueError):
+			AeroTable([1.0, 2.0], [1.0, 1.0, 1.0], [0.0, 0.0])
+
+	def test_load_mach_alpha_table(self):
+		M, A = np.meshgrid(self.mach, self.alpha, indexing='ij')
+		CD = 1.0 + 0.01*M + 1E-3*A**2
+		CL = 0.02*A
+		rows = np.column_stack((A.ravel(), M.ravel(), CL.ravel(), CD.ravel()))[::-1]
+
+		with tempfile.TemporaryDirectory() as tmpdir:
+			datfile = os.path.join(tmpdir, 'aero.dat')
+			np.savetxt(datfile, rows)
+			table = loadAeroTable(datfile, 1, 3, 2, alphaCol=0)
+
+			np.savetxt(datfile, rows[1:])
+			with self.assertRaises(ValueError):
+				loadAeroTable(datfile, 1, 3, 2, alphaCol=0)
+
+		np.testing.assert_array_equal(table.CD, CD)
+		np.testing.assert_array_equal(table.CL, CL)
+
+
+class TestVehicleAeroTable(unittest.TestCase):
+	"""
+	Check that a vehicle with a Mach table gives the same trajectory
+	as the equivalent user defined CD(Mach) function.
+	"""
+
+	def test_table_matches_cd_mach_function(self):
+		planet = Planet("EARTH")
+		planet.loadAtmosphereModel('atmdata/Earth/earth-gram-avg.dat', 0, 1, 2, 3)
+
+		mach = TestAeroTable.mach
+		CD = 0.9 + 0.5*np.tanh(mach - 1.0)
+		f_int = interp1d(mach, CD, kind='linear', fill_value=(CD[0], CD[-1]), bounds_error=False)
+
+		def CDMach(x):
+			if np.size(x) == 1:
+				return float(f_int(x))
+			return f_int(x)
+
+		vehicle1 = Vehicle("Apollo-AS-201-A", 5400.0, 400.0, 0.3, 12.0, 0.0, 3.0, planet, userDefinedCDMach=True)
+		vehicle1.setCDMachFunction(CDMach)
+		vehicle2 = Vehicle("Apollo-AS-201-B", 5400.0, 400.0, 0.3, 12.0, 0.0, 3.0, planet)
+		vehicle2.setAeroTable(AeroTable(mach, CD, vehicle2.CL*np.ones(len(mach))))
+
+		for vehicle in [vehicle1, vehicle2]:
+			vehicle.setInitialState(120.0, 0.0, 0.0, 7.67, 0.0, -9.03, 0.0, 0.0)
+			vehicle.setSolverParams(1e-6)
+			vehicle.propogateEntry(2400.0, 0.1, 60.0)
+
+		np.testing.assert_allclose(vehicle2.h_kmc, vehicle1.h_kmc, rtol=1E-10)
+		np.testing.assert_allclose(vehicle2.acc_drag_g, vehicle1.acc_drag_g, rtol=1E-10, atol=1E-12)
+
+		D1 = vehicle1.Dvectorized(vehicle1.rc, vehicle1.thetac, vehicle1.phic, vehicle1.vc)
+		D2 = vehicle2.Dvectorized(vehicle1.rc, vehicle1.thetac, vehicle1.phic, vehicle1.vc)
+		np.testing.assert_allclose(D2, D1, rtol=1E-12)
+		self.assertTrue(np.all(vehicle2.CD_vec < CD[-1] + 1E-12))
+
+
+if __name__ == '__main__':
+	unittest.main()
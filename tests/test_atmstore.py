@@ -0,0 +1,182 @@
+"""
+test_atmstore.py
+
+Tests for the atmosphere table cache
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.atmstore import AtmosphereCache, AtmosphereTable, packAtmosphereStore, STORE_FILENAME
+	from AMAT.atmstore import cache as moduleCache
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import AtmosphereCache, AtmosphereTable, packAtmosphereStore, STORE_FILENAME, "
+							  "cache from AMAT.atmstore")
+
+
+class TestAtmosphereCache(unittest.TestCase):
+	"""
+	Check the in-memory cache and the sidecar files against
+	np.loadtxt().
+	"""
+
+	def setUp(self):
+		self.tmpdir = tempfile.mkdtemp()
+		self.datfile = os.path.join(self.tmpdir, 'LAT00N.txt')
+		shutil.copy('atmdata/Titan/LAT00N.txt', self.datfile)
+		self.reference = np.loadtxt(self.datfile)
+		self.cacheDir = os.path.join(self.tmpdir, 'cache')
+
+	def tearDown(self):
+		shutil.rmtree(self.tmpdir)
+
+	def test_memory_cache(self):
+		cache = AtmosphereCache(sidecar=False, cacheDir=self.cacheDir)
+		table = cache.load(self.datfile)
+
+		np.testing.assert_array_equal(table, self.reference)
+		self.assertFalse(table.flags.writeable)
+		self.assertIs(cache.load(self.datfile), table)
+		self.assertFalse(os.path.exists(self.cacheDir))
+
+	def test_sidecar(self):
+		AtmosphereCache(cacheDir=self.cacheDir).load(self.datfile)
+		npyfile, metafile = AtmosphereCache(cacheDir=self.cacheDir).sidecarFiles(self.datfile)
+		self.assertTrue(os.path.exists(npyfile))
+		self.assertTrue(os.path.exists(metafile))
+
+		# nothing is written next to the source file
+		self.assertEqual(sorted(os.listdir(self.tmpdir)), ['LAT00N.txt', 'cache'])
+
+		# a new process memory-maps the sidecar
+		table = AtmosphereCache(cacheDir=self.cacheDir).load(self.datfile)
+		self.assertIsInstance(table, np.memmap)
+		np.testing.assert_array_equal(table, self.reference)
+
+		# touching the source keeps the sidecar, the contents are unchanged
+		stat = os.stat(self.datfile)
+		os.utime(self.datfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+		self.assertIsInstance(AtmosphereCache(cacheDir=self.cacheDir).load(self.datfile), np.memmap)
+
+	def test_default_cache_dir(self):
+		with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.cacheDir}):
+			cache = AtmosphereCache()
+		self.assertEqual(cache.cacheDir, os.path.join(self.cacheDir, 'AMAT', 'atmcache'))
+
+		# sidecars of source files of the same name in different
+		# directories are kept apart
+		otherfile = os.path.join(self.tmpdir, 'other', 'LAT00N.txt')
+		self.assertNotEqual(cache.sidecarFiles(self.datfile), cache.sidecarFiles(otherfile))
+
+	def test_sidecar_invalidated(self):
+		cache = AtmosphereCache(cacheDir=self.cacheDir)
+		cache.load(self.datfile)
+
+		modified = self.reference.copy()
+		modified[0, 1] = 2*modified[0, 1]
+		np.savetxt(self.datfile, modified)
+		stat = os.stat(self.datfile)
+		os.utime(self.datfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+		np.testing.assert_array_equal(cache.load(self.datfile), modified)
+		np.testing.assert_array_equal(AtmosphereCache(cacheDir=self.cacheDir).load(self.datfile), modified)
+
+	def test_monte_carlo_density_file(self):
+		planet = Planet("TITAN")
+		with mock.patch.object(moduleCache, 'cacheDir', self.cacheDir):
+			ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, ATM_density_pert = \
+				planet.loadMonteCarloDensityFile2(self.datfile, 0, 1, 2, 3, 4, heightInKmFlag=True)
+
+		np.testing.assert_array_equal(ATM_height, self.reference[:, 0]*1E3)
+		np.testing.assert_array_equal(ATM_density_avg, self.reference[:, 2])
+		np.testing.assert_array_equal(ATM_density_pert, self.reference[:, 4] - self.reference[:, 2])
+
+
+class TestAtmosphereStore(unittest.TestCase):
+	"""
+	Pack a nominal and a Monte Carlo table into a store and check
+	the stored tables against np.loadtxt().
+	"""
+
+	def setUp(self):
+		self.tmpdir = tempfile.mkdtemp()
+		self.mcfile = os.path.join(self.tmpdir, 'LAT00N.txt')
+		self.nominalfile = os.path.join(self.tmpdir, 'titan-gram-avg.dat')
+		shutil.copy('atmdata/Titan/LAT00N.txt', self.mcfile)
+		shutil.copy('atmdata/Titan/titan-gram-avg.dat', self.nominalfile)
+
+		self.storefile = os.path.join(self.tmpdir, STORE_FILENAME)
+		self.store = packAtmosphereStore(self.storefile, [self.nominalfile, self.mcfile])
+
+	def tearDown(self):
+		shutil.rmtree(self.tmpdir)
+
+	def test_tables(self):
+		for datfile in [self.nominalfile, self.mcfile]:
+			table = self.store.table(os.path.basename(datfile))
+			reference = np.loadtxt(datfile)
+			self.assertEqual(table.shape, reference.shape)
+			for j in range(reference.shape[1]):
+				np.testing.assert_array_equal(table[:, j], reference[:, j])
+			np.testing.assert_array_equal(np.asarray(table), reference)
+
+		# repeated columns store a single period
+		self.assertLess(os.path.getsize(self.storefile), 0.2*os.path.getsize(self.mcfile))
+
+	def test_column_metadata(self):
+		table = self.store.table('LAT00N.txt')
+		self.assertEqual(table.roles[0:5], ['height', 'DENSLO', 'DENSAV', 'DENSHI', 'DENSTOT'])
+		self.assertEqual(table.heightUnits, 'km')
+
+		table = self.store.table('titan-gram-avg.dat')
+		self.assertEqual(table.roles, ['height', 'temp', 'pres', 'dens', 'sonic'])
+		self.assertEqual(table.columnIndex('dens'), 3)
+		self.assertEqual(table.heightUnits, 'm')
+
+	def test_transparent_load(self):
+		planet = Planet("TITAN")
+		cache = AtmosphereCache(sidecar=False)
+
+		self.assertIsInstance(cache.load(self.nominalfile), AtmosphereTable)
+		self.assertIsInstance(cache.load(self.storefile + '/LAT00N.txt'), AtmosphereTable)
+
+		planet.loadAtmosphereModel(self.nominalfile, 0, 1, 2, 3)
+		self.assertIs(type(planet.ATM), np.ndarray)
+		self.assertTrue(planet.ATM.flags.writeable)
+		np.testing.assert_array_equal(planet.ATM, np.loadtxt(self.nominalfile))
+		np.testing.assert_array_equal(planet.ATM_density, np.loadtxt(self.nominalfile)[:, 3])
+
+		# changes to a planet's table do not reach the shared table
+		planet.ATM[0, 3] = -1.0
+		np.testing.assert_array_equal(moduleCache.load(self.nominalfile)[:, 3], np.loadtxt(self.nominalfile)[:, 3])
+
+		ATM_height, ATM_density_low, ATM_density_avg, ATM_density_high, ATM_density_pert = \
+			planet.loadMonteCarloDensityFile2(self.mcfile, 0, 1, 2, 3, 4, heightInKmFlag=True)
+		np.testing.assert_array_equal(ATM_density_pert, np.loadtxt(self.mcfile)[:, 4] - np.loadtxt(self.mcfile)[:, 2])
+
+		# the store is used after the text table is removed, and not
+		# once the text table has changed
+		os.remove(self.mcfile)
+		self.assertIsInstance(cache.load(self.mcfile), AtmosphereTable)
+
+		reference = np.loadtxt(self.nominalfile)[::2]
+		np.savetxt(self.nominalfile, reference)
+		table = cache.load(self.nominalfile)
+		self.assertNotIsInstance(table, AtmosphereTable)
+		np.testing.assert_array_equal(table, reference)
+
+
+if __name__ == '__main__':
+	unittest.main()
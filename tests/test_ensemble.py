@@ -0,0 +1,68 @@
+"""
+test_ensemble.py
+
+Tests for Ensemble class
+
+"""
+
+import unittest
+import numpy as np
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.vehicle import Vehicle
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
+
+try:
+	from AMAT.ensemble import Ensemble
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Ensemble from AMAT.ensemble")
+
+
+class TestEnsemble(unittest.TestCase):
+	"""
+	Propogate an ensemble of Venus aerocapture trajectories and
+	compare each member with a single vehicle propogation.
+	"""
+
+	def test_ensemble_matches_vehicle(self):
+		planet = Planet("VENUS")
+		planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+
+		gamma0_deg = np.array([-4.5, -5.2, -6.0, -7.0])
+		delta_deg = np.array([0.0, 180.0, 0.0, 180.0])
+		beta = np.array([35.0, 35.0, 60.0, 60.0])
+		RN = np.array([0.5, 0.5, 1.0, 1.0])
+		heatLoad0 = np.array([0.0, 0.0, 100.0, 100.0])
+
+		ensemble = Ensemble(planet, beta, 0.24, RN)
+		ensemble.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, gamma0_deg, 0.0, heatLoad0)
+		ensemble.setSolverParams(1E-10)
+		ensemble.propogateEntry(1200.0, 0.1, delta_deg)
+
+		self.assertEqual(ensemble.N, 4)
+
+		for i in range(4):
+			vehicle = Vehicle('Test', 300.0, beta[i], 0.24, 300.0/(beta[i]*1.0), 0.0, RN[i], planet)
+			vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, gamma0_deg[i], 0.0, heatLoad0[i])
+			vehicle.setSolverParams(1E-10)
+			vehicle.propogateEntry(1200.0, 0.1, delta_deg[i])
+
+			self.assertEqual(ensemble.exitflag[i], vehicle.exitflag)
+			self.assertEqual(ensemble.index[i], vehicle.index)
+			np.testing.assert_allclose(ensemble.h_kmc[i], vehicle.h_kmc, atol=1E-5)
+			self.assertAlmostEqual(max(ensemble.q_stag_total[i]), max(vehicle.q_stag_total), delta=1E-3)
+			self.assertAlmostEqual(max(ensemble.acc_net_g[i]), max(vehicle.acc_net_g), delta=1E-4)
+			# Vehicle.propogateEntry() starts the heat load at zero
+			self.assertEqual(ensemble.heatload[i][0], heatLoad0[i])
+			self.assertAlmostEqual(ensemble.heatload[i][-1], vehicle.heatload[-1] + heatLoad0[i], delta=1E-3)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,188 @@
+"""
+test_feasibility.py
+
+Tests for FeasibilityGrid class
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.vehicle import Vehicle
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
+
+try:
+	from AMAT.feasibility import FeasibilityGrid
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import FeasibilityGrid from AMAT.feasibility")
+
+
+class TestFeasibilityGrid(unittest.TestCase):
+	"""
+	Compute small Venus lift and drag modulation feasibility grids
+	with and without warm starting.
+	"""
+
+	def setUp(self):
+		self.planet = Planet("VENUS")
+		self.planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+
+	def test_walk_order(self):
+		grid = FeasibilityGrid(self.planet, 'Apollo', 300.0, 78.0, 3.1416, 1.54, 180.0)
+		grid.setLiftModulationGrid(np.array([0.0, 5.0]), np.array([0.2, 0.3, 0.4]))
+
+		self.assertEqual(grid.walkOrder(), [(0, 0), (0, 1), (0, 2), (1, 2), (1, 1), (1, 0)])
+
+	def test_lift_modulation_warm_start_matches_cold_start(self):
+		grid = FeasibilityGrid(self.planet, 'Apollo', 300.0, 78.0, 3.1416, 1.54, 180.0)
+		grid.setLiftModulationGrid(np.array([0.0, 6.0]), np.array([0.2, 0.3, 0.4]))
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-6, 407.0)
+
+		grid.setWarmStartParams(False)
+		overShootLimit_ref, underShootLimit_ref, TCW_ref = [x.copy() for x in grid.computeFeasibility()]
+		evaluations_ref = grid.evaluations
+
+		grid.setWarmStartParams(True)
+		overShootLimit_array, underShootLimit_array, TCW_array = grid.computeFeasibility()
+
+		self.assertTrue(np.all(grid.exitflag_os_array == 1.0))
+		self.assertTrue(np.all(grid.exitflag_us_array == 1.0))
+		np.testing.assert_allclose(overShootLimit_array, overShootLimit_ref, atol=1E-4)
+		np.testing.assert_allclose(underShootLimit_array, underShootLimit_ref, atol=1E-4)
+		np.testing.assert_allclose(TCW_array, overShootLimit_array - underShootLimit_array)
+		self.assertLess(grid.evaluations, evaluations_ref)
+
+	def test_cell_matches_vehicle(self):
+		grid = FeasibilityGrid(self.planet, 'Apollo', 300.0, 78.0, 3.1416, 1.54, 180.0)
+		grid.setLiftModulationGrid(np.array([0.0, 6.0]), np.array([0.3]))
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-2, 407.0)
+		grid.computeFeasibility()
+
+		vehicle = Vehicle('Apollo', 300.0, 78.0, 0.3, 3.1416, 0.0, 1.54, self.planet)
+		vehicle.setInitialState(180.0, 0.0, 0.0, grid.v0_kms_array[0], 0.0, -4.5, 0.0, 0.0)
+		vehicle.setSolverParams(1E-6)
+		overShootLimit, exitflag_os = vehicle.findOverShootLimit(2400.0, 1.0, -80.0, -4.0, 1E-2, 407.0)
+
+		self.assertEqual(grid.overShootLimit_array[0, 0], overShootLimit)
+		self.assertEqual(grid.exitflag_os_array[0, 0], exitflag_os)
+
+	def test_drag_modulation(self):
+		self.planet.h_skip = 150.0E3
+		grid = FeasibilityGrid(self.planet, 'DMVehicle', 1500.0, 5.0, 3.1416, 0.10, 150.0)
+		grid.setDragModulationGrid(np.array([0.0, 6.0]), np.array([1.0, 11.0]))
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-4, 400.0)
+		grid.computeFeasibility()
+
+		# beta ratio of 1 has zero corridor width
+		self.assertAlmostEqual(grid.TCW_array[0, 0], 0.0, delta=2E-4)
+		self.assertTrue(np.all(grid.TCW_array[:, 1] > 0.1))
+
+
+class TestFeasibilityGridParallel(unittest.TestCase):
+	"""
+	Compute a small Venus lift modulation feasibility grid on a
+	process pool, and resume it from a partial results file.
+	"""
+
+	def setUp(self):
+		self.planet = Planet("VENUS")
+		self.planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+		self.folder = tempfile.mkdtemp()
+		self.resultsFile = os.path.join(self.folder, 'results.txt')
+
+	def tearDown(self):
+		shutil.rmtree(self.folder)
+
+	def createGrid(self):
+		grid = FeasibilityGrid(self.planet, 'Apollo', 300.0, 78.0, 3.1416, 1.54, 180.0)
+		grid.setLiftModulationGrid(np.array([0.0, 6.0]), np.array([0.2, 0.4]))
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-2, 407.0)
+		return grid
+
+	def test_parallel_matches_serial(self):
+		grid_ref = self.createGrid()
+		grid_ref.computeFeasibility(peakLoads=True)
+
+		grid = self.createGrid()
+		grid.computeFeasibilityParallel(self.resultsFile, processes=2, peakLoads=True)
+
+		np.testing.assert_allclose(grid.overShootLimit_array, grid_ref.overShootLimit_array, atol=1E-2)
+		np.testing.assert_allclose(grid.underShootLimit_array, grid_ref.underShootLimit_array, atol=1E-2)
+		np.testing.assert_allclose(grid.TCW_array, grid.overShootLimit_array - grid.underShootLimit_array)
+		np.testing.assert_allclose(grid.acc_net_g_max_array, grid_ref.acc_net_g_max_array, rtol=0.05)
+		self.assertTrue(np.all(grid.acc_net_g_max_array > 0.0))
+		self.assertTrue(np.all(grid.heatload_max_array > 0.0))
+
+	def test_resume(self):
+		grid_ref = self.createGrid()
+		grid_ref.computeFeasibilityParallel(self.resultsFile, processes=2)
+
+		# keep the first two cells and a truncated third line
+		n = len(grid_ref.resultsFileHeader()) + 2
+		with open(self.resultsFile, 'r') as f:
+			lines = f.read().split('\n')
+		with open(self.resultsFile, 'w') as f:
+			f.write('\n'.join(lines[0:n]) + '\n' + lines[n][0:10])
+
+		grid = self.createGrid()
+		grid.computeFeasibilityParallel(self.resultsFile, processes=2)
+
+		np.testing.assert_allclose(grid.overShootLimit_array, grid_ref.overShootLimit_array, atol=1E-2)
+		np.testing.assert_allclose(grid.underShootLimit_array, grid_ref.underShootLimit_array, atol=1E-2)
+		self.assertLess(grid.evaluations, grid_ref.evaluations)
+
+		grid.computeFeasibilityParallel(self.resultsFile, processes=2)
+		self.assertEqual(grid.evaluations, 0)
+
+	def test_resume_different_grid(self):
+		self.createGrid().loadResultsFile(self.resultsFile)
+
+		grid = self.createGrid()
+		grid.setLiftModulationGrid(np.array([0.0, 6.0]), np.array([0.2, 0.3]))
+		self.assertRaises(ValueError, grid.loadResultsFile, self.resultsFile)
+
+	def test_resume_different_search(self):
+		self.createGrid().loadResultsFile(self.resultsFile)
+
+		grid = self.createGrid()
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-2, 2000.0)
+		self.assertRaises(ValueError, grid.loadResultsFile, self.resultsFile)
+
+		grid = self.createGrid()
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-2, 407.0, method='illinois')
+		self.assertRaises(ValueError, grid.loadResultsFile, self.resultsFile)
+
+		grid = FeasibilityGrid(self.planet, 'Apollo', 600.0, 78.0, 3.1416, 1.54, 180.0)
+		grid.setLiftModulationGrid(np.array([0.0, 6.0]), np.array([0.2, 0.4]))
+		grid.setSearchParams(2400.0, 1.0, -80.0, -4.0, 1E-2, 407.0)
+		self.assertRaises(ValueError, grid.loadResultsFile, self.resultsFile)
+
+		grid = self.createGrid()
+		grid.peakLoads = True
+		self.assertRaises(ValueError, grid.loadResultsFile, self.resultsFile)
+
+		self.assertEqual(self.createGrid().loadResultsFile(self.resultsFile), set())
+
+	def test_save_results(self):
+		grid = self.createGrid()
+		grid.computeFeasibilityParallel(self.resultsFile, processes=2)
+		grid.saveResults(self.folder, 'run1_')
+
+		self.assertTrue(os.path.exists(os.path.join(self.folder, 'run1_LD_array.txt')))
+		self.assertFalse(os.path.exists(os.path.join(self.folder, 'run1_heatload_max_array.txt')))
+		np.testing.assert_allclose(np.loadtxt(os.path.join(self.folder, 'run1_TCW_array.txt')), grid.TCW_array)
+
+
+if __name__ == '__main__':
+	unittest.main()
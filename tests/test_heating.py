@@ -0,0 +1,103 @@
+"""
+test_heating.py
+
+Tests for the heating correlation registry
+
+"""
+
+import unittest
+import numpy as np
+from scipy.integrate import cumulative_trapezoid
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.vehicle import Vehicle
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
+
+try:
+	from AMAT.heating import HeatingRegistry, SuttonGraves, registry
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import HeatingRegistry, SuttonGraves, registry from AMAT.heating")
+
+
+class TestHeatingRegistry(unittest.TestCase):
+	"""
+	Check the registration and lookup of the heating correlations.
+	"""
+
+	def test_default_correlations(self):
+		for planetID in ['VENUS', 'EARTH', 'MARS', 'JUPITER', 'SATURN', 'TITAN', 'URANUS', 'NEPTUNE']:
+			self.assertIsNotNone(registry.convective(planetID))
+			self.assertIsNotNone(registry.radiative(planetID))
+
+		self.assertIsNone(registry.convective('PLUTO'))
+
+	def test_register(self):
+		heating = HeatingRegistry()
+		radiative = lambda rho, v, RN: 2.0*rho*v/RN
+		heating.register('PLUTO', convective=SuttonGraves(1.0E-8))
+		heating.register('PLUTO', radiative=radiative)
+
+		self.assertEqual(heating.convective('PLUTO').k, 1.0E-8)
+		self.assertIs(heating.radiative('PLUTO'), radiative)
+		self.assertIsNone(registry.convective('PLUTO'))
+
+
+class TestHeatingGrid(unittest.TestCase):
+	"""
+	Check the trajectory x nose radius heating grid against the
+	heating rates computed one nose radius at a time.
+	"""
+
+	def setUp(self):
+		self.planet = Planet("VENUS")
+		self.planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+		self.vehicle = Vehicle('Apollo', 300.0, 78.0, 0.35, 3.1416, 0.0, 1.54, self.planet)
+		self.vehicle.setInitialState(180.0, 0.0, 0.0, 11.0, 0.0, -5.5, 0.0, 0.0)
+		self.vehicle.setSolverParams(1E-6)
+		self.vehicle.propogateEntry(2400.0, 0.1, 0.0)
+		self.rn_array = np.linspace(0.5, 3.0, 6)
+
+	def test_grid_matches_single_nose_radius(self):
+		q_stag_con, q_stag_rad = self.vehicle.qStagHeating(self.vehicle.rc, self.vehicle.vc, self.rn_array)
+		self.assertEqual(q_stag_con.shape, (len(self.vehicle.rc), len(self.rn_array)))
+
+		for j, RN in enumerate(self.rn_array):
+			self.vehicle.RN = RN
+			np.testing.assert_allclose(q_stag_con[:, j], self.vehicle.qStagConvective(self.vehicle.rc,
+																					   self.vehicle.vc), rtol=1E-12)
+			np.testing.assert_allclose(q_stag_rad[:, j], self.vehicle.qStagRadiative(self.vehicle.rc,
+																					  self.vehicle.vc), rtol=1E-12)
+
+	def test_multiple_nose_radii_single_density_evaluation(self):
+		rhovectorized = self.planet.rhovectorized
+		calls = []
+
+		def counter(r):
+			calls.append(len(r))
+			return rhovectorized(r)
+
+		self.planet.rhovectorized = counter
+		q_stag_max, heatload = self.vehicle.computeHeatingForMultipleRN(self.vehicle.tc, self.vehicle.rc,
+																		 self.vehicle.vc, self.rn_array)
+		self.planet.rhovectorized = rhovectorized
+
+		self.assertEqual(len(calls), 1)
+		self.assertEqual(self.vehicle.RN, 1.54)
+
+		for j, RN in enumerate(self.rn_array):
+			self.vehicle.RN = RN
+			q_stag = self.vehicle.qStagTotal(self.vehicle.rc, self.vehicle.vc)
+			self.assertAlmostEqual(q_stag_max[j], max(q_stag), delta=1E-9*max(q_stag))
+			self.assertAlmostEqual(heatload[j], cumulative_trapezoid(q_stag, self.vehicle.tc, initial=0)[-1],
+								   delta=1E-9*heatload[j])
+
+
+if __name__ == '__main__':
+	unittest.main()
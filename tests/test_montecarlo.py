@@ -0,0 +1,335 @@
+"""
+test_montecarlo.py
+
+Tests for the Monte Carlo executor
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.vehicle import Vehicle
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
+
+try:
+	from AMAT.montecarlo import MonteCarloExecutor, MonteCarloSink, loadMonteCarloResults, \
+		varianceReduction, OUTCOMES, SUMMARIES
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import MonteCarloExecutor, MonteCarloSink, loadMonteCarloResults, "
+							  "varianceReduction, OUTCOMES, SUMMARIES from AMAT.montecarlo")
+
+
+class TestMonteCarloExecutor(unittest.TestCase):
+	"""
+	Check the per-run seeding and that the campaign results do not
+	depend on the number of workers.
+	"""
+
+	def setUp(self):
+		planet = Planet('VENUS')
+		planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+		planet.h_skip = 150000.0
+
+		self.vehicle = Vehicle('DMVehicle', 68.2, 38.1, 0.0, 3.1416, 0.0, 0.10, planet)
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -5.50, 0.0, 0.0)
+		self.vehicle.setSolverParams(1E-6)
+		self.vehicle.setDragModulationVehicleParams(38.1, 7.5)
+		self.vehicle.setDragEntryPhaseParams(6.0, 80.0, 101, -300.0)
+		self.vehicle.setTargetOrbitParams(200.0, 2000.0, 50.0)
+
+		atmfiles = ['atmdata/Venus/LAT10N.txt', 'atmdata/Venus/LAT40S.txt']
+		self.vehicle.setupMonteCarloSimulationD(151, 200, atmfiles, 0, 1, 2, 3, 4, True,
+												-5.40, 0.033, 38.1, 0.0, 1.0, 1.0, 0.1, 1200.0)
+
+		self.tempdir = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.tempdir)
+
+	def test_sample_depends_on_seed_and_run_index(self):
+		executor1 = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=12)
+		executor2 = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=12)
+		executor3 = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=13)
+
+		self.assertEqual(executor1.sample(5), executor2.sample(5))
+		self.assertNotEqual(executor1.sample(5), executor1.sample(6))
+		self.assertNotEqual(executor1.sample(5), executor3.sample(5))
+
+		sample = executor1.sample(5)
+		self.assertIn(sample['atmfile'], self.vehicle.atmfiles)
+		self.assertTrue(1 <= sample['profile'] <= 200)
+		self.assertEqual(sample['LD'], 0.0)
+
+	def test_master_seed_drawn_if_not_given(self):
+		executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD')
+		self.assertIsInstance(executor.masterSeed, int)
+
+		with self.assertRaises(ValueError):
+			MonteCarloExecutor(self.vehicle, 'propogateEntry')
+
+	def test_results_independent_of_workers(self):
+		folder1 = os.path.join(self.tempdir, 'MCB1')
+		folder2 = os.path.join(self.tempdir, 'MCB2')
+
+		results1 = self.vehicle.runMonteCarloD(3, folder1, masterSeed=2026, workers=1, legacyText=True)
+		results2 = self.vehicle.runMonteCarloD(3, folder2, masterSeed=2026, workers=2)
+		self.assertEqual(self.vehicle.masterSeed, 2026)
+
+		for name in results1.columns:
+			np.testing.assert_array_equal(results1.columns[name], results2.columns[name])
+
+		for name in SUMMARIES:
+			arr1 = np.loadtxt(os.path.join(folder1, name + '_arr.txt'))
+			arr2 = np.loadtxt(os.path.join(folder2, name + '_arr.txt'))
+			np.testing.assert_array_equal(arr1, arr2)
+			self.assertEqual(len(arr1), 3)
+
+		for i in range(3):
+			with open(os.path.join(folder1, '#' + str(i + 1), 'atmfile.txt')) as f:
+				self.assertEqual(f.read().strip(), results2.atmfile_arr[i])
+			self.assertEqual(np.loadtxt(os.path.join(folder1, '#' + str(i + 1), 'terminal_apoapsis.txt')),
+							 results2.terminal_apoapsis_arr[i])
+
+		self.assertFalse(os.path.exists(os.path.join(folder2, '#1')))
+
+	def test_sink_batches_and_loader(self):
+		executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=4)
+		os.makedirs(os.path.join(self.tempdir, 'MCB'))
+		sink = MonteCarloSink(os.path.join(self.tempdir, 'MCB'), self.vehicle.atmfiles, executor.masterSeed,
+							  flushEvery=2)
+
+		rows = []
+		for i in [0, 2, 1]:
+			row = executor.sample(i)
+			row.update({name: float(i) for name in OUTCOMES})
+			rows.append(row)
+			sink.append(i, row)
+
+		# two rows written, one buffered
+		self.assertEqual(len(loadMonteCarloResults(os.path.join(self.tempdir, 'MCB'))), 2)
+		sink.flush()
+
+		results = loadMonteCarloResults(os.path.join(self.tempdir, 'MCB'))
+		self.assertEqual(results.masterSeed, 4)
+		np.testing.assert_array_equal(results.run_arr, [0, 1, 2])
+		np.testing.assert_array_equal(results.terminal_apoapsis_arr, [0.0, 1.0, 2.0])
+		self.assertEqual(results.efpa_arr[2], rows[1]['efpa'])
+		self.assertEqual(results.atmfile_arr[1], rows[2]['atmfile'])
+
+		with self.assertRaises(AttributeError):
+			results.terminal_velocity_arr
+
+		# a row interrupted during a write is ignored
+		with open(os.path.join(self.tempdir, 'MCB', 'results', 'efpa.bin'), 'ab') as f:
+			f.write(np.zeros(1).tobytes())
+		self.assertEqual(len(loadMonteCarloResults(os.path.join(self.tempdir, 'MCB'))), 3)
+
+	def test_resume_interrupted_campaign(self):
+		folder1 = os.path.join(self.tempdir, 'MCB1')
+		folder2 = os.path.join(self.tempdir, 'MCB2')
+
+		results1 = self.vehicle.runMonteCarloD(4, folder1, masterSeed=99)
+
+		executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=99)
+		simulate = executor.simulate
+
+		def interrupted(runIndex):
+			if runIndex == 2:
+				raise KeyboardInterrupt
+			return simulate(runIndex)
+
+		executor.simulate = interrupted
+		with self.assertRaises(KeyboardInterrupt):
+			executor.runCampaign(4, folder2, flushEvery=10)
+
+		# the buffered runs are saved when interrupted
+		np.testing.assert_array_equal(loadMonteCarloResults(folder2).run_arr, [0, 1])
+
+		with self.assertRaises(FileExistsError):
+			self.vehicle.runMonteCarloD(4, folder2)
+		with self.assertRaises(ValueError):
+			self.vehicle.runMonteCarloD(4, folder2, masterSeed=98, resume=True)
+
+		# a partially written row is discarded on resume
+		with open(os.path.join(folder2, 'results', 'run.bin'), 'ab') as f:
+			f.write(np.array([3]).astype('<i8').tobytes())
+
+		results2 = self.vehicle.runMonteCarloD(4, folder2, resume=True)
+		self.assertEqual(self.vehicle.masterSeed, 99)
+
+		for name in results1.columns:
+			np.testing.assert_array_equal(results1.columns[name], results2.columns[name])
+		for name in SUMMARIES:
+			np.testing.assert_array_equal(np.loadtxt(os.path.join(folder1, name + '_arr.txt')),
+										  np.loadtxt(os.path.join(folder2, name + '_arr.txt')))
+
+	def test_resume_with_different_settings(self):
+		folder = os.path.join(self.tempdir, 'MCB')
+		self.vehicle.runMonteCarloD(1, folder, masterSeed=5)
+
+		with self.assertRaisesRegex(ValueError, 'guidance'):
+			self.vehicle.runMonteCarloD2(2, folder, masterSeed=5, resume=True)
+		with self.assertRaisesRegex(ValueError, 'earthAtmosphere'):
+			MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', earthAtmosphere=True,
+							   masterSeed=5).runCampaign(2, folder, resume=True)
+
+		self.vehicle.nominalEFPA = -5.45
+		with self.assertRaisesRegex(ValueError, 'nominalEFPA'):
+			self.vehicle.runMonteCarloD(2, folder, resume=True)
+		self.vehicle.nominalEFPA = -5.40
+
+		self.vehicle.mass = 70.0
+		with self.assertRaisesRegex(ValueError, 'mass'):
+			self.vehicle.runMonteCarloD(2, folder, resume=True)
+		self.vehicle.mass = 68.2
+
+		self.vehicle.vehicleCopy.h0_km_ref = 140.0
+		with self.assertRaisesRegex(ValueError, 'initialState'):
+			self.vehicle.runMonteCarloD(2, folder, resume=True)
+		self.vehicle.vehicleCopy.h0_km_ref = 150.0
+
+		results = self.vehicle.runMonteCarloD(2, folder, resume=True)
+		np.testing.assert_array_equal(results.run_arr, [0, 1])
+
+	def test_run_matches_direct_propogation(self):
+		executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=7)
+		result = executor.simulate(0)
+
+		planet = self.vehicle.planetObj
+		ATM = planet.loadMonteCarloDensityFile2(result['atmfile'], 0, 1, 2, 3, 4, True)
+		planet.density_int = planet.loadAtmosphereModel5(*ATM, result['atmSigma'], 151, result['profile'])
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, result['efpa'], 0.0, 0.0)
+		self.vehicle.propogateGuidedEntryD(1.0, 1.0, 0.1, 1200.0)
+
+		self.assertEqual(result['terminal_apoapsis'], self.vehicle.terminal_apoapsis)
+		self.assertEqual(result['heatload_max'], max(self.vehicle.heatload_full))
+
+
+class TestMonteCarloSamplers(unittest.TestCase):
+	"""
+	Check the Latin hypercube, Sobol and stratified designs of the
+	dispersions and the variance reduction diagnostics.
+	"""
+
+	def setUp(self):
+		planet = Planet('VENUS')
+		self.vehicle = Vehicle('DMVehicle', 68.2, 38.1, 0.0, 3.1416, 0.0, 0.10, planet)
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -5.50, 0.0, 0.0)
+
+		atmfiles = ['atmdata/Venus/LAT10N.txt', 'atmdata/Venus/LAT40S.txt', 'atmdata/Venus/LAT80N.txt']
+		self.vehicle.setupMonteCarloSimulationD(151, 200, atmfiles, 0, 1, 2, 3, 4, True,
+												-5.40, 0.033, 38.1, 0.0, 1.0, 1.0, 0.1, 1200.0)
+
+	def test_lhs_and_sobol_stratify_each_dimension(self):
+		for sampler in ['lhs', 'sobol']:
+			executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=3, sampler=sampler)
+			executor.setDesign(64)
+
+			for column in executor.design.T:
+				np.testing.assert_array_equal(np.sort((column*64).astype(int)), np.arange(64))
+
+			samples = [executor.sample(i) for i in range(64)]
+			self.assertLess(abs(np.mean([sample['efpa'] for sample in samples]) + 5.40), 0.033/64**0.5)
+
+			executor2 = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=3, sampler=sampler)
+			executor2.setDesign(64)
+			np.testing.assert_array_equal(executor.design, executor2.design)
+
+	def test_stratified_files_and_profiles(self):
+		executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=3, sampler='stratified')
+		diagnostics = executor.designDiagnostics(100)
+
+		self.assertLessEqual(np.ptp(diagnostics['fileCounts']), 1)
+		self.assertEqual(diagnostics['profiles'], 100)
+
+		# the continuous dispersions are those of the random sampler
+		random = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=3)
+		self.assertEqual(executor.sample(7)['efpa'], random.sample(7)['efpa'])
+		self.assertEqual(executor.sample(7)['atmSigma'], random.sample(7)['atmSigma'])
+
+	def test_design_independent_of_previous_design(self):
+		for sampler in ['lhs', 'sobol', 'stratified']:
+			executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=3, sampler=sampler)
+			executor.designDiagnostics(10)
+			executor.designDiagnostics(20)
+			self.assertEqual(len(executor.design), 20)
+
+			executor.setDesign(8)
+			fresh = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=3, sampler=sampler)
+			fresh.setDesign(8)
+			np.testing.assert_array_equal(executor.design, fresh.design)
+
+	def test_design_diagnostics(self):
+		discrepancy = {}
+		for sampler in ['random', 'lhs', 'sobol']:
+			executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=5, sampler=sampler)
+			discrepancy[sampler] = executor.designDiagnostics(128)['discrepancy']
+
+		self.assertLess(discrepancy['lhs'], discrepancy['random'])
+		self.assertLess(discrepancy['sobol'], discrepancy['random'])
+
+		executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', sampler='lhs')
+		with self.assertRaises(ValueError):
+			executor.sample(0)
+		with self.assertRaises(ValueError):
+			MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', sampler='halton')
+
+	def test_variance_reduction(self):
+		statistic = lambda values: np.mean(values)
+		baseline = [np.random.default_rng(i).normal(size=100) for i in range(50)]
+		design = [np.random.default_rng(i).normal(size=100)/4.0 for i in range(50, 100)]
+
+		ans = varianceReduction(statistic, baseline, design)
+		self.assertAlmostEqual(ans['baselineStd'], 0.1, delta=0.03)
+		self.assertGreater(ans['varianceRatio'], 8.0)
+		self.assertEqual(ans['equivalentRuns'], ans['varianceRatio']*100)
+
+		with self.assertRaises(ValueError):
+			varianceReduction(statistic, baseline[0:1], design)
+
+	def test_campaign_with_design_sampler(self):
+		planet = self.vehicle.planetObj
+		planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+		planet.h_skip = 150000.0
+		self.vehicle.setSolverParams(1E-6)
+		self.vehicle.setDragModulationVehicleParams(38.1, 7.5)
+		self.vehicle.setDragEntryPhaseParams(6.0, 80.0, 101, -300.0)
+		self.vehicle.setTargetOrbitParams(200.0, 2000.0, 50.0)
+		self.vehicle.setupMonteCarloSimulationD(151, 200, self.vehicle.atmfiles, 0, 1, 2, 3, 4, True,
+												-5.40, 0.033, 38.1, 0.0, 1.0, 1.0, 0.1, 1200.0)
+
+		tempdir = tempfile.mkdtemp()
+		try:
+			folder1 = os.path.join(tempdir, 'MCB1')
+			folder2 = os.path.join(tempdir, 'MCB2')
+			results1 = self.vehicle.runMonteCarloD(2, folder1, masterSeed=8, sampler='sobol')
+			results2 = self.vehicle.runMonteCarloD(2, folder2, masterSeed=8, sampler='sobol', workers=2)
+
+			for name in results1.columns:
+				np.testing.assert_array_equal(results1.columns[name], results2.columns[name])
+
+			executor = MonteCarloExecutor(self.vehicle, 'propogateGuidedEntryD', masterSeed=8, sampler='sobol')
+			executor.setDesign(2)
+			self.assertEqual(results1.efpa_arr[1], executor.sample(1)['efpa'])
+
+			with self.assertRaises(ValueError):
+				self.vehicle.runMonteCarloD(2, folder1, masterSeed=8, sampler='lhs', resume=True)
+			with self.assertRaises(ValueError):
+				self.vehicle.runMonteCarloD(4, folder1, masterSeed=8, sampler='sobol', resume=True)
+		finally:
+			shutil.rmtree(tempdir)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -7,10 +7,12 @@ atmospheric profiles.
 """
 
 import unittest
+import numpy as np
+from scipy.interpolate import interp1d
 
 
 try:
-	from AMAT.planet import Planet
+	from AMAT.planet import Planet, UniformGridInterpolator, DensityProfileBank
 except ModuleNotFoundError:
 	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
 
@@ -339,5 +341,115 @@ class TestAtmosphereValues(unittest.TestCase):
 		self.assertAlmostEqual(planet8.density(h=0.0), 0.44021, places=2)
 
 
+class TestUniformGridInterpolator(unittest.TestCase):
+
+	def test_uniform_grid_matches_interp1d(self):
+		planet = Planet("VENUS")
+		planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+		self.assertIsInstance(planet.density_int, UniformGridInterpolator)
+
+		h = np.linspace(-5.0E3, 260.0E3, 5001)
+		for kind in ['linear', 'cubic']:
+			for y, fill in [(planet.ATM_density, 0.0), (planet.ATM_sonic, 1E20)]:
+				ref = interp1d(planet.ATM_height, y, kind=kind, fill_value=fill, bounds_error=False)
+				fast = UniformGridInterpolator(planet.ATM_height, y, kind=kind, fill_value=fill)
+				np.testing.assert_allclose(fast(h), ref(h), rtol=1E-13)
+				for hi in h[::50]:
+					self.assertAlmostEqual(fast(hi), float(ref(hi)), delta=1E-13*abs(float(ref(hi))))
+
+	def test_density_and_sonic(self):
+		planet = Planet("VENUS")
+		planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+		self.assertTrue(planet.density_int.sharesGrid(planet.sonic_int))
+
+		for h in np.linspace(-5.0E3, 260.0E3, 531):
+			rho, sonic = planet.densityAndSonic(h)
+			self.assertEqual(rho, planet.density(h))
+			self.assertEqual(sonic, float(planet.sonic_int(h)))
+
+	def test_non_uniform_grid_fallback(self):
+		planet = Planet("TITAN")
+		planet.loadAtmosphereModel('atmdata/Titan/titan-gram-avg.dat', 0, 1, 2, 3)
+		self.assertIsInstance(planet.density_int, interp1d)
+
+		planet.loadAtmosphereModel('atmdata/Titan/titan-gram-avg.dat', 0, 1, 2, 3, intType='quadratic')
+		self.assertIsInstance(planet.density_int, interp1d)
+
+	def test_density_derivative_table_edges(self):
+		planet = Planet("TITAN")
+		planet.loadAtmosphereModel('atmdata/Titan/titan-gram-avg.dat', 0, 1, 2, 3)
+		self.assertIsInstance(planet.density_int, interp1d)
+
+		# near the bottom of the table, the central difference would
+		# read the fill value below h = 0
+		x, y = planet.density_int.x, planet.density_int.y
+		slope = (y[1] - y[0])/(x[1] - x[0])
+		for h in [0.0, 0.2, 0.49, 0.6]:
+			self.assertAlmostEqual(planet.densityDerivative(h), slope, delta=5E-2*abs(slope))
+		self.assertLess(planet.densityDerivative(0.0), 0.0)
+
+		# same at the top, with h_thres raised to the end of the table
+		planet.h_thres = x[-1]
+		slope = (y[-1] - y[-2])/(x[-1] - x[-2])
+		for h in [planet.h_thres, planet.h_thres - 0.2]:
+			self.assertAlmostEqual(planet.densityDerivative(h), slope, delta=5E-2*abs(slope) + 1E-30)
+
+	def test_with_values(self):
+		x = np.linspace(0.0, 100.0E3, 101)
+		template = UniformGridInterpolator(x, np.exp(-x/7.0E3), kind='cubic')
+		y = np.exp(-x/9.0E3)
+
+		fast = template.withValues(y)
+		ref = UniformGridInterpolator(x, y, kind='cubic')
+		np.testing.assert_array_equal(fast.c, ref.c)
+		self.assertEqual(fast(42.0E3), ref(42.0E3))
+		self.assertEqual(template(42.0E3), UniformGridInterpolator(x, np.exp(-x/7.0E3), kind='cubic')(42.0E3))
+
+
+class TestDensityProfileBank(unittest.TestCase):
+
+	def setUp(self):
+		self.planet = Planet("VENUS")
+		self.atmfile = 'atmdata/Venus/LAT10N.txt'
+		self.ATM = self.planet.loadMonteCarloDensityFile2(self.atmfile, 0, 1, 2, 3, 4, heightInKmFlag=True)
+
+		self.bank = DensityProfileBank(151)
+		self.bank.add(self.atmfile, *self.ATM)
+
+	def test_matches_load_atmosphere_model5(self):
+		h = np.linspace(-5.0E3, 160.0E3, 3301)
+
+		for i, sigma in [(1, 0.0), (37, 1.8), (200, -2.4)]:
+			ref = self.planet.loadAtmosphereModel5(*self.ATM, sigma, 151, i)
+			h_array, d_array = self.bank.profile(self.atmfile, i, sigma)
+			np.testing.assert_array_equal(h_array, ref.x)
+			np.testing.assert_array_equal(d_array, ref.y)
+
+			density_int = self.bank.densityInterpolator(self.atmfile, i, sigma)
+			self.assertIsInstance(density_int, UniformGridInterpolator)
+			np.testing.assert_array_equal(density_int(h), ref(h))
+			for hi in h[::30]:
+				self.assertEqual(density_int(hi), float(ref(hi)))
+
+	def test_non_uniform_grid_fallback(self):
+		ATM_height = self.ATM[0].copy()
+		ATM_height[1::151] += 100.0
+		self.bank.add('perturbed', ATM_height, *self.ATM[1:])
+
+		ref = self.planet.loadAtmosphereModel5(ATM_height, *self.ATM[1:], 0.5, 151, 3)
+		density_int = self.bank.densityInterpolator('perturbed', 3, 0.5)
+		self.assertIsInstance(density_int, interp1d)
+
+		h = np.linspace(0.0, 150.0E3, 301)
+		np.testing.assert_array_equal(density_int(h), ref(h))
+
+	def test_invalid_profile(self):
+		self.assertIn(self.atmfile, self.bank)
+		with self.assertRaises(IndexError):
+			self.bank.profile(self.atmfile, 201, 0.0)
+		with self.assertRaises(IndexError):
+			self.bank.profile(self.atmfile, 0, 0.0)
+
+
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,176 @@
+"""
+test_trajectory.py
+
+Tests for TrajectoryResult class
+
+"""
+
+import copy
+import unittest
+import numpy as np
+from scipy.integrate import cumulative_trapezoid
+
+
+try:
+	from AMAT.planet import Planet
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Planet from AMAT.planet")
+
+try:
+	from AMAT.vehicle import Vehicle
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
+
+try:
+	from AMAT.trajectory import TrajectoryResult, TrajectoryLog
+except ModuleNotFoundError:
+	raise ModuleNotFoundError("Cannot import TrajectoryResult, TrajectoryLog from AMAT.trajectory")
+
+
+class TestTrajectoryResult(unittest.TestCase):
+	"""
+	Propogate a Venus entry trajectory and check the trajectory
+	result against the dimensional solver output.
+	"""
+
+	def setUp(self):
+		self.planet = Planet("VENUS")
+		self.planet.loadAtmosphereModel('atmdata/Venus/venus-gram-avg.dat', 0, 1, 2, 3)
+
+		self.vehicle = Vehicle('Apollo', 300.0, 78.0, 0.35, 3.1416, 0.0, 1.54, self.planet)
+		self.vehicle.setInitialState(180.0, 0.0, 0.0, 11.0, 0.0, -5.5, 0.0, 0.0)
+		self.vehicle.setSolverParams(1E-6)
+
+	def test_vehicle_attributes_are_views(self):
+		self.assertIsNone(self.vehicle.trajectory)
+		self.assertIsNone(self.vehicle.h_kmc)
+
+		self.vehicle.propogateEntry(2400.0, 1.0, 60.0)
+		trajectory = self.vehicle.trajectory
+
+		self.assertIsInstance(trajectory, TrajectoryResult)
+		self.assertEqual(len(trajectory), self.vehicle.index)
+		self.assertEqual(trajectory.data.shape, (len(TrajectoryResult.fields), self.vehicle.index))
+		self.assertTrue(trajectory.data.flags['C_CONTIGUOUS'])
+
+		for name in TrajectoryResult.fields:
+			self.assertTrue(np.shares_memory(getattr(self.vehicle, name), trajectory.data))
+
+	def test_vehicle_attributes_assignable(self):
+		self.vehicle.heatload = np.zeros(3)
+		np.testing.assert_array_equal(self.vehicle.heatload, np.zeros(3))
+
+		self.vehicle.propogateEntry(2400.0, 1.0, 60.0)
+		trajectory = self.vehicle.trajectory
+		h_kmc = self.vehicle.h_kmc + 1.0
+		self.vehicle.h_kmc = h_kmc
+		self.vehicle.heatload = None
+
+		self.assertIs(self.vehicle.h_kmc, h_kmc)
+		self.assertIsNone(self.vehicle.heatload)
+		self.assertIsNotNone(trajectory.heatload)
+		np.testing.assert_array_equal(trajectory.h_kmc, h_kmc - 1.0)
+
+		# shallow copies keep their own assigned values
+		vehicleCopy = copy.copy(self.vehicle)
+		vehicleCopy.heatload = trajectory.heatload
+		self.assertIsNone(self.vehicle.heatload)
+
+		# the next propogation replaces the assigned values
+		self.vehicle.propogateEntry(2400.0, 1.0, 120.0)
+		self.assertEqual(len(self.vehicle.h_kmc), self.vehicle.index)
+		np.testing.assert_array_equal(self.vehicle.h_kmc, self.vehicle.trajectory.h_kmc)
+		np.testing.assert_array_equal(self.vehicle.heatload, self.vehicle.trajectory.heatload)
+
+	def test_matches_dimensional_solution(self):
+		self.vehicle.propogateEntry(2400.0, 1.0, 60.0)
+		vehicle = self.vehicle
+
+		h0 = vehicle.planetObj.computeR(180.0E3)
+		rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0 = \
+			self.planet.nonDimState(h0, 0.0, 0.0, 11.0E3, 0.0, -5.5*np.pi/180.0, 0.0)
+		solution = vehicle.solveTrajectory(rbar0, theta0, phi0, vbar0, psi0, gamma0, drangebar0, 2400.0, 1.0,
+										   60.0*np.pi/180.0)
+		t, r, theta, phi, v, psi, gamma, drange = self.planet.dimensionalize(*solution)
+		t_min, h_km, v_kms, phi_deg, psi_deg, theta_deg, gamma_deg, drange_km = \
+			vehicle.convertToPlotUnits(t, r, v, phi, psi, theta, gamma, drange)
+
+		index = vehicle.index
+		np.testing.assert_array_equal(vehicle.tc, t[0:index])
+		np.testing.assert_array_equal(vehicle.rc, r[0:index])
+		np.testing.assert_array_equal(vehicle.drangec, drange[0:index])
+		np.testing.assert_array_equal(vehicle.t_minc, t_min[0:index])
+		np.testing.assert_array_equal(vehicle.h_kmc, h_km[0:index])
+		np.testing.assert_array_equal(vehicle.gamma_degc, gamma_deg[0:index])
+		np.testing.assert_array_equal(vehicle.q_stag_total, vehicle.q_stag_con + vehicle.q_stag_rad)
+		np.testing.assert_array_equal(vehicle.heatload, cumulative_trapezoid(vehicle.q_stag_total, vehicle.tc,
+																			 initial=0))
+
+	def test_loads_deferred(self):
+		vehicle = self.vehicle
+		vehicle.propogateEntry(2400.0, 1.0, 60.0)
+		trajectory = vehicle.trajectory
+		self.assertFalse(trajectory.loadsComputed)
+
+		q_stag_con, q_stag_rad = vehicle.qStagHeating(vehicle.rc, vehicle.vc, vehicle.RN)
+		dyn_pres_atm = vehicle.computeDynPres(vehicle.rc, vehicle.vc)/1.01325E5
+
+		# loads use the vehicle state at propogation
+		vehicle.RN = 2*vehicle.RN
+		heatload = vehicle.heatload
+
+		self.assertTrue(trajectory.loadsComputed)
+		self.assertIsNone(trajectory.loadsCallback)
+		np.testing.assert_array_equal(vehicle.q_stag_con, q_stag_con)
+		np.testing.assert_array_equal(vehicle.q_stag_rad, q_stag_rad)
+		np.testing.assert_array_equal(vehicle.dyn_pres_atm, dyn_pres_atm)
+		self.assertTrue(np.shares_memory(vehicle.heatload, heatload))
+
+		vehicle.propogateEntry(2400.0, 1.0, 60.0)
+		self.assertFalse(vehicle.trajectory.loadsComputed)
+		np.testing.assert_array_equal(vehicle.q_stag_con, vehicle.qStagHeating(vehicle.rc, vehicle.vc, vehicle.RN)[0])
+
+	def test_loads_not_computed(self):
+		self.vehicle.propogateEntrySensitivity(2400.0, 1.0, 60.0)
+
+		self.assertEqual(len(self.vehicle.tc), self.vehicle.index)
+		self.assertIsNone(self.vehicle.acc_net_g)
+		self.assertIsNone(self.vehicle.heatload)
+
+
+class TestTrajectoryLog(unittest.TestCase):
+	"""
+	Check the growable trajectory log against np.concatenate.
+	"""
+
+	def test_append_matches_concatenate(self):
+		log = TrajectoryLog(capacity=4)
+		rng = np.random.default_rng(1)
+
+		h_km = np.array([0.0])
+		log.append('h_km', 0.0)
+		for i in range(50):
+			h_km_c = rng.random(rng.integers(0, 7))
+			h_km = np.concatenate((h_km, h_km_c), axis=0)
+			view = log.append('h_km', h_km_c)
+			np.testing.assert_array_equal(view, h_km)
+
+		self.assertGreaterEqual(len(log.buffers['h_km']), len(h_km))
+		self.assertLess(len(log.buffers['h_km']), 2*len(h_km))
+
+		h_km_log = log.finalize('h_km')
+		np.testing.assert_array_equal(h_km_log, h_km)
+		self.assertEqual(len(h_km_log), len(h_km))
+		self.assertFalse(np.shares_memory(h_km_log, log.buffers['h_km']))
+
+	def test_fields_grow_independently(self):
+		log = TrajectoryLog()
+		log.append('acc_step_array', [0.0, 1.0])
+		log.append('t_step_array', 0.0)
+
+		np.testing.assert_array_equal(log['acc_step_array'], [0.0, 1.0])
+		np.testing.assert_array_equal(log['t_step_array'], [0.0])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -5,8 +5,11 @@ Tests for Vehicle class
 
 """
 
+import contextlib
+import io
 import unittest
 import numpy as np
+from scipy.interpolate import interp1d
 
 
 try:
@@ -20,6 +23,47 @@ except ModuleNotFoundError:
 	raise ModuleNotFoundError("Cannot import Vehicle from AMAT.vehicle")
 
 
+# GRAM average atmosphere of each planet used by the tests below
+ATMDATA = {'VENUS': 'atmdata/Venus/venus-gram-avg.dat',
+		   'EARTH': 'atmdata/Earth/earth-gram-avg.dat'}
+
+# vehicle parameters used by the tests below, see Vehicle()
+APOLLO = ('Apollo', 300.0, 78.0, 0.35, 3.1416, 0.0, 1.54)
+LIFTING = ('Test', 300.0, 35.0, 0.24, 3.1416, 0.0, 0.50)
+
+
+def createPlanet(planetID):
+	"""
+	Creates a planet with its GRAM average atmosphere.
+	"""
+	planet = Planet(planetID)
+	planet.loadAtmosphereModel(ATMDATA[planetID], 0, 1, 2, 3)
+	return planet
+
+
+class VehicleTestCase(unittest.TestCase):
+	"""
+	Shared setUp of the tests below. Creates self.planet and a 
+	vehicle flying in it, self.vehicle. Subclasses choose the 
+	planet, the vehicle parameters and optionally the initial 
+	state and the solver tolerance.
+	"""
+
+	planetID = 'VENUS'
+	vehicleParams = APOLLO
+	initialState = None
+	solverTol = None
+
+	def setUp(self):
+		self.planet = createPlanet(self.planetID)
+		self.vehicle = Vehicle(*self.vehicleParams, self.planet)
+
+		if self.initialState is not None:
+			self.vehicle.setInitialState(*self.initialState)
+		if self.solverTol is not None:
+			self.vehicle.setSolverParams(self.solverTol)
+
+
 class TestBallisticEntries(unittest.TestCase):
 	"""
 	Create vehicles and propagate a few ballistic planetary
@@ -89,6 +133,452 @@ class TestBallisticEntries(unittest.TestCase):
 		self.assertEqual(vehicle3.exitflag, -1.0)
 
 
+class TestFusedEOM(VehicleTestCase):
+	"""
+	Check the fused right hand side against the reference EOM.
+	"""
+
+	vehicleParams = LIFTING
+
+	def test_fused_rhs_matches_eom(self):
+		rng = np.random.default_rng(0)
+		for i in range(50):
+			y = np.array([1.0 + rng.uniform(0, 0.03), rng.uniform(-3, 3),
+						  rng.uniform(-1.4, 1.4), rng.uniform(0.1, 2.0),
+						  rng.uniform(-3, 3), rng.uniform(-1.5, 0.5), 0.0])
+			delta = rng.uniform(0, np.pi)
+			dydt_ref = np.array(self.vehicle.EOM(y, 0.0, delta))
+			np.testing.assert_allclose(self.vehicle.EOMFused(y, 0.0, delta), dydt_ref, rtol=1e-13, atol=0)
+			np.testing.assert_allclose(self.vehicle.EOM2Fused(0.0, y, delta), dydt_ref, rtol=1e-13, atol=0)
+
+	def test_fused_trajectory_matches_eom(self):
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -4.5, 0.0, 0.0)
+
+		self.vehicle.setSolverParams(1E-10, fusedEOM=False)
+		self.vehicle.propogateEntry(2400.0, 0.1, 0.0)
+		h_ref = self.vehicle.h_kmc.copy()
+
+		self.vehicle.setSolverParams(1E-10, fusedEOM=True)
+		self.vehicle.propogateEntry(2400.0, 0.1, 0.0)
+
+		np.testing.assert_allclose(self.vehicle.h_kmc, h_ref, rtol=1e-9)
+
+	def test_solver_options_kept_when_not_passed(self):
+		self.vehicle.setSolverParams(1E-10, fusedEOM=False, method='Radau', terminalPredictor=True)
+		self.vehicle.setSolverParams(1E-6)
+
+		self.assertEqual(self.vehicle.tol, 1E-6)
+		self.assertFalse(self.vehicle.fusedEOM)
+		self.assertEqual(self.vehicle.method, 'Radau')
+		self.assertTrue(self.vehicle.terminalPredictor)
+		self.assertFalse(self.vehicle.eventTermination)
+
+
+class TestEventTermination(VehicleTestCase):
+	"""
+	Check event-terminated propogation against the default
+	integrate-then-truncate propogation.
+	"""
+
+	vehicleParams = LIFTING
+
+	def test_skip_out_event(self):
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -4.5, 0.0, 0.0)
+		self.vehicle.setSolverParams(1E-10)
+		self.vehicle.propogateEntry(2400.0, 0.1, 0.0)
+		exitflag_ref = self.vehicle.exitflag
+		heatload_ref = self.vehicle.heatload[-1]
+
+		for propogate in [self.vehicle.propogateEntry, self.vehicle.propogateEntry2]:
+			self.vehicle.setSolverParams(1E-10, eventTermination=True)
+			propogate(2400.0, 0.1, 0.0)
+
+			self.assertEqual(self.vehicle.exitflag, exitflag_ref)
+			self.assertEqual(self.vehicle.index, len(self.vehicle.tc))
+			self.assertAlmostEqual(self.vehicle.h_kmc[-1], self.planet.h_skip/1E3, places=6)
+			self.assertAlmostEqual(self.vehicle.heatload[-1], heatload_ref, delta=0.1)
+
+	def test_trap_in_event(self):
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -8.0, 0.0, 0.0)
+		self.vehicle.setSolverParams(1E-10, eventTermination=True)
+		self.planet.h_trap = 100.0E3
+		self.vehicle.propogateEntry(2400.0, 0.1, 0.0)
+
+		self.assertEqual(self.vehicle.exitflag, -1.0)
+		self.assertAlmostEqual(self.vehicle.h_kmc[-1], 100.0, places=6)
+		self.assertLess(self.vehicle.t_minc[-1], 2.0)
+
+	def test_event_flag_returned(self):
+		self.planet.h_trap = 100.0E3
+		r0 = self.planet.computeR(150.0E3)
+		state0 = self.planet.nonDimState(r0, 0.0, 0.0, 11.0E3, 0.0, -8.0*np.pi/180.0, 0.0)
+
+		self.vehicle.setSolverParams(1E-10, eventTermination=True)
+		*solution, eventFlag = self.vehicle.solveEntryTrajectory(*state0, 2400.0, 0.1, 0.0)
+		self.assertEqual(eventFlag, -1.0)
+		self.assertEqual(self.vehicle.classifyTrajectory(solution[1]*self.planet.RP, eventFlag),
+						 (len(solution[1]), -1.0))
+
+		# the flag is not shared with runs which do not stop at an event
+		self.vehicle.setSolverParams(1E-10, eventTermination=False)
+		*solution, eventFlag = self.vehicle.solveEntryTrajectory(*state0, 2400.0, 0.1, 0.0, 'solve_ivp')
+		self.assertEqual(eventFlag, 0.0)
+		self.assertLess(self.vehicle.classifyTrajectory(solution[1]*self.planet.RP)[0], len(solution[1]))
+
+
+class TestAnalyticJacobian(VehicleTestCase):
+	"""
+	Check the analytic Jacobian against finite differences of
+	the EOM, and its effect on the number of RHS evaluations.
+	"""
+
+	vehicleParams = LIFTING
+
+	def test_jacobian_matches_finite_difference(self):
+		rng = np.random.default_rng(1)
+		for i in range(20):
+			y = np.array([1.0 + rng.uniform(0.002, 0.02), rng.uniform(-3, 3),
+						  rng.uniform(-1.2, 1.2), rng.uniform(0.1, 2.0),
+						  rng.uniform(-3, 3), rng.uniform(-1.2, 0.3), 0.0])
+			delta = rng.uniform(0, np.pi)
+			J = self.vehicle.EOMJacobian(y, 0.0, delta)
+			J_fd = np.zeros((7, 7))
+			for j in range(7):
+				eps = 1E-7 * max(1.0, abs(y[j]))
+				yp = y.copy()
+				ym = y.copy()
+				yp[j] += eps
+				ym[j] -= eps
+				J_fd[:, j] = (np.array(self.vehicle.EOM(yp, 0.0, delta)) -
+							  np.array(self.vehicle.EOM(ym, 0.0, delta))) / (2 * eps)
+			np.testing.assert_allclose(J, J_fd, rtol=1e-4, atol=1e-6 * np.max(np.abs(J_fd)))
+			np.testing.assert_array_equal(self.vehicle.EOM2Jacobian(0.0, y, delta), J)
+
+	def test_jacobian_reduces_rhs_evaluations(self):
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -5.5, 0.0, 0.0)
+
+		self.vehicle.setSolverParams(1E-10, analyticJacobian=False)
+		self.vehicle.propogateEntry(2400.0, 0.1, 180.0)
+		nfev_ref = self.vehicle.nfev
+		h_ref = self.vehicle.h_kmc.copy()
+
+		self.vehicle.setSolverParams(1E-10, analyticJacobian=True)
+		self.vehicle.propogateEntry(2400.0, 0.1, 180.0)
+
+		self.assertLess(self.vehicle.nfev, nfev_ref)
+		self.assertEqual(len(self.vehicle.h_kmc), len(h_ref))
+		np.testing.assert_allclose(self.vehicle.h_kmc, h_ref, rtol=0, atol=1E-3)
+
+	def test_implicit_method_with_jacobian(self):
+		self.vehicle.setInitialState(150.0, 0.0, 0.0, 11.0, 0.0, -4.5, 0.0, 0.0)
+		self.vehicle.setSolverParams(1E-10, method='Radau')
+		self.vehicle.propogateEntry2(2400.0, 0.1, 0.0)
+
+		self.assertEqual(self.vehicle.exitflag, 1.0)
+		self.assertGreater(self.vehicle.njev, 0)
+
+
+class TestCorridorNewton(VehicleTestCase):
+	"""
+	Check the state transition matrix apoapsis sensitivity and the
+	Newton corridor limit search against finite differences and
+	the bisection search.
+	"""
+
+	initialState = (180.0, 0.0, 0.0, 12.0, 0.0, -4.5, 0.0, 0.0)
+
+	def test_apoapsis_sensitivity_matches_finite_difference(self):
+		self.vehicle.setSolverParams(1E-8)
+		h = 1E-4
+		for gamma0_deg in [-9.0, -9.44, -10.0]:
+			self.vehicle.gamma0_deg = gamma0_deg
+			err, derr = self.vehicle.computeApoapsisSensitivity(2400.0, 1.0, 0.0, 407.0)
+			self.vehicle.gamma0_deg = gamma0_deg + h
+			err1, _ = self.vehicle.computeApoapsisSensitivity(2400.0, 1.0, 0.0, 407.0)
+			self.vehicle.gamma0_deg = gamma0_deg - h
+			err2, _ = self.vehicle.computeApoapsisSensitivity(2400.0, 1.0, 0.0, 407.0)
+
+			self.assertAlmostEqual(derr, (err1 - err2)/(2*h), delta=0.01*abs(derr))
+
+	def test_sensitivity_after_event_propogation(self):
+		self.planet.h_trap = 100.0E3
+		self.vehicle.setSolverParams(1E-8)
+		self.vehicle.propogateEntrySensitivity(2400.0, 1.0, 0.0)
+		exitflag_ref = self.vehicle.exitflag
+		index_ref = self.vehicle.index
+
+		# a trap in event run must not leak into the sensitivity run
+		self.vehicle.setSolverParams(1E-8, eventTermination=True)
+		self.vehicle.gamma0_deg = -8.0
+		self.vehicle.propogateEntry(2400.0, 1.0, 0.0)
+		self.assertEqual(self.vehicle.exitflag, -1.0)
+
+		self.vehicle.gamma0_deg = -4.5
+		self.vehicle.propogateEntrySensitivity(2400.0, 1.0, 0.0)
+
+		self.assertEqual(exitflag_ref, 1.0)
+		self.assertEqual(self.vehicle.exitflag, exitflag_ref)
+		self.assertEqual(self.vehicle.index, index_ref)
+
+	def test_newton_matches_bisection(self):
+		# the apoapsis altitude error is resolved to 1E-6 deg at this
+		# solver tolerance
+		self.vehicle.setSolverParams(1E-10)
+
+		underShootLimit, exitflag_us = self.vehicle.findUnderShootLimit(2400.0, 1.0, -20.0, -4.0, 1E-6, 407.0)
+		evaluations = self.vehicle.corridorEvaluations
+		underShootLimitN, exitflag_usN = self.vehicle.findUnderShootLimit(2400.0, 1.0, -20.0, -4.0, 1E-6, 407.0,
+																		  method='newton')
+
+		self.assertEqual(exitflag_usN, exitflag_us)
+		self.assertAlmostEqual(underShootLimitN, underShootLimit, delta=1E-6)
+		self.assertEqual(evaluations, 26)
+		self.assertLess(self.vehicle.corridorEvaluations, evaluations)
+		self.assertEqual(self.vehicle.gamma0_deg, -4.5)
+
+	def test_newton_drag_modulation_limits(self):
+		vehicle = Vehicle('DM', 150.0, 35.0, 0.0, 3.1416, 0.0, 0.50, self.planet)
+		vehicle.setInitialState(180.0, 0.0, 0.0, 12.0, 0.0, -4.5, 0.0, 0.0)
+		vehicle.setSolverParams(1E-10)
+		vehicle.setDragModulationVehicleParams(35.0, 7.5)
+
+		for find in [vehicle.findOverShootLimitD, vehicle.findUnderShootLimitD]:
+			EFPALimit, exitflag = find(2400.0, 1.0, -20.0, -4.0, 1E-6, 407.0)
+			evaluations = vehicle.corridorEvaluations
+			EFPALimitN, exitflagN = find(2400.0, 1.0, -20.0, -4.0, 1E-6, 407.0, method='newton')
+
+			self.assertEqual(exitflagN, exitflag)
+			self.assertAlmostEqual(EFPALimitN, EFPALimit, delta=1E-6)
+			self.assertLess(vehicle.corridorEvaluations, evaluations)
+
+	def test_newton_not_supported_for_overshoot(self):
+		self.vehicle.setSolverParams(1E-6)
+
+		with self.assertRaises(ValueError):
+			self.vehicle.findOverShootLimit(2400.0, 1.0, -20.0, -4.0, 1E-2, 407.0, method='newton')
+
+	def test_newton_outside_bounds_reported_once(self):
+		self.vehicle.setSolverParams(1E-6)
+
+		out = io.StringIO()
+		with contextlib.redirect_stdout(out):
+			underShootLimit, exitflag_us = self.vehicle.findUnderShootLimit(2400.0, 1.0, -4.0, -3.0, 1E-2, 407.0,
+																			method='newton')
+
+		self.assertEqual(exitflag_us, 0.0)
+		self.assertEqual(out.getvalue(), "Undershoot limit is outside user specified bounds.\n")
+		self.assertEqual(self.vehicle.gamma0_deg, -4.5)
+
+
+class TestCorridorLimitSearch(VehicleTestCase):
+	"""
+	Check the memoized corridor limit root finder.
+	"""
+
+	initialState = (180.0, 0.0, 0.0, 12.0, 0.0, -4.5, 0.0, 0.0)
+	solverTol = 1E-6
+
+	def test_bisection_one_propogation_per_iteration(self):
+		overShootLimit, exitflag_os = self.vehicle.findOverShootLimit(2400.0, 1.0, -20.0, -4.0, 1E-2, 407.0)
+
+		self.assertEqual(exitflag_os, 1.0)
+		self.assertEqual(overShootLimit, -7.046875)
+		# 2 end points + 11 bisection steps to reduce 16 deg to 1E-2 deg
+		self.assertEqual(self.vehicle.corridorEvaluations, 13)
+
+	def test_illinois_matches_bisection(self):
+		for find in [self.vehicle.findOverShootLimit, self.vehicle.findUnderShootLimit]:
+			limit, exitflag = find(2400.0, 1.0, -20.0, -4.0, 1E-4, 407.0)
+			limitI, exitflagI = find(2400.0, 1.0, -20.0, -4.0, 1E-4, 407.0, method='illinois')
+
+			self.assertEqual(exitflagI, exitflag)
+			self.assertAlmostEqual(limitI, limit, delta=1E-4)
+
+	def test_limit_outside_bounds(self):
+		limit, exitflag = self.vehicle.findUnderShootLimit(2400.0, 1.0, -6.0, -4.0, 1E-2, 407.0)
+
+		self.assertEqual(exitflag, 0.0)
+		self.assertEqual(limit, 0.0)
+		self.assertEqual(self.vehicle.gamma0_deg, -4.5)
+
+
+class TestPredictorContext(VehicleTestCase):
+	"""
+	Check that the onboard predictor copy of the vehicle shares the
+	vehicle history and only replaces the density source.
+	"""
+
+	initialState = (180.0, 0.0, 0.0, 11.0, 0.0, -5.5, 0.0, 0.0)
+	solverTol = 1E-6
+
+	def test_dummy_vehicle_shares_history(self):
+		self.vehicle.propogateEntry(2400.0, 1.0, 0.0)
+		self.vehicle.h_km = np.zeros(100000)
+		h_kmc = self.vehicle.h_kmc.copy()
+
+		density_mes_int = lambda h: 1.1*self.planet.density_int(h)
+		vehicleCopy = self.vehicle.dummyVehicle(density_mes_int)
+
+		self.assertIs(vehicleCopy.h_km, self.vehicle.h_km)
+		self.assertIs(vehicleCopy.planetObj.ATM_height, self.planet.ATM_height)
+		self.assertIs(vehicleCopy.planetObj.density_int, density_mes_int)
+		self.assertIsNot(self.planet.density_int, density_mes_int)
+
+		vehicleCopy.propogateEntry(2400.0, 1.0, 180.0)
+		np.testing.assert_array_equal(self.vehicle.h_kmc, h_kmc)
+		self.assertFalse(np.array_equal(vehicleCopy.h_kmc, h_kmc))
+
+	def test_predictor_matches_scaled_density(self):
+		density_mes_int = lambda h: 1.1*self.planet.density_int(h)
+		h_kmc = self.vehicle.propogateEntry_util(180.0, 0.0, 0.0, 11.0, -5.5, 0.0, 0.0, 0.0, 2400.0, 1.0, 0.0,
+												 density_mes_int)[1]
+
+		planet = createPlanet('VENUS')
+		planet.density_int = density_mes_int
+		vehicle = Vehicle(*APOLLO, planet)
+		vehicle.setInitialState(*self.initialState)
+		vehicle.setSolverParams(self.solverTol)
+		vehicle.propogateEntry(2400.0, 1.0, 0.0)
+
+		np.testing.assert_array_equal(h_kmc, vehicle.h_kmc)
+
+
+class TestGuidedFirstStep(VehicleTestCase):
+	"""
+	Check that the guided propogators started from the step size of 
+	the previous guidance cycle keep the per-cycle results.
+	"""
+
+	planetID = 'EARTH'
+
+	def setUp(self):
+		super().setUp()
+		self.planet.h_skip = 125.0E3
+
+	def createDragVehicle(self):
+		vehicle = Vehicle('EarthSmallSat', 25.97, 66.4, 0.0, np.pi*0.25**2, 0.0, 0.0563, self.planet)
+		vehicle.setInitialState(125.0, 0.0, 0.0, 9.8, 0.0, -4.90, 0.0, 0.0)
+		vehicle.setSolverParams(1E-6)
+		vehicle.setDragModulationVehicleParams(66.4, 4.72)
+		vehicle.setTargetOrbitParams(180.0, 1760.0, 50.0)
+		vehicle.setDragEntryPhaseParams(5.0, 50.0, 101, -200.0)
+		return vehicle
+
+	def propogateCycles(self, vehicle, first_step):
+		vehicle.setInitialState(100.0, 0.0, 0.0, 11.0, 0.0, -5.5, 0.0, 0.0)
+		vehicle.propogateEntry2(1.0, 0.1, 0.0)
+		nfev = 0
+		for i in range(0, 60):
+			vehicle.setInitialState(vehicle.h_kmc[-1], vehicle.theta_degc[-1], vehicle.phi_degc[-1],
+									vehicle.v_kmsc[-1], vehicle.psi_degc[-1], vehicle.gamma_degc[-1],
+									vehicle.drange_kmc[-1], 0.0)
+			vehicle.propogateEntry2(1.0, 0.1, 60.0, vehicle.largestStep if first_step else None)
+			nfev += vehicle.nfev
+		return vehicle.h_kmc[-1], nfev
+
+	def test_first_step_keeps_trajectory(self):
+		for method in ['RK45', 'RK23', 'DOP853', 'Radau']:
+			self.vehicle.setSolverParams(1E-6, method=method)
+			h_km1, nfev1 = self.propogateCycles(self.vehicle, False)
+			h_km2, nfev2 = self.propogateCycles(self.vehicle, True)
+
+			self.assertAlmostEqual(h_km2, h_km1, delta=1E-3)
+			self.assertLess(nfev2, nfev1)
+
+	def test_multistep_methods_choose_first_step(self):
+		for method in ['BDF', 'LSODA']:
+			self.vehicle.setSolverParams(1E-6, method=method)
+			self.assertEqual(self.propogateCycles(self.vehicle, True), self.propogateCycles(self.vehicle, False))
+
+	def test_drag_modulation_matches_restarts(self):
+		vehicle1 = self.createDragVehicle()
+		propogateEntry2 = vehicle1.propogateEntry2
+		vehicle1.propogateEntry2 = lambda t_sec, dt, delta_deg, first_step=None: \
+			propogateEntry2(t_sec, dt, delta_deg)
+		vehicle1.propogateGuidedEntryD2(1.0, 1.0, 0.1, 2400.0)
+
+		vehicle2 = self.createDragVehicle()
+		vehicle2.propogateGuidedEntryD2(1.0, 1.0, 0.1, 2400.0)
+
+		self.assertEqual(vehicle2.t_switch, vehicle1.t_switch)
+		self.assertEqual(len(vehicle2.h_km_full), len(vehicle1.h_km_full))
+		np.testing.assert_allclose(vehicle2.h_km_full, vehicle1.h_km_full, rtol=0, atol=1E-3)
+		self.assertAlmostEqual(vehicle2.terminal_apoapsis, vehicle1.terminal_apoapsis, delta=1.0)
+
+
+class TestTerminalPredictor(VehicleTestCase):
+	"""
+	Check that the terminal state only apoapsis predictor matches the
+	full predictor propogation with fewer RHS evaluations.
+	"""
+
+	planetID = 'EARTH'
+
+	def setUp(self):
+		super().setUp()
+		self.planet.h_skip = 125.0E3
+		self.vehicle.setDragModulationVehicleParams(78.0, 4.0)
+
+	def predict(self, predictor, terminalPredictor):
+		self.vehicle.setSolverParams(1E-6, terminalPredictor=terminalPredictor)
+		self.vehicle.predictorNfev = 0
+		apoapsis = getattr(self.vehicle, predictor)(100.0, 0.0, 0.0, 10.5, -2.0, 0.0, 0.0, 0.0, 2400.0, 0.1, 0.0,
+													self.planet.density_int)
+		return apoapsis, self.vehicle.predictorNfev
+
+	def test_terminal_predictor_matches_full(self):
+		for predictor in ['predictApoapsisAltitudeKm_withLiftUp', 'predictApoapsisAltitudeKm_withLiftUp2',
+						  'predictApoapsisAltitudeKm_afterJettision', 'predictApoapsisAltitudeKm_afterJettision2']:
+			apoapsis1, nfev1 = self.predict(predictor, False)
+			apoapsis2, nfev2 = self.predict(predictor, True)
+
+			self.assertAlmostEqual(apoapsis2, apoapsis1, delta=1E-3*abs(apoapsis1))
+			self.assertGreater(nfev2, 0)
+			self.assertLess(nfev2, nfev1)
+
+
+class TestRadiativeHeating(VehicleTestCase):
+	"""
+	Check the array evaluation of the Venus and Earth radiative heating
+	correlations against element by element evaluation.
+	"""
+
+	def setUp(self):
+		super().setUp()
+		self.v = np.concatenate((np.linspace(5000.0, 17000.0, 1201), [8000.0, 10000.0, 9000.0, 16000.0]))
+		self.h = np.linspace(60.0E3, 150.0E3, len(self.v))
+
+	def test_venus_radiative_heating(self):
+		vehicle = self.vehicle
+		r = vehicle.planetObj.RP + self.h
+		rho = vehicle.planetObj.rhovectorized(r)
+
+		q = np.zeros(len(r))
+		for i in range(0, len(r)):
+			if self.v[i] < 8000.0:
+				q[i] = 3.33E-34*self.v[i]**10.0*rho[i]**1.2*vehicle.RN**0.49
+			elif self.v[i] < 10000.0:
+				q[i] = 1.22E-16*self.v[i]**5.5*rho[i]**1.2*vehicle.RN**0.49
+			else:
+				q[i] = 3.07E-48*self.v[i]**13.4*rho[i]**1.2*vehicle.RN**0.49
+
+		np.testing.assert_allclose(vehicle.qStagRadiative(r, self.v), q, rtol=1E-12, atol=0)
+
+	def test_earth_radiative_heating(self):
+		vehicle = Vehicle(*APOLLO, createPlanet('EARTH'))
+		r = vehicle.planetObj.RP + self.h
+		rho = vehicle.planetObj.rhovectorized(r)
+
+		xx = np.array([9000.0, 10000.0, 11000.0, 12000.0, 13000.0, 14000.0, 15000.0, 16000.0])
+		yy = np.array([1.5, 35, 151, 359, 660, 1065, 1550, 2040])
+		fV = interp1d(xx, yy, kind='linear', fill_value=(0.0, 2040), bounds_error=False)
+
+		q = np.zeros(len(r))
+		for i in range(0, len(r)):
+			q[i] = 4.736E4*vehicle.RN**0.6*rho[i]**1.22*float(fV(self.v[i]))
+
+		np.testing.assert_allclose(vehicle.qStagRadiative(r, self.v), q, rtol=1E-12, atol=0)
+
 
 if __name__ == '__main__':
 	unittest.main()